@@ -0,0 +1,49 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: benchmarks/bench_backends.py
+Deskripsi: Latensi end-to-end (build + solve + ambil nilai) backend cbc
+           (PuLP, file MPS + subprocess CBC), highs (SciPy, in-process) dan
+           netflow (min-cost flow OR-Tools, sawit/netflow.py), serta glpk jika
+           terpasang. Harness lengkap (iterasi, memori, JSON + HTML):
+           `python -m sawit compare --backends`.
+
+Jalankan dari root repo:
+    python benchmarks/bench_backends.py [n_kebun ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sawit.backends import available_backends, solve
+from sawit.instances import generate_instance
+from sawit.network import Network
+
+
+def main(sizes):
+    backends = available_backends()
+
+    # Import scipy.optimize/pulp sekali di awal agar tidak ikut terukur
+    for backend in backends:
+        solve(Network.from_dicts(*generate_instance(2)), backend)
+
+    print(f"{'Kebun':>8} {'Rute':>8} " + " ".join(f"{b + ' (s)':>12}" for b in backends) + f" {'Objective':>18}")
+    print("-" * 84)
+    for n_kebun in sizes:
+        network = Network.from_dicts(*generate_instance(n_kebun))
+        times, objectives = [], []
+        for backend in backends:
+            start = time.perf_counter()
+            result = solve(network, backend)
+            times.append(time.perf_counter() - start)
+            objectives.append(result.objective)
+        assert all(abs(obj - objectives[0]) <= 1e-6 * abs(objectives[0]) for obj in objectives), objectives
+        print(f"{n_kebun:>8,} {network.n_vars:>8,} " + " ".join(f"{t:>12.3f}" for t in times)
+              + f" {objectives[0]:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 1000, 10000])
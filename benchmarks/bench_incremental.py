@@ -0,0 +1,67 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: benchmarks/bench_incremental.py
+Deskripsi: Iterasi simplex dan waktu re-solve cold vs warm (sawit.incremental)
+           untuk edit kecil: beberapa biaya TBS/CPO dan demand PD berubah.
+
+Jalankan dari root repo:
+    python benchmarks/bench_incremental.py [n_kebun ...]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from sawit.incremental import IncrementalModel
+from sawit.instances import generate_instance
+from sawit.network import Network
+
+ROUNDS = 20
+
+
+def random_edit(model, rng):
+    network = model.network
+    tbs = network.tbs_routes()
+    cpo = network.cpo_routes()
+    model.set_cost_tbs({tbs[i]: network.tbs_cost[i] * rng.uniform(0.9, 1.1)
+                        for i in rng.choice(len(tbs), min(3, len(tbs)), replace=False)})
+    model.set_cost_cpo({cpo[i]: network.cpo_cost[i] * rng.uniform(0.9, 1.1)
+                        for i in rng.choice(len(cpo), min(2, len(cpo)), replace=False)})
+    d = int(rng.integers(len(network.pusat)))
+    model.set_demand({network.pusat[d]: network.demand[d] * rng.uniform(0.95, 1.05)})
+
+
+def main(sizes):
+    print(f"{'Kebun':>8} {'Rute':>8} {'Iter cold':>10} {'Iter warm':>10} "
+          f"{'Cold (ms)':>10} {'Warm (ms)':>10}")
+    print("-" * 62)
+    for n_kebun in sizes:
+        rng = np.random.default_rng(n_kebun)
+        network = Network.from_dicts(*generate_instance(n_kebun))
+        model = IncrementalModel(network)
+        model.solve()
+
+        cold, warm = [], []
+        for _ in range(ROUNDS):
+            random_edit(model, rng)
+            w = model.solve()
+            c = model.solve(cold=True)
+            assert w.status == c.status == 'Optimal'
+            assert abs(w.objective - c.objective) <= 1e-7 * abs(c.objective)
+            warm.append(w)
+            cold.append(c)
+
+        def mean(stats, attr):
+            return sum(getattr(s, attr) for s in stats) / len(stats)
+
+        print(f"{n_kebun:>8,} {network.n_vars:>8,} {mean(cold, 'iterations'):>10.1f} "
+              f"{mean(warm, 'iterations'):>10.1f} {mean(cold, 'solve_time') * 1000:>10.3f} "
+              f"{mean(warm, 'solve_time') * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 1000, 10000])
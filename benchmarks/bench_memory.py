@@ -0,0 +1,78 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: benchmarks/bench_memory.py
+Deskripsi: Perbandingan puncak memori Python antara model PuLP
+           (LpVariable.dicts, sawit.model) dan representasi array + MPS
+           (sawit.mps) untuk input CBC dan hasil solve.
+
+Yang diukur (tracemalloc, di atas Network yang sudah dibuat):
+    pulp   - build_model + LpProblem.writeMPS (langkah PuLP sebelum CBC
+             dipanggil) + dict hasil x/y
+    arrays - write_mps dari matriks sparse + array hasil + RouteValues
+CBC sendiri berjalan di proses terpisah dan sama untuk keduanya.
+
+Jalankan dari root repo:
+    python benchmarks/bench_memory.py [n_kebun ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from sawit.backends import route_values
+from sawit.instances import generate_instance
+from sawit.model import build_model
+from sawit.mps import write_mps
+from sawit.network import Network
+
+
+def model_pulp(network, path):
+    model, x, y = build_model(network)
+    model.writeMPS(path, rename=1)
+    return model, x, y
+
+
+def model_arrays(network, path):
+    lo, hi = network.row_bounds()
+    write_mps(path, network.objective(), network.constraint_matrix(), lo, hi)
+    return route_values(network, np.zeros(network.n_tbs), np.zeros(network.n_cpo))
+
+
+def measure(fn, network):
+    """(puncak MB, detik) satu pemanggilan fn."""
+    fd, path = tempfile.mkstemp(suffix=".mps")
+    os.close(fd)
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        kept = fn(network, path)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del kept
+    finally:
+        os.remove(path)
+    return peak / 1e6, elapsed
+
+
+def main(sizes):
+    print(f"{'Kebun':>8} {'Rute':>10} {'PuLP (MB)':>10} {'Array (MB)':>11} {'Rasio':>6} "
+          f"{'PuLP (s)':>9} {'Array (s)':>10}")
+    print("-" * 70)
+    for n_kebun in sizes:
+        network = Network.from_dicts(*generate_instance(n_kebun))
+        mb_pulp, t_pulp = measure(model_pulp, network)
+        mb_arrays, t_arrays = measure(model_arrays, network)
+        print(f"{n_kebun:>8,} {network.n_vars:>10,} {mb_pulp:>10.1f} {mb_arrays:>11.1f} "
+              f"{mb_pulp / mb_arrays:>5.0f}x {t_pulp:>9.2f} {t_arrays:>10.2f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [2000, 20000, 200000])
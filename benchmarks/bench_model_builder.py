@@ -0,0 +1,87 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: benchmarks/bench_model_builder.py
+Deskripsi: Perbandingan waktu build model antara builder lama (scan semua
+           nama kebun/pabrik/PD per constraint) dan builder sparse
+           (sawit.network + sawit.model).
+
+Jalankan dari root repo:
+    python benchmarks/bench_model_builder.py [n_kebun ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pulp import LpMinimize, LpProblem, LpVariable, lpSum
+
+from sawit.instances import generate_instance
+from sawit.model import build_model
+from sawit.network import Network
+
+
+def build_model_legacy(supply_capacity, factory_capacity, demand, cost_tbs, cost_cpo, yield_rate):
+    """Salinan builder asli python_solver.py (sebelum memakai sawit.model)."""
+    kebun_list = list(supply_capacity.keys())
+    pabrik_list = list(factory_capacity.keys())
+    pd_list = list(demand.keys())
+
+    model = LpProblem("Optimasi_Distribusi_Sawit", LpMinimize)
+    x = LpVariable.dicts("X_TBS", cost_tbs.keys(), lowBound=0, cat='Continuous')
+    y = LpVariable.dicts("Y_CPO", cost_cpo.keys(), lowBound=0, cat='Continuous')
+
+    model += (
+        lpSum([cost_tbs[i] * x[i] for i in cost_tbs.keys()]) +
+        lpSum([cost_cpo[j] * y[j] for j in cost_cpo.keys()]),
+        "Total_Biaya"
+    )
+
+    for kebun in kebun_list:
+        model += lpSum([x[(kebun, p)] for p in pabrik_list if (kebun, p) in cost_tbs.keys()]) <= supply_capacity[kebun]
+
+    for pabrik in pabrik_list:
+        model += lpSum([x[(k, pabrik)] for k in kebun_list if (k, pabrik) in cost_tbs.keys()]) <= factory_capacity[pabrik]
+
+    for pabrik in pabrik_list:
+        tbs_in = lpSum([x[(k, pabrik)] for k in kebun_list if (k, pabrik) in cost_tbs.keys()])
+        cpo_out = lpSum([y[(pabrik, d)] for d in pd_list if (pabrik, d) in cost_cpo.keys()])
+        model += cpo_out == yield_rate * tbs_in
+
+    for d in pd_list:
+        model += lpSum([y[(p, d)] for p in pabrik_list if (p, d) in cost_cpo.keys()]) >= demand[d]
+
+    return model, x, y
+
+
+def build_model_sparse(supply_capacity, factory_capacity, demand, cost_tbs, cost_cpo, yield_rate):
+    network = Network.from_dicts(supply_capacity, factory_capacity, demand, cost_tbs, cost_cpo, yield_rate)
+    return build_model(network)
+
+
+def timed(fn, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    print(f"{'Kebun':>8} {'Pabrik':>7} {'PD':>6} {'Rute':>8} {'Lama (s)':>10} {'Sparse (s)':>11} {'Speedup':>8}")
+    print("-" * 64)
+    for n_kebun in sizes:
+        data = generate_instance(n_kebun)
+        repeat = 3 if n_kebun <= 1000 else 1
+        t_legacy = timed(build_model_legacy, data, repeat)
+        t_sparse = timed(build_model_sparse, data, repeat)
+        n_routes = len(data[3]) + len(data[4])
+        print(f"{n_kebun:>8,} {len(data[1]):>7,} {len(data[2]):>6,} {n_routes:>8,} "
+              f"{t_legacy:>10.3f} {t_sparse:>11.3f} {t_legacy / t_sparse:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10, 1000, 10000])
@@ -0,0 +1,91 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: benchmarks/bench_startup.py
+Deskripsi: Waktu startup CLI (`python -m sawit`) dan pemeriksaan import berat.
+
+Setiap perintah dijalankan di proses Python baru beberapa kali (diambil
+median). Setelah itu dicek modul apa saja yang ter-import:
+
+    import sawit.cli / --help          : tanpa numpy, scipy, pulp, pandas,
+                                         openpyxl, webbrowser
+    report --no-excel --headless       : tanpa pandas dan webbrowser
+
+Jika ada modul terlarang yang ter-import, script keluar dengan kode 1
+sehingga regresi import langsung ketahuan.
+
+Jalankan dari root repo:
+    python benchmarks/bench_startup.py [ulangan]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ('numpy', 'scipy', 'pulp', 'pandas', 'openpyxl', 'highspy', 'pyarrow', 'webbrowser')
+
+# (nama, kode Python, modul yang tidak boleh ter-import)
+CASES = [
+    ('python -c pass', "pass", ()),
+    ('import sawit.cli', "import sawit.cli", HEAVY),
+    ('sawit --help', "from sawit.cli import main\ntry:\n    main(['--help'])\nexcept SystemExit:\n    pass", HEAVY),
+    ('sawit report --help', "from sawit.cli import main\ntry:\n    main(['report', '--help'])\nexcept SystemExit:\n    pass", HEAVY),
+    ('sawit compare --help', "from sawit.cli import main\ntry:\n    main(['compare', '--help'])\nexcept SystemExit:\n    pass", HEAVY),
+    ('sawit report --no-excel --headless',
+     "from sawit.cli import main\nmain(['report', '--no-excel', '--headless', '-o', 'report.html'])",
+     ('pandas', 'webbrowser')),
+]
+
+PROBE = """
+import sys, json, io, contextlib
+with contextlib.redirect_stdout(io.StringIO()):
+{code}
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+def run_case(code, cwd):
+    """Jalankan code di proses baru. Return (detik, modul berat yang ter-import)."""
+    body = '\n'.join('    ' + line for line in code.splitlines())
+    script = PROBE.format(code=body, heavy=HEAVY)
+    env = dict(os.environ, PYTHONPATH=ROOT, SAWIT_HEADLESS='1')
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, '-c', script], cwd=cwd, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(out.strip().splitlines()[-1])
+
+
+def main(repeat):
+    failures = []
+    print(f"{'Perintah':<38} {'Median (ms)':>12} {'Min (ms)':>10}  Modul berat")
+    print("-" * 90)
+    with tempfile.TemporaryDirectory() as cwd:
+        for name, code, forbidden in CASES:
+            times = []
+            for _ in range(repeat):
+                elapsed, imported = run_case(code, cwd)
+                times.append(elapsed)
+            bad = [m for m in imported if m in forbidden]
+            if bad:
+                failures.append((name, bad))
+            print(f"{name:<38} {statistics.median(times) * 1000:>12.1f} {min(times) * 1000:>10.1f}  "
+                  f"{', '.join(imported) or '-'}{'  ← REGRESI' if bad else ''}")
+
+    if failures:
+        print()
+        for name, bad in failures:
+            print(f"✗ {name}: tidak boleh meng-import {', '.join(bad)}")
+        return 1
+    print("\n✓ Tidak ada import berat yang tidak perlu")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
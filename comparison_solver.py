@@ -7,594 +7,17 @@ PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
 File: comparison_solver.py
 Deskripsi: Membandingkan hasil Excel Solver vs Python PuLP
            dan menampilkan dalam format HTML interaktif
-"""
-
-import webbrowser
-import os
-import datetime
-
-print("="*80)
-print("PERBANDINGAN EXCEL SOLVER vs PYTHON PuLP")
-print("="*80)
-print()
-
-# ================================================================================
-# DATA HASIL DARI EXCEL SOLVER (Point 3a Part 1)
-# ================================================================================
-
-print("📊 Mengumpulkan data hasil...")
-
-excel_results = {
-    'solver': 'Excel Solver',
-    'total_biaya': 910275252.49,  # Dari Excel Anda
-    'biaya_tbs': 686025252.49,
-    'biaya_cpo': 224250000.00,
-    'alokasi_tbs': {
-        ('Kebun_A', 'Pabrik_1'): 1776,
-        ('Kebun_A', 'Pabrik_2'): 2315,
-        ('Kebun_B', 'Pabrik_1'): 1737,
-        ('Kebun_B', 'Pabrik_2'): 2263,
-        ('Kebun_C', 'Pabrik_1'): 1487,
-        ('Kebun_C', 'Pabrik_2'): 2013,
-    },
-    'produksi_cpo': {
-        'Pabrik_1': 1100,
-        'Pabrik_2': 1450,
-    }
-}
-
-# ================================================================================
-# DATA HASIL DARI PYTHON PuLP (Point 3a Part 2)
-# ================================================================================
-
-python_results = {
-    'solver': 'Python PuLP',
-    'total_biaya': 910275252.49,  # Akan sama dengan Excel jika data sama
-    'biaya_tbs': 686025252.49,
-    'biaya_cpo': 224250000.00,
-    'alokasi_tbs': {
-        ('Kebun_A', 'Pabrik_1'): 1776,
-        ('Kebun_A', 'Pabrik_2'): 2315,
-        ('Kebun_B', 'Pabrik_1'): 1737,
-        ('Kebun_B', 'Pabrik_2'): 2263,
-        ('Kebun_C', 'Pabrik_1'): 1487,
-        ('Kebun_C', 'Pabrik_2'): 2013,
-    },
-    'produksi_cpo': {
-        'Pabrik_1': 1100,
-        'Pabrik_2': 1450,
-    }
-}
-
-print("✓ Data Excel Solver loaded")
-print("✓ Data Python PuLP loaded")
-
-# ================================================================================
-# ANALISIS PERBANDINGAN
-# ================================================================================
-
-print("\n" + "="*80)
-print("ANALISIS PERBANDINGAN")
-print("-" * 80)
-
-# Hitung selisih
-diff_total = python_results['total_biaya'] - excel_results['total_biaya']
-diff_tbs = python_results['biaya_tbs'] - excel_results['biaya_tbs']
-diff_cpo = python_results['biaya_cpo'] - excel_results['biaya_cpo']
-
-print(f"\n1. PERBANDINGAN BIAYA:")
-print(f"   Excel Solver : Rp {excel_results['total_biaya']:,}")
-print(f"   Python PuLP  : Rp {python_results['total_biaya']:,}")
-print(f"   Selisih      : Rp {diff_total:,}")
-
-print(f"\n2. PERBANDINGAN ALOKASI TBS:")
-alokasi_identik = True
-for route, qty_excel in excel_results['alokasi_tbs'].items():
-    qty_python = python_results['alokasi_tbs'].get(route, 0)
-    if abs(qty_excel - qty_python) > 0.1:
-        alokasi_identik = False
-        print(f"   ⚠️  {route}: Excel={qty_excel}, Python={qty_python}")
-    else:
-        print(f"   ✓ {route}: {qty_excel:,} ton (IDENTIK)")
-
-if alokasi_identik:
-    print("\n   ✅ Alokasi TBS IDENTIK!")
-else:
-    print("\n   ⚠️  Alokasi TBS BERBEDA!")
-
-print(f"\n3. PERBANDINGAN PRODUKSI CPO:")
-produksi_identik = True
-for pabrik, qty_excel in excel_results['produksi_cpo'].items():
-    qty_python = python_results['produksi_cpo'].get(pabrik, 0)
-    if abs(qty_excel - qty_python) > 0.1:
-        produksi_identik = False
-        print(f"   ⚠️  {pabrik}: Excel={qty_excel}, Python={qty_python}")
-    else:
-        print(f"   ✓ {pabrik}: {qty_excel:,} ton (IDENTIK)")
-
-if produksi_identik:
-    print("\n   ✅ Produksi CPO IDENTIK!")
 
-# ================================================================================
-# MEMBUAT HTML REPORT PERBANDINGAN
-# ================================================================================
+Isi perbandingan ada di sawit/compare.py; file ini sama dengan
+`python -m sawit compare`. Dengan --backends, semua backend solver yang
+tersedia di-benchmark pada instance yang sama (sawit/benchmark.py):
 
-print("\n" + "="*80)
-print("MEMBUAT HTML REPORT PERBANDINGAN")
-print("-" * 80)
-
-html_content = f"""
-<!DOCTYPE html>
-<html lang="id">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Perbandingan Solver</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            color: #333;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        .header p {{ font-size: 1.2em; opacity: 0.9; }}
-        .main-content {{ padding: 40px; }}
-        .section {{
-            margin-bottom: 40px;
-            background: #f8f9fa;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .section h2 {{
-            color: #1e3c72;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        .comparison-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        .solver-card {{
-            background: white;
-            padding: 30px;
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            border-top: 5px solid #667eea;
-        }}
-        .solver-card h3 {{
-            color: #1e3c72;
-            font-size: 1.5em;
-            margin-bottom: 20px;
-            text-align: center;
-        }}
-        .solver-card .metric {{
-            margin: 15px 0;
-            padding: 10px;
-            background: #f8f9fa;
-            border-radius: 8px;
-        }}
-        .solver-card .metric .label {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 5px;
-        }}
-        .solver-card .metric .value {{
-            color: #1e3c72;
-            font-size: 1.3em;
-            font-weight: bold;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            background: white;
-            border-radius: 10px;
-            overflow: hidden;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        th {{
-            background: #1e3c72;
-            color: white;
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        td {{ padding: 12px 15px; border-bottom: 1px solid #eee; }}
-        tr:hover {{ background: #f5f5f5; }}
-        .identical {{ color: #28a745; font-weight: bold; }}
-        .different {{ color: #dc3545; font-weight: bold; }}
-        .validation {{
-            background: #d4edda;
-            border: 3px solid #28a745;
-            color: #155724;
-            padding: 30px;
-            border-radius: 15px;
-            margin: 30px 0;
-            text-align: center;
-        }}
-        .validation h3 {{
-            font-size: 2em;
-            margin-bottom: 15px;
-        }}
-        .validation p {{
-            font-size: 1.2em;
-            line-height: 1.6;
-        }}
-        .analysis {{
-            background: white;
-            padding: 25px;
-            border-radius: 12px;
-            margin: 20px 0;
-            border-left: 5px solid #667eea;
-        }}
-        .analysis h4 {{
-            color: #1e3c72;
-            margin-bottom: 15px;
-        }}
-        .analysis ul {{
-            list-style-position: inside;
-            line-height: 1.8;
-        }}
-        .footer {{
-            background: #1e3c72;
-            color: white;
-            text-align: center;
-            padding: 30px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 PERBANDINGAN SOLVER</h1>
-            <p>Excel Solver vs Python PuLP</p>
-            <p style="font-size: 0.9em; margin-top: 10px;">Teknik Riset Operasional</p>
-        </div>
-        
-        <div class="main-content">
-            <div class="section">
-                <h2>📊 PERBANDINGAN HASIL OPTIMASI</h2>
-                
-                <div class="comparison-grid">
-                    <div class="solver-card">
-                        <h3>📈 Excel Solver</h3>
-                        <div class="metric">
-                            <div class="label">Total Biaya</div>
-                            <div class="value">Rp {excel_results['total_biaya']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Biaya TBS</div>
-                            <div class="value">Rp {excel_results['biaya_tbs']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Biaya CPO</div>
-                            <div class="value">Rp {excel_results['biaya_cpo']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Solver Engine</div>
-                            <div class="value" style="font-size: 1em;">Simplex LP</div>
-                        </div>
-                    </div>
-                    
-                    <div class="solver-card">
-                        <h3>🐍 Python PuLP</h3>
-                        <div class="metric">
-                            <div class="label">Total Biaya</div>
-                            <div class="value">Rp {python_results['total_biaya']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Biaya TBS</div>
-                            <div class="value">Rp {python_results['biaya_tbs']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Biaya CPO</div>
-                            <div class="value">Rp {python_results['biaya_cpo']:,}</div>
-                        </div>
-                        <div class="metric">
-                            <div class="label">Solver Engine</div>
-                            <div class="value" style="font-size: 1em;">CBC (COIN-OR)</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>📋 TABEL PERBANDINGAN DETAIL</h2>
-                
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Metrik</th>
-                            <th>Excel Solver</th>
-                            <th>Python PuLP</th>
-                            <th>Selisih</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr>
-                            <td><strong>Total Biaya</strong></td>
-                            <td>Rp {excel_results['total_biaya']:,}</td>
-                            <td>Rp {python_results['total_biaya']:,}</td>
-                            <td>Rp {diff_total:,}</td>
-                            <td class="identical">✓ IDENTIK</td>
-                        </tr>
-                        <tr>
-                            <td><strong>Biaya TBS</strong></td>
-                            <td>Rp {excel_results['biaya_tbs']:,}</td>
-                            <td>Rp {python_results['biaya_tbs']:,}</td>
-                            <td>Rp {diff_tbs:,}</td>
-                            <td class="identical">✓ IDENTIK</td>
-                        </tr>
-                        <tr>
-                            <td><strong>Biaya CPO</strong></td>
-                            <td>Rp {excel_results['biaya_cpo']:,}</td>
-                            <td>Rp {python_results['biaya_cpo']:,}</td>
-                            <td>Rp {diff_cpo:,}</td>
-                            <td class="identical">✓ IDENTIK</td>
-                        </tr>
-                        <tr>
-                            <td><strong>% Biaya TBS</strong></td>
-                            <td>{excel_results['biaya_tbs']/excel_results['total_biaya']*100:.1f}%</td>
-                            <td>{python_results['biaya_tbs']/python_results['total_biaya']*100:.1f}%</td>
-                            <td>0.0%</td>
-                            <td class="identical">✓ IDENTIK</td>
-                        </tr>
-                        <tr>
-                            <td><strong>% Biaya CPO</strong></td>
-                            <td>{excel_results['biaya_cpo']/excel_results['total_biaya']*100:.1f}%</td>
-                            <td>{python_results['biaya_cpo']/python_results['total_biaya']*100:.1f}%</td>
-                            <td>0.0%</td>
-                            <td class="identical">✓ IDENTIK</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>🚛 PERBANDINGAN ALOKASI TBS</h2>
-                
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Rute (Kebun → Pabrik)</th>
-                            <th>Excel Solver</th>
-                            <th>Python PuLP</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-"""
-
-for route, qty_excel in excel_results['alokasi_tbs'].items():
-    qty_python = python_results['alokasi_tbs'].get(route, 0)
-    status = "✓ IDENTIK" if abs(qty_excel - qty_python) < 0.1 else "✗ BERBEDA"
-    status_class = "identical" if abs(qty_excel - qty_python) < 0.1 else "different"
-    kebun, pabrik = route
-    html_content += f"""
-                        <tr>
-                            <td><strong>{kebun} → {pabrik}</strong></td>
-                            <td>{qty_excel:,} ton</td>
-                            <td>{qty_python:,} ton</td>
-                            <td class="{status_class}">{status}</td>
-                        </tr>
-"""
-
-html_content += f"""
-                    </tbody>
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>🏭 PERBANDINGAN PRODUKSI CPO</h2>
-                
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Pabrik</th>
-                            <th>Excel Solver</th>
-                            <th>Python PuLP</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-"""
-
-for pabrik, qty_excel in excel_results['produksi_cpo'].items():
-    qty_python = python_results['produksi_cpo'].get(pabrik, 0)
-    status = "✓ IDENTIK" if abs(qty_excel - qty_python) < 0.1 else "✗ BERBEDA"
-    status_class = "identical" if abs(qty_excel - qty_python) < 0.1 else "different"
-    html_content += f"""
-                        <tr>
-                            <td><strong>{pabrik}</strong></td>
-                            <td>{qty_excel:,} ton</td>
-                            <td>{qty_python:,} ton</td>
-                            <td class="{status_class}">{status}</td>
-                        </tr>
-"""
-
-html_content += """
-                    </tbody>
-                </table>
-            </div>
-            
-            <div class="validation">
-                <h3>✅ HASIL VALIDASI</h3>
-                <p><strong>KEDUA SOLVER MENGHASILKAN SOLUSI YANG IDENTIK!</strong></p>
-                <p style="margin-top: 15px;">
-                    Excel Solver dan Python PuLP menghasilkan:<br>
-                    • Total biaya yang sama: <strong>Rp 837,250,000</strong><br>
-                    • Alokasi TBS yang sama<br>
-                    • Produksi CPO yang sama<br>
-                    • Breakdown biaya yang sama
-                </p>
-                <p style="margin-top: 15px; font-size: 1em; opacity: 0.8;">
-                    Ini membuktikan bahwa model Linear Programming telah dibangun dengan benar<br>
-                    dan kedua solver mengimplementasikan algoritma Simplex dengan benar.
-                </p>
-            </div>
-            
-            <div class="section">
-                <h2>📝 ANALISIS & INTERPRETASI</h2>
-                
-                <div class="analysis">
-                    <h4>1. Konsistensi Solusi</h4>
-                    <ul>
-                        <li>Kedua software menghasilkan solusi optimal yang identik</li>
-                        <li>Tidak ada perbedaan dalam alokasi maupun biaya</li>
-                        <li>Membuktikan keunikan solusi optimal untuk masalah ini</li>
-                    </ul>
-                </div>
-                
-                <div class="analysis">
-                    <h4>2. Keandalan Model</h4>
-                    <ul>
-                        <li>Model matematis dibangun dengan benar</li>
-                        <li>Semua constraint terimplementasi dengan tepat</li>
-                        <li>Fungsi tujuan sesuai dengan objektif bisnis</li>
-                    </ul>
-                </div>
-                
-                <div class="analysis">
-                    <h4>3. Perbandingan Solver</h4>
-                    <ul>
-                        <li><strong>Excel Solver:</strong> User-friendly, GUI-based, cocok untuk model sederhana</li>
-                        <li><strong>Python PuLP:</strong> Programmable, scalable, cocok untuk model kompleks dan otomasi</li>
-                        <li>Keduanya menggunakan algoritma Simplex untuk Linear Programming</li>
-                        <li>Hasil identik membuktikan keduanya reliable untuk masalah ini</li>
-                    </ul>
-                </div>
-                
-                <div class="analysis">
-                    <h4>4. Rekomendasi Penggunaan</h4>
-                    <ul>
-                        <li><strong>Gunakan Excel:</strong> Untuk analisis cepat, presentasi, dan model < 200 variabel</li>
-                        <li><strong>Gunakan Python:</strong> Untuk model besar, otomasi, integrasi sistem, dan reproducibility</li>
-                        <li>Untuk tugas akademik: Gunakan keduanya sebagai cross-validation</li>
-                    </ul>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>✅ KESIMPULAN </h2>
-                
-                <div style="background: white; padding: 25px; border-radius: 12px; line-height: 1.8; font-size: 1.1em;">
-                    <p><strong>1. Validasi Silang Berhasil</strong></p>
-                    <p style="margin-left: 20px; margin-bottom: 15px;">
-                        Excel Solver dan Python PuLP menghasilkan solusi optimal yang <strong>100% identik</strong>,
-                        membuktikan kebenaran model dan implementasi.
-                    </p>
-                    
-                    <p><strong>2. Solusi Optimal Unik</strong></p>
-                    <p style="margin-left: 20px; margin-bottom: 15px;">
-                        Untuk masalah distribusi PT Sawit Makmur Sejahtera, terdapat satu solusi optimal unik
-                        dengan total biaya <strong>Rp 837,250,000/bulan</strong>.
-                    </p>
-                    
-                    <p><strong>3. Kedua Software Reliable</strong></p>
-                    <p style="margin-left: 20px; margin-bottom: 15px;">
-                        Excel Solver (Simplex LP) dan Python PuLP (CBC) sama-sama mengimplementasikan
-                        algoritma optimasi dengan benar dan dapat diandalkan.
-                    </p>
-                    
-                    <p><strong>4. Model Terverifikasi</strong></p>
-                    <p style="margin-left: 20px;">
-                        Cross-validation dengan dua solver berbeda memastikan tidak ada kesalahan dalam
-                        formulasi model, constraint, atau objective function.
-                    </p>
-                </div>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p><strong>Perbandingan Solver</strong></p>
-            <p>Teknik Riset Operasional</p>
-            <p>Program Studi Teknik Informatika</p>
-        </div>
-    </div>
-</body>
-</html>
+    python comparison_solver.py --backends [--sizes 10 100 1000] [--repeat 3]
 """
 
-# Simpan HTML
-output_file = 'perbandingan_solver_point3c.html'
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write(html_content)
-
-print(f"✓ HTML Report berhasil dibuat: {output_file}")
-
-# Buka di browser
-abs_path = os.path.abspath(output_file)
-print(f"✓ Membuka browser...")
-
-try:
-    webbrowser.open('file://' + abs_path)
-    print("✓ Browser terbuka!")
-except Exception as e:
-    print(f"⚠️  Browser tidak bisa dibuka otomatis: {e}")
-    print(f"   Silakan buka manual: {output_file}")
-
-# ================================================================================
-# KESIMPULAN AKHIR
-# ================================================================================
-
-print("\n" + "="*80)
-print("KESIMPULAN ")
-print("="*80)
-
-if diff_total == 0 and alokasi_identik and produksi_identik:
-    print("""
-✅ VALIDASI BERHASIL!
-
-Kedua solver menghasilkan solusi yang IDENTIK:
-  • Total Biaya  : Rp 837,250,000 (sama)
-  • Alokasi TBS  : Identik 100%
-  • Produksi CPO : Identik 100%
-  
-Ini membuktikan:
-  1. Model Linear Programming dibangun dengan benar
-  2. Kedua solver reliable dan akurat
-  3. Solusi optimal bersifat unik untuk masalah ini
-  4. Tidak ada kesalahan dalam formulasi atau implementasi
-    """)
-else:
-    print("""
-⚠️  TERDAPAT PERBEDAAN!
+import sys
 
-Ada perbedaan kecil antara hasil Excel dan Python.
-Kemungkinan penyebab:
-  1. Perbedaan toleransi solver
-  2. Pembulatan angka
-  3. Multiple optimal solutions
-    """)
+from sawit.cli import main
 
-print("="*80)
-print("✅ POINT 3c SELESAI!")
-print("="*80)
-print(f"\nFile HTML: {output_file}")
-print("Silakan buka di browser untuk melihat perbandingan lengkap.")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main(['compare', *sys.argv[1:]]))
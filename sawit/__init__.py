@@ -0,0 +1,7 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+Package: sawit
+Deskripsi: Komponen yang dapat dipakai ulang oleh python_solver.py dan
+           comparison_solver.py (representasi jaringan, model builder, solver).
+"""
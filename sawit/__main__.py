@@ -0,0 +1,7 @@
+import sys
+
+from sawit.cli import main
+
+# Guard wajib: worker multiprocessing (spawn) meng-import ulang modul ini
+if __name__ == "__main__":
+    sys.exit(main())
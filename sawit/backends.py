@@ -0,0 +1,333 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/backends.py
+Deskripsi: Pilihan backend solver untuk model distribusi.
+
+    cbc   - binary CBC bawaan PuLP. Default: file MPS ditulis langsung dari
+            array Network (sawit/mps.py) tanpa objek LpVariable per rute;
+            SAWIT_CBC_MODEL=pulp memakai jalur asli python_solver.py
+            (LpVariable.dicts + LpProblem.solve).
+    highs - SciPy linprog (HiGHS), in-process tanpa file sementara dan
+            tanpa subprocess; data langsung diambil dari matriks sparse
+            Network. Default memakai interior point + crossover
+            ("highs-ipm"), yang pada jaringan transportasi besar ~3x lebih
+            cepat daripada dual simplex HiGHS dan tetap menghasilkan
+            solusi basis (vertex).
+    netflow - min-cost flow OR-Tools pada jaringan dua tahap (sawit/netflow.py),
+            tanpa solver LP sama sekali; hanya jika ortools terpasang.
+    glpk  - PuLP + GLPK (glpsol), hanya jika terpasang; lihat
+            available_backends().
+
+cbc dan glpk menerima algorithm="primal" | "dual" | "barrier" (default:
+pengaturan bawaan solver); highs menerima method="highs-ds" | "highs-ipm".
+Backend "portfolio" menjalankan beberapa konfigurasi sekaligus dan memakai
+yang pertama optimal (sawit/portfolio.py). Backend "decomp" memecah jaringan
+per region dengan dekomposisi Benders (sawit/decomposition.py).
+
+Semua backend mengembalikan SolveResult dengan x/y berupa mapping rute → objek
+ber-atribut varValue, sehingga tahap HTML dan Excel tidak perlu diubah.
+Backend berbasis array memakai RouteValues: nilai disimpan sebagai satu array
+NumPy dan VarValue baru dibuat saat diakses.
+Selain waktu solve, SolveResult mencatat waktu membangun model (build_time)
+dan jumlah iterasi solver jika tersedia (iterations); dipakai oleh harness
+benchmark sawit/benchmark.py.
+"""
+
+import os
+import re
+import tempfile
+import time
+from collections.abc import Mapping
+
+BACKENDS = ("cbc", "highs", "netflow", "glpk")
+
+# Semua nama yang diterima solve(): backend tunggal ditambah meta-backend
+SOLVE_BACKENDS = BACKENDS + ("portfolio", "decomp")
+
+
+class VarValue:
+    """Pengganti LpVariable yang hanya membawa nilai solusi."""
+
+    __slots__ = ("name", "varValue")
+
+    def __init__(self, name, varValue):
+        self.name = name
+        self.varValue = varValue
+
+    def value(self):
+        return self.varValue
+
+    def __repr__(self):
+        return f"{self.name}={self.varValue}"
+
+
+class RouteValues(Mapping):
+    """Mapping rute → VarValue di atas satu array nilai (urutan kolom Network).
+
+    Daftar rute dan indeks rute → kolom baru dibuat saat dibutuhkan, sehingga
+    hasil solve yang hanya dibaca lewat .array (sawit/solution.py) tidak pernah
+    membuat objek Python per rute.
+    """
+
+    def __init__(self, prefix, routes, array):
+        self.prefix = prefix
+        self.array = array
+        self._routes = routes         # list rute atau callable yang membuatnya
+        self._index = None
+
+    @property
+    def routes(self):
+        if callable(self._routes):
+            self._routes = self._routes()
+        return self._routes
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    def __getitem__(self, route):
+        if self._index is None:
+            self._index = {r: i for i, r in enumerate(self.routes)}
+        return VarValue(f"{self.prefix}_{route}", float(self.array[self._index[route]]))
+
+    def values(self):
+        return [VarValue(f"{self.prefix}_{route}", v) for route, v in zip(self.routes, self.array.tolist())]
+
+    def items(self):
+        return list(zip(self.routes, self.values()))
+
+
+def route_values(network, x_vals, y_vals):
+    """(x, y) RouteValues untuk array solusi sejajar kolom X_TBS / Y_CPO Network."""
+    import numpy as np
+
+    return (RouteValues("X_TBS", network.tbs_routes, np.asarray(x_vals, dtype=float)),
+            RouteValues("Y_CPO", network.cpo_routes, np.asarray(y_vals, dtype=float)))
+
+
+class SolveResult:
+    """Hasil solve yang seragam untuk semua backend."""
+
+    def __init__(self, backend, status, objective, x, y, solve_time, model=None):
+        self.backend = backend
+        self.status = status          # string gaya LpStatus: Optimal, Infeasible, ...
+        self.objective = objective
+        self.x = x                    # mapping (kebun, pabrik) → varValue
+        self.y = y                    # mapping (pabrik, pd) → varValue
+        self.solve_time = solve_time
+        self.model = model            # LpProblem (hanya untuk cbc/glpk lewat PuLP)
+        self.cache_key = None         # kunci sawit/resultcache.py
+        self.from_cache = False
+        self.build_time = None        # detik membangun model/array untuk solver
+        self.iterations = None        # iterasi simplex/IPM/fase, None jika tidak diketahui
+        self.portfolio = None         # info balapan sawit/portfolio.py (pemenang, semua run)
+        self.decomposition = None     # region dan riwayat iterasi sawit/decomposition.py
+        self.mip = None               # truk, rute terbuka dan profil CBC sawit/mip.py
+        self.presolve = None          # statistik reduksi sawit/presolve.py (x/y sudah di-postsolve)
+        self.feasibility = None       # pre-check max-flow sawit/feasibility.py
+        self.method = None            # metode linprog yang dipakai (hanya highs)
+        self.sensitivity = None       # dual/ranging solusi ini (sawit/sensitivity.py), juga dari cache
+
+    @property
+    def label(self):
+        return {"cbc": "CBC (COIN-OR)", "highs": "HiGHS (SciPy)", "netflow": "Min-Cost Flow",
+                "glpk": "GLPK (PuLP)", "decomp": "Benders per region (HiGHS)",
+                "precheck": "Pre-check max-flow (solver tidak dijalankan)"}[self.backend]
+
+
+def available_backends():
+    """Backend yang bisa dijalankan di mesin ini (urutan sama dengan BACKENDS)."""
+    available = []
+    for backend in BACKENDS:
+        try:
+            if backend == "cbc":
+                from pulp import PULP_CBC_CMD
+                ok = PULP_CBC_CMD(msg=0).available()
+            elif backend == "glpk":
+                from pulp import GLPK_CMD
+                ok = GLPK_CMD(msg=0).available()
+            elif backend == "highs":
+                import scipy.optimize  # noqa: F401
+                ok = True
+            else:
+                # Cukup cek terpasang: ortools hanya di-import di subprocess solver
+                import importlib.util
+                ok = importlib.util.find_spec("ortools") is not None
+        except ImportError:
+            ok = False
+        if ok:
+            available.append(backend)
+    return tuple(available)
+
+
+# ================================================================================
+# BACKEND CBC / GLPK (PuLP)
+# ================================================================================
+
+# Opsi command line per algoritma LP
+_CBC_ALGORITHMS = {"primal": "primalS", "dual": "dualS", "barrier": "barrier"}
+_GLPK_ALGORITHMS = {"primal": "--primal", "dual": "--dual", "barrier": "--interior"}
+
+
+def _cbc_iterations(log):
+    # Barrier mencatat iterasi barrier dan crossover secara terpisah
+    found = re.findall(r"(\d+) iterations", log)
+    return sum(map(int, found)) if found else None
+
+
+def _glpk_iterations(log):
+    # Baris progres simplex "*   123: obj = ..." bersifat kumulatif
+    found = re.findall(r"^\*?\s*(\d+): obj", log, re.MULTILINE)
+    return int(found[-1]) if found else None
+
+
+def _solve_pulp(network, backend, make_solver, count_iterations):
+    from pulp import LpStatus, value
+
+    from sawit.model import build_model
+
+    start = time.perf_counter()
+    model, x, y = build_model(network)
+    build_time = time.perf_counter() - start
+
+    # Log ditulis ke file sementara hanya untuk membaca jumlah iterasi
+    fd, log_path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        model.solve(make_solver(log_path))
+        solve_time = time.perf_counter() - start
+        with open(log_path, errors="replace") as f:
+            iterations = count_iterations(f.read())
+    finally:
+        os.remove(log_path)
+
+    result = SolveResult(backend, LpStatus[model.status], value(model.objective), x, y, solve_time, model)
+    result.build_time = build_time
+    result.iterations = iterations
+    return result
+
+
+def cbc_model():
+    """Jalur model CBC: 'arrays' (default, sawit/mps.py) atau 'pulp'."""
+    return os.environ.get("SAWIT_CBC_MODEL", "arrays")
+
+
+def solve_cbc(network, msg=0, algorithm=None):
+    if cbc_model() != "pulp":
+        from sawit.mps import solve_cbc_arrays
+        return solve_cbc_arrays(network, msg=msg, algorithm=algorithm)
+
+    from pulp import PULP_CBC_CMD
+
+    if algorithm is None:
+        return _solve_pulp(network, "cbc", lambda log: PULP_CBC_CMD(msg=msg, logPath=log), _cbc_iterations)
+    # mip=False: CBC hanya menjalankan algoritma LP yang diminta (tanpa -solve)
+    options = [_CBC_ALGORITHMS[algorithm]]
+    return _solve_pulp(network, "cbc", lambda log: PULP_CBC_CMD(msg=msg, mip=False, options=options, logPath=log),
+                       _cbc_iterations)
+
+
+def solve_glpk(network, msg=0, algorithm=None):
+    from pulp import GLPK_CMD
+
+    options = [_GLPK_ALGORITHMS[algorithm]] if algorithm else []
+    return _solve_pulp(network, "glpk", lambda log: GLPK_CMD(msg=msg, options=options + ["--log", log]),
+                       _glpk_iterations)
+
+
+# ================================================================================
+# BACKEND HiGHS (SciPy, in-process)
+# ================================================================================
+
+# Metode linprog default backend highs (interior point HiGHS)
+HIGHS_METHOD = "highs-ipm"
+
+# scipy.optimize.OptimizeResult.status → LpStatus
+_LINPROG_STATUS = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded", 4: "Undefined"}
+
+
+def linprog_arrays(network):
+    """Ubah Network menjadi argumen linprog (c, A_ub, b_ub, A_eq, b_eq).
+
+    Baris demand (>=) dinegasikan agar masuk ke blok A_ub.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    K, P = len(network.kebun), len(network.pabrik)
+    A = network.constraint_matrix()
+    lo, hi = network.row_bounds()
+
+    le = slice(0, K + P)
+    eq = slice(K + P, K + 2 * P)
+    ge = slice(K + 2 * P, network.n_rows)
+
+    A_ub = sp.vstack([A[le], -A[ge]], format="csr")
+    b_ub = np.concatenate([hi[le], -lo[ge]])
+    return network.objective(), A_ub, b_ub, A[eq], hi[eq]
+
+
+def solve_highs(network, method=HIGHS_METHOD):
+    import numpy as np
+    from scipy.optimize import linprog
+
+    if network.n_vars == 0:
+        return _solve_empty(network, method)
+
+    start = time.perf_counter()
+    c, A_ub, b_ub, A_eq, b_eq = linprog_arrays(network)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=(0, None), method=method)
+    solve_time = time.perf_counter() - start
+
+    status = _LINPROG_STATUS.get(res.status, "Undefined")
+    values = res.x if res.x is not None else np.zeros(network.n_vars)
+    objective = float(res.fun) if res.fun is not None else float(c @ values)
+
+    x, y = route_values(network, values[:network.n_tbs], values[network.n_tbs:])
+    result = SolveResult("highs", status, objective, x, y, solve_time)
+    result.method = method
+    result.build_time = build_time
+    result.iterations = int(res.nit) if res.nit is not None else None
+    return result
+
+
+def _solve_empty(network, method):
+    """Network tanpa rute (mis. presolve menghapus semua kolom karena demand 0).
+    linprog menolak c kosong; tanpa variabel A·v = 0, jadi model optimal
+    dengan biaya 0 jika setiap baris mengizinkan 0, selain itu infeasible."""
+    import numpy as np
+
+    lo, hi = network.row_bounds()
+    status = "Optimal" if np.all(lo <= 0) and np.all(hi >= 0) else "Infeasible"
+    x, y = route_values(network, np.zeros(0), np.zeros(0))
+    result = SolveResult("highs", status, 0.0, x, y, 0.0)
+    result.method = method
+    result.build_time = 0.0
+    result.iterations = 0
+    return result
+
+
+def solve(network, backend="cbc", **options):
+    """Selesaikan model dengan backend pilihan (lihat SOLVE_BACKENDS)."""
+    if backend == "cbc":
+        return solve_cbc(network, **options)
+    if backend == "highs":
+        return solve_highs(network, **options)
+    if backend == "netflow":
+        from sawit.netflow import solve_netflow
+        return solve_netflow(network, **options)
+    if backend == "glpk":
+        return solve_glpk(network, **options)
+    if backend == "portfolio":
+        from sawit.portfolio import solve_portfolio
+        return solve_portfolio(network, **options)
+    if backend == "decomp":
+        from sawit.decomposition import solve_decomposition
+        return solve_decomposition(network, **options)
+    raise ValueError(f"Backend tidak dikenal: {backend!r} (pilihan: {', '.join(SOLVE_BACKENDS)})")
@@ -0,0 +1,276 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/benchmark.py
+Deskripsi: Harness benchmark multi-solver (comparison_solver.py --backends /
+           sawit compare --backends).
+
+Semua backend yang tersedia di mesin ini (cbc, highs, netflow dan glpk jika
+terpasang; lihat available_backends di sawit/backends.py) dijalankan pada
+instance yang sama: data default (workbook atau sawit/data.py) ditambah
+instance sintetis dari sawit/instances.py. Per run dicatat:
+
+    build_time    detik membangun model PuLP / array linprog / graf flow
+    solve_time    detik solver (median dari beberapa ulangan)
+    iterations    iterasi simplex/IPM (log CBC/GLPK, res.nit HiGHS; netflow tidak ada)
+    peak_rss_mb   puncak RSS proses worker (model, array, HiGHS in-process)
+    solver_rss_mb puncak RSS subprocess solver (CBC/GLPK/OR-Tools), None jika
+                  backend tidak memakai subprocess
+    objective     nilai fungsi tujuan
+
+Setiap pasangan (instance, backend) berjalan di proses baru (multiprocessing
+spawn) supaya puncak memori tidak tercampur antar backend; cache hasil
+(sawit/resultcache.py) tidak dipakai. Status dan objective semua backend
+dicek sama dengan toleransi sawit/comparison.py.
+
+Output: JSON (benchmark_solver.json) dan report HTML dengan layout
+perbandingan sawit/compare.py ditambah tabel benchmark.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sawit.comparison import COST_ATOL, QTY_ATOL, RTOL, compare
+
+BENCHMARK_JSON = 'benchmark_solver.json'
+BENCHMARK_OUTPUT = 'benchmark_solver.html'
+
+# Ukuran (jumlah kebun) instance sintetis default
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEAT = 3
+
+# Modul yang di-import sebelum baseline memori diukur
+_WARM_IMPORTS = {
+    'cbc': ('pulp', 'sawit.mps'),
+    'glpk': ('pulp', 'sawit.model'),
+    'highs': ('scipy.optimize', 'scipy.sparse'),
+    'netflow': ('sawit.netflow',),
+}
+
+
+# ================================================================================
+# WORKER (proses terpisah)
+# ================================================================================
+
+def _rss_mb(who):
+    """ru_maxrss dalam MB, atau None jika modul resource tidak ada (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(getattr(resource, who)).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _measure(instance, backend, repeat):
+    """Jalankan satu backend `repeat` kali pada instance. Dipanggil di proses baru."""
+    import importlib
+
+    from sawit.backends import solve
+    from sawit.comparison import from_result
+    from sawit.network import Network
+
+    for module in _WARM_IMPORTS[backend]:
+        importlib.import_module(module)
+    network = Network.from_dicts(*instance)
+    baseline = _rss_mb('RUSAGE_SELF')
+
+    build_times, solve_times = [], []
+    for _ in range(repeat):
+        result = solve(network, backend)
+        build_times.append(result.build_time)
+        solve_times.append(result.solve_time)
+
+    # Dua puncak terpisah: ru_maxrss CHILDREN adalah puncak subprocess terbesar,
+    # tidak terjadi bersamaan dengan puncak worker sehingga tidak dijumlahkan
+    peak, solver = _rss_mb('RUSAGE_SELF'), _rss_mb('RUSAGE_CHILDREN')
+    return {
+        'backend': backend,
+        'label': result.label,
+        'status': result.status,
+        'objective': result.objective,
+        'build_time': statistics.median(build_times),
+        'solve_time': statistics.median(solve_times),
+        'solve_times': solve_times,
+        'iterations': result.iterations,
+        'baseline_rss_mb': baseline,
+        'peak_rss_mb': peak,
+        'solver_rss_mb': solver or None,
+    }, from_result(network, result, name=result.label)
+
+
+def measure(instance, backend, repeat=DEFAULT_REPEAT):
+    """Return (metrik run, SolutionArtifact) dari proses spawn baru."""
+    import multiprocessing
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_measure, instance, backend, repeat).result()
+
+
+# ================================================================================
+# HARNESS
+# ================================================================================
+
+def benchmark_instances(sizes=DEFAULT_SIZES):
+    """[(nama, instance)]: data default lalu instance sintetis per ukuran."""
+    from sawit.instances import generate_instance
+    from sawit.loader import load_default_instance
+    from sawit.pipeline import DATA_SOURCES
+
+    instance, source = load_default_instance()
+    return [(f"default: {DATA_SOURCES[source]}", instance)] + [(f"sintetis_{n}", generate_instance(n)) for n in sizes]
+
+
+def check_agreement(runs, rtol=RTOL, cost_atol=COST_ATOL):
+    """Apakah semua backend melaporkan status dan objective yang sama
+    (objective hanya dibandingkan jika statusnya Optimal)."""
+    ref = runs[0]
+    same_status = all(r['status'] == ref['status'] for r in runs)
+    diffs = [abs(r['objective'] - ref['objective']) for r in runs
+             if r['status'] == 'Optimal' and ref['status'] == 'Optimal']
+    max_diff = max(diffs) if len(diffs) > 1 else None
+    tol = cost_atol + rtol * abs(ref['objective'] or 0.0)
+    return {
+        'agree': same_status and (max_diff is None or max_diff <= tol),
+        'reference': ref['backend'],
+        'max_abs_diff': max_diff,
+        'tolerance': tol,
+    }
+
+
+def _environment():
+    from importlib.metadata import PackageNotFoundError, version
+
+    def pkg(name):
+        try:
+            return version(name)
+        except PackageNotFoundError:
+            return None
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': {name: pkg(name) for name in ('pulp', 'numpy', 'scipy')},
+    }
+
+
+def run_benchmarks(instances, backends, repeat=DEFAULT_REPEAT, rtol=RTOL, cost_atol=COST_ATOL):
+    """Jalankan semua backend pada semua instance.
+
+    Return (payload JSON, {nama instance: [SolutionArtifact per backend]}).
+    """
+    from sawit.network import Network
+
+    entries, artifacts = [], {}
+    for name, instance in instances:
+        network = Network.from_dicts(*instance)
+        print(f"\n▶ {name}: {len(network.kebun):,} kebun, {len(network.pabrik):,} pabrik, "
+              f"{len(network.pusat):,} PD, {network.n_vars:,} variabel")
+        runs, artifacts[name] = [], []
+        for backend in backends:
+            run, artifact = measure(instance, backend, repeat)
+            runs.append(run)
+            artifacts[name].append(artifact)
+            print(f"   {backend:<8} {run['status']:<11} build {run['build_time']:>8.3f} s  "
+                  f"solve {run['solve_time']:>8.3f} s  iterasi {_fmt(run['iterations']):>7}  "
+                  f"memori {_fmt(run['peak_rss_mb'], '.1f'):>8} MB (solver {_fmt(run['solver_rss_mb'], '.1f'):>7} MB)  "
+                  f"objective {_fmt(run['objective'], ',.0f')}")
+        agreement = check_agreement(runs, rtol, cost_atol)
+        print(f"   {'✓ Status dan objective sama' if agreement['agree'] else '⚠️  Hasil backend BERBEDA'}")
+        entries.append({
+            'name': name,
+            'n_kebun': len(network.kebun),
+            'n_pabrik': len(network.pabrik),
+            'n_pd': len(network.pusat),
+            'n_vars': network.n_vars,
+            'n_rows': network.n_rows,
+            'runs': runs,
+            'agreement': agreement,
+        })
+
+    payload = {
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': _environment(),
+        'backends': list(backends),
+        'repeat': repeat,
+        'tolerance': {'rtol': rtol, 'cost_atol': cost_atol},
+        'instances': entries,
+    }
+    return payload, artifacts
+
+
+def detail_instance(payload):
+    """Instance untuk tabel perbandingan per rute: yang pertama dengan semua
+    backend Optimal, selain itu instance pertama."""
+    for entry in payload['instances']:
+        if all(r['status'] == 'Optimal' for r in entry['runs']):
+            return entry['name']
+    return payload['instances'][0]['name']
+
+
+def _fmt(value, spec='d'):
+    return '–' if value is None else format(value, spec)
+
+
+# ================================================================================
+# ALUR LENGKAP (comparison_solver.py --backends / sawit compare --backends)
+# ================================================================================
+
+def run_benchmark(output_file=BENCHMARK_OUTPUT, json_file=BENCHMARK_JSON, backends=None,
+                  sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, headless=False,
+                  qty_atol=QTY_ATOL, cost_atol=COST_ATOL, rtol=RTOL, mode=None):
+    """Benchmark semua backend, tulis JSON + HTML. Return payload JSON."""
+    from sawit.backends import available_backends
+    from sawit.compare import open_report, print_analysis, write_comparison_report
+
+    print("="*80)
+    print("BENCHMARK SOLVER")
+    print("="*80)
+
+    available = available_backends()
+    missing = [b for b in backends or () if b not in available]
+    for backend in missing:
+        print(f"⚠️  Backend {backend} tidak tersedia, dilewati")
+    backends = [b for b in backends or available if b in available]
+    if not backends:
+        raise ValueError("Tidak ada backend solver yang tersedia")
+    print(f"✓ Backend: {', '.join(backends)} ({repeat}x per instance)")
+
+    payload, artifacts = run_benchmarks(benchmark_instances(sizes), backends, repeat, rtol, cost_atol)
+
+    name = detail_instance(payload)
+    payload['detail_instance'] = name
+
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+    print(f"\n✓ JSON benchmark: {json_file}")
+
+    # Layout perbandingan membutuhkan minimal dua solusi
+    if len(backends) < 2:
+        print("⚠️  Hanya satu backend: HTML report perbandingan tidak dibuat")
+    else:
+        result = compare(artifacts[name], qty_atol=qty_atol, cost_atol=cost_atol, rtol=rtol)
+
+        print("\n" + "="*80)
+        print(f"ANALISIS PERBANDINGAN ({name})")
+        print("-" * 80)
+        print_analysis(result)
+
+        write_comparison_report(output_file, result, mode, benchmark=payload)
+        print(f"\n✓ HTML Report berhasil dibuat: {output_file}")
+
+        if not headless:
+            open_report(output_file)
+
+    n_agree = sum(e['agreement']['agree'] for e in payload['instances'])
+    print("\n" + "="*80)
+    print(f"{'✅' if n_agree == len(payload['instances']) else '⚠️ '} Objective sama pada "
+          f"{n_agree} dari {len(payload['instances'])} instance")
+    print("="*80)
+    return payload
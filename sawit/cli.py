@@ -0,0 +1,259 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/cli.py
+Deskripsi: Command line `sawit` (atau `python -m sawit`).
+
+    sawit solve   [--backend B] [--no-cache] [--no-presolve] [--no-precheck]
+                                                   solve saja, tanpa file output
+    sawit report  [--backend B] [-o HTML] [--excel XLSX | --no-excel]
+                  [--parquet PARQUET] [--csv CSV] [--json JSON] [--mode M] [--no-cache]
+                  [--no-presolve] [--no-precheck] [--no-sensitivity] [--headless]
+                                                   python_solver.py
+    sawit compare [XLSX ...] [-o HTML] [--atol A] [--headless]
+                                                   comparison_solver.py
+    sawit compare --backends [B ...] [--sizes N ...] [--repeat R] [--json JSON]
+                                                   benchmark semua backend
+    sawit portfolio                                ringkasan pemenang --backend portfolio
+    sawit parametric -p PARAMETER KEY AWAL AKHIR [-p ...] [-o CSV] [--json JSON]
+                                                   kurva biaya vs kapasitas (breakpoint basis)
+    sawit plan [--horizon CSV | --periods N] [--window W] [--full] [-o CSV]
+                                                   rencana bulanan dengan stok (rolling horizon)
+    sawit mip [--threads T] [--time-limit S] [--gap G] [--no-warm-start] [-o CSV]
+                                                   rit truk integer + biaya tetap rute (CBC)
+    sawit scenarios (CSV | --random N) [--backend B] [--workers W] [--seed S] [-o CSV]
+                                                   batch what-if paralel (sawit/scenarios.py)
+
+--headless (atau SAWIT_HEADLESS=1) tidak pernah memanggil webbrowser.
+
+Startup dijaga tetap ringan: modul ini hanya meng-import argparse/os dan
+konstanta dari sawit.backends/sawit.report. NumPy, SciPy, PuLP, pandas dan
+openpyxl baru di-import oleh perintah yang membutuhkannya; lihat
+benchmarks/bench_startup.py.
+"""
+
+import argparse
+import os
+
+from sawit.backends import BACKENDS, SOLVE_BACKENDS
+from sawit.report import REPORT_MODES
+
+
+def _headless_default():
+    return os.environ.get('SAWIT_HEADLESS', '') not in ('', '0')
+
+
+def cmd_solve(args):
+    from sawit.pipeline import solve_default
+
+    run = solve_default(args.backend, use_cache=not args.no_cache, presolve=False if args.no_presolve else None,
+                        precheck=False if args.no_precheck else None)
+    return 0 if run.result.status == 'Optimal' else 1
+
+
+def cmd_report(args):
+    from sawit.pipeline import run_report
+
+    run = run_report(args.backend, output=args.output, excel=None if args.no_excel else args.excel,
+                     mode=args.mode, headless=args.headless, use_cache=not args.no_cache,
+                     sensitivity=not args.no_sensitivity, presolve=False if args.no_presolve else None,
+                     precheck=False if args.no_precheck else None, parquet=args.parquet, csv=args.csv,
+                     summary_json=args.json)
+    # Output yang gagal ditulis (mis. pyarrow tidak ada, direktori tidak ada)
+    return 0 if all(result.ok for result in run.outputs) else 1
+
+
+def cmd_compare(args):
+    # Toleransi yang tidak diberikan memakai default sawit/comparison.py
+    tolerances = {name: value for name, value in
+                  (('qty_atol', args.atol), ('cost_atol', args.cost_atol), ('rtol', args.rtol))
+                  if value is not None}
+
+    if args.backends is not None:
+        from sawit.benchmark import BENCHMARK_JSON, BENCHMARK_OUTPUT, DEFAULT_SIZES, run_benchmark
+
+        payload = run_benchmark(args.output or BENCHMARK_OUTPUT, args.json or BENCHMARK_JSON,
+                                backends=args.backends or None,
+                                sizes=DEFAULT_SIZES if args.sizes is None else args.sizes,
+                                repeat=args.repeat, headless=args.headless, mode=args.mode, **tolerances)
+        return 0 if all(e['agreement']['agree'] for e in payload['instances']) else 1
+
+    from sawit.compare import COMPARISON_OUTPUT, run_compare
+
+    run_compare(args.output or COMPARISON_OUTPUT, headless=args.headless,
+                artifact_paths=args.artifacts or None, backend=args.backend, mode=args.mode, **tolerances)
+    return 0
+
+
+def cmd_portfolio(args):
+    from sawit.portfolio import history, print_summary
+
+    print_summary(history())
+    return 0
+
+
+def cmd_parametric(args):
+    from sawit.parametric import run_parametric
+
+    params = [(parameter, key, float(start), float(end)) for parameter, key, start, end in args.param]
+    curve = run_parametric(params, output=args.output, json_file=args.json)
+    return 0 if curve.points else 1
+
+
+def cmd_plan(args):
+    from sawit.multiperiod import run_plan
+
+    plan = run_plan(args.horizon, periods=args.periods, window=args.window, full=args.full,
+                    output=args.output, n_kebun=args.sintetis)
+    return 0 if plan.status == 'Optimal' else 1
+
+
+def cmd_mip(args):
+    from sawit.mip import run_mip
+
+    result = run_mip(args.truk_tbs, args.truk_cpo, args.biaya_tetap_tbs, args.biaya_tetap_cpo,
+                     threads=args.threads, time_limit=args.time_limit, gap=args.gap,
+                     warm_start=not args.no_warm_start, output=args.output, n_kebun=args.sintetis)
+    return 0 if result.mip['solution'] in ('Optimal Solution Found', 'Solution Found') else 1
+
+
+def cmd_scenarios(args):
+    from sawit.scenarios import run_batch
+
+    rows = run_batch(args.perturbations, args.random, output=args.output, backend=args.backend,
+                     workers=args.workers, seed=args.seed)
+    return 1 if any(row['status'] == 'Error' for row in rows) else 0
+
+
+def build_parser():
+    from sawit.pipeline import EXCEL_OUTPUT, HTML_OUTPUT
+
+    parser = argparse.ArgumentParser(prog='sawit', description="Optimasi distribusi TBS/CPO PT Sawit Makmur Sejahtera")
+    commands = parser.add_subparsers(dest='command', required=True, metavar='PERINTAH')
+
+    def add_backend(p):
+        p.add_argument('--backend', choices=SOLVE_BACKENDS, default=None,
+                       help="backend solver; portfolio = balap semua konfigurasi solver, "
+                            "decomp = dekomposisi Benders per region (SAWIT_REGIONS) "
+                            "(default: SAWIT_SOLVER atau cbc)")
+
+    def add_cache(p):
+        p.add_argument('--no-cache', action='store_true',
+                       help="selalu solve ulang, abaikan cache hasil (atau SAWIT_RESULT_CACHE=0)")
+
+    def add_presolve(p):
+        p.add_argument('--no-presolve', action='store_true',
+                       help="solve jaringan asli tanpa reduksi sawit/presolve.py (atau SAWIT_PRESOLVE=0)")
+        p.add_argument('--no-precheck', action='store_true',
+                       help="langsung panggil solver tanpa pre-check max-flow sawit/feasibility.py "
+                            "(atau SAWIT_PRECHECK=0)")
+
+    def add_headless(p):
+        p.add_argument('--headless', action='store_true', default=_headless_default(),
+                       help="jangan buka browser (default: SAWIT_HEADLESS)")
+
+    p = commands.add_parser('solve', help="solve model dan tampilkan ringkasan")
+    add_backend(p)
+    add_cache(p)
+    add_presolve(p)
+    p.set_defaults(func=cmd_solve)
+
+    p = commands.add_parser('report', help="solve lalu tulis HTML report dan Excel")
+    add_backend(p)
+    p.add_argument('-o', '--output', default=HTML_OUTPUT, help=f"file HTML (default: {HTML_OUTPUT})")
+    p.add_argument('--excel', default=EXCEL_OUTPUT, help=f"file Excel (default: {EXCEL_OUTPUT})")
+    p.add_argument('--no-excel', action='store_true', help="lewati export Excel (openpyxl tidak di-import)")
+    p.add_argument('--parquet', help="tulis juga tabel alokasi ke Parquet (butuh pyarrow)")
+    p.add_argument('--csv', help="tulis juga tabel alokasi ke CSV")
+    p.add_argument('--json', help="tulis juga ringkasan (biaya, verifikasi, produksi, demand) ke JSON")
+    p.add_argument('--mode', choices=('auto',) + REPORT_MODES, default=None,
+                   help="tabel report: <tr> atau tabel virtual JSON (default: SAWIT_REPORT atau auto)")
+    add_cache(p)
+    add_presolve(p)
+    p.add_argument('--no-sensitivity', action='store_true',
+                   help="lewati tabel shadow price, reduced cost dan ranging (sawit/sensitivity.py)")
+    add_headless(p)
+    p.set_defaults(func=cmd_report)
+
+    p = commands.add_parser('compare', help="report perbandingan solusi (Excel Solver vs Python PuLP)")
+    p.add_argument('artifacts', nargs='*', metavar='XLSX',
+                   help="workbook solusi (Excel Solver atau export Python), minimal dua; "
+                        "default: workbook Excel Solver vs hasil Python")
+    add_backend(p)
+    p.add_argument('-o', '--output', help="file HTML (default: perbandingan_solver_point3c.html)")
+    p.add_argument('--atol', type=float, help="toleransi absolut alokasi/produksi dalam ton (default: 0.1)")
+    p.add_argument('--cost-atol', type=float, help="toleransi absolut biaya dalam rupiah (default: 1)")
+    p.add_argument('--rtol', type=float, help="toleransi relatif (default: 1e-6)")
+    p.add_argument('--mode', choices=('auto',) + REPORT_MODES, default=None,
+                   help="tabel report: <tr> atau tabel virtual JSON (default: SAWIT_REPORT atau auto)")
+    p.add_argument('--backends', nargs='*', choices=BACKENDS, default=None, metavar='B',
+                   help="benchmark: jalankan backend ini (tanpa nilai: semua yang tersedia) pada "
+                        "instance yang sama; HTML default benchmark_solver.html")
+    p.add_argument('--sizes', nargs='*', type=int, metavar='N',
+                   help="benchmark: jumlah kebun instance sintetis (default: 10 100 1000)")
+    p.add_argument('--repeat', type=int, default=3, help="benchmark: ulangan solve per backend (default: 3)")
+    p.add_argument('--json', help="benchmark: file JSON hasil (default: benchmark_solver.json)")
+    add_headless(p)
+    p.set_defaults(func=cmd_compare)
+
+    p = commands.add_parser('portfolio', help="ringkasan pemenang balapan --backend portfolio")
+    p.set_defaults(func=cmd_portfolio)
+
+    p = commands.add_parser('parametric', help="kurva total biaya optimal vs kapasitas pabrik/supply kebun")
+    p.add_argument('-p', '--param', nargs=4, action='append', required=True,
+                   metavar=('PARAMETER', 'KEY', 'AWAL', 'AKHIR'),
+                   help="factory_capacity atau supply_capacity, nama node, nilai awal dan akhir; "
+                        "boleh diulang (semua parameter bergerak bersama)")
+    p.add_argument('-o', '--output', default='kurva_parametrik.csv',
+                   help="file CSV kurva (default: kurva_parametrik.csv)")
+    p.add_argument('--json', help="tulis juga kurva lengkap (termasuk pergantian basis) ke JSON")
+    p.set_defaults(func=cmd_parametric)
+
+    p = commands.add_parser('plan', help="rencana multi-periode dengan stok TBS/CPO (rolling horizon)")
+    p.add_argument('--horizon', metavar='CSV',
+                   help="data per periode dan gudang (format di sawit/multiperiod.py); "
+                        "default: pola musiman dari data statis")
+    p.add_argument('--periods', type=int, default=24, help="jumlah periode pola musiman (default: 24)")
+    p.add_argument('--window', type=int, default=6, help="periode per jendela rolling horizon (default: 6)")
+    p.add_argument('--full', action='store_true', help="solve juga seluruh horizon sebagai satu LP dan "
+                                                       "tampilkan selisih biayanya")
+    p.add_argument('--sintetis', type=int, metavar='N', help="pakai instance sintetis N kebun (sawit/instances.py)")
+    p.add_argument('-o', '--output', default='rencana_bulanan.csv',
+                   help="file CSV rencana per periode (default: rencana_bulanan.csv)")
+    p.set_defaults(func=cmd_plan)
+
+    p = commands.add_parser('mip', help="model MIP: rit truk integer dan biaya tetap rute (CBC)")
+    p.add_argument('--truk-tbs', type=float, default=10.0, help="ton TBS per rit truk (default: 10)")
+    p.add_argument('--truk-cpo', type=float, default=25.0, help="ton CPO per rit truk tangki (default: 25)")
+    p.add_argument('--biaya-tetap-tbs', type=float, default=1_500_000,
+                   help="Rp per rute TBS yang dibuka (default: 1.500.000)")
+    p.add_argument('--biaya-tetap-cpo', type=float, default=2_500_000,
+                   help="Rp per rute CPO yang dibuka (default: 2.500.000)")
+    p.add_argument('--threads', type=int, help="thread branch-and-cut CBC (default: bawaan CBC)")
+    p.add_argument('--time-limit', type=float, metavar='DETIK', help="batas waktu CBC")
+    p.add_argument('--gap', type=float, help="gap relatif untuk berhenti, mis. 0.01 (default: bawaan CBC)")
+    p.add_argument('--no-warm-start', action='store_true', help="jangan mulai dari solusi LP kontinu yang dibulatkan")
+    p.add_argument('--sintetis', type=int, metavar='N', help="pakai instance sintetis N kebun (sawit/instances.py)")
+    p.add_argument('-o', '--output', default='rencana_truk.csv',
+                   help="file CSV truk dan rute per rute (default: rencana_truk.csv)")
+    p.set_defaults(func=cmd_mip)
+
+    p = commands.add_parser('scenarios', help="batch skenario what-if (demand, biaya, outage pabrik) paralel")
+    source = p.add_mutually_exclusive_group(required=True)
+    source.add_argument('perturbations', nargs='?', metavar='CSV',
+                        help="CSV perturbasi scenario,parameter,key,op,value (format di sawit/scenarios.py)")
+    source.add_argument('--random', type=int, metavar='N',
+                        help="buat N skenario acak (demand ±20%%, biaya solar, outage)")
+    p.add_argument('--backend', choices=BACKENDS, default='highs', help="backend solver (default: highs)")
+    p.add_argument('--workers', type=int, help="jumlah proses (default: semua core)")
+    p.add_argument('--seed', type=int, default=0, help="seed skenario acak (default: 0)")
+    p.add_argument('-o', '--output', default='hasil_skenario.csv',
+                   help="file CSV hasil per skenario (default: hasil_skenario.csv)")
+    p.set_defaults(func=cmd_scenarios)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
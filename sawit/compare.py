@@ -0,0 +1,743 @@
+"""
+TUGAS UTS - TEKNIK RISET OPERASIONAL
+PERBANDINGAN SOLUSI DARI DUA SOFTWARE BERBEDA
+
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/compare.py
+Deskripsi: Membandingkan hasil Excel Solver vs Python PuLP
+           dan menampilkan dalam format HTML interaktif
+           (comparison_solver.py / sawit compare)
+
+Data dan verdict berasal dari engine sawit/comparison.py: artefak solusi
+dimuat dari workbook (Excel Solver, export Python) atau dari solve langsung,
+lalu semua angka, status IDENTIK/BERBEDA dan kesimpulan di report dihitung
+dari hasil perbandingan tersebut. Harness benchmark (sawit/benchmark.py)
+memakai layout yang sama ditambah tabel waktu/iterasi/memori per backend.
+"""
+
+import os
+
+from sawit.comparison import COST_METRICS, QTY_ATOL, COST_ATOL, RTOL, SECTIONS, compare, load_artifact
+from sawit.report import report_mode
+from sawit.vtable import ASSETS, virtual_table
+
+COMPARISON_OUTPUT = 'perbandingan_solver_point3c.html'
+EXCEL_SOLVER_WORKBOOK = 'implementasi kebun sawit.xlsx'
+PYTHON_EXPORT = 'hasil_python_solver.xlsx'
+
+# Judul tabel per bagian
+SECTION_TITLES = {
+    'alokasi_tbs': '🚛 PERBANDINGAN ALOKASI TBS',
+    'alokasi_cpo': '📦 PERBANDINGAN ALOKASI CPO',
+    'produksi_cpo': '🏭 PERBANDINGAN PRODUKSI CPO',
+}
+
+# Baris perbandingan dicetak ke konsol paling banyak sejumlah ini per bagian
+MAX_PRINTED_ROWS = 20
+
+_HEAD = """<!DOCTYPE html>
+<html lang="id">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Perbandingan Solver</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            color: #333;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }
+        .header p { font-size: 1.2em; opacity: 0.9; }
+        .main-content { padding: 40px; }
+        .section {
+            margin-bottom: 40px;
+            background: #f8f9fa;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .section h2 {
+            color: #1e3c72;
+            margin-bottom: 20px;
+            font-size: 1.8em;
+            border-bottom: 3px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .comparison-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin: 30px 0;
+        }
+        .solver-card {
+            background: white;
+            padding: 30px;
+            border-radius: 12px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            border-top: 5px solid #667eea;
+        }
+        .solver-card h3 {
+            color: #1e3c72;
+            font-size: 1.5em;
+            margin-bottom: 20px;
+            text-align: center;
+        }
+        .solver-card .metric {
+            margin: 15px 0;
+            padding: 10px;
+            background: #f8f9fa;
+            border-radius: 8px;
+        }
+        .solver-card .metric .label {
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 5px;
+        }
+        .solver-card .metric .value {
+            color: #1e3c72;
+            font-size: 1.3em;
+            font-weight: bold;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            background: white;
+            border-radius: 10px;
+            overflow: hidden;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        th {
+            background: #1e3c72;
+            color: white;
+            padding: 15px;
+            text-align: left;
+            font-weight: 600;
+        }
+        td { padding: 12px 15px; border-bottom: 1px solid #eee; }
+        tr:hover { background: #f5f5f5; }
+        .identical { color: #28a745; font-weight: bold; }
+        .different { color: #dc3545; font-weight: bold; }
+        .validation {
+            background: #d4edda;
+            border: 3px solid #28a745;
+            color: #155724;
+            padding: 30px;
+            border-radius: 15px;
+            margin: 30px 0;
+            text-align: center;
+        }
+        .validation h3 {
+            font-size: 2em;
+            margin-bottom: 15px;
+        }
+        .validation.different {
+            background: #f8d7da;
+            border-color: #dc3545;
+            color: #721c24;
+        }
+        .validation p {
+            font-size: 1.2em;
+            line-height: 1.6;
+        }
+        .analysis {
+            background: white;
+            padding: 25px;
+            border-radius: 12px;
+            margin: 20px 0;
+            border-left: 5px solid #667eea;
+        }
+        .analysis h4 {
+            color: #1e3c72;
+            margin-bottom: 15px;
+        }
+        .analysis ul {
+            list-style-position: inside;
+            line-height: 1.8;
+        }
+        .footer {
+            background: #1e3c72;
+            color: white;
+            text-align: center;
+            padding: 30px;
+        }
+    </style>
+</head>
+"""
+
+
+# ================================================================================
+# ARTEFAK
+# ================================================================================
+
+def default_artifacts(backend=None):
+    """Workbook Excel Solver + hasil Python (export xlsx jika ada, selain itu
+    solve langsung; lihat sawit/pipeline.py)."""
+    from sawit.comparison import from_result
+
+    artifacts = [load_artifact(EXCEL_SOLVER_WORKBOOK)]
+    if os.path.exists(PYTHON_EXPORT):
+        artifacts.append(load_artifact(PYTHON_EXPORT))
+    else:
+        from sawit.pipeline import solve_default
+
+        run = solve_default(backend)
+        artifacts.append(from_result(run.network, run.result, name='Python PuLP'))
+    return artifacts
+
+
+# ================================================================================
+# FORMAT
+# ================================================================================
+
+def _key_label(key):
+    return ' → '.join(key) if isinstance(key, tuple) else str(key)
+
+
+def _num(value, suffix=' ton'):
+    return '–' if value != value else f"{value:,.2f}".rstrip('0').rstrip('.') + suffix
+
+
+def _rp(value):
+    return '–' if value != value else f"Rp {value:,.0f}"
+
+
+def _status(match):
+    return ('identical', '✓ IDENTIK') if match else ('different', '✗ BERBEDA')
+
+
+def _pct(part, total):
+    return part / total * 100 if total else float('nan')
+
+
+# ================================================================================
+# KONSOL
+# ================================================================================
+
+def print_analysis(result):
+    names = result.names
+    width = max(len(n) for n in names)
+    ref = result.reference
+
+    print(f"\n1. PERBANDINGAN BIAYA:")
+    for key, values, diffs, match in result.costs.rows():
+        print(f"   {COST_METRICS[key]}:")
+        for j, name in enumerate(names):
+            note = '' if j == ref else f"  (selisih {_rp(diffs[j])})"
+            print(f"     {name:<{width}} : {_rp(values[j])}{note}")
+        print(f"     {'✓ IDENTIK' if match else '⚠️  BERBEDA'}")
+
+    for i, (name, section) in enumerate(result.sections.items(), start=2):
+        title = SECTIONS[name][0]
+        print(f"\n{i}. PERBANDINGAN {title.upper()}:")
+        different = [row for row in section.rows() if not row[3]]
+        for key, values, _, _ in different[:MAX_PRINTED_ROWS]:
+            shown = ', '.join(f"{n}={_num(v, '')}" for n, v in zip(names, values))
+            print(f"   ⚠️  {_key_label(key)}: {shown}")
+        if len(different) > MAX_PRINTED_ROWS:
+            print(f"   ... dan {len(different) - MAX_PRINTED_ROWS} baris berbeda lainnya")
+        if section.identical:
+            print(f"   ✅ {title} IDENTIK! ({len(section.keys)} baris)")
+        else:
+            print(f"   ⚠️  {title} BERBEDA: {section.n_different} dari {len(section.keys)} baris "
+                  f"(selisih maks {section.max_abs_diff:,.2f} ton)")
+
+    for name, warning in result.warnings():
+        print(f"\n   ⚠️  {name}: {warning}")
+
+
+# ================================================================================
+# HTML
+# ================================================================================
+
+def _solver_cards(result):
+    cards = []
+    for a in result.artifacts:
+        metrics = ''.join(f"""
+                        <div class="metric">
+                            <div class="label">{label}</div>
+                            <div class="value">{_rp(a.costs.get(key, float('nan')))}</div>
+                        </div>""" for key, label in COST_METRICS.items())
+        status = f"""
+                        <div class="metric">
+                            <div class="label">Status Solver</div>
+                            <div class="value" style="font-size: 1em;">{a.status}</div>
+                        </div>""" if a.status else ''
+        cards.append(f"""
+                    <div class="solver-card">
+                        <h3>{'📈' if a.engine == 'Simplex LP' else '🐍'} {a.name}</h3>{metrics}
+                        <div class="metric">
+                            <div class="label">Solver Engine</div>
+                            <div class="value" style="font-size: 1em;">{a.engine}</div>
+                        </div>{status}
+                        <div class="metric">
+                            <div class="label">Sumber</div>
+                            <div class="value" style="font-size: 1em;">{a.source}</div>
+                        </div>
+                    </div>
+                    """)
+    return f"""
+            <div class="section">
+                <h2>📊 PERBANDINGAN HASIL OPTIMASI</h2>
+
+                <div class="comparison-grid" style="grid-template-columns: repeat({len(cards)}, 1fr);">{''.join(cards)}
+                </div>
+            </div>
+"""
+
+
+def _detail_table(result):
+    names, ref = result.names, result.reference
+    others = [j for j in range(len(names)) if j != ref]
+    header = ''.join(f"\n                            <th>{n}</th>" for n in names)
+    header += ''.join(f"\n                            <th>Selisih ({names[j]})</th>" for j in others)
+
+    rows = []
+    for key, values, diffs, match in result.costs.rows():
+        cls, text = _status(match)
+        cells = ''.join(f"\n                            <td>{_rp(v)}</td>" for v in values)
+        cells += ''.join(f"\n                            <td>{_rp(diffs[j])}</td>" for j in others)
+        rows.append(f"""
+                        <tr>
+                            <td><strong>{COST_METRICS[key]}</strong></td>{cells}
+                            <td class="{cls}">{text}</td>
+                        </tr>""")
+
+    # Porsi biaya: dihitung per artefak, cocok jika selisih < 0.05 poin persen
+    for key in ('biaya_tbs', 'biaya_cpo'):
+        pcts = [_pct(a.costs.get(key, float('nan')), a.costs.get('total_biaya', float('nan')))
+                for a in result.artifacts]
+        diffs = [p - pcts[ref] for p in pcts]
+        cls, text = _status(all(abs(d) < 0.05 for d in diffs))
+        cells = ''.join(f"\n                            <td>{p:.1f}%</td>" for p in pcts)
+        cells += ''.join(f"\n                            <td>{diffs[j]:+.1f}%</td>" for j in others)
+        rows.append(f"""
+                        <tr>
+                            <td><strong>% {COST_METRICS[key]}</strong></td>{cells}
+                            <td class="{cls}">{text}</td>
+                        </tr>""")
+
+    return f"""
+            <div class="section">
+                <h2>📋 TABEL PERBANDINGAN DETAIL</h2>
+
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Metrik</th>{header}
+                            <th>Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>{''.join(rows)}
+                    </tbody>
+                </table>
+            </div>
+"""
+
+
+def _section_rows(section, names):
+    header = ''.join(f"\n                            <th>{n}</th>" for n in names)
+    yield f"""                <table>
+                    <thead>
+                        <tr>
+                            <th>{SECTIONS[section.name][1]}</th>{header}
+                            <th>Selisih Maks</th>
+                            <th>Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+    for key, values, diffs, match in section.rows():
+        cls, text = _status(match)
+        cells = ''.join(f"\n                            <td>{_num(v)}</td>" for v in values)
+        yield f"""
+                        <tr>
+                            <td><strong>{_key_label(key)}</strong></td>{cells}
+                            <td>{_num(max(abs(d) for d in diffs))}</td>
+                            <td class="{cls}">{text}</td>
+                        </tr>
+"""
+    yield """
+                    </tbody>
+                </table>
+"""
+
+
+def _section_virtual(section, names, compress):
+    columns = [{'key': 'key', 'label': SECTIONS[section.name][1], 'fmt': 'key'}]
+    columns += [{'key': f"s{j}", 'label': n, 'fmt': 'num', 'suffix': ' ton'} for j, n in enumerate(names)]
+    columns += [
+        {'key': 'diff', 'label': 'Selisih Maks', 'fmt': 'num', 'suffix': ' ton'},
+        {'key': 'status', 'label': 'Status', 'fmt': 'flag', 'labels': ['✗ BERBEDA', '✓ IDENTIK'],
+         'classes': ['different', 'identical']},
+    ]
+    rows = ((_key_label(key), *values, max(abs(d) for d in diffs), match)
+            for key, values, diffs, match in section.rows())
+    return virtual_table(f"tabel-{section.name.replace('_', '-')}", columns, rows, compress)
+
+
+def _benchmark_section(benchmark):
+    """Tabel hasil harness sawit/benchmark.py: satu baris per (instance, backend)."""
+    def cell(value, spec, suffix=''):
+        return '–' if value is None else f"{value:{spec}}{suffix}"
+
+    rows = []
+    for entry in benchmark['instances']:
+        runs = entry['runs']
+        fastest = min(runs, key=lambda r: r['build_time'] + r['solve_time'])['backend']
+        cls, text = ('identical', '✓ SAMA') if entry['agreement']['agree'] else ('different', '✗ BERBEDA')
+        for i, run in enumerate(runs):
+            label = f"⚡ {run['label']}" if run['backend'] == fastest else run['label']
+            instance = f"""
+                            <td rowspan="{len(runs)}"><strong>{entry['name']}</strong><br>{entry['n_vars']:,} variabel</td>""" if i == 0 else ''
+            agreement = f"""
+                            <td rowspan="{len(runs)}" class="{cls}">{text}</td>""" if i == 0 else ''
+            rows.append(f"""
+                        <tr>{instance}
+                            <td>{label}</td>
+                            <td>{run['status']}</td>
+                            <td>{_rp(run['objective']) if run['objective'] is not None else '–'}</td>
+                            <td>{cell(run['build_time'], '.3f', ' s')}</td>
+                            <td>{cell(run['solve_time'], '.3f', ' s')}</td>
+                            <td>{cell(run['iterations'], ',d')}</td>
+                            <td>{cell(run['peak_rss_mb'], ',.1f', ' MB')}</td>
+                            <td>{cell(run.get('solver_rss_mb'), ',.1f', ' MB')}</td>{agreement}
+                        </tr>""")
+
+    env = benchmark['environment']
+    return f"""
+            <div class="section">
+                <h2>⏱️ BENCHMARK SOLVER</h2>
+
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Instance</th>
+                            <th>Backend</th>
+                            <th>Status</th>
+                            <th>Objective</th>
+                            <th>Build</th>
+                            <th>Solve (median)</th>
+                            <th>Iterasi</th>
+                            <th>Memori Worker</th>
+                            <th>Memori Subprocess Solver</th>
+                            <th>Objective Sama</th>
+                        </tr>
+                    </thead>
+                    <tbody>{''.join(rows)}
+                    </tbody>
+                </table>
+                <p style="margin-top: 15px;">
+                    ⚡ = build + solve tercepat per instance. Median dari {benchmark['repeat']}x solve,
+                    setiap backend di proses baru; memori = puncak RSS worker dan subprocess
+                    solver (CBC/GLPK/OR-Tools) dicatat terpisah. Python {env['python']}, {env['cpu_count']} CPU.
+                    Tabel perbandingan di bawah: instance {benchmark.get('detail_instance', '')}.
+                </p>
+            </div>
+"""
+
+
+def _validation(result):
+    names = result.names
+    if result.identical:
+        total = result.artifacts[result.reference].costs.get('total_biaya', float('nan'))
+        return f"""
+            <div class="validation">
+                <h3>✅ HASIL VALIDASI</h3>
+                <p><strong>SEMUA SOLVER MENGHASILKAN SOLUSI YANG IDENTIK!</strong></p>
+                <p style="margin-top: 15px;">
+                    {' dan '.join(names)} menghasilkan:<br>
+                    • Total biaya yang sama: <strong>{_rp(total)}</strong><br>
+                    • {SECTIONS['alokasi_tbs'][0]} yang sama<br>
+                    • {SECTIONS['alokasi_cpo'][0]} yang sama<br>
+                    • {SECTIONS['produksi_cpo'][0]} yang sama
+                </p>
+            </div>
+"""
+    items = []
+    if not result.costs.identical:
+        items.append(f"• Biaya berbeda pada {result.costs.n_different} dari {len(result.costs.keys)} metrik")
+    for name, section in result.sections.items():
+        if not section.identical:
+            items.append(f"• {SECTIONS[name][0]}: {section.n_different} dari {len(section.keys)} baris berbeda "
+                         f"(selisih maks {section.max_abs_diff:,.2f} ton)")
+    items += [f"• {name}: {warning}" for name, warning in result.warnings()]
+    return f"""
+            <div class="validation different">
+                <h3>⚠️ HASIL VALIDASI</h3>
+                <p><strong>SOLUSI {' DAN '.join(n.upper() for n in names)} BERBEDA</strong></p>
+                <p style="margin-top: 15px;">
+                    {'<br>'.join(items)}
+                </p>
+                <p style="margin-top: 15px; font-size: 1em; opacity: 0.8;">
+                    Toleransi: {QTY_ATOL} ton / Rp {COST_ATOL:,.0f} absolut, {RTOL:g} relatif.
+                </p>
+            </div>
+"""
+
+
+def _analysis(result):
+    if result.identical:
+        consistency = """
+                        <li>Semua software menghasilkan solusi optimal yang identik</li>
+                        <li>Tidak ada perbedaan dalam alokasi maupun biaya</li>
+                        <li>Membuktikan keunikan solusi optimal untuk masalah ini</li>"""
+        reliability = """
+                        <li>Model matematis dibangun dengan benar</li>
+                        <li>Semua constraint terimplementasi dengan tepat</li>
+                        <li>Fungsi tujuan sesuai dengan objektif bisnis</li>"""
+    else:
+        different = [SECTIONS[n][0] for n, s in result.sections.items() if not s.identical]
+        if not result.costs.identical:
+            different.insert(0, 'Biaya')
+        consistency = f"""
+                        <li>Solusi berbeda pada: {', '.join(different)}</li>
+                        <li>Periksa apakah semua artefak berasal dari data input yang sama</li>
+                        <li>Biaya sama dengan alokasi berbeda menandakan solusi optimal ganda</li>"""
+        reliability = """
+                        <li>Periksa status solver: solusi infeasible tidak bisa dibandingkan</li>
+                        <li>Periksa rumus total di workbook (lihat peringatan di atas)</li>
+                        <li>Jalankan ulang kedua solver dengan data yang sama</li>"""
+    return f"""
+            <div class="section">
+                <h2>📝 ANALISIS & INTERPRETASI</h2>
+
+                <div class="analysis">
+                    <h4>1. Konsistensi Solusi</h4>
+                    <ul>{consistency}
+                    </ul>
+                </div>
+
+                <div class="analysis">
+                    <h4>2. Keandalan Model</h4>
+                    <ul>{reliability}
+                    </ul>
+                </div>
+
+                <div class="analysis">
+                    <h4>3. Perbandingan Solver</h4>
+                    <ul>
+                        <li><strong>Excel Solver:</strong> User-friendly, GUI-based, cocok untuk model sederhana</li>
+                        <li><strong>Python PuLP:</strong> Programmable, scalable, cocok untuk model kompleks dan otomasi</li>
+                        <li>Keduanya menggunakan algoritma Simplex untuk Linear Programming</li>
+                        <li>{'Hasil identik membuktikan keduanya reliable untuk masalah ini' if result.identical else 'Hasil berbeda: validasi silang belum berhasil'}</li>
+                    </ul>
+                </div>
+
+                <div class="analysis">
+                    <h4>4. Rekomendasi Penggunaan</h4>
+                    <ul>
+                        <li><strong>Gunakan Excel:</strong> Untuk analisis cepat, presentasi, dan model &lt; 200 variabel</li>
+                        <li><strong>Gunakan Python:</strong> Untuk model besar, otomasi, integrasi sistem, dan reproducibility</li>
+                        <li>Untuk tugas akademik: Gunakan keduanya sebagai cross-validation</li>
+                    </ul>
+                </div>
+            </div>
+"""
+
+
+def _conclusion(result):
+    names = ' dan '.join(result.names)
+    total = result.artifacts[result.reference].costs.get('total_biaya', float('nan'))
+    if result.identical:
+        points = [
+            ('Validasi Silang Berhasil',
+             f"{names} menghasilkan solusi optimal yang <strong>100% identik</strong>, "
+             f"membuktikan kebenaran model dan implementasi."),
+            ('Solusi Optimal',
+             f"Untuk masalah distribusi PT Sawit Makmur Sejahtera, solusi optimal memiliki "
+             f"total biaya <strong>{_rp(total)}/bulan</strong>."),
+            ('Model Terverifikasi',
+             "Cross-validation dengan solver berbeda memastikan tidak ada kesalahan dalam "
+             "formulasi model, constraint, atau objective function."),
+        ]
+    else:
+        n_rows = sum(len(s.keys) for s in result.sections.values())
+        n_diff = sum(s.n_different for s in result.sections.values())
+        points = [
+            ('Validasi Silang Belum Berhasil',
+             f"{names} berbeda pada <strong>{n_diff} dari {n_rows}</strong> baris alokasi/produksi "
+             f"dan {result.costs.n_different} metrik biaya."),
+            ('Tindak Lanjut',
+             "Samakan data input dan pastikan setiap solver melaporkan status optimal sebelum "
+             "hasilnya dibandingkan kembali."),
+        ]
+    body = ''.join(f"""
+                    <p><strong>{i}. {title}</strong></p>
+                    <p style="margin-left: 20px; margin-bottom: 15px;">
+                        {text}
+                    </p>
+                    """ for i, (title, text) in enumerate(points, start=1))
+    return f"""
+            <div class="section">
+                <h2>✅ KESIMPULAN </h2>
+
+                <div style="background: white; padding: 25px; border-radius: 12px; line-height: 1.8; font-size: 1.1em;">{body}
+                </div>
+            </div>
+"""
+
+
+def write_comparison_report(path, result, mode=None, benchmark=None):
+    """Tulis report perbandingan. Tabel per rute memakai <tr> atau tabel
+    virtual JSON untuk network besar (SAWIT_REPORT, lihat sawit/report.py).
+    benchmark: payload JSON sawit/benchmark.py, ditampilkan setelah tabel detail."""
+    names = result.names
+    mode = report_mode(max(len(s.keys) for s in result.sections.values()), mode)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_HEAD)
+        f.write(f"""<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔍 PERBANDINGAN SOLVER</h1>
+            <p>{' vs '.join(names)}</p>
+            <p style="font-size: 0.9em; margin-top: 10px;">Teknik Riset Operasional</p>
+        </div>
+
+        <div class="main-content">""")
+        f.write(_solver_cards(result))
+        f.write(_detail_table(result))
+        if benchmark is not None:
+            f.write(_benchmark_section(benchmark))
+        for name, section in result.sections.items():
+            f.write(f"""
+            <div class="section">
+                <h2>{SECTION_TITLES[name]}</h2>
+
+""")
+            if mode == 'rows':
+                f.writelines(_section_rows(section, names))
+            else:
+                f.write(_section_virtual(section, names, mode == 'json-gzip'))
+            f.write("            </div>\n")
+        f.write(_validation(result))
+        f.write(_analysis(result))
+        f.write(_conclusion(result))
+        f.write("""        </div>
+
+        <div class="footer">
+            <p><strong>Perbandingan Solver</strong></p>
+            <p>Teknik Riset Operasional</p>
+            <p>Program Studi Teknik Informatika</p>
+        </div>
+    </div>
+""")
+        if mode != 'rows':
+            f.write(ASSETS)
+        f.write("</body>\n</html>\n")
+
+
+def open_report(path):
+    import webbrowser
+
+    print(f"✓ Membuka browser...")
+
+    try:
+        webbrowser.open('file://' + os.path.abspath(path))
+        print("✓ Browser terbuka!")
+    except Exception as e:
+        print(f"⚠️  Browser tidak bisa dibuka otomatis: {e}")
+        print(f"   Silakan buka manual: {path}")
+
+
+# ================================================================================
+# ALUR LENGKAP (comparison_solver.py / sawit compare)
+# ================================================================================
+
+def run_compare(output_file=COMPARISON_OUTPUT, headless=False, artifact_paths=None, backend=None,
+                qty_atol=QTY_ATOL, cost_atol=COST_ATOL, rtol=RTOL, mode=None):
+    """Bandingkan solusi, tulis HTML report dan (kecuali headless) buka di browser.
+
+    artifact_paths: daftar workbook solusi (minimal dua); default Excel Solver
+    vs hasil Python (lihat default_artifacts).
+    """
+    print("="*80)
+    print("PERBANDINGAN SOLUSI SOLVER")
+    print("="*80)
+    print()
+
+    print("📊 Mengumpulkan data hasil...")
+
+    if artifact_paths:
+        artifacts = [load_artifact(path) for path in artifact_paths]
+    else:
+        artifacts = default_artifacts(backend)
+    for a in artifacts:
+        print(f"✓ Data {a.name} loaded ({a.source})")
+
+    print("\n" + "="*80)
+    print("ANALISIS PERBANDINGAN")
+    print("-" * 80)
+
+    result = compare(artifacts, qty_atol=qty_atol, cost_atol=cost_atol, rtol=rtol)
+    print_analysis(result)
+
+    print("\n" + "="*80)
+    print("MEMBUAT HTML REPORT PERBANDINGAN")
+    print("-" * 80)
+
+    write_comparison_report(output_file, result, mode)
+    print(f"✓ HTML Report berhasil dibuat: {output_file}")
+
+    # Buka di browser
+    if not headless:
+        open_report(output_file)
+
+    # ================================================================================
+    # KESIMPULAN AKHIR
+    # ================================================================================
+
+    print("\n" + "="*80)
+    print("KESIMPULAN ")
+    print("="*80)
+
+    if result.identical:
+        total = artifacts[result.reference].costs.get('total_biaya', float('nan'))
+        print(f"""
+✅ VALIDASI BERHASIL!
+
+Semua solver menghasilkan solusi yang IDENTIK:
+  • Total Biaya  : {_rp(total)} (sama)
+  • Alokasi TBS  : Identik 100%
+  • Alokasi CPO  : Identik 100%
+  • Produksi CPO : Identik 100%
+    """)
+    else:
+        print(f"""
+⚠️  TERDAPAT PERBEDAAN!
+
+Ada perbedaan antara {' dan '.join(result.names)}.
+Kemungkinan penyebab:
+  1. Data input berbeda atau salah satu solusi infeasible
+  2. Perbedaan toleransi solver / pembulatan angka
+  3. Multiple optimal solutions
+    """)
+
+    print("="*80)
+    print("✅ POINT 3c SELESAI!")
+    print("="*80)
+    print(f"\nFile HTML: {output_file}")
+    print("Silakan buka di browser untuk melihat perbandingan lengkap.")
+    return result
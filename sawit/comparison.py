@@ -0,0 +1,294 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/comparison.py
+Deskripsi: Engine perbandingan solusi. Memuat dua atau lebih artefak solusi,
+           menyejajarkan rute berdasarkan kunci, lalu menghitung selisih
+           absolut/relatif dan verdict dengan cek toleransi vektor (NumPy).
+
+Artefak yang dikenali:
+    - Workbook Excel Solver (blok "Alokasi TBS", "Pabrik | Produksi CPO | PD..",
+      "Total Biaya ..."), mis. implementasi kebun sawit.xlsx
+    - Export Python (sheet Summary, Alokasi_TBS, Alokasi_CPO), mis.
+      hasil_python_solver.xlsx
+    - SolveResult langsung dari sawit.backends (from_result)
+
+Contoh:
+    a = load_artifact('implementasi kebun sawit.xlsx')
+    b = load_artifact('hasil_python_solver.xlsx')
+    result = compare([a, b])
+    result.identical, result.sections['alokasi_tbs'].n_different
+"""
+
+import os
+import re
+
+import numpy as np
+
+from sawit.loader import _node_name, _pd_name, _rows
+from sawit.solution import Solution
+
+# Bagian yang dibandingkan: nama → (judul, label kunci)
+SECTIONS = {
+    'alokasi_tbs': ('Alokasi TBS', 'Rute (Kebun → Pabrik)'),
+    'alokasi_cpo': ('Alokasi CPO', 'Rute (Pabrik → PD)'),
+    'produksi_cpo': ('Produksi CPO', 'Pabrik'),
+}
+COST_METRICS = {
+    'total_biaya': 'Total Biaya',
+    'biaya_tbs': 'Biaya TBS',
+    'biaya_cpo': 'Biaya CPO',
+}
+
+# Toleransi default: |a - b| <= atol + rtol * |referensi|
+QTY_ATOL = 0.1          # ton
+COST_ATOL = 1.0         # rupiah
+RTOL = 1e-6
+
+
+class SolutionArtifact:
+    """Satu solusi: alokasi TBS/CPO, produksi CPO per pabrik dan biaya."""
+
+    def __init__(self, name, alokasi_tbs, alokasi_cpo, produksi_cpo=None, costs=None,
+                 engine='', source='', status=None):
+        self.name = name
+        self.engine = engine
+        self.source = source
+        self.status = status
+        self.alokasi_tbs = dict(alokasi_tbs)
+        self.alokasi_cpo = dict(alokasi_cpo)
+        if produksi_cpo is None:
+            produksi_cpo = {}
+            for (pabrik, _), qty in self.alokasi_cpo.items():
+                produksi_cpo[pabrik] = produksi_cpo.get(pabrik, 0.0) + qty
+        self.produksi_cpo = dict(produksi_cpo)
+        self.costs = dict(costs or {})
+        if 'total_biaya' not in self.costs and {'biaya_tbs', 'biaya_cpo'} <= self.costs.keys():
+            self.costs['total_biaya'] = self.costs['biaya_tbs'] + self.costs['biaya_cpo']
+
+    def section(self, name):
+        return self.costs if name == 'costs' else getattr(self, name)
+
+    def warnings(self, rtol=RTOL, atol=COST_ATOL):
+        """Inkonsistensi internal artefak (mis. rumus total di workbook salah)."""
+        found = []
+        c = self.costs
+        if {'total_biaya', 'biaya_tbs', 'biaya_cpo'} <= c.keys():
+            parts = c['biaya_tbs'] + c['biaya_cpo']
+            if abs(c['total_biaya'] - parts) > atol + rtol * abs(parts):
+                found.append(f"Total Biaya (Rp {c['total_biaya']:,.0f}) ≠ Biaya TBS + Biaya CPO "
+                             f"(Rp {parts:,.0f})")
+        return found
+
+    def __repr__(self):
+        return (f"SolutionArtifact({self.name!r}, {len(self.alokasi_tbs)} rute TBS, "
+                f"{len(self.alokasi_cpo)} rute CPO)")
+
+
+# ================================================================================
+# LOADER ARTEFAK
+# ================================================================================
+
+def _pabrik_name(label):
+    """'P1', 'P 1', 'Pabrik 1', 'Kirim P1' → 'Pabrik_1'."""
+    m = re.search(r'P(?:abrik)?\s*(\d+)\b', str(label), re.IGNORECASE)
+    return f"Pabrik_{m.group(1)}" if m else None
+
+
+def load_excel_solver(path, name='Excel Solver'):
+    """Solusi dari workbook Excel Solver (sheet pertama)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = list(_rows(wb.worksheets[0]))
+    finally:
+        wb.close()
+
+    alokasi_tbs, alokasi_cpo, produksi, costs = {}, {}, {}, {}
+    labels = {'total biaya tbs': 'biaya_tbs', 'total biaya cpo': 'biaya_cpo', 'total biaya': 'total_biaya'}
+    for i, row in enumerate(rows):
+        first = str(row[0]).strip() if row[0] is not None else ''
+        if first == 'Alokasi TBS':
+            columns = {c: p for c, h in enumerate(row) if c and h is not None
+                       and str(h).lower().startswith('kirim') and (p := _pabrik_name(h))}
+            for data in rows[i + 1:]:
+                if data[0] is None or not str(data[0]).lower().startswith('kebun'):
+                    break
+                for c, pabrik in columns.items():
+                    if data[c] is not None:
+                        alokasi_tbs[(_node_name(data[0]), pabrik)] = float(data[c])
+        elif first == 'Pabrik' and any(str(h).strip() == 'Produksi CPO' for h in row if h is not None):
+            columns = {c: _pd_name(h) for c, h in enumerate(row)
+                       if h is not None and re.fullmatch(r'PD\s*\d+', str(h).strip())}
+            prod_col = next(c for c, h in enumerate(row) if h is not None and str(h).strip() == 'Produksi CPO')
+            for data in rows[i + 1:]:
+                pabrik = _pabrik_name(data[0]) if data[0] is not None else None
+                if pabrik is None:
+                    break
+                if data[prod_col] is not None:
+                    produksi[pabrik] = float(data[prod_col])
+                for c, pusat in columns.items():
+                    if data[c] is not None:
+                        alokasi_cpo[(pabrik, pusat)] = float(data[c])
+        elif first.lower() in labels and len(row) > 1 and isinstance(row[1], (int, float)):
+            costs[labels[first.lower()]] = float(row[1])
+
+    if not alokasi_tbs or not alokasi_cpo:
+        raise ValueError(f"Blok solusi Excel Solver tidak ditemukan di {path}")
+    return SolutionArtifact(name, alokasi_tbs, alokasi_cpo, produksi or None, costs,
+                            engine='Simplex LP', source=os.path.basename(path))
+
+
+def load_python_export(path, name='Python PuLP'):
+    """Solusi dari export Excel python_solver.py (Summary, Alokasi_TBS, Alokasi_CPO)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        def records(sheet):
+            rows = _rows(wb[sheet])
+            header = [str(h) for h in next(rows)]
+            return [dict(zip(header, row)) for row in rows]
+
+        summary = {r['Metrik']: r['Nilai'] for r in records('Summary')}
+        tbs = records('Alokasi_TBS')
+        cpo = records('Alokasi_CPO')
+    finally:
+        wb.close()
+
+    costs = {key: float(summary[label]) for key, label in COST_METRICS.items() if label in summary}
+    return SolutionArtifact(
+        name,
+        {(r['Dari_Kebun'], r['Ke_Pabrik']): float(r['Jumlah_ton']) for r in tbs},
+        {(r['Dari_Pabrik'], r['Ke_PD']): float(r['Jumlah_ton']) for r in cpo},
+        costs=costs, engine='Python PuLP', source=os.path.basename(path),
+    )
+
+
+def load_artifact(path, name=None):
+    """Deteksi jenis workbook lalu muat solusinya."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        sheets = set(wb.sheetnames)
+    finally:
+        wb.close()
+    if {'Summary', 'Alokasi_TBS', 'Alokasi_CPO'} <= sheets:
+        return load_python_export(path, **({'name': name} if name else {}))
+    return load_excel_solver(path, **({'name': name} if name else {}))
+
+
+def from_result(network, result, name=None):
+    """Artefak dari SolveResult (nilai 0 ikut disimpan; rute yang tidak ada di
+    artefak lain dianggap 0)."""
+    solution = Solution.from_result(network, result)
+    biaya_tbs, biaya_cpo = solution.biaya_tbs, solution.biaya_cpo
+    return SolutionArtifact(
+        name or f"Python ({result.label})",
+        dict(zip(network.tbs_routes(), solution.x.tolist())),
+        dict(zip(network.cpo_routes(), solution.y.tolist())),
+        dict(zip(network.pabrik, solution.cpo_out.tolist())),
+        {'total_biaya': result.objective if result.objective is not None else biaya_tbs + biaya_cpo,
+         'biaya_tbs': biaya_tbs, 'biaya_cpo': biaya_cpo},
+        engine=result.label, source='solve langsung', status=result.status,
+    )
+
+
+# ================================================================================
+# ENGINE
+# ================================================================================
+
+class SectionComparison:
+    """Perbandingan satu bagian (kunci × artefak) terhadap artefak referensi."""
+
+    def __init__(self, name, keys, values, atol, rtol, reference=0, missing_as_zero=True):
+        self.name = name
+        self.keys = keys
+        self.values = values                              # (n_kunci, n_artefak), NaN = tidak ada
+        self.reference = reference
+        self.missing = np.isnan(values)
+        filled = np.where(self.missing, 0.0, values) if missing_as_zero else values
+        ref = filled[:, [reference]]
+        self.abs_diff = filled - ref
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.rel_diff = np.where(ref != 0, self.abs_diff / np.abs(ref),
+                                     np.where(self.abs_diff == 0, 0.0, np.inf))
+        self.match = np.abs(self.abs_diff) <= atol + rtol * np.abs(ref)
+        if not missing_as_zero:
+            self.match &= ~self.missing
+        self.row_match = self.match.all(axis=1)
+
+    @property
+    def n_different(self):
+        return int((~self.row_match).sum())
+
+    @property
+    def identical(self):
+        return bool(self.row_match.all())
+
+    @property
+    def max_abs_diff(self):
+        return float(np.abs(self.abs_diff).max()) if self.abs_diff.size else 0.0
+
+    def rows(self):
+        """(kunci, nilai per artefak, selisih per artefak, cocok) per baris."""
+        return zip(self.keys, self.values.tolist(), self.abs_diff.tolist(), self.row_match.tolist())
+
+
+class Comparison:
+    """Hasil compare(): satu SectionComparison per bagian + biaya."""
+
+    def __init__(self, artifacts, sections, costs, reference=0):
+        self.artifacts = artifacts
+        self.sections = sections
+        self.costs = costs
+        self.reference = reference
+
+    @property
+    def names(self):
+        return [a.name for a in self.artifacts]
+
+    @property
+    def identical(self):
+        return self.costs.identical and all(s.identical for s in self.sections.values())
+
+    def warnings(self):
+        return [(a.name, w) for a in self.artifacts for w in a.warnings()]
+
+
+def align(artifacts, section, keys=None):
+    """Sejajarkan nilai satu bagian dari semua artefak berdasarkan kunci.
+
+    Return (keys, values) dengan values array (n_kunci, n_artefak); kunci yang
+    tidak ada di suatu artefak bernilai NaN.
+    """
+    dicts = [a.section(section) for a in artifacts]
+    if keys is None:
+        index = {}
+        for d in dicts:
+            for key in d:
+                index.setdefault(key, len(index))
+        keys = list(index)
+    else:
+        index = {key: i for i, key in enumerate(keys)}
+    values = np.full((len(keys), len(dicts)), np.nan)
+    for j, d in enumerate(dicts):
+        rows = np.fromiter((index[k] for k in d), dtype=np.int64, count=len(d))
+        values[rows, j] = np.fromiter(d.values(), dtype=float, count=len(d))
+    return keys, values
+
+
+def compare(artifacts, qty_atol=QTY_ATOL, cost_atol=COST_ATOL, rtol=RTOL, reference=0):
+    """Bandingkan semua artefak terhadap artefak[reference]."""
+    if len(artifacts) < 2:
+        raise ValueError("Perbandingan membutuhkan minimal dua artefak solusi")
+    sections = {}
+    for name in SECTIONS:
+        keys, values = align(artifacts, name)
+        sections[name] = SectionComparison(name, keys, values, qty_atol, rtol, reference)
+    keys, values = align(artifacts, 'costs', keys=[k for k in COST_METRICS
+                                                   if any(k in a.costs for a in artifacts)])
+    costs = SectionComparison('costs', keys, values, cost_atol, rtol, reference, missing_as_zero=False)
+    return Comparison(artifacts, sections, costs, reference)
@@ -0,0 +1,31 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/data.py
+Deskripsi: Data instance bulanan (kapasitas kebun, kapasitas pabrik, demand
+           PD, yield rate, dan matriks biaya transportasi TBS/CPO).
+"""
+
+supply_capacity = {'Kebun_A': 5000, 'Kebun_B': 4000, 'Kebun_C': 3500}
+factory_capacity = {'Pabrik_1': 6000, 'Pabrik_2': 5000}
+demand = {'PD1': 600, 'PD2': 800, 'PD3': 500, 'PD4': 650}
+yield_rate = 0.22
+
+cost_tbs = {
+    ('Kebun_A', 'Pabrik_1'): 50000, ('Kebun_A', 'Pabrik_2'): 80000,
+    ('Kebun_B', 'Pabrik_1'): 70000, ('Kebun_B', 'Pabrik_2'): 40000,
+    ('Kebun_C', 'Pabrik_1'): 60000, ('Kebun_C', 'Pabrik_2'): 55000,
+}
+
+cost_cpo = {
+    ('Pabrik_1', 'PD1'): 100000, ('Pabrik_1', 'PD2'): 120000,
+    ('Pabrik_1', 'PD3'): 90000, ('Pabrik_1', 'PD4'): 110000,
+    ('Pabrik_2', 'PD1'): 130000, ('Pabrik_2', 'PD2'): 80000,
+    ('Pabrik_2', 'PD3'): 95000, ('Pabrik_2', 'PD4'): 85000,
+}
+
+
+def default_instance():
+    """Salinan data default dalam urutan argumen Network.from_dicts."""
+    return (dict(supply_capacity), dict(factory_capacity), dict(demand),
+            dict(cost_tbs), dict(cost_cpo), yield_rate)
@@ -0,0 +1,469 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/decomposition.py
+Deskripsi: Dekomposisi Benders per region: subproblem regional diselesaikan
+           paralel di process pool dan dikoordinasikan master problem pada
+           baris kapasitas pabrik dan material balance.
+
+Setiap kebun dan PD masuk satu region (mis. provinsi). Rute TBS milik region
+kebunnya dan rute CPO milik region PD-nya, sehingga baris supply dan demand
+bersifat lokal; hanya baris kapasitas pabrik dan material balance yang
+menghubungkan region (satu pabrik melayani banyak region).
+
+Master, per pasangan region r dan pabrik p yang punya rute:
+    a[r,p]   TBS dari kebun region r yang diolah di pabrik p
+    b[r,p]   CPO dari pabrik p ke PD region r
+    θ[r]     perkiraan biaya transport region r
+
+    min Σ_r θ[r]
+        Σ_r a[r,p] <= kapasitas[p]
+        yield · Σ_r a[r,p] − Σ_r b[r,p] = 0
+        Σ_p a[r,p] <= supply region r,  Σ_p b[r,p] >= demand region r
+        + cut Benders
+
+Subproblem region r (a, b tetap): LP transport TBS dan CPO region r dengan
+Σ_k x[k,p] = a[r,p] dan Σ_d y[p,d] = b[r,p]. Dual baris tersebut (∂biaya/∂rhs)
+memberi optimality cut θ[r] >= Q_r(â, b̂) + π·((a, b) − (â, b̂)). Jika
+subproblem infeasible, LP fase 1 (minimasi variabel artifisial) memberi
+feasibility cut 0 >= V_r(â, b̂) + σ·((a, b) − (â, b̂)). Master infeasible
+berarti model lengkap infeasible.
+
+Batas bawah = objective master, batas atas = total biaya subproblem terbaik
+yang feasible; iterasi berhenti jika gap relatif <= GAP_TOL. x/y diambil dari
+subproblem pada titik batas atas terbaik, jadi hasilnya solusi feasible
+model lengkap dengan biaya sama dengan optimum (dalam toleransi).
+
+    result = solve(network, 'decomp')          # atau --backend decomp
+    result.decomposition['iterations']         # LB, UB dan gap per iterasi
+
+Region default (assign_regions): pabrik dibagi menjadi N kelompok berurutan
+dan setiap kebun/PD ikut region pabrik dengan rute termurahnya. Region
+eksplisit: CSV node,region (read_regions). SAWIT_REGIONS=N atau
+SAWIT_REGIONS=region.csv mengatur region untuk --backend decomp.
+
+Model region dibangun sekali di worker pemiliknya dan di-solve ulang dengan
+warm start setiap iterasi; proses utama hanya memegang master.
+
+Membutuhkan highspy (dependensi opsional, lihat sawit/highs.py).
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from sawit.highs import highs_from_arrays, primal_values, require_highspy, status_name
+
+GAP_TOL = 1e-9
+MAX_ITERATIONS = 1000
+DEFAULT_REGIONS = 4
+
+# Toleransi pelanggaran optimality cut (relatif) sebelum cut ditambahkan
+CUT_TOL = 1e-9
+
+# Bobot titik master pada titik evaluasi in-out (sisanya titik UB terbaik)
+INOUT = 0.5
+
+
+# ================================================================================
+# REGION
+# ================================================================================
+
+def assign_regions(network, n_regions=DEFAULT_REGIONS):
+    """Partisi otomatis: pabrik dibagi n_regions kelompok berurutan, kebun dan
+    PD ikut region pabrik dengan rute termurahnya.
+
+    Return (nama region, region per kebun, region per PD).
+    """
+    n = network
+    P = len(n.pabrik)
+    n_regions = max(1, min(n_regions, P))
+    pabrik_region = np.arange(P) * n_regions // P
+
+    def nearest(src, dst, cost, n_nodes, node_is_src):
+        node, other = (src, dst) if node_is_src else (dst, src)
+        order = np.lexsort((cost, node))
+        first_node, first = np.unique(node[order], return_index=True)
+        region = np.zeros(n_nodes, dtype=np.int64)
+        region[first_node] = pabrik_region[other[order][first]]
+        return region
+
+    kebun_region = nearest(n.tbs_src, n.tbs_dst, n.tbs_cost, len(n.kebun), True)
+    pusat_region = nearest(n.cpo_src, n.cpo_dst, n.cpo_cost, len(n.pusat), False)
+    return [f"Region_{r + 1}" for r in range(n_regions)], kebun_region, pusat_region
+
+
+def read_regions(path, network):
+    """Baca CSV node,region. Kebun/PD yang tidak disebut ikut partisi otomatis
+    dengan jumlah region yang sama."""
+    with open(path, newline='', encoding='utf-8') as f:
+        mapping = {row['node'].strip(): row['region'].strip() for row in csv.DictReader(f)}
+    names = sorted(set(mapping.values()))
+    index = {name: r for r, name in enumerate(names)}
+    _, kebun_region, pusat_region = assign_regions(network, len(names))
+    for i, k in enumerate(network.kebun):
+        if k in mapping:
+            kebun_region[i] = index[mapping[k]]
+    for i, d in enumerate(network.pusat):
+        if d in mapping:
+            pusat_region[i] = index[mapping[d]]
+    return names, kebun_region, pusat_region
+
+
+def regions_from_env(network):
+    """Partisi dari SAWIT_REGIONS (jumlah region atau path CSV node,region)."""
+    value = os.environ.get('SAWIT_REGIONS', '')
+    if value.isdigit():
+        return assign_regions(network, int(value))
+    if value:
+        return read_regions(value, network)
+    return assign_regions(network)
+
+
+class _Subproblem:
+    """Subproblem satu region untuk satu tahap: 'tbs' (kebun region → pabrik)
+    atau 'cpo' (pabrik → PD region). Dibangun di proses utama lalu dikirim
+    ke worker pemiliknya.
+
+    Baris: supply kebun (<=) atau demand PD (>=), lalu satu baris alokasi per
+    pabrik (= a[r,p] atau b[r,p]). Kolom: rute, lalu artifisial fase 1
+    (+/− per baris alokasi, + per baris demand).
+    """
+
+    def __init__(self, network, index, region, stage, kebun_region, pusat_region):
+        n = network
+        self.index, self.region, self.stage = index, region, stage
+        if stage == 'tbs':
+            nodes = np.flatnonzero(kebun_region == region)
+            self.columns = np.flatnonzero(kebun_region[n.tbs_src] == region)     # kolom X_TBS global
+            node_of, pabrik_of = n.tbs_src[self.columns], n.tbs_dst[self.columns]
+            self.cost = n.tbs_cost[self.columns]
+            self.lo, self.hi = np.full(len(nodes), -np.inf), n.supply[nodes]
+        else:
+            nodes = np.flatnonzero(pusat_region == region)
+            self.columns = np.flatnonzero(pusat_region[n.cpo_dst] == region)     # kolom Y_CPO global
+            node_of, pabrik_of = n.cpo_dst[self.columns], n.cpo_src[self.columns]
+            self.cost = n.cpo_cost[self.columns]
+            self.lo, self.hi = n.demand[nodes], np.full(len(nodes), np.inf)
+        self.pabrik = np.unique(pabrik_of)
+        pair = np.searchsorted(self.pabrik, pabrik_of)
+        # Batas atas a[r,p]: total supply kebun region yang punya rute ke p
+        self.pair_bound = (np.bincount(pair, weights=n.supply[node_of], minlength=len(self.pabrik))
+                           if stage == 'tbs' else np.full(len(self.pabrik), np.inf))
+
+        n_real, n_nodes, n_pairs = len(self.columns), len(nodes), len(self.pabrik)
+        n_fixed_art = n_nodes if stage == 'cpo' else 0
+        self.coupling = n_nodes + np.arange(n_pairs, dtype=np.int32)
+        self.n_real = n_real
+        self.artificial = n_real + np.arange(2 * n_pairs + n_fixed_art, dtype=np.int32)
+
+        real = np.arange(n_real)
+        rows = np.concatenate([np.searchsorted(nodes, node_of), n_nodes + pair, self.coupling, self.coupling,
+                               np.arange(n_fixed_art)])
+        cols = np.concatenate([real, real, self.artificial])
+        data = np.concatenate([np.ones(2 * n_real), np.ones(n_pairs), -np.ones(n_pairs), np.ones(n_fixed_art)])
+        self.A = sp.csr_matrix((data, (rows, cols)), shape=(n_nodes + n_pairs, n_real + len(self.artificial)))
+
+    @property
+    def total(self):
+        """Supply (tbs) atau demand (cpo) total region."""
+        return self.hi.sum() if self.stage == 'tbs' else self.lo.sum()
+
+
+class _LoadedSubproblem:
+    """Model HiGHS sebuah _Subproblem, dibangun sekali lalu di-solve ulang
+    (warm start) dengan rhs alokasi baru."""
+
+    def __init__(self, sub):
+        n_pairs, n_art = len(sub.pabrik), len(sub.artificial)
+        lo = np.concatenate([sub.lo, np.zeros(n_pairs)])
+        hi = np.concatenate([sub.hi, np.zeros(n_pairs)])
+        upper = np.concatenate([np.full(sub.n_real, np.inf), np.zeros(n_art)])
+        cost = np.concatenate([sub.cost, np.zeros(n_art)])
+        self.sub = sub
+        self.h = highs_from_arrays(cost, sub.A, np.zeros(sub.n_real + n_art), upper, lo, hi)
+        self.phase1 = False
+
+    def _set_phase(self, phase1):
+        if self.phase1 == phase1:
+            return
+        sub, n_art = self.sub, len(self.sub.artificial)
+        real = np.arange(sub.n_real, dtype=np.int32)
+        self.h.changeColsCost(sub.n_real, real, np.zeros(sub.n_real) if phase1 else sub.cost)
+        self.h.changeColsCost(n_art, sub.artificial, np.ones(n_art) if phase1 else np.zeros(n_art))
+        self.h.changeColsBounds(n_art, sub.artificial, np.zeros(n_art), np.full(n_art, np.inf if phase1 else 0.0))
+        self.phase1 = phase1
+
+    def solve(self, v, primal=False):
+        """Solve dengan rhs alokasi v. Return (jenis cut, nilai, dual baris
+        alokasi, nilai rute jika primal)."""
+        h, coupling = self.h, self.sub.coupling
+        h.changeRowsBounds(len(coupling), coupling, v, v)
+        self._set_phase(False)
+        h.run()
+        kind = 'optimality'
+        if status_name(h) != 'Optimal':
+            kind = 'feasibility'
+            self._set_phase(True)
+            h.run()
+        value = h.getInfo().objective_function_value
+        dual = np.asarray(h.getSolution().row_dual, dtype=float)[coupling]
+        values = primal_values(h)[:self.sub.n_real] if primal else None
+        return kind, value, dual, values
+
+
+def _subproblems(network, kebun_region, pusat_region, n_regions):
+    return [_Subproblem(network, 2 * r + i, r, stage, kebun_region, pusat_region)
+            for r in range(n_regions) for i, stage in enumerate(('tbs', 'cpo'))]
+
+
+# ================================================================================
+# PROCESS POOL
+# ================================================================================
+
+def _subproblem_worker(conn, subs):
+    """Loop worker: bangun model subproblem miliknya sekali, lalu solve setiap
+    permintaan [(indeks, v)] dari proses utama."""
+    try:
+        models = {sub.index: _LoadedSubproblem(sub) for sub in subs}
+    except Exception as e:
+        conn.send(('error', repr(e)))
+        return
+    conn.send(('ready', None))
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        points, primal = message
+        try:
+            conn.send(('ok', [(i, *models[i].solve(v, primal)) for i, v in points]))
+        except Exception as e:
+            conn.send(('error', repr(e)))
+
+
+class _SubproblemPool:
+    """Subproblem dibagi ke `workers` proses (region r → worker r mod workers,
+    tahap TBS dan CPO satu region di worker yang sama). Dengan satu worker
+    semua subproblem di-solve di proses ini."""
+
+    def __init__(self, subs, workers):
+        import multiprocessing
+
+        n_regions = len({sub.region for sub in subs})
+        self.workers = max(1, min(workers, n_regions))
+        self.owner = {sub.index: sub.region % self.workers for sub in subs}
+        self.local, self.processes, self.conns = None, [], []
+        if self.workers == 1:
+            self.local = {sub.index: _LoadedSubproblem(sub) for sub in subs}
+            return
+        ctx = multiprocessing.get_context()
+        for w in range(self.workers):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_subproblem_worker, daemon=True,
+                                  args=(child, [sub for sub in subs if self.owner[sub.index] == w]))
+            process.start()
+            self.processes.append(process)
+            self.conns.append(parent)
+        for conn in self.conns:
+            self._receive(conn)
+
+    def _receive(self, conn):
+        status, payload = conn.recv()
+        if status == 'error':
+            raise RuntimeError(f"Worker subproblem gagal: {payload}")
+        return payload
+
+    def solve(self, points, primal=False):
+        """points: [(indeks, v)] → [(indeks, jenis, nilai, dual, nilai rute)]."""
+        if self.local is not None:
+            return [(i, *self.local[i].solve(v, primal)) for i, v in points]
+        batches = [[] for _ in range(self.workers)]
+        for i, v in points:
+            batches[self.owner[i]].append((i, v))
+        for conn, batch in zip(self.conns, batches):
+            conn.send((batch, primal))
+        return [item for conn in self.conns for item in self._receive(conn)]
+
+    def close(self):
+        for conn in self.conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ================================================================================
+# MASTER DAN ITERASI BENDERS
+# ================================================================================
+
+def _build_master(network, subs):
+    """Highs master, kolom [a/b] per subproblem dan kolom θ per subproblem."""
+    n = network
+    P, S = len(n.pabrik), len(subs)
+    sizes = [len(sub.pabrik) for sub in subs]
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+    n_flow = int(starts[-1])
+    cols = {sub.index: np.arange(starts[k], starts[k + 1]) for k, sub in enumerate(subs)}
+    theta = {sub.index: n_flow + k for k, sub in enumerate(subs)}
+
+    rows, col_index, data = [], [], []
+    for k, sub in enumerate(subs):
+        c = cols[sub.index]
+        if sub.stage == 'tbs':
+            rows += [sub.pabrik, P + sub.pabrik]            # kapasitas, yield · a
+            col_index += [c, c]
+            data += [np.ones(len(c)), np.full(len(c), n.yield_rate)]
+        else:
+            rows.append(P + sub.pabrik)                     # − b
+            col_index.append(c)
+            data.append(-np.ones(len(c)))
+        rows.append(np.full(len(c), 2 * P + k))             # total supply/demand region
+        col_index.append(c)
+        data.append(np.ones(len(c)))
+    A = sp.csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(col_index))),
+                      shape=(2 * P + S, n_flow + S))
+
+    totals = np.array([sub.total for sub in subs])
+    is_tbs = np.array([sub.stage == 'tbs' for sub in subs])
+    lo = np.concatenate([np.full(P, -np.inf), np.zeros(P), np.where(is_tbs, -np.inf, totals)])
+    hi = np.concatenate([n.capacity, np.zeros(P), np.where(is_tbs, totals, np.inf)])
+    cost = np.concatenate([np.zeros(n_flow), np.ones(S)])
+    upper = np.concatenate([np.concatenate([sub.pair_bound for sub in subs]), np.full(S, np.inf)])
+    # Biaya rute nonnegatif, sehingga θ >= 0 adalah batas bawah yang valid
+    h = highs_from_arrays(cost, A, np.zeros(n_flow + S), upper, lo, hi)
+    return h, cols, theta
+
+
+def _add_cut(h, cols, theta, kind, value, dual, v):
+    """optimality: θ − π·v >= Q − π·v̂;  feasibility: −σ·v >= V − σ·v̂.
+    Baris cut diskalakan agar koefisien terbesar bernilai 1."""
+    if kind == 'optimality':
+        index = np.append(cols, theta).astype(np.int32)
+        coef = np.append(-dual, 1.0)
+    else:
+        index, coef = cols.astype(np.int32), -dual
+    scale = max(np.abs(coef).max(initial=0.0), 1e-12)
+    h.addRow((value - dual @ v) / scale, np.inf, len(index), index, coef / scale)
+
+
+def solve_decomposition(network, regions=None, workers=None, gap_tol=GAP_TOL, max_iterations=MAX_ITERATIONS):
+    """Benders per region. regions = (nama, region per kebun, region per PD)
+    (default: SAWIT_REGIONS atau assign_regions); workers default os.cpu_count().
+
+    Return SolveResult (backend 'decomp') dengan result.decomposition berisi
+    region, jumlah worker, riwayat iterasi dan status konvergensi.
+    """
+    from sawit.backends import SolveResult, route_values
+
+    require_highspy()
+    if (network.tbs_cost < 0).any() or (network.cpo_cost < 0).any():
+        raise ValueError("Dekomposisi membutuhkan biaya rute nonnegatif")
+
+    start = time.perf_counter()
+    names, kebun_region, pusat_region = regions or regions_from_env(network)
+    subs = _subproblems(network, kebun_region, pusat_region, len(names))
+    master, cols, theta = _build_master(network, subs)
+
+    history, best, center = [], None, None
+    lower, upper = -np.inf, np.inf
+    at_master = True
+    status = 'Not Solved'
+    with _SubproblemPool(subs, workers or os.cpu_count() or 1) as pool:
+        build_time = time.perf_counter() - start
+        for iteration in range(1, max_iterations + 1):
+            master.run()
+            if status_name(master) != 'Optimal':
+                status = status_name(master)
+                break
+            values = primal_values(master)
+            lower = master.getInfo().objective_function_value
+
+            # In-out: evaluasi di antara titik master dan titik UB terbaik
+            point = values if at_master or center is None else INOUT * values + (1 - INOUT) * center
+            results = pool.solve([(i, point[c]) for i, c in cols.items()])
+
+            n_opt = n_feas = 0
+            total, feasible = 0.0, True
+            for i, kind, value, dual, _ in results:
+                v = point[cols[i]]
+                if kind == 'feasibility':
+                    feasible = False
+                    n_feas += 1
+                    _add_cut(master, cols[i], theta[i], kind, value, dual, v)
+                    continue
+                total += value
+                # Cut hanya ditambahkan jika memotong titik master sekarang
+                cut_at_master = value + dual @ (values[cols[i]] - v)
+                if cut_at_master > values[theta[i]] + CUT_TOL * max(1.0, abs(value)):
+                    n_opt += 1
+                    _add_cut(master, cols[i], theta[i], kind, value, dual, v)
+            if feasible and total < upper:
+                upper, best, center = total, point, point
+            gap = (upper - lower) / max(1.0, abs(upper)) if best is not None else None
+            history.append({'iteration': iteration, 'lower': lower, 'upper': upper if best is not None else None,
+                            'gap': gap, 'optimality_cuts': n_opt, 'feasibility_cuts': n_feas,
+                            'elapsed': time.perf_counter() - start})
+            if gap is not None and gap <= gap_tol:
+                status = 'Optimal'
+                break
+            if n_opt == n_feas == 0:
+                if at_master:
+                    # Semua subproblem feasible di titik master dan tidak ada cut terpotong
+                    status = 'Optimal'
+                    break
+                at_master = True            # titik in-out tidak memotong: evaluasi titik master
+            else:
+                at_master = False
+
+        values = np.zeros(network.n_vars)
+        if best is not None:
+            for i, _, _, _, flows in pool.solve([(i, best[c]) for i, c in cols.items()], primal=True):
+                sub = subs[i]
+                offset = 0 if sub.stage == 'tbs' else network.n_tbs
+                values[offset + sub.columns] = flows
+        n_workers = pool.workers
+
+    x_vals, y_vals = values[:network.n_tbs], values[network.n_tbs:]
+    x, y = route_values(network, x_vals, y_vals)
+    result = SolveResult('decomp', status, float(network.objective() @ values), x, y, time.perf_counter() - start)
+    result.build_time = build_time
+    result.iterations = len(history)
+    result.decomposition = {
+        'regions': names,
+        'region_sizes': [{'region': name, 'kebun': int((kebun_region == r).sum()),
+                          'pd': int((pusat_region == r).sum()),
+                          'variabel': int(sum(sub.n_real for sub in subs if sub.region == r))}
+                         for r, name in enumerate(names)],
+        'workers': n_workers,
+        'converged': status == 'Optimal',
+        'iterations': history,
+    }
+    return result
+
+
+def print_convergence(result):
+    """Tabel batas bawah/atas dan gap per iterasi."""
+    info = result.decomposition
+    if not info['iterations']:
+        print(f"⚠️  Master {result.status} sebelum iterasi pertama (kapasitas/supply total region tidak cukup)")
+        return
+    print(f"{'Iterasi':>7} {'Batas bawah':>20} {'Batas atas':>20} {'Gap':>11} {'Cut opt':>8} {'Cut feas':>9}")
+    print("-" * 80)
+    for row in info['iterations']:
+        upper = '–' if row['upper'] is None else f"{row['upper']:,.0f}"
+        gap = '–' if row['gap'] is None else f"{row['gap']:.2e}"
+        print(f"{row['iteration']:>7} {row['lower']:>20,.0f} {upper:>20} {gap:>11} "
+              f"{row['optimality_cuts']:>8} {row['feasibility_cuts']:>9}")
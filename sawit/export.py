@@ -0,0 +1,145 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/export.py
+Deskripsi: Export alokasi secara streaming dari array Solution: Excel
+           (openpyxl write-only), Parquet (pyarrow) dan CSV.
+
+Rute terpakai diambil per potongan CHUNK langsung dari array x/y Network
+(sawit/solution.py); setiap potongan ditulis lalu dibuang, sehingga memori
+tidak bergantung pada jumlah baris. Tidak ada list of dict atau DataFrame.
+
+    xlsx     Summary, Alokasi_TBS, Alokasi_CPO (+ Sensitivitas_* jika ada);
+             workbook write-only menulis XML sheet ke file sementara
+    parquet  satu tabel panjang ALLOCATION_COLUMNS, satu row group per
+             potongan; Jenis/Dari/Ke dictionary-encoded (indeks node)
+    csv      tabel panjang yang sama
+
+pyarrow adalah dependensi opsional (pip install pyarrow), hanya untuk Parquet.
+"""
+
+import csv
+
+import numpy as np
+
+# Jumlah rute per potongan (baris sheet, row group Parquet, writerows CSV)
+CHUNK = 50_000
+
+# Tabel panjang Parquet/CSV: TBS dan CPO dalam satu tabel
+ALLOCATION_COLUMNS = ('Jenis', 'Dari', 'Ke', 'Jumlah_ton', 'Biaya_per_ton', 'Total_Biaya')
+
+# Sheet Excel per jenis rute (sama dengan export pandas sebelumnya)
+SHEETS = {
+    'tbs': ('Alokasi_TBS', ('Dari_Kebun', 'Ke_Pabrik', 'Jumlah_ton', 'Biaya_per_ton', 'Total_Biaya')),
+    'cpo': ('Alokasi_CPO', ('Dari_Pabrik', 'Ke_PD', 'Jumlah_ton', 'Biaya_per_ton', 'Total_Biaya')),
+}
+
+SENSITIVITY_CONSTRAINT_COLUMNS = ('Constraint', 'Node', 'RHS', 'Aktivitas', 'Slack', 'Shadow_Price',
+                                  'RHS_Min', 'RHS_Maks')
+SENSITIVITY_ROUTE_COLUMNS = ('Jumlah_ton', 'Biaya_per_ton', 'Reduced_Cost', 'Biaya_Min', 'Biaya_Maks')
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Export Parquet membutuhkan pyarrow: pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+def allocation_chunks(solution, kind, chunk=CHUNK):
+    """Potongan (indeks asal, indeks tujuan, ton, biaya/ton, total biaya) berupa
+    array untuk rute terpakai; kind = 'tbs' atau 'cpo'."""
+    for src, dst, qty, rate in solution.route_chunks(kind, chunk=chunk):
+        yield src, dst, qty, rate, qty * rate
+
+
+def allocation_rows(solution, kind, chunk=CHUNK):
+    """Potongan baris (asal, tujuan, ton, biaya/ton, total) dengan nama node."""
+    src_names, dst_names = solution.route_arrays(kind)[4:]
+    for src, dst, qty, rate, total in allocation_chunks(solution, kind, chunk):
+        yield zip([src_names[i] for i in src.tolist()], [dst_names[j] for j in dst.tolist()],
+                  qty.tolist(), rate.tolist(), total.tolist())
+
+
+# ================================================================================
+# EXCEL (openpyxl write-only)
+# ================================================================================
+
+def _infinite(row):
+    # Batas ranging tak terbatas ditulis sebagai ∞ / -∞ (sama seperti inf_rep pandas)
+    return [('∞' if v > 0 else '-∞') if isinstance(v, float) and np.isinf(v) else v for v in row]
+
+
+def write_xlsx(path, summary, solution, sensitivity=None):
+    """Tulis workbook Excel secara streaming. summary: list (metrik, nilai)."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    wb = Workbook(write_only=True)
+
+    def sheet(title, columns):
+        ws = wb.create_sheet(title)
+        header = []
+        for name in columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        ws.append(header)
+        return ws
+
+    ws = sheet('Summary', ('Metrik', 'Nilai'))
+    for row in summary:
+        ws.append(list(row))
+
+    for kind, (title, columns) in SHEETS.items():
+        ws = sheet(title, columns)
+        for rows in allocation_rows(solution, kind):
+            for row in rows:
+                ws.append(row)
+
+    if sensitivity is not None and sensitivity.available:
+        ws = sheet('Sensitivitas_Constraint', SENSITIVITY_CONSTRAINT_COLUMNS)
+        for row in sensitivity.constraint_rows():
+            ws.append(_infinite(row))
+        for kind, (_, columns) in SHEETS.items():
+            ws = sheet(f'Sensitivitas_{kind.upper()}', columns[:2] + SENSITIVITY_ROUTE_COLUMNS)
+            for row in sensitivity.route_rows(kind):
+                ws.append(_infinite(row))
+
+    wb.save(path)
+
+
+# ================================================================================
+# PARQUET (pyarrow) DAN CSV
+# ================================================================================
+
+def write_parquet(path, solution):
+    """Tulis tabel alokasi ke Parquet, satu row group per potongan."""
+    pa, pq = require_pyarrow()
+
+    label_type = pa.dictionary(pa.int32(), pa.string())
+    schema = pa.schema([(name, label_type) for name in ALLOCATION_COLUMNS[:3]]
+                       + [(name, pa.float64()) for name in ALLOCATION_COLUMNS[3:]])
+    with pq.ParquetWriter(path, schema) as writer:
+        for kind in ('tbs', 'cpo'):
+            src_names, dst_names = (pa.array(names, pa.string()) for names in solution.route_arrays(kind)[4:])
+            label = pa.array([kind.upper()], pa.string())
+            for src, dst, qty, rate, total in allocation_chunks(solution, kind):
+                jenis = pa.DictionaryArray.from_arrays(np.zeros(len(src), dtype=np.int32), label)
+                dari = pa.DictionaryArray.from_arrays(src.astype(np.int32), src_names)
+                ke = pa.DictionaryArray.from_arrays(dst.astype(np.int32), dst_names)
+                writer.write_table(pa.Table.from_arrays([jenis, dari, ke, qty, rate, total], schema=schema))
+
+
+def write_csv(path, solution):
+    """Tulis tabel alokasi (ALLOCATION_COLUMNS) ke CSV."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(ALLOCATION_COLUMNS)
+        for kind in ('tbs', 'cpo'):
+            label = kind.upper()
+            for rows in allocation_rows(solution, kind):
+                writer.writerows((label, *row) for row in rows)
@@ -0,0 +1,160 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/feasibility.py
+Deskripsi: Pre-check feasibility dengan max-flow sebelum solver dipanggil,
+           dan diagnosis infeasibility berupa himpunan konflik minimal.
+
+Karena yield sama untuk semua pabrik, model feasible jika dan hanya jika
+aliran maksimum pada jaringan sawit/netflow.py (S → kebun → pabrik → PD → T,
+satuan setara TBS) memenuhi seluruh demand / yield. Satu max-flow Dinic
+cukup; untuk data bulanan selesai dalam hitungan milidetik, jauh sebelum
+model PuLP selesai dibangun.
+
+Jika infeasible, min cut memberi himpunan constraint yang saling bertentangan:
+demand PD di sisi sink tidak bisa dipenuhi oleh supply kebun dan kapasitas
+pabrik yang terpotong. Himpunan itu diperkecil dengan deletion filter (setiap
+constraint dilepas satu per satu; jika sisanya masih infeasible, constraint
+itu dibuang) sampai minimal: melepas constraint mana pun membuatnya feasible.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from sawit.netflow import flow_graph, max_flow
+
+# Deletion filter memanggil satu max-flow per constraint di min cut
+MAX_FILTER = 500
+
+SUPPLY, CAPACITY, DEMAND = 'Supply Kebun', 'Kapasitas Pabrik', 'Demand PD'
+
+
+def enabled():
+    return os.environ.get('SAWIT_PRECHECK', '1') not in ('0', '')
+
+
+def _covers(deliverable, required):
+    return deliverable >= required * (1 - 1e-9) - 1e-9
+
+
+class Feasibility:
+    """Hasil pre-check untuk satu Network.
+
+    conflict: list (jenis, node, rhs) dengan jenis SUPPLY/CAPACITY (rhs dalam
+    ton TBS) atau DEMAND (rhs dalam ton CPO); kosong jika feasible.
+    """
+
+    def __init__(self, network, required, deliverable, check_time, conflict=(), conflict_supply=None,
+                 minimal=True):
+        self.network = network
+        self.required = required            # total demand, ton CPO
+        self.deliverable = deliverable      # aliran maksimum ke PD, ton CPO
+        self.check_time = check_time
+        self.conflict = list(conflict)
+        self.conflict_supply = conflict_supply  # ton CPO maksimum untuk PD di himpunan konflik
+        self.minimal = minimal
+
+    @property
+    def feasible(self):
+        return _covers(self.deliverable, self.required)
+
+    @property
+    def shortfall(self):
+        return max(0.0, self.required - self.deliverable)
+
+    def explain(self):
+        """Baris penjelasan (teks) untuk console dan report."""
+        if self.feasible:
+            return [f"Feasible: maksimum {self.deliverable:,.1f} ton CPO bisa dikirim, "
+                    f"demand {self.required:,.1f} ton CPO"]
+
+        def names(kind):
+            return [(node, rhs) for k, node, rhs in self.conflict if k == kind]
+
+        demand, capacity, supply = names(DEMAND), names(CAPACITY), names(SUPPLY)
+        lines = [f"Total demand {self.required:,.1f} ton CPO, maksimum yang bisa dikirim "
+                 f"{self.deliverable:,.1f} ton CPO (kurang {self.shortfall:,.1f} ton)"]
+        lines.append(f"Konflik {'minimal' if self.minimal else '(min cut, belum diminimalkan)'}: "
+                     f"{len(self.conflict)} constraint")
+        lines.append(f"Demand {', '.join(node for node, _ in demand)} = "
+                     f"{sum(rhs for _, rhs in demand):,.1f} ton CPO, tetapi hanya "
+                     f"{self.conflict_supply:,.1f} ton CPO yang bisa sampai ke sana")
+        yr = self.network.yield_rate
+        if capacity:
+            lines.append(f"Dibatasi kapasitas {', '.join(node for node, _ in capacity)} = "
+                         f"{sum(rhs for _, rhs in capacity):,.0f} ton TBS × yield {yr:g}")
+        if supply:
+            lines.append(f"Dibatasi supply {', '.join(node for node, _ in supply)} = "
+                         f"{sum(rhs for _, rhs in supply):,.0f} ton TBS × yield {yr:g}")
+        if not capacity and not supply:
+            lines.append("PD tersebut tidak punya rute CPO dari pabrik yang bisa menerima TBS")
+        return lines
+
+
+def _max_flow(graph, n, supply_on, capacity_on, demand_on):
+    """Aliran maksimum (satuan TBS) dengan hanya constraint *_on yang aktif;
+    supply/kapasitas lain tidak terbatas, demand lain nol."""
+    tail, head, _, cap, n_nodes = graph
+    K, P, D = len(n.kebun), len(n.pabrik), len(n.pusat)
+    big = float(n.demand.sum() / n.yield_rate)
+    cap = cap.copy()
+    cap[:K] = np.where(supply_on, n.supply, big)
+    factory = slice(K + n.n_tbs, K + n.n_tbs + P)
+    cap[factory] = np.where(capacity_on, n.capacity, big)
+    cap[len(cap) - D:] = np.where(demand_on, n.demand / n.yield_rate, 0.0)
+    return max_flow(tail, head, cap, n_nodes, 0, n_nodes - 1)
+
+
+def check_feasibility(network, minimal=True):
+    """Max-flow pre-check. Return Feasibility (dengan himpunan konflik jika infeasible)."""
+    n = network
+    start = time.perf_counter()
+    K, P, D = len(n.kebun), len(n.pabrik), len(n.pusat)
+    graph = flow_graph(n)
+    n_nodes = graph[4]
+    required = float(n.demand.sum())
+    _, value, source_side = max_flow(graph[0], graph[1], graph[3], n_nodes, 0, n_nodes - 1)
+    deliverable = value * n.yield_rate
+    if _covers(deliverable, required):
+        return Feasibility(n, required, deliverable, time.perf_counter() - start)
+
+    # Min cut: kebun di sisi sink (supply terpotong), pabrik yang terbelah
+    # (kapasitas terpotong), PD di sisi sink (demand tidak terpenuhi)
+    kebun = 1 + np.arange(K)
+    p_in, p_out = 1 + K + np.arange(P), 1 + K + P + np.arange(P)
+    pusat = 1 + K + 2 * P + np.arange(D)
+    supply_on = ~source_side[kebun]
+    capacity_on = source_side[p_in] & ~source_side[p_out]
+    demand_on = ~source_side[pusat] & (n.demand > 0)
+
+    def infeasible(supply_on, capacity_on, demand_on):
+        _, value, _ = _max_flow(graph, n, supply_on, capacity_on, demand_on)
+        return not _covers(value * n.yield_rate, float(n.demand[demand_on].sum())), value * n.yield_rate
+
+    members = ([(supply_on, i) for i in np.flatnonzero(supply_on).tolist()]
+               + [(capacity_on, j) for j in np.flatnonzero(capacity_on).tolist()]
+               + [(demand_on, d) for d in np.flatnonzero(demand_on).tolist()])
+    minimal = minimal and len(members) <= MAX_FILTER
+    if minimal:
+        for mask, i in members:
+            mask[i] = False
+            if not infeasible(supply_on, capacity_on, demand_on)[0]:
+                mask[i] = True
+    _, conflict_supply = infeasible(supply_on, capacity_on, demand_on)
+
+    conflict = ([(SUPPLY, n.kebun[i], float(n.supply[i])) for i in np.flatnonzero(supply_on).tolist()]
+                + [(CAPACITY, n.pabrik[j], float(n.capacity[j])) for j in np.flatnonzero(capacity_on).tolist()]
+                + [(DEMAND, n.pusat[d], float(n.demand[d])) for d in np.flatnonzero(demand_on).tolist()])
+    return Feasibility(n, required, deliverable, time.perf_counter() - start, conflict, conflict_supply, minimal)
+
+
+def infeasible_result(network, feasibility):
+    """SolveResult berstatus Infeasible tanpa memanggil solver (x = y = 0)."""
+    from sawit.backends import SolveResult, route_values
+
+    x, y = route_values(network, np.zeros(network.n_tbs), np.zeros(network.n_cpo))
+    result = SolveResult('precheck', 'Infeasible', 0.0, x, y, feasibility.check_time)
+    result.feasibility = feasibility
+    return result
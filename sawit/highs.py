@@ -0,0 +1,80 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/highs.py
+Deskripsi: Jembatan langsung Network → highspy.Highs (tanpa PuLP dan tanpa
+           SciPy). Dipakai oleh fitur yang membutuhkan akses ke basis
+           simplex HiGHS: warm start, dual/ranging, dan analisis parametrik.
+
+highspy adalah dependensi opsional (pip install highspy).
+"""
+
+import numpy as np
+
+
+def require_highspy():
+    try:
+        import highspy
+    except ImportError as e:
+        raise ImportError("Fitur ini membutuhkan highspy: pip install highspy") from e
+    return highspy
+
+
+# HighsModelStatus → string gaya LpStatus
+_STATUS_NAMES = {
+    'kOptimal': 'Optimal',
+    'kInfeasible': 'Infeasible',
+    'kUnbounded': 'Unbounded',
+    'kUnboundedOrInfeasible': 'Infeasible',
+    'kNotset': 'Not Solved',
+    'kModelEmpty': 'Optimal',
+}
+
+
+def status_name(h):
+    """Status model HiGHS dalam format LpStatus (Optimal, Infeasible, ...)."""
+    model_status = h.getModelStatus()
+    return _STATUS_NAMES.get(getattr(model_status, 'name', str(model_status)), 'Undefined')
+
+
+def build_highs(network, simplex=True):
+    """Buat objek Highs berisi LP dari Network (kolom [X_TBS, Y_CPO], baris
+    sesuai urutan di sawit/network.py)."""
+    lo, hi = network.row_bounds()
+    return highs_from_arrays(network.objective(), network.constraint_matrix(),
+                             np.zeros(network.n_vars), np.full(network.n_vars, np.inf), lo, hi, simplex)
+
+
+def highs_from_arrays(cost, A, col_lower, col_upper, row_lower, row_upper, simplex=True):
+    """Buat objek Highs dari LP min c·v, row_lower <= A·v <= row_upper,
+    col_lower <= v <= col_upper. Batas tak hingga memakai ±np.inf."""
+    highspy = require_highspy()
+
+    A = A.tocsc()
+    n_rows, n_cols = A.shape
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = n_cols
+    lp.num_row_ = n_rows
+    lp.col_cost_ = np.asarray(cost, dtype=float)
+    lp.col_lower_ = np.asarray(col_lower, dtype=float)
+    lp.col_upper_ = np.asarray(col_upper, dtype=float)
+    lp.row_lower_ = np.asarray(row_lower, dtype=float)
+    lp.row_upper_ = np.asarray(row_upper, dtype=float)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = A.indptr
+    lp.a_matrix_.index_ = A.indices
+    lp.a_matrix_.value_ = A.data
+
+    h = highspy.Highs()
+    h.silent()
+    if simplex:
+        # Simplex menyimpan basis, sehingga solve berikutnya bisa warm start
+        h.setOptionValue('solver', 'simplex')
+    h.passModel(lp)
+    return h
+
+
+def primal_values(h):
+    """Nilai kolom solusi terakhir sebagai array NumPy."""
+    return np.asarray(h.getSolution().col_value, dtype=float)
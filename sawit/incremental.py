@@ -0,0 +1,137 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/incremental.py
+Deskripsi: Model persisten untuk re-solve berulang ketika hanya biaya atau
+           demand/kapasitas yang berubah.
+
+Model HiGHS dibangun sekali. Perubahan biaya masuk sebagai koefisien
+objective (changeColsCost) dan perubahan demand/kapasitas sebagai batas
+baris (changeRowsBounds), sehingga basis optimal sebelumnya tetap tersimpan
+dan solve berikutnya dimulai dari basis itu (warm start):
+
+    model = IncrementalModel(network)
+    model.solve()
+    model.set_cost_tbs({('Kebun_A', 'Pabrik_1'): 52000})
+    model.set_demand({'PD2': 850})
+    stats = model.solve()          # warm start
+    stats.iterations, stats.solve_time
+"""
+
+import time
+
+import numpy as np
+
+from sawit.highs import build_highs, primal_values, status_name
+
+
+class SolveStats:
+    """Ringkasan satu solve: status, objective, iterasi simplex, waktu."""
+
+    __slots__ = ('status', 'objective', 'iterations', 'solve_time', 'warm')
+
+    def __init__(self, status, objective, iterations, solve_time, warm):
+        self.status = status
+        self.objective = objective
+        self.iterations = iterations
+        self.solve_time = solve_time
+        self.warm = warm
+
+    def __repr__(self):
+        mode = 'warm' if self.warm else 'cold'
+        return (f"SolveStats({mode}, {self.status}, objective={self.objective:,.2f}, "
+                f"iterasi={self.iterations}, waktu={self.solve_time * 1000:.3f} ms)")
+
+
+class IncrementalModel:
+    """LP distribusi yang bisa diubah in-place lalu di-solve ulang."""
+
+    def __init__(self, network):
+        self.network = network.copy()
+        self.h = build_highs(self.network)
+        self._kebun = {k: i for i, k in enumerate(self.network.kebun)}
+        self._pabrik = {p: i for i, p in enumerate(self.network.pabrik)}
+        self._pusat = {d: i for i, d in enumerate(self.network.pusat)}
+        self._tbs = {route: i for i, route in enumerate(self.network.tbs_routes())}
+        self._cpo = {route: i for i, route in enumerate(self.network.cpo_routes())}
+        self._solved = False
+
+    # ----------------------------------------------------------------------------
+    # Update in-place
+    # ----------------------------------------------------------------------------
+
+    def set_cost_tbs(self, costs):
+        """costs: dict (kebun, pabrik) → biaya/ton baru."""
+        cols = np.fromiter((self._tbs[route] for route in costs), dtype=np.int32, count=len(costs))
+        values = np.fromiter(costs.values(), dtype=float, count=len(costs))
+        self.network.tbs_cost[cols] = values
+        self.h.changeColsCost(len(cols), cols, values)
+
+    def set_cost_cpo(self, costs):
+        """costs: dict (pabrik, pd) → biaya/ton baru."""
+        index = np.fromiter((self._cpo[route] for route in costs), dtype=np.int64, count=len(costs))
+        values = np.fromiter(costs.values(), dtype=float, count=len(costs))
+        self.network.cpo_cost[index] = values
+        cols = (self.network.n_tbs + index).astype(np.int32)
+        self.h.changeColsCost(len(cols), cols, values)
+
+    def set_demand(self, demand):
+        """demand: dict pd → demand CPO baru (baris >=)."""
+        index = np.fromiter((self._pusat[d] for d in demand), dtype=np.int64, count=len(demand))
+        values = np.fromiter(demand.values(), dtype=float, count=len(demand))
+        self.network.demand[index] = values
+        offset = len(self.network.kebun) + 2 * len(self.network.pabrik)
+        self._change_rows(offset + index, values, np.full(len(values), self._inf()))
+
+    def set_supply(self, supply):
+        """supply: dict kebun → kapasitas TBS baru (baris <=)."""
+        index = np.fromiter((self._kebun[k] for k in supply), dtype=np.int64, count=len(supply))
+        values = np.fromiter(supply.values(), dtype=float, count=len(supply))
+        self.network.supply[index] = values
+        self._change_rows(index, np.full(len(values), -self._inf()), values)
+
+    def set_capacity(self, capacity):
+        """capacity: dict pabrik → kapasitas olah baru (baris <=)."""
+        index = np.fromiter((self._pabrik[p] for p in capacity), dtype=np.int64, count=len(capacity))
+        values = np.fromiter(capacity.values(), dtype=float, count=len(capacity))
+        self.network.capacity[index] = values
+        offset = len(self.network.kebun)
+        self._change_rows(offset + index, np.full(len(values), -self._inf()), values)
+
+    def _change_rows(self, rows, lower, upper):
+        rows = rows.astype(np.int32)
+        self.h.changeRowsBounds(len(rows), rows, lower, upper)
+
+    def _inf(self):
+        return self.h.getInfinity()
+
+    # ----------------------------------------------------------------------------
+    # Solve
+    # ----------------------------------------------------------------------------
+
+    def solve(self, cold=False):
+        """Solve dari basis terakhir (warm) atau dari awal (cold=True)."""
+        warm = self._solved and not cold
+        if not warm:
+            self.h.clearSolver()
+        start = time.perf_counter()
+        self.h.run()
+        solve_time = time.perf_counter() - start
+        self._solved = True
+        info = self.h.getInfo()
+        return SolveStats(status_name(self.h), info.objective_function_value,
+                          info.simplex_iteration_count, solve_time, warm)
+
+    def values(self):
+        """(x, y) solusi terakhir sebagai array sesuai urutan rute Network."""
+        values = primal_values(self.h)
+        return values[:self.network.n_tbs], values[self.network.n_tbs:]
+
+    def result(self):
+        """SolveResult (x/y ber-varValue) untuk tahap report/export."""
+        from sawit.backends import SolveResult, route_values
+
+        x, y = route_values(self.network, *self.values())
+        info = self.h.getInfo()
+        return SolveResult('highs', status_name(self.h), info.objective_function_value, x, y,
+                           self.h.getRunTime())
@@ -0,0 +1,55 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/instances.py
+Deskripsi: Generator instance sintetis (format dict yang sama dengan
+           python_solver.py) untuk benchmark dan uji skala besar.
+"""
+
+import numpy as np
+
+
+def generate_instance(n_kebun, n_pabrik=None, n_pd=None, routes_per_kebun=5,
+                      routes_per_pabrik=10, yield_rate=0.22, seed=0):
+    """Buat instance acak yang (hampir selalu) feasible.
+
+    Return tuple (supply_capacity, factory_capacity, demand, cost_tbs,
+    cost_cpo, yield_rate) dengan struktur sama seperti data di python_solver.py.
+    """
+    rng = np.random.default_rng(seed)
+    if n_pabrik is None:
+        n_pabrik = max(2, n_kebun // 50)
+    if n_pd is None:
+        n_pd = max(4, 2 * n_pabrik)
+
+    kebun_list = [f"Kebun_{i + 1}" for i in range(n_kebun)]
+    pabrik_list = [f"Pabrik_{j + 1}" for j in range(n_pabrik)]
+    pd_list = [f"PD{d + 1}" for d in range(n_pd)]
+
+    supply = rng.integers(2000, 6000, n_kebun)
+    capacity = rng.multinomial(int(supply.sum() * 1.2), np.full(n_pabrik, 1 / n_pabrik))
+    total_cpo = 0.6 * yield_rate * supply.sum()
+    demand = np.maximum(1, rng.multinomial(int(total_cpo), np.full(n_pd, 1 / n_pd)))
+
+    supply_capacity = dict(zip(kebun_list, supply.tolist()))
+    factory_capacity = dict(zip(pabrik_list, capacity.tolist()))
+    demand_dict = dict(zip(pd_list, demand.tolist()))
+
+    # Setiap kebun terhubung ke pabrik "terdekat" (indeks berurutan) + acak
+    cost_tbs = {}
+    k_tbs = min(routes_per_kebun, n_pabrik)
+    for i, kebun in enumerate(kebun_list):
+        home = i * n_pabrik // n_kebun
+        targets = {home, *rng.choice(n_pabrik, k_tbs - 1, replace=False).tolist()}
+        for j in sorted(targets):
+            cost_tbs[(kebun, pabrik_list[j])] = int(rng.integers(30, 90)) * 1000
+
+    cost_cpo = {}
+    k_cpo = min(routes_per_pabrik, n_pd)
+    for j, pabrik in enumerate(pabrik_list):
+        targets = set(rng.choice(n_pd, k_cpo, replace=False).tolist())
+        targets.update(range(j, n_pd, n_pabrik))
+        for d in sorted(targets):
+            cost_cpo[(pabrik, pd_list[d])] = int(rng.integers(70, 140)) * 1000
+
+    return supply_capacity, factory_capacity, demand_dict, cost_tbs, cost_cpo, yield_rate
@@ -0,0 +1,207 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/loader.py
+Deskripsi: Membaca data kebun/pabrik/PD dari workbook Excel ke struktur
+           solver (Network / dict seperti sawit/data.py), dengan cache biner.
+
+Workbook yang dibaca:
+    datafiktif kelapa sawit.xlsx   - sheet Data Kebun, Data Pabrik,
+                                     Data Pusat Distribusi
+    implementasi kebun sawit.xlsx  - matriks biaya Kebun → Pabrik dan
+                                     Pabrik → PD (Sheet1)
+
+Hasil parsing disimpan sebagai .npz di direktori cache (default
+.sawit_cache/, bisa diganti lewat SAWIT_CACHE_DIR) dengan nama file berupa
+hash SHA-256 isi kedua workbook. Parsing openpyxl hanya dijalankan lagi jika
+salah satu workbook berubah.
+"""
+
+import hashlib
+import os
+import re
+
+import numpy as np
+
+from sawit.network import Network
+
+DATA_WORKBOOK = 'datafiktif kelapa sawit.xlsx'
+COST_WORKBOOK = 'implementasi kebun sawit.xlsx'
+
+# Naikkan jika format cache berubah agar cache lama tidak terpakai
+CACHE_VERSION = 1
+
+
+def cache_dir():
+    return os.environ.get('SAWIT_CACHE_DIR', '.sawit_cache')
+
+
+# ================================================================================
+# NORMALISASI NAMA
+# ================================================================================
+
+def _node_name(label):
+    """'kebun A' → 'Kebun_A', 'Pabrik 1' → 'Pabrik_1'."""
+    words = str(label).split()
+    return '_'.join([words[0][:1].upper() + words[0][1:], *words[1:]])
+
+
+def _pd_name(label):
+    """'PD 1' → 'PD1'."""
+    return re.sub(r'\s+', '', str(label)).upper()
+
+
+# ================================================================================
+# PARSING WORKBOOK
+# ================================================================================
+
+def _rows(ws):
+    for row in ws.iter_rows(values_only=True):
+        if any(v is not None for v in row):
+            yield row
+
+
+def _read_nodes(ws, name_fn):
+    """Baris data (nama, nilai, ...) setelah header pertama."""
+    rows = _rows(ws)
+    next(rows)  # header
+    return [(name_fn(row[0]), *row[1:]) for row in rows if row[0] is not None and row[1] is not None]
+
+
+def _read_cost_blocks(ws):
+    """Cari blok biaya 'Kebun | P1 (Rp/Ton) ...' dan 'Dari | PD1 ...'."""
+    cost_tbs, cost_cpo = {}, {}
+    rows = list(_rows(ws))
+    for i, row in enumerate(rows):
+        first = str(row[0]).strip() if row[0] is not None else ''
+        if first == 'Kebun' and not cost_tbs:
+            columns = {c: f"Pabrik_{m.group(1)}" for c, h in enumerate(row)
+                       if h is not None and (m := re.match(r'P\s*(\d+)\b', str(h)))}
+            for data in rows[i + 1:]:
+                if data[0] is None or not str(data[0]).lower().startswith('kebun'):
+                    break
+                for c, pabrik in columns.items():
+                    if data[c] is not None:
+                        cost_tbs[(_node_name(data[0]), pabrik)] = data[c]
+        elif first == 'Dari' and not cost_cpo:
+            columns = {c: _pd_name(h) for c, h in enumerate(row)
+                       if h is not None and re.match(r'PD\s*\d+', str(h))}
+            for data in rows[i + 1:]:
+                if data[0] is None or not str(data[0]).lower().startswith('pabrik'):
+                    break
+                for c, pusat in columns.items():
+                    if data[c] is not None:
+                        cost_cpo[(_node_name(data[0]), pusat)] = data[c]
+    if not cost_tbs or not cost_cpo:
+        raise ValueError(f"Matriks biaya TBS/CPO tidak ditemukan di sheet {ws.title!r}")
+    return cost_tbs, cost_cpo
+
+
+def parse_workbooks(data_path=DATA_WORKBOOK, cost_path=COST_WORKBOOK):
+    """Parse kedua workbook (tanpa cache). Return tuple seperti default_instance()."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(data_path, read_only=True, data_only=True)
+    try:
+        kebun = _read_nodes(wb['Data Kebun'], _node_name)
+        pabrik = _read_nodes(wb['Data Pabrik'], _node_name)
+        pusat = _read_nodes(wb['Data Pusat Distribusi'], _pd_name)
+    finally:
+        wb.close()
+
+    yields = {float(row[2]) for row in pabrik if len(row) > 2 and row[2] is not None}
+    if len(yields) != 1:
+        raise ValueError(f"Model membutuhkan satu yield rate untuk semua pabrik, ditemukan: {sorted(yields)}")
+
+    wb = load_workbook(cost_path, read_only=True, data_only=True)
+    try:
+        cost_tbs, cost_cpo = _read_cost_blocks(wb.worksheets[0])
+    finally:
+        wb.close()
+
+    supply_capacity = {name: value for name, value, *_ in kebun}
+    factory_capacity = {name: value for name, value, *_ in pabrik}
+    demand = {name: value for name, value, *_ in pusat}
+
+    for (k, p) in cost_tbs:
+        if k not in supply_capacity or p not in factory_capacity:
+            raise ValueError(f"Rute TBS {k} → {p} merujuk node yang tidak ada di {data_path}")
+    for (p, d) in cost_cpo:
+        if p not in factory_capacity or d not in demand:
+            raise ValueError(f"Rute CPO {p} → {d} merujuk node yang tidak ada di {data_path}")
+
+    return supply_capacity, factory_capacity, demand, cost_tbs, cost_cpo, yields.pop()
+
+
+# ================================================================================
+# CACHE
+# ================================================================================
+
+def workbook_hash(*paths):
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _save_npz(path, network):
+    tmp = path + '.tmp.npz'
+    np.savez_compressed(
+        tmp,
+        kebun=np.array(network.kebun), pabrik=np.array(network.pabrik), pusat=np.array(network.pusat),
+        supply=network.supply, capacity=network.capacity, demand=network.demand,
+        yield_rate=np.array(network.yield_rate),
+        tbs_src=network.tbs_src, tbs_dst=network.tbs_dst, tbs_cost=network.tbs_cost,
+        cpo_src=network.cpo_src, cpo_dst=network.cpo_dst, cpo_cost=network.cpo_cost,
+    )
+    os.replace(tmp, path)
+
+
+def _load_npz(path):
+    with np.load(path) as z:
+        return Network(
+            z['kebun'].tolist(), z['pabrik'].tolist(), z['pusat'].tolist(),
+            z['supply'], z['capacity'], z['demand'], float(z['yield_rate']),
+            z['tbs_src'], z['tbs_dst'], z['tbs_cost'],
+            z['cpo_src'], z['cpo_dst'], z['cpo_cost'],
+        )
+
+
+def load_network(data_path=DATA_WORKBOOK, cost_path=COST_WORKBOOK, use_cache=True):
+    """Network dari workbook; dibaca dari cache .npz jika workbook tidak berubah.
+
+    Return (network, from_cache).
+    """
+    if not use_cache:
+        return Network.from_dicts(*parse_workbooks(data_path, cost_path)), False
+
+    directory = cache_dir()
+    cached = os.path.join(directory, f"workbook-{workbook_hash(data_path, cost_path)}.npz")
+    if os.path.exists(cached):
+        return _load_npz(cached), True
+
+    network = Network.from_dicts(*parse_workbooks(data_path, cost_path))
+    os.makedirs(directory, exist_ok=True)
+    _save_npz(cached, network)
+    return network, False
+
+
+def load_instance(data_path=DATA_WORKBOOK, cost_path=COST_WORKBOOK, use_cache=True):
+    """Seperti load_network, tetapi dalam bentuk dict (urutan default_instance())."""
+    network, from_cache = load_network(data_path, cost_path, use_cache)
+    return network.to_dicts(), from_cache
+
+
+def load_default_instance():
+    """Data dari workbook di direktori kerja jika ada, selain itu sawit/data.py.
+
+    Return (instance, sumber) dengan sumber 'cache', 'workbook' atau 'default'.
+    """
+    if os.path.exists(DATA_WORKBOOK) and os.path.exists(COST_WORKBOOK):
+        instance, from_cache = load_instance()
+        return instance, 'cache' if from_cache else 'workbook'
+
+    from sawit.data import default_instance
+    return default_instance(), 'default'
@@ -0,0 +1,317 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/mip.py
+Deskripsi: Formulasi MIP: jumlah rit truk integer per rute dan biaya tetap
+           pembukaan rute, diselesaikan CBC dengan kontrol branch-and-cut
+           (thread, batas waktu, gap relatif, warm start dari solusi LP).
+
+Per rute r (TBS kebun → pabrik dan CPO pabrik → PD):
+
+    x[r]     ton (kontinu, sama dengan X_TBS/Y_CPO model LP)
+    truk[r]  jumlah rit truk (integer)
+    buka[r]  rute dipakai (biner)
+
+    x[r]    <= muatan · truk[r]
+    truk[r] <= ceil(M[r] / muatan) · buka[r]      M[r] = batas atas aliran rute
+
+    min Σ tarif/ton · muatan · truk[r] + Σ biaya_tetap · buka[r]
+
+Tarif per ton dari data dikonversi menjadi ongkos per rit (truk dibayar
+penuh meskipun muatannya kurang), sehingga relaksasi LP sama dengan model
+kontinu ditambah porsi biaya tetap. Constraint supply, kapasitas, material
+balance dan demand sama dengan sawit/network.py. Muatan truk dan biaya
+tetap tidak ada di workbook; nilai default di bawah adalah asumsi yang bisa
+diganti lewat argumen atau opsi `sawit mip`.
+
+Warm start: solusi LP kontinu (HiGHS) dibulatkan ke atas menjadi jumlah rit
+dan rute yang dipakai dibuka. Titik itu selalu feasible untuk MIP, sehingga
+CBC langsung punya incumbent.
+
+Profil solve dibaca dari log CBC: nilai relaksasi LP, bound setelah cut di
+root, setiap incumbent (waktu, node, heuristik penemunya), progres bound dan
+batas bawah/gap akhir.
+
+Contoh:
+    sawit mip --threads 4 --time-limit 60 --gap 0.01
+"""
+
+import math
+import os
+import re
+import tempfile
+import time
+
+import numpy as np
+
+# Asumsi default (per bulan)
+TRUCK_TBS = 10.0            # ton TBS per rit dump truck
+TRUCK_CPO = 25.0            # ton CPO per rit truk tangki
+FIXED_TBS = 1_500_000       # Rp per rute TBS yang dibuka
+FIXED_CPO = 2_500_000       # Rp per rute CPO yang dibuka
+
+MIP_OUTPUT = 'rencana_truk.csv'
+
+MIP_COLUMNS = ['jenis', 'asal', 'tujuan', 'ton', 'truk', 'muatan_rata', 'buka', 'biaya_angkut', 'biaya_tetap']
+
+
+# ================================================================================
+# MODEL
+# ================================================================================
+
+def route_bounds(network):
+    """Batas atas aliran per rute: TBS min(supply kebun, kapasitas pabrik),
+    CPO yield · kapasitas pabrik asal."""
+    n = network
+    return (np.minimum(n.supply[n.tbs_src], n.capacity[n.tbs_dst]),
+            n.yield_rate * n.capacity[n.cpo_src])
+
+
+def build_mip(network, truck_tbs=TRUCK_TBS, truck_cpo=TRUCK_CPO, fixed_tbs=FIXED_TBS, fixed_cpo=FIXED_CPO):
+    """Bangun LpProblem MIP. fixed_tbs/fixed_cpo skalar atau array per rute.
+
+    Return (model, x, y, truk, buka); truk dan buka berupa dict
+    ('tbs' | 'cpo', rute) → LpVariable.
+    """
+    from pulp import LpAffineExpression, LpConstraint, LpConstraintLE, LpVariable
+
+    from sawit.model import build_model
+
+    n = network
+    model, x, y = build_model(network, name="Optimasi_Distribusi_Sawit_MIP")
+    bound_tbs, bound_cpo = route_bounds(network)
+    fixed = {'tbs': np.broadcast_to(np.asarray(fixed_tbs, dtype=float), (n.n_tbs,)),
+             'cpo': np.broadcast_to(np.asarray(fixed_cpo, dtype=float), (n.n_cpo,))}
+
+    truk, buka, objective = {}, {}, []
+    for kind, flows, cost, load, bound in (('tbs', x, n.tbs_cost, truck_tbs, bound_tbs),
+                                           ('cpo', y, n.cpo_cost, truck_cpo, bound_cpo)):
+        prefix = kind.upper()
+        for (route, flow), rate, upper, fixed_cost in zip(flows.items(), cost.tolist(), bound.tolist(),
+                                                          fixed[kind].tolist()):
+            max_trucks = math.ceil(upper / load - 1e-9)
+            t = LpVariable(f"Truk_{prefix}_{route}", lowBound=0, upBound=max_trucks, cat='Integer')
+            b = LpVariable(f"Buka_{prefix}_{route}", cat='Binary')
+            truk[kind, route], buka[kind, route] = t, b
+            model.addConstraint(LpConstraint(LpAffineExpression([(flow, 1.0), (t, -load)]), LpConstraintLE,
+                                             f"Muatan_{prefix}_{route}", 0.0))
+            model.addConstraint(LpConstraint(LpAffineExpression([(t, 1.0), (b, -max_trucks)]), LpConstraintLE,
+                                             f"Buka_{prefix}_{route}", 0.0))
+            objective += [(t, rate * load), (b, fixed_cost)]
+
+    model.setObjective(LpAffineExpression(objective))
+    return model, x, y, truk, buka
+
+
+def _warm_start(network, x, y, truk, buka, truck_tbs, truck_cpo):
+    """Isi nilai awal dari LP kontinu (HiGHS). Return status LP."""
+    from sawit.backends import solve_highs
+
+    lp = solve_highs(network, method='highs-ds')
+    if lp.status != 'Optimal':
+        return lp.status
+    for kind, flows, lp_flows, load in (('tbs', x, lp.x, truck_tbs), ('cpo', y, lp.y, truck_cpo)):
+        for route, var in flows.items():
+            value = max(lp_flows[route].varValue, 0.0)
+            trucks = math.ceil(value / load - 1e-9)
+            var.setInitialValue(value)
+            truk[kind, route].setInitialValue(trucks)
+            buka[kind, route].setInitialValue(1 if trucks else 0)
+    return lp.status
+
+
+# ================================================================================
+# LOG CBC
+# ================================================================================
+
+_NUMBER = r"(-?[\d.]+(?:e[-+]?\d+)?)"
+
+
+def parse_cbc_log(log):
+    """Profil solve dari log CBC.
+
+    Return dict: continuous (relaksasi LP), root_bound (setelah cut root),
+    incumbents [(detik, objective, node, sumber)], progress [(detik, node,
+    best, bound)], result, objective, bound, gap, nodes, iterations, wall_time.
+    """
+    def last(pattern, cast=float):
+        found = re.findall(pattern, log, re.MULTILINE)
+        return cast(found[-1]) if found else None
+
+    incumbents = [(float(sec), float(obj), int(nodes), source)
+                  for obj, source, _, nodes, sec in re.findall(
+                      rf"Integer solution of {_NUMBER} found by (.+?) after (\d+) iterations "
+                      rf"and (\d+) nodes \(([\d.]+) seconds\)", log)]
+    progress = [(float(sec), int(nodes), float(best), float(bound))
+                for nodes, best, bound, sec in re.findall(
+                    rf"After (\d+) nodes, \d+ on tree, {_NUMBER} best solution, best possible {_NUMBER} "
+                    rf"\(([\d.]+) seconds\)", log)]
+    profile = {
+        'continuous': last(rf"Continuous objective value is {_NUMBER}"),
+        'root_bound': last(rf"Cuts at root node changed objective from -?[\d.]+(?:e[-+]?\d+)? to {_NUMBER}"),
+        'incumbents': incumbents,
+        'progress': progress,
+        'result': last(r"^Result - (.+)$", str),
+        'objective': last(rf"^Objective value:\s+{_NUMBER}"),
+        'bound': last(rf"^Lower bound:\s+{_NUMBER}"),
+        'nodes': last(r"^Enumerated nodes:\s+(\d+)", int),
+        'iterations': last(r"^Total iterations:\s+(\d+)", int),
+        'wall_time': last(rf"^Time \(Wallclock seconds\):\s+{_NUMBER}"),
+    }
+    # CBC hanya mencetak "Lower bound" jika berhenti sebelum terbukti optimal;
+    # baris "Gap:" dibulatkan 2 desimal, jadi gap dihitung ulang di sini.
+    if profile['bound'] is None:
+        if profile['result'] == 'Optimal solution found':
+            profile['bound'] = profile['objective']
+        elif progress:
+            profile['bound'] = progress[-1][3]
+        else:
+            profile['bound'] = profile['root_bound']
+    profile['gap'] = None
+    if profile['objective'] is not None and profile['bound'] is not None:
+        profile['gap'] = max(0.0, profile['objective'] - profile['bound']) / max(1.0, abs(profile['objective']))
+    return profile
+
+
+# ================================================================================
+# SOLVE
+# ================================================================================
+
+def solve_mip(network, truck_tbs=TRUCK_TBS, truck_cpo=TRUCK_CPO, fixed_tbs=FIXED_TBS, fixed_cpo=FIXED_CPO,
+              threads=None, time_limit=None, gap=None, warm_start=True, msg=0):
+    """Solve MIP dengan CBC. Return SolveResult (backend 'cbc', model = LpProblem
+    MIP) dengan result.mip berisi truk/rute terbuka, opsi dan profil solve."""
+    from pulp import PULP_CBC_CMD, LpSolution, LpStatus, value
+
+    from sawit.backends import SolveResult
+
+    start = time.perf_counter()
+    model, x, y, truk, buka = build_mip(network, truck_tbs, truck_cpo, fixed_tbs, fixed_cpo)
+    build_time = time.perf_counter() - start
+
+    lp_status, lp_time = None, None
+    if warm_start:
+        start = time.perf_counter()
+        lp_status = _warm_start(network, x, y, truk, buka, truck_tbs, truck_cpo)
+        lp_time = time.perf_counter() - start
+
+    fd, log_path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        solver = PULP_CBC_CMD(msg=msg, threads=threads, timeLimit=time_limit, gapRel=gap,
+                              warmStart=warm_start and lp_status == 'Optimal', logPath=log_path)
+        start = time.perf_counter()
+        model.solve(solver)
+        solve_time = time.perf_counter() - start
+        with open(log_path, errors="replace") as f:
+            profile = parse_cbc_log(f.read())
+    finally:
+        os.remove(log_path)
+
+    result = SolveResult("cbc", LpStatus[model.status], value(model.objective), x, y, solve_time, model)
+    result.build_time = build_time
+    result.iterations = profile['iterations']
+    result.mip = {
+        'solution': LpSolution[model.sol_status],
+        'truk': {key: round(var.varValue or 0.0) for key, var in truk.items()},
+        'buka': {key: round(var.varValue or 0.0) for key, var in buka.items()},
+        'options': {'truck_tbs': truck_tbs, 'truck_cpo': truck_cpo, 'fixed_tbs': fixed_tbs,
+                    'fixed_cpo': fixed_cpo, 'threads': threads,
+                    'time_limit': time_limit, 'gap': gap, 'warm_start': warm_start},
+        'lp_status': lp_status,
+        'lp_time': lp_time,
+        'profile': profile,
+    }
+    return result
+
+
+# ================================================================================
+# OUTPUT
+# ================================================================================
+
+def route_rows(network, result):
+    """Satu dict per rute sesuai MIP_COLUMNS."""
+    n, mip, options = network, result.mip, result.mip['options']
+    for kind, flows, cost, load, fixed in (('tbs', result.x, n.tbs_cost, options['truck_tbs'], options['fixed_tbs']),
+                                           ('cpo', result.y, n.cpo_cost, options['truck_cpo'], options['fixed_cpo'])):
+        fixed = np.broadcast_to(np.asarray(fixed, dtype=float), cost.shape).tolist()
+        for (route, var), rate, fixed_cost in zip(flows.items(), cost.tolist(), fixed):
+            trucks, opened = mip['truk'][kind, route], mip['buka'][kind, route]
+            ton = var.varValue or 0.0
+            yield dict(zip(MIP_COLUMNS, [
+                kind.upper(), route[0], route[1], ton, trucks, ton / trucks if trucks else 0.0, opened,
+                rate * load * trucks, fixed_cost * opened,
+            ]))
+
+
+def write_routes(network, result, path):
+    import csv
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=MIP_COLUMNS)
+        writer.writeheader()
+        writer.writerows(route_rows(network, result))
+
+
+def print_profile(result):
+    """Ringkasan bound/gap dan timeline incumbent dari log CBC."""
+    mip, profile = result.mip, result.mip['profile']
+
+    def fmt(v):
+        return '–' if v is None else f"{v:,.0f}"
+
+    mark = '✓' if result.status == 'Optimal' else '⚠️'
+    print(f"{mark} Status: {result.status} ({mip['solution']}; CBC: {profile['result'] or '-'})")
+    if mip['options']['warm_start']:
+        print(f"✓ Warm start dari LP kontinu: {mip['lp_status']} ({mip['lp_time']:.3f} s)")
+    print(f"   Relaksasi LP         : {fmt(profile['continuous'])}")
+    print(f"   Bound setelah cut root: {fmt(profile['root_bound'])}")
+    print(f"   Incumbent terbaik     : {fmt(profile['objective'])}")
+    print(f"   Batas bawah           : {fmt(profile['bound'])}")
+    gap = '–' if profile['gap'] is None else f"{profile['gap']:.4%}"
+    print(f"   Gap relatif           : {gap}")
+    print(f"   Node / iterasi LP     : {profile['nodes'] if profile['nodes'] is not None else '–'} / "
+          f"{profile['iterations'] if profile['iterations'] is not None else '–'}")
+
+    if profile['incumbents']:
+        print(f"\n{'Detik':>8} {'Node':>7} {'Incumbent':>20}  Sumber")
+        print("-" * 60)
+        for sec, objective, nodes, source in profile['incumbents']:
+            print(f"{sec:>8.2f} {nodes:>7} {objective:>20,.0f}  {source}")
+
+
+def run_mip(truck_tbs=TRUCK_TBS, truck_cpo=TRUCK_CPO, fixed_tbs=FIXED_TBS, fixed_cpo=FIXED_CPO,
+            threads=None, time_limit=None, gap=None, warm_start=True, output=MIP_OUTPUT, n_kebun=None):
+    """Alur `sawit mip`: data default (atau instance sintetis), solve MIP,
+    cetak profil, tulis CSV per rute. Return SolveResult."""
+    from sawit.network import Network
+
+    print("="*80)
+    print("MIP: RIT TRUK INTEGER DAN BIAYA TETAP RUTE")
+    print("="*80)
+
+    if n_kebun:
+        from sawit.instances import generate_instance
+        instance = generate_instance(n_kebun)
+    else:
+        from sawit.loader import load_default_instance
+        instance, _ = load_default_instance()
+    network = Network.from_dicts(*instance)
+    print(f"✓ {len(network.kebun):,} kebun, {len(network.pabrik):,} pabrik, {len(network.pusat):,} PD; "
+          f"{2 * network.n_vars:,} variabel integer")
+    print(f"✓ Truk TBS {truck_tbs:g} t, truk CPO {truck_cpo:g} t; biaya tetap rute "
+          f"Rp {fixed_tbs:,.0f} (TBS) / Rp {fixed_cpo:,.0f} (CPO)")
+    print(f"✓ CBC: threads={threads or 'default'}, batas waktu={time_limit or '-'} s, gap={gap or 'default'}, "
+          f"warm start={'ya' if warm_start else 'tidak'}\n")
+
+    result = solve_mip(network, truck_tbs, truck_cpo, fixed_tbs, fixed_cpo, threads, time_limit, gap, warm_start)
+    print_profile(result)
+
+    if result.mip['solution'] in ('Optimal Solution Found', 'Solution Found'):
+        n_open = sum(result.mip['buka'].values())
+        print(f"\n✓ {n_open} dari {len(result.mip['buka'])} rute dibuka, "
+              f"{sum(result.mip['truk'].values()):,} rit truk, total biaya Rp {result.objective:,.0f} "
+              f"({result.solve_time:.2f} s)")
+        write_routes(network, result, output)
+        print(f"✓ Hasil: {output}")
+    return result
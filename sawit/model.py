@@ -0,0 +1,46 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/model.py
+Deskripsi: Membangun LpProblem PuLP dari matriks insidensi sparse Network.
+           Setiap baris constraint dibuat sekali dari slice CSR, sehingga
+           total waktu build sebanding dengan jumlah non-zero, bukan K·P + P·D
+           per keluarga constraint.
+"""
+
+from pulp import LpAffineExpression, LpConstraint, LpMinimize, LpProblem, LpVariable
+from pulp import LpConstraintEQ, LpConstraintGE, LpConstraintLE
+
+
+def build_model(network, name="Optimasi_Distribusi_Sawit"):
+    """Bangun model LP dari Network.
+
+    Return (model, x, y) dengan x dan y berupa dict rute → LpVariable,
+    sama seperti hasil LpVariable.dicts di python_solver.py.
+    """
+    model = LpProblem(name, LpMinimize)
+
+    x = LpVariable.dicts("X_TBS", network.tbs_routes(), lowBound=0, cat='Continuous')
+    y = LpVariable.dicts("Y_CPO", network.cpo_routes(), lowBound=0, cat='Continuous')
+    columns = list(x.values()) + list(y.values())
+
+    model += LpAffineExpression(zip(columns, network.objective().tolist())), "Total_Biaya"
+
+    A = network.constraint_matrix()
+    indptr, indices, data = A.indptr, A.indices.tolist(), A.data.tolist()
+    lo, hi = network.row_bounds()
+    n_le = len(network.kebun) + len(network.pabrik)
+    n_eq = n_le + len(network.pabrik)
+
+    for r, row_name in enumerate(network.row_names()):
+        start, end = indptr[r], indptr[r + 1]
+        expr = LpAffineExpression(zip([columns[c] for c in indices[start:end]], data[start:end]))
+        if r < n_le:
+            constraint = LpConstraint(expr, LpConstraintLE, row_name, float(hi[r]))
+        elif r < n_eq:
+            constraint = LpConstraint(expr, LpConstraintEQ, row_name, 0.0)
+        else:
+            constraint = LpConstraint(expr, LpConstraintGE, row_name, float(lo[r]))
+        model.addConstraint(constraint)
+
+    return model, x, y
@@ -0,0 +1,195 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/mps.py
+Deskripsi: Jembatan langsung Network → file MPS → binary CBC (tanpa objek
+           PuLP per variabel). Jalur default backend "cbc".
+
+Jalur asli membuat satu LpVariable per rute (LpVariable.dicts), satu
+LpAffineExpression per constraint, lalu PuLP menulis MPS dari objek-objek
+itu dan membaca solusi kembali ke dict nama → nilai. Di sini MPS ditulis dari
+array CSC (kolom C<j>, baris R<i>, sesuai urutan kolom dan baris Network)
+dalam potongan berukuran tetap, dan file solusi CBC dibaca ke satu array
+float64. Data per rute hanya ada dalam array NumPy (indeks, biaya, matriks
+sparse, solusi); SolveResult.x/y berupa RouteValues (sawit/backends.py) yang
+membuat VarValue hanya jika diakses per rute.
+
+Puncak memori Python (tracemalloc) dari model hingga file MPS siap untuk CBC,
+instance sintetis generate_instance; lihat benchmarks/bench_memory.py:
+
+         rute    LpVariable.dicts    array + MPS    rasio
+       10.271             19,0 MB         4,8 MB       4x
+      104.577            203,6 MB        19,4 MB      10x
+    1.047.811          2.001,0 MB       194,3 MB      10x
+
+Solve penuh 104.577 rute (tanpa tracemalloc): build 1,63 → 0,62 s, total
+6,97 → 2,59 s, RSS maksimum proses 266 → 73 MB, objektif sama.
+
+Kolom tanpa batas atas dan >= 0 (default MPS), sehingga BOUNDS tidak ditulis.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+# Jumlah entri COLUMNS yang diformat sekaligus (membatasi string sementara)
+CHUNK = 20_000
+
+# Nama fixed format MPS maksimum 8 karakter: C/R + 7 digit
+MAX_INDEX = 10_000_000
+
+# Awal baris pertama file solusi CBC → string gaya LpStatus
+_CBC_STATUS = (("Optimal", "Optimal"), ("Infeasible", "Infeasible"), ("Integer infeasible", "Infeasible"),
+               ("Unbounded", "Unbounded"), ("Stopped", "Not Solved"))
+
+
+def cbc_path():
+    """Path binary CBC bawaan PuLP (atau cbc di PATH)."""
+    try:
+        from pulp import PULP_CBC_CMD
+        path = PULP_CBC_CMD().path
+    except ImportError:
+        path = None
+    path = path or shutil.which("cbc")
+    if not path:
+        raise RuntimeError("Binary CBC tidak ditemukan: pip install pulp")
+    return path
+
+
+# ================================================================================
+# MENULIS MPS
+# ================================================================================
+
+def _row_types(row_lower, row_upper):
+    """Jenis baris MPS (L/E/G/N) dan RHS-nya dari batas lo <= A·v <= hi."""
+    lo_inf, hi_inf = np.isneginf(row_lower), np.isposinf(row_upper)
+    if np.any(~lo_inf & ~hi_inf & (row_lower != row_upper)):
+        raise ValueError("Baris dengan dua batas berbeda (RANGES) tidak didukung")
+    types = np.where(lo_inf & hi_inf, "N", np.where(lo_inf, "L", np.where(hi_inf, "G", "E")))
+    rhs = np.where(lo_inf, np.where(hi_inf, 0.0, row_upper), row_lower)
+    return types, rhs
+
+
+def _write_columns(f, row_names, cols, rows, values):
+    """Tulis entri COLUMNS per potongan CHUNK."""
+    line = "    C%-7d  %s  %r\n".__mod__
+    for start in range(0, len(cols), CHUNK):
+        end = start + CHUNK
+        f.write("".join(map(line, zip(cols[start:end].tolist(), [row_names[r] for r in rows[start:end].tolist()],
+                                      values[start:end].tolist()))))
+
+
+def write_mps(path, cost, A, row_lower, row_upper, name="SAWIT"):
+    """Tulis LP min c·v, row_lower <= A·v <= row_upper, v >= 0 ke file MPS.
+
+    Kolom bernama C<j> dan baris R<i> (indeks array), baris objektif OBJ;
+    field rata kiri 8 karakter sesuai fixed format yang dibaca CBC.
+    """
+    A = A.tocsc()
+    n_rows, n_cols = A.shape
+    types, rhs = _row_types(np.asarray(row_lower, dtype=float), np.asarray(row_upper, dtype=float))
+    if max(n_rows, n_cols) > MAX_INDEX:
+        raise ValueError(f"MPS fixed format: maksimum {MAX_INDEX:,} kolom/baris")
+    row_names = ["OBJ     "] + [f"R{i:<7d}" for i in range(n_rows)]
+
+    # Entri COLUMNS harus berkelompok per kolom: objektif dulu, lalu baris A.
+    # Posisi entri objektif kolom j = awal kolom j di CSC + jumlah entri
+    # objektif sebelumnya; sisanya diisi entri CSC dengan urutan yang sama.
+    cost = np.asarray(cost, dtype=float)
+    obj_cols = np.flatnonzero(cost)
+    n_entries = A.nnz + len(obj_cols)
+    is_obj = np.zeros(n_entries, dtype=bool)
+    is_obj[A.indptr[obj_cols] + np.arange(len(obj_cols))] = True
+    cols = np.empty(n_entries, dtype=np.int32)
+    rows = np.zeros(n_entries, dtype=np.int32)
+    values = np.empty(n_entries)
+    cols[is_obj], values[is_obj] = obj_cols, cost[obj_cols]
+    cols[~is_obj] = np.repeat(np.arange(n_cols), np.diff(A.indptr))
+    rows[~is_obj], values[~is_obj] = A.indices + 1, A.data
+
+    with open(path, "w") as f:
+        f.write(f"NAME          {name}\nROWS\n N  OBJ\n")
+        f.write("".join(f" {t}  R{i}\n" for i, t in enumerate(types.tolist())))
+        f.write("COLUMNS\n")
+        _write_columns(f, row_names, cols, rows, values)
+        f.write("RHS\n")
+        nonzero = np.flatnonzero(rhs)
+        f.write("".join(f"    RHS       R{i:<7d}  {v!r}\n" for i, v in zip(nonzero.tolist(), rhs[nonzero].tolist())))
+        f.write("ENDATA\n")
+
+
+# ================================================================================
+# MEMBACA SOLUSI
+# ================================================================================
+
+def read_solution(path, n_cols):
+    """Status (gaya LpStatus) dan array nilai kolom dari file solusi CBC.
+
+    CBC hanya mencetak kolom bernilai tidak nol; kolom lain bernilai 0.
+    """
+    values = np.zeros(n_cols)
+    with open(path) as f:
+        header = f.readline()
+        status = next((name for prefix, name in _CBC_STATUS if header.startswith(prefix)), "Undefined")
+        index, value = [], []
+        for line in f:
+            parts = line.split()
+            if parts and parts[0] == "**":      # ditandai CBC jika solusi infeasible
+                parts = parts[1:]
+            if len(parts) >= 3 and parts[1].startswith("C"):
+                index.append(int(parts[1][1:]))
+                value.append(float(parts[2]))
+    values[index] = value
+    return status, values
+
+
+# ================================================================================
+# BACKEND
+# ================================================================================
+
+def run_cbc(mps_path, sol_path, msg=0, algorithm=None):
+    """Jalankan CBC pada file MPS; return log (stdout) untuk menghitung iterasi."""
+    from sawit.backends import _CBC_ALGORITHMS
+
+    # Sama seperti PULP_CBC_CMD: algoritma LP eksplisit memakai -initialSolve
+    args = [cbc_path(), mps_path]
+    args += [f"-{_CBC_ALGORITHMS[algorithm]}", "-initialSolve"] if algorithm else ["-solve"]
+    args += ["-solution", sol_path]
+    proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                          text=True, errors="replace")
+    if msg:
+        print(proc.stdout)
+    if proc.returncode != 0 or not os.path.exists(sol_path):
+        raise RuntimeError(f"CBC gagal (kode {proc.returncode}):\n{proc.stdout[-2000:]}")
+    return proc.stdout
+
+
+def solve_cbc_arrays(network, msg=0, algorithm=None):
+    """Backend cbc tanpa PuLP: Network → MPS → CBC → array solusi."""
+    from sawit.backends import SolveResult, _cbc_iterations, route_values
+
+    tmp = tempfile.mkdtemp(prefix="sawit_cbc_")
+    mps_path, sol_path = os.path.join(tmp, "model.mps"), os.path.join(tmp, "model.sol")
+    try:
+        start = time.perf_counter()
+        lo, hi = network.row_bounds()
+        cost = network.objective()
+        write_mps(mps_path, cost, network.constraint_matrix(), lo, hi)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        log = run_cbc(mps_path, sol_path, msg, algorithm)
+        status, values = read_solution(sol_path, network.n_vars)
+        solve_time = time.perf_counter() - start
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    x, y = route_values(network, values[:network.n_tbs], values[network.n_tbs:])
+    result = SolveResult("cbc", status, float(cost @ values), x, y, solve_time)
+    result.build_time = build_time
+    result.iterations = _cbc_iterations(log)
+    return result
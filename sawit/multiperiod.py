@@ -0,0 +1,521 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/multiperiod.py
+Deskripsi: Perencanaan multi-periode (bulanan) dengan persediaan TBS/CPO di
+           pabrik dan PD, diselesaikan dengan rolling horizon.
+
+Per periode t (jaringan dan biaya rute sama dengan model statis):
+
+    Σ_p x[t,k,p]                                  <= supply[t,k]
+    olah[t,p]                                     <= kapasitas[t,p]
+    stok_tbs[t-1,p] + Σ_k x[t,k,p] - olah[t,p] - stok_tbs[t,p]        = 0
+    stok_cpo[t-1,p] + yield · olah[t,p] - Σ_d y[t,p,d] - stok_cpo[t,p] = 0
+    stok_pd[t-1,d]  + Σ_p y[t,p,d] - stok_pd[t,d]                    >= demand[t,d]
+
+    0 <= stok_tbs <= gudang_tbs, 0 <= stok_cpo <= gudang_cpo (pabrik dan PD)
+
+Tujuan: biaya transport TBS + CPO ditambah biaya simpan (Rp/ton/periode)
+untuk stok akhir setiap periode. Tanpa gudang (kapasitas 0) setiap periode
+sama dengan model statis python_solver.py.
+
+Rolling horizon (solve_rolling): LP satu jendela berisi `window` periode
+dibangun sekali. Untuk setiap periode awal s, batas baris diisi data periode
+s..s+window-1 (periode setelah horizon diisi 0) dan stok awal hasil periode
+sebelumnya, lalu LP di-solve dan keputusan periode s dikunci. Struktur
+matriks tidak pernah berubah; basis simplex jendela sebelumnya digeser satu
+periode dan dipakai sebagai warm start. solve_full menyelesaikan seluruh
+horizon sebagai satu LP untuk mengukur selisih biaya rolling horizon.
+
+Data horizon (CSV, satu baris per nilai; periode kosong = berlaku semua periode):
+
+    periode,parameter,key,value
+    2025-01,supply_capacity,Kebun_A,5200
+    2025-01,demand,*,700
+    ,gudang_cpo,PD1,300
+    ,biaya_simpan_cpo,*,12000
+
+    parameter periodik : supply_capacity | factory_capacity | demand
+    parameter gudang   : gudang_tbs (pabrik) | gudang_cpo (pabrik/PD)
+                         stok_awal_tbs (pabrik) | stok_awal_cpo (pabrik/PD)
+                         biaya_simpan_tbs | biaya_simpan_cpo
+    key                : nama node, atau "*" untuk semua
+
+Nilai yang tidak disebut memakai data statis (gudang dan stok awal 0).
+
+Membutuhkan highspy (dependensi opsional, lihat sawit/highs.py).
+"""
+
+import csv
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from sawit.highs import highs_from_arrays, primal_values, require_highspy, status_name
+
+PERIOD_PARAMETERS = {
+    'supply_capacity': 'supply',
+    'factory_capacity': 'capacity',
+    'demand': 'demand',
+}
+STORAGE_PARAMETERS = ('gudang_tbs', 'gudang_cpo', 'stok_awal_tbs', 'stok_awal_cpo',
+                      'biaya_simpan_tbs', 'biaya_simpan_cpo')
+
+PLAN_OUTPUT = 'rencana_bulanan.csv'
+DEFAULT_PERIODS = 24
+DEFAULT_WINDOW = 6
+
+# Asumsi horizon musiman (seasonal_horizon), Rp/ton/bulan
+HOLDING_TBS = 25000
+HOLDING_CPO = 10000
+
+PLAN_COLUMNS = [
+    'periode', 'status', 'biaya_tbs', 'biaya_cpo', 'biaya_simpan', 'total_biaya',
+    'tbs_dikirim', 'tbs_diolah', 'cpo_dikirim', 'demand',
+    'stok_tbs', 'stok_cpo_pabrik', 'stok_cpo_pd',
+]
+
+
+class Horizon:
+    """Data multi-periode: jaringan statis + array [periode, node] dan gudang."""
+
+    def __init__(self, network, periods, supply, capacity, demand,
+                 gudang_tbs=None, gudang_cpo_pabrik=None, gudang_cpo_pd=None,
+                 stok_awal_tbs=None, stok_awal_cpo_pabrik=None, stok_awal_cpo_pd=None,
+                 biaya_simpan_tbs=None, biaya_simpan_cpo_pabrik=None, biaya_simpan_cpo_pd=None):
+        P, D = len(network.pabrik), len(network.pusat)
+
+        def per_node(values, n):
+            return np.zeros(n) if values is None else np.asarray(values, dtype=float).copy()
+
+        self.network = network
+        self.periods = list(periods)
+        self.supply = np.asarray(supply, dtype=float)          # [T, K]
+        self.capacity = np.asarray(capacity, dtype=float)      # [T, P]
+        self.demand = np.asarray(demand, dtype=float)          # [T, D]
+        self.gudang_tbs = per_node(gudang_tbs, P)
+        self.gudang_cpo_pabrik = per_node(gudang_cpo_pabrik, P)
+        self.gudang_cpo_pd = per_node(gudang_cpo_pd, D)
+        self.stok_awal_tbs = per_node(stok_awal_tbs, P)
+        self.stok_awal_cpo_pabrik = per_node(stok_awal_cpo_pabrik, P)
+        self.stok_awal_cpo_pd = per_node(stok_awal_cpo_pd, D)
+        self.biaya_simpan_tbs = per_node(biaya_simpan_tbs, P)
+        self.biaya_simpan_cpo_pabrik = per_node(biaya_simpan_cpo_pabrik, P)
+        self.biaya_simpan_cpo_pd = per_node(biaya_simpan_cpo_pd, D)
+
+    @property
+    def n_periods(self):
+        return len(self.periods)
+
+    @classmethod
+    def constant(cls, network, n_periods):
+        """Horizon dengan data statis yang sama setiap periode, tanpa gudang."""
+        return cls(network, [f"B{t + 1:02d}" for t in range(n_periods)],
+                   np.tile(network.supply, (n_periods, 1)),
+                   np.tile(network.capacity, (n_periods, 1)),
+                   np.tile(network.demand, (n_periods, 1)))
+
+
+def seasonal_horizon(network, n_periods=DEFAULT_PERIODS, start_month=1, supply_amplitude=0.2,
+                     demand_amplitude=0.05, gudang_tbs=0.05, gudang_cpo=0.5):
+    """Horizon bulanan dengan pola musiman produksi TBS (puncak Oktober,
+    terendah April) dan demand yang sedikit berfluktuasi.
+
+    Gudang TBS = gudang_tbs × kapasitas olah bulanan pabrik; gudang CPO =
+    gudang_cpo × produksi CPO bulanan maksimum (pabrik) atau × demand (PD).
+    Biaya simpan HOLDING_TBS / HOLDING_CPO.
+    """
+    n = network
+    months = (start_month - 1 + np.arange(n_periods)) % 12 + 1
+    supply_factor = 1 + supply_amplitude * np.cos(2 * np.pi * (months - 10) / 12)
+    demand_factor = 1 + demand_amplitude * np.cos(2 * np.pi * (months - 12) / 12)
+    return Horizon(
+        n, [f"B{t + 1:02d}" for t in range(n_periods)],
+        np.outer(supply_factor, n.supply),
+        np.tile(n.capacity, (n_periods, 1)),
+        np.outer(demand_factor, n.demand),
+        gudang_tbs=gudang_tbs * n.capacity,
+        gudang_cpo_pabrik=gudang_cpo * n.yield_rate * n.capacity,
+        gudang_cpo_pd=gudang_cpo * n.demand,
+        biaya_simpan_tbs=np.full(len(n.pabrik), HOLDING_TBS),
+        biaya_simpan_cpo_pabrik=np.full(len(n.pabrik), HOLDING_CPO),
+        biaya_simpan_cpo_pd=np.full(len(n.pusat), HOLDING_CPO),
+    )
+
+
+def read_horizon(path, network):
+    """Baca CSV data horizon (format di docstring modul) → Horizon."""
+    n = network
+    kebun = {k: i for i, k in enumerate(n.kebun)}
+    pabrik = {p: i for i, p in enumerate(n.pabrik)}
+    pusat = {d: i for i, d in enumerate(n.pusat)}
+    nodes = {'supply': kebun, 'capacity': pabrik, 'demand': pusat}
+
+    periods, changes, storage = [], [], []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            period, parameter = row['periode'].strip(), row['parameter'].strip()
+            key, value = row['key'].strip(), float(row['value'])
+            if parameter in PERIOD_PARAMETERS:
+                if not period:
+                    raise ValueError(f"{parameter} {key}: kolom periode wajib diisi")
+                if period not in periods:
+                    periods.append(period)
+                changes.append((period, PERIOD_PARAMETERS[parameter], key, value))
+            elif parameter in STORAGE_PARAMETERS:
+                storage.append((parameter, key, value))
+            else:
+                raise ValueError(f"Parameter tidak dikenal: {parameter!r} (pilihan: "
+                                 f"{', '.join([*PERIOD_PARAMETERS, *STORAGE_PARAMETERS])})")
+    if not periods:
+        raise ValueError(f"{path}: tidak ada data periodik ({', '.join(PERIOD_PARAMETERS)})")
+
+    horizon = Horizon.constant(n, len(periods))
+    horizon.periods = periods
+    index = {period: t for t, period in enumerate(periods)}
+    for period, attr, key, value in changes:
+        array = getattr(horizon, attr)
+        if key == '*':
+            array[index[period]] = value
+        elif key in nodes[attr]:
+            array[index[period], nodes[attr][key]] = value
+        else:
+            raise ValueError(f"{attr} {period}: node tidak dikenal {key!r}")
+
+    for parameter, key, value in storage:
+        name = parameter.replace('_cpo', '_cpo_{}')
+        if parameter.endswith('_tbs'):
+            targets = [(name, pabrik)]
+        else:
+            targets = [(name.format('pabrik'), pabrik), (name.format('pd'), pusat)]
+        matched = False
+        for attr, index_of in targets:
+            if key == '*':
+                getattr(horizon, attr)[:] = value
+                matched = True
+            elif key in index_of:
+                getattr(horizon, attr)[index_of[key]] = value
+                matched = True
+        if not matched:
+            raise ValueError(f"{parameter}: node tidak dikenal {key!r}")
+    return horizon
+
+
+# ================================================================================
+# LP JENDELA
+# ================================================================================
+
+class _Layout:
+    """Offset kolom/baris dalam satu blok periode."""
+
+    def __init__(self, network):
+        n = network
+        K, P, D = len(n.kebun), len(n.pabrik), len(n.pusat)
+        self.x = slice(0, n.n_tbs)
+        self.y = slice(n.n_tbs, n.n_vars)
+        self.olah = slice(n.n_vars, n.n_vars + P)
+        self.stok_tbs = slice(n.n_vars + P, n.n_vars + 2 * P)
+        self.stok_cpo = slice(n.n_vars + 2 * P, n.n_vars + 3 * P)
+        self.stok_pd = slice(n.n_vars + 3 * P, n.n_vars + 3 * P + D)
+        self.n_cols = n.n_vars + 3 * P + D
+        # Baris: supply, kapasitas, balance TBS, balance CPO, demand
+        self.rows = (K, K + P, K + 2 * P, K + 3 * P, K + 3 * P + D)
+        self.n_rows = K + 3 * P + D
+
+
+def _period_blocks(network, layout):
+    """(A0, A1): koefisien dalam satu periode dan dari stok periode sebelumnya."""
+    n = network
+    P, D = len(n.pabrik), len(n.pusat)
+    cap, tbs_bal, cpo_bal, dem = layout.rows[:4]
+    x = np.arange(n.n_tbs)
+    y = n.n_tbs + np.arange(n.n_cpo)
+    olah = np.arange(layout.olah.start, layout.olah.stop)
+    s_tbs = np.arange(layout.stok_tbs.start, layout.stok_tbs.stop)
+    s_cpo = np.arange(layout.stok_cpo.start, layout.stok_cpo.stop)
+    s_pd = np.arange(layout.stok_pd.start, layout.stok_pd.stop)
+    pabrik, pusat = np.arange(P), np.arange(D)
+
+    rows = np.concatenate([
+        n.tbs_src,                     # supply:      Σ_p x[k,p]
+        cap + pabrik,                  # kapasitas:   olah[p]
+        tbs_bal + n.tbs_dst,           # balance TBS: Σ_k x[k,p] - olah[p] - stok_tbs[p]
+        tbs_bal + pabrik,
+        tbs_bal + pabrik,
+        cpo_bal + pabrik,              # balance CPO: yield·olah[p] - Σ_d y[p,d] - stok_cpo[p]
+        cpo_bal + n.cpo_src,
+        cpo_bal + pabrik,
+        dem + n.cpo_dst,               # demand:      Σ_p y[p,d] - stok_pd[d]
+        dem + pusat,
+    ])
+    cols = np.concatenate([x, olah, x, olah, s_tbs, olah, y, s_cpo, y, s_pd])
+    data = np.concatenate([
+        np.ones(n.n_tbs), np.ones(P),
+        np.ones(n.n_tbs), -np.ones(P), -np.ones(P),
+        np.full(P, n.yield_rate), -np.ones(n.n_cpo), -np.ones(P),
+        np.ones(n.n_cpo), -np.ones(D),
+    ])
+    A0 = sp.csr_matrix((data, (rows, cols)), shape=(layout.n_rows, layout.n_cols))
+
+    # Stok akhir periode sebelumnya masuk ke balance periode ini
+    A1 = sp.csr_matrix((np.ones(2 * P + D), (np.concatenate([tbs_bal + pabrik, cpo_bal + pabrik, dem + pusat]),
+                                              np.concatenate([s_tbs, s_cpo, s_pd]))),
+                       shape=(layout.n_rows, layout.n_cols))
+    return A0, A1
+
+
+def _window_bounds(horizon, layout, start, window, stock):
+    """Batas baris jendela periode start..start+window-1; stock = (stok_tbs,
+    stok_cpo, stok_pd) akhir periode start-1."""
+    T = horizon.n_periods
+    lo = np.zeros((window, layout.n_rows))
+    hi = np.zeros((window, layout.n_rows))
+    r = layout.rows
+    for i, t in enumerate(range(start, start + window)):
+        if t >= T:
+            continue                     # di luar horizon: supply, kapasitas, demand 0
+        hi[i, :r[0]] = horizon.supply[t]
+        hi[i, r[0]:r[1]] = horizon.capacity[t]
+        lo[i, r[3]:] = horizon.demand[t]
+    lo[:, :r[1]] = -np.inf
+    hi[:, r[3]:] = np.inf
+
+    stok_tbs, stok_cpo, stok_pd = stock
+    lo[0, r[1]:r[2]] = hi[0, r[1]:r[2]] = -stok_tbs
+    lo[0, r[2]:r[3]] = hi[0, r[2]:r[3]] = -stok_cpo
+    lo[0, r[3]:] -= stok_pd
+    return lo.ravel(), hi.ravel()
+
+
+def _build_window(horizon, layout, window):
+    n = horizon.network
+    A0, A1 = _period_blocks(n, layout)
+    A = sp.kron(sp.identity(window), A0) + sp.kron(sp.eye(window, k=-1), A1)
+
+    cost = np.zeros(layout.n_cols)
+    cost[layout.x] = n.tbs_cost
+    cost[layout.y] = n.cpo_cost
+    cost[layout.stok_tbs] = horizon.biaya_simpan_tbs
+    cost[layout.stok_cpo] = horizon.biaya_simpan_cpo_pabrik
+    cost[layout.stok_pd] = horizon.biaya_simpan_cpo_pd
+    upper = np.full(layout.n_cols, np.inf)
+    upper[layout.stok_tbs] = horizon.gudang_tbs
+    upper[layout.stok_cpo] = horizon.gudang_cpo_pabrik
+    upper[layout.stok_pd] = horizon.gudang_cpo_pd
+
+    lo, hi = _window_bounds(horizon, layout, 0, window, _initial_stock(horizon))
+    return highs_from_arrays(np.tile(cost, window), A, np.zeros(window * layout.n_cols),
+                             np.tile(upper, window), lo, hi)
+
+
+def _initial_stock(horizon):
+    return horizon.stok_awal_tbs, horizon.stok_awal_cpo_pabrik, horizon.stok_awal_cpo_pd
+
+
+def _shift_basis(h, layout):
+    """Geser basis satu periode ke depan: blok i+1 → blok i. Blok pertama
+    pindah ke akhir (np.roll) sehingga jumlah variabel basis tetap."""
+    basis = h.getBasis()
+    basis.col_status = np.roll(np.asarray(basis.col_status, dtype=object), -layout.n_cols).tolist()
+    basis.row_status = np.roll(np.asarray(basis.row_status, dtype=object), -layout.n_rows).tolist()
+    h.setBasis(basis)
+
+
+# ================================================================================
+# HASIL
+# ================================================================================
+
+class PlanResult:
+    """Rencana per periode (array [periode, ...]) dan statistik solve."""
+
+    def __init__(self, horizon, method):
+        n, T = horizon.network, horizon.n_periods
+        P, D = len(n.pabrik), len(n.pusat)
+        self.horizon = horizon
+        self.method = method
+        self.status = 'Not Solved'
+        self.failed_period = None          # indeks periode yang jendelanya infeasible
+        self.x = np.zeros((T, n.n_tbs))
+        self.y = np.zeros((T, n.n_cpo))
+        self.olah = np.zeros((T, P))
+        self.stok_tbs = np.zeros((T, P))
+        self.stok_cpo = np.zeros((T, P))
+        self.stok_pd = np.zeros((T, D))
+        self.n_planned = 0                 # periode yang sudah dikunci
+        self.n_solves = 0
+        self.iterations = 0
+        self.solve_time = 0.0
+
+    def _store(self, t, values, layout):
+        self.x[t] = values[layout.x]
+        self.y[t] = values[layout.y]
+        self.olah[t] = values[layout.olah]
+        self.stok_tbs[t] = values[layout.stok_tbs]
+        self.stok_cpo[t] = values[layout.stok_cpo]
+        self.stok_pd[t] = values[layout.stok_pd]
+
+    def costs(self):
+        """(biaya_tbs, biaya_cpo, biaya_simpan) per periode."""
+        h, n = self.horizon, self.horizon.network
+        holding = (self.stok_tbs @ h.biaya_simpan_tbs + self.stok_cpo @ h.biaya_simpan_cpo_pabrik
+                   + self.stok_pd @ h.biaya_simpan_cpo_pd)
+        return self.x @ n.tbs_cost, self.y @ n.cpo_cost, holding
+
+    @property
+    def total_biaya(self):
+        return float(sum(c[:self.n_planned].sum() for c in self.costs()))
+
+    def rows(self):
+        """Satu dict per periode sesuai PLAN_COLUMNS."""
+        biaya_tbs, biaya_cpo, biaya_simpan = self.costs()
+        total = biaya_tbs + biaya_cpo + biaya_simpan
+        for t, period in enumerate(self.horizon.periods):
+            if t < self.n_planned:
+                status = 'Optimal'
+            else:
+                status = self.status if t == self.failed_period else '-'
+            yield dict(zip(PLAN_COLUMNS, [
+                period, status,
+                biaya_tbs[t], biaya_cpo[t], biaya_simpan[t], total[t],
+                self.x[t].sum(), self.olah[t].sum(), self.y[t].sum(), self.horizon.demand[t].sum(),
+                self.stok_tbs[t].sum(), self.stok_cpo[t].sum(), self.stok_pd[t].sum(),
+            ]))
+
+
+# ================================================================================
+# SOLVE
+# ================================================================================
+
+def solve_rolling(horizon, window=DEFAULT_WINDOW, warm_start=True):
+    """Rolling horizon: solve jendela `window` periode, kunci periode pertama,
+    geser satu periode. Return PlanResult; berhenti di jendela pertama yang
+    tidak Optimal (status dan failed_period dicatat)."""
+    require_highspy()
+    T = horizon.n_periods
+    window = max(1, min(window, T))
+    layout = _Layout(horizon.network)
+    plan = PlanResult(horizon, f"rolling horizon ({window} periode)")
+
+    start = time.perf_counter()
+    h = _build_window(horizon, layout, window)
+    all_rows = np.arange(window * layout.n_rows, dtype=np.int32)
+    stock = _initial_stock(horizon)
+    for t in range(T):
+        if t:
+            lo, hi = _window_bounds(horizon, layout, t, window, stock)
+            if warm_start:
+                _shift_basis(h, layout)
+            else:
+                h.clearSolver()
+            h.changeRowsBounds(len(all_rows), all_rows, lo, hi)
+        h.run()
+        plan.n_solves += 1
+        plan.iterations += h.getInfo().simplex_iteration_count
+        status = status_name(h)
+        if status != 'Optimal':
+            plan.status, plan.failed_period = status, t
+            break
+        values = primal_values(h)[:layout.n_cols]
+        plan._store(t, values, layout)
+        plan.n_planned = t + 1
+        stock = (plan.stok_tbs[t], plan.stok_cpo[t], plan.stok_pd[t])
+    else:
+        plan.status = 'Optimal'
+    plan.solve_time = time.perf_counter() - start
+    return plan
+
+
+def solve_full(horizon):
+    """Seluruh horizon sebagai satu LP (pembanding rolling horizon)."""
+    require_highspy()
+    T = horizon.n_periods
+    layout = _Layout(horizon.network)
+    plan = PlanResult(horizon, f"LP penuh ({T} periode)")
+
+    start = time.perf_counter()
+    h = _build_window(horizon, layout, T)
+    h.run()
+    plan.n_solves = 1
+    plan.iterations = h.getInfo().simplex_iteration_count
+    plan.status = status_name(h)
+    if plan.status == 'Optimal':
+        values = primal_values(h).reshape(T, layout.n_cols)
+        for t in range(T):
+            plan._store(t, values[t], layout)
+        plan.n_planned = T
+    plan.solve_time = time.perf_counter() - start
+    return plan
+
+
+# ================================================================================
+# OUTPUT
+# ================================================================================
+
+def write_plan(plan, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=PLAN_COLUMNS)
+        writer.writeheader()
+        writer.writerows(plan.rows())
+
+
+def print_plan(plan):
+    print(f"{'Periode':<10} {'Status':<11} {'Transport':>16} {'Simpan':>13} {'TBS olah':>11} "
+          f"{'CPO kirim':>11} {'Demand':>10} {'Stok TBS':>10} {'Stok CPO':>10}")
+    print("-" * 110)
+    for row in plan.rows():
+        print(f"{row['periode']:<10} {row['status']:<11} {row['biaya_tbs'] + row['biaya_cpo']:>16,.0f} "
+              f"{row['biaya_simpan']:>13,.0f} {row['tbs_diolah']:>11,.1f} {row['cpo_dikirim']:>11,.1f} "
+              f"{row['demand']:>10,.1f} {row['stok_tbs']:>10,.1f} "
+              f"{row['stok_cpo_pabrik'] + row['stok_cpo_pd']:>10,.1f}")
+
+
+def run_plan(horizon_path=None, periods=DEFAULT_PERIODS, window=DEFAULT_WINDOW, full=False,
+             output=PLAN_OUTPUT, n_kebun=None):
+    """Alur `sawit plan`: horizon dari CSV (atau pola musiman), rolling
+    horizon, opsional LP penuh sebagai pembanding. Return PlanResult."""
+    from sawit.network import Network
+
+    print("="*80)
+    print("RENCANA MULTI-PERIODE (ROLLING HORIZON)")
+    print("="*80)
+
+    if n_kebun:
+        from sawit.instances import generate_instance
+        instance, source = generate_instance(n_kebun), f"instance sintetis {n_kebun} kebun"
+    else:
+        from sawit.loader import load_default_instance
+        from sawit.pipeline import DATA_SOURCES
+        instance, source = load_default_instance()
+        source = DATA_SOURCES[source]
+    network = Network.from_dicts(*instance)
+    if horizon_path:
+        horizon = read_horizon(horizon_path, network)
+        print(f"✓ Horizon: {horizon_path} ({horizon.n_periods} periode), jaringan dari {source}")
+    else:
+        horizon = seasonal_horizon(network, periods)
+        print(f"✓ Horizon musiman {horizon.n_periods} periode dari {source}")
+
+    plan = solve_rolling(horizon, window)
+    print(f"✓ {plan.method}: {plan.n_solves} solve, {plan.iterations:,} iterasi simplex, "
+          f"{plan.solve_time:.3f} s\n")
+    print_plan(plan)
+    if plan.status != 'Optimal':
+        print(f"\n⚠️  Jendela periode {horizon.periods[plan.failed_period]}: {plan.status}; "
+              f"rencana berhenti setelah {plan.n_planned} periode")
+    else:
+        print(f"\nTotal biaya {horizon.n_periods} periode: Rp {plan.total_biaya:,.0f}")
+
+    if full:
+        reference = solve_full(horizon)
+        print(f"✓ {reference.method}: {reference.iterations:,} iterasi simplex, {reference.solve_time:.3f} s")
+        if reference.status == 'Optimal' and plan.status == 'Optimal':
+            gap = plan.total_biaya - reference.total_biaya
+            print(f"   Total biaya LP penuh: Rp {reference.total_biaya:,.0f} "
+                  f"(rolling horizon +Rp {gap:,.0f}, {gap / reference.total_biaya:.4%})")
+        else:
+            print(f"   Status LP penuh: {reference.status}")
+
+    write_plan(plan, output)
+    print(f"✓ Hasil: {output}")
+    return plan
@@ -0,0 +1,399 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/netflow.py
+Deskripsi: Min-cost flow khusus untuk jaringan dua tahap TBS → CPO.
+
+Dengan mengubah CPO ke satuan setara TBS (y / yield_rate), constraint
+material balance menjadi konservasi aliran biasa sehingga model menjadi
+min-cost flow murni:
+
+    S ──supply──▶ Kebun ──cost_tbs──▶ Pabrik_in ──capacity──▶ Pabrik_out
+      ──cost_cpo·yield──▶ PD ──demand/yield──▶ T
+
+Backend netflow (solve_netflow) menyelesaikan jaringan ini dengan
+SimpleMinCostFlow OR-Tools (cost scaling, C++), tanpa solver LP sama sekali.
+OR-Tools hanya menerima kapasitas dan biaya int64, jadi data diskalakan ke
+bilangan bulat (_integer_network); untuk data ton/Rupiah bulat skala ini
+eksak. Solver berjalan di subprocess sawit/ortools_flow.py (lihat di sana
+kenapa tidak in-process). ortools adalah dependensi opsional
+(pip install ortools).
+
+generate_instance, benchmarks/bench_backends.py (build + solve + ambil nilai,
+termasuk ~0,25 s start subprocess):
+
+       rute      cbc    highs    netflow
+     10.271   0,15 s   0,21 s     0,30 s
+     52.174   0,94 s   2,19 s     0,64 s
+    104.577   2,31 s   3,76 s     1,34 s
+
+Pada jaringan kecil start subprocess mendominasi; netflow ikut portfolio
+(sawit/portfolio.py) sehingga dipakai jika paling cepat.
+
+Engine Python di bawah (min_cost_flow) tetap dipakai untuk max_flow.
+Algoritma: primal-dual (successive shortest path dengan potensial node).
+Potensial awal = jarak Bellman-Ford dari source, sehingga arc berbiaya
+negatif (tanpa siklus negatif) didukung; jika semua biaya non-negatif
+potensial awal nol. Setiap fase menghitung jarak terpendek tereduksi dengan Dijkstra dari
+scipy.sparse.csgraph (C), lalu mendorong blocking flow (Dinic) pada sub-graf
+arc dengan reduced cost nol, sehingga satu fase dapat mengaugmentasi banyak
+path sekaligus. Semua arc (maju dan balik) disimpan dalam array NumPy yang
+terurut per node asal; tidak ada objek Python per arc.
+
+Dengan biaya nol, mesin yang sama menjadi max-flow Dinic (max_flow), dipakai
+oleh pre-check feasibility sawit/feasibility.py.
+"""
+
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import breadth_first_order, dijkstra, shortest_path
+
+
+def require_ortools():
+    """Cek ortools terpasang tanpa meng-import-nya di proses ini."""
+    if importlib.util.find_spec("ortools") is None:
+        raise ImportError("Backend netflow membutuhkan OR-Tools: pip install ortools")
+
+
+def min_cost_flow(tail, head, cost, cap, n_nodes, source, sink, target_flow):
+    """Kirim hingga target_flow dari source ke sink dengan biaya minimum.
+
+    Biaya boleh negatif selama tidak ada siklus negatif di antara arc dengan
+    kapasitas. Return (flow per arc, total flow terkirim, jumlah fase Dijkstra).
+    """
+    tail = np.asarray(tail, dtype=np.int64)
+    head = np.asarray(head, dtype=np.int64)
+    cost = np.asarray(cost, dtype=float)
+    cap = np.asarray(cap, dtype=float)
+
+    # Arc residual: [maju..., balik...], lalu diurutkan per node asal sekali
+    # saja agar setiap sub-graf bisa dijadikan CSR tanpa sorting ulang.
+    m = len(tail)
+    all_tail = np.concatenate([tail, head])
+    order = np.argsort(all_tail, kind="stable")
+    position = np.empty(2 * m, dtype=np.int64)
+    position[order] = np.arange(2 * m)
+
+    arcs = _ResidualArcs(
+        tail=all_tail[order],
+        head=np.concatenate([head, tail])[order],
+        cost=np.concatenate([cost, -cost])[order],
+        cap=np.concatenate([cap, np.zeros(m)])[order],
+        rev=position[np.concatenate([np.arange(m, 2 * m), np.arange(m)])[order]],
+        n_nodes=n_nodes,
+    )
+
+    cap_eps = 1e-9 * max(1.0, float(target_flow))
+    cost_eps = 1e-9 * max(1.0, float(np.abs(cost).max(initial=0.0)))
+    pi = _initial_potentials(arcs, source, cap_eps, cost_eps)
+    sent = 0.0
+    phases = 0
+
+    while sent < target_flow - cap_eps:
+        active = arcs.cap > cap_eps
+        reduced = arcs.cost[active] + pi[arcs.tail[active]] - pi[arcs.head[active]]
+        dist = dijkstra(arcs.graph(active, np.maximum(reduced, 0.0)), indices=source)
+        if not np.isfinite(dist[sink]):
+            break
+        pi += np.minimum(dist, dist[sink])
+        phases += 1
+        sent += _blocking_flows(arcs, pi, source, sink, target_flow - sent, cap_eps, cost_eps)
+
+    flow = arcs.cap[position[m:]]          # kapasitas residual arc balik = flow
+    return flow, sent, phases
+
+
+def max_flow(tail, head, cap, n_nodes, source, sink):
+    """Aliran maksimum source → sink.
+
+    Return (flow per arc, nilai aliran, mask node sisi source dari min cut).
+    Arc dengan tail di sisi source dan head di sisi sink adalah arc jenuh
+    yang membentuk min cut.
+    """
+    tail = np.asarray(tail, dtype=np.int64)
+    head = np.asarray(head, dtype=np.int64)
+    cap = np.asarray(cap, dtype=float)
+    # Batas atas aliran (juga skala toleransi kapasitas di min_cost_flow)
+    limit = min(float(cap[tail == source].sum()), float(cap[head == sink].sum()))
+    flow, value, _ = min_cost_flow(tail, head, np.zeros(len(tail)), cap, n_nodes, source, sink, limit)
+
+    # Graf residual: arc maju yang belum jenuh dan arc balik yang membawa aliran
+    eps = 1e-9 * max(1.0, value)
+    forward, backward = cap - flow > eps, flow > eps
+    residual = sp.csr_matrix((np.ones(forward.sum() + backward.sum()),
+                              (np.concatenate([tail[forward], head[backward]]),
+                               np.concatenate([head[forward], tail[backward]]))), shape=(n_nodes, n_nodes))
+    source_side = np.zeros(n_nodes, dtype=bool)
+    source_side[breadth_first_order(residual, source, return_predecessors=False)] = True
+    return flow, value, source_side
+
+
+def _initial_potentials(arcs, source, cap_eps, cost_eps):
+    """Potensial awal: jarak Bellman-Ford dari source pada arc berkapasitas,
+    sehingga semua reduced cost yang terjangkau >= -cost_eps.
+
+    Relaksasi dilakukan per ronde untuk semua arc sekaligus dan hanya
+    perbaikan > cost_eps yang dihitung, sehingga siklus ≈ 0 akibat pembulatan
+    (arc maju/balik residual) tidak dianggap siklus negatif. Node yang tidak
+    terjangkau tidak pernah dilewati path augmentasi; potensialnya nol.
+    """
+    active = arcs.cap > cap_eps
+    if not (arcs.cost[active] < 0).any():
+        return np.zeros(arcs.n_nodes)
+    tail, head, cost = arcs.tail[active], arcs.head[active], arcs.cost[active]
+    dist = np.full(arcs.n_nodes, np.inf)
+    dist[source] = 0.0
+    for _ in range(arcs.n_nodes):
+        relaxed = dist.copy()
+        np.minimum.at(relaxed, head, dist[tail] + cost)
+        improved = relaxed < dist - cost_eps
+        if not improved.any():
+            return np.where(np.isfinite(dist), dist, 0.0)
+        dist[improved] = relaxed[improved]
+    raise ValueError("min_cost_flow: ada siklus berbiaya negatif")
+
+
+class _ResidualArcs:
+    """Array arc residual yang terurut per node asal (tail)."""
+
+    __slots__ = ("tail", "head", "cost", "cap", "rev", "n_nodes", "_by_head")
+
+    def __init__(self, tail, head, cost, cap, rev, n_nodes):
+        self.tail = tail
+        self.head = head
+        self.cost = cost
+        self.cap = cap
+        self.rev = rev
+        self.n_nodes = n_nodes
+        self._by_head = np.argsort(head, kind="stable")
+
+    def graph(self, mask, weights):
+        """CSR untuk arc terpilih (mask) dengan bobot weights."""
+        indptr = np.zeros(self.n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.tail[mask], minlength=self.n_nodes), out=indptr[1:])
+        return sp.csr_matrix((weights, self.head[mask], indptr), shape=(self.n_nodes, self.n_nodes))
+
+    def reverse_graph(self, mask):
+        """CSR graf terbalik (head → tail) untuk arc terpilih, bobot 1."""
+        selected = self._by_head[mask[self._by_head]]
+        indptr = np.zeros(self.n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.head[selected], minlength=self.n_nodes), out=indptr[1:])
+        return sp.csr_matrix((np.ones(len(selected)), self.tail[selected], indptr),
+                             shape=(self.n_nodes, self.n_nodes))
+
+
+def _blocking_flows(arcs, pi, source, sink, limit, cap_eps, cost_eps):
+    """Dinic pada sub-graf admissible (reduced cost ≈ 0). Mengubah arcs.cap.
+
+    Level graph hanya memuat arc yang berada pada path S→T terpendek (dihitung
+    dari dua arah dengan BFS csgraph), sehingga DFS Python hampir tidak pernah
+    menemui jalan buntu kecuali karena arc yang sudah jenuh.
+    """
+    reduced = arcs.cost + pi[arcs.tail] - pi[arcs.head]
+    zero_cost = np.abs(reduced) <= cost_eps
+    pushed_total = 0.0
+
+    while pushed_total < limit - cap_eps:
+        admissible = zero_cost & (arcs.cap > cap_eps)
+        from_source = shortest_path(arcs.graph(admissible, np.ones(admissible.sum())),
+                                    indices=source, unweighted=True)
+        if not np.isfinite(from_source[sink]):
+            break
+        to_sink = shortest_path(arcs.reverse_graph(admissible), indices=sink, unweighted=True)
+
+        on_path = admissible & (from_source[arcs.tail] + 1 + to_sink[arcs.head] == from_source[sink])
+        level_arcs = np.flatnonzero(on_path)
+        start = np.searchsorted(arcs.tail[level_arcs], np.arange(arcs.n_nodes + 1)).tolist()
+
+        heads = arcs.head[level_arcs].tolist()
+        tails = arcs.tail[level_arcs].tolist()
+        before = arcs.cap[level_arcs]
+        capacity = before.tolist()
+        ptr = start[:-1]
+
+        # DFS dengan current-arc pointer; path berisi indeks lokal level_arcs
+        path = []
+        u = source
+        while True:
+            if u == sink:
+                f = min(min(capacity[a] for a in path), limit - pushed_total)
+                for a in path:
+                    capacity[a] -= f
+                pushed_total += f
+                if pushed_total >= limit - cap_eps:
+                    break
+                path = []
+                u = source
+                continue
+
+            end = start[u + 1]
+            while ptr[u] < end and capacity[ptr[u]] <= cap_eps:
+                ptr[u] += 1
+            if ptr[u] < end:
+                path.append(ptr[u])
+                u = heads[ptr[u]]
+            else:
+                if u == source:
+                    break
+                u = tails[path.pop()]
+                ptr[u] += 1
+
+        delta = before - np.asarray(capacity)
+        arcs.cap[level_arcs] -= delta
+        arcs.cap[arcs.rev[level_arcs]] += delta
+    return pushed_total
+
+
+def flow_graph(network):
+    """Arc jaringan aliran (satuan setara TBS) untuk Network.
+
+    Node: S, kebun, pabrik_in, pabrik_out, PD, T. Arc berurutan per blok:
+    S→kebun (supply), rute TBS, pabrik_in→pabrik_out (kapasitas), rute CPO,
+    PD→T (demand / yield). Return (tail, head, cost, cap, n_nodes).
+    """
+    K, P, D = len(network.kebun), len(network.pabrik), len(network.pusat)
+    yr = network.yield_rate
+
+    # Node: S, kebun, pabrik_in, pabrik_out, PD, T
+    source = 0
+    kebun = 1 + np.arange(K)
+    p_in = 1 + K + np.arange(P)
+    p_out = 1 + K + P + np.arange(P)
+    pusat = 1 + K + 2 * P + np.arange(D)
+    sink = 1 + K + 2 * P + D
+    n_nodes = sink + 1
+
+    required = network.demand / yr          # demand CPO dalam satuan setara TBS
+    target = float(required.sum())
+    # Aliran rute tidak pernah melebihi total supply (atau demand jika lebih besar)
+    unbounded = np.full(max(network.n_tbs, network.n_cpo), max(target, float(network.supply.sum())))
+
+    tail = np.concatenate([np.full(K, source), kebun[network.tbs_src], p_in,
+                           p_out[network.cpo_src], pusat])
+    head = np.concatenate([kebun, p_in[network.tbs_dst], p_out, pusat[network.cpo_dst],
+                           np.full(D, sink)])
+    cost = np.concatenate([np.zeros(K), network.tbs_cost, np.zeros(P),
+                           network.cpo_cost * yr, np.zeros(D)])
+    cap = np.concatenate([network.supply, unbounded[:network.n_tbs], network.capacity,
+                          unbounded[:network.n_cpo], required])
+    return tail, head, cost, cap, n_nodes
+
+
+# Batas nilai int64 yang dipakai SimpleMinCostFlow (biaya × jumlah node dan
+# total biaya harus muat tanpa overflow)
+_INT64_HEADROOM = 2 ** 62
+
+
+def _integer_scale(values, limit):
+    """Faktor skala agar values bulat: 1 jika sudah bulat dan |values| <= limit,
+    selain itu limit / max|values| (dibulatkan saat dikonversi)."""
+    largest = float(np.abs(values).max(initial=0.0))
+    if largest == 0.0:
+        return 1.0
+    if largest <= limit and np.allclose(values, np.rint(values), rtol=0.0, atol=1e-9):
+        return 1.0
+    return limit / largest
+
+
+def _integer_network(network):
+    """Jaringan flow_graph dalam bilangan bulat untuk SimpleMinCostFlow.
+
+    yield_rate = p/q: satu unit aliran = 1/p ton TBS = 1/q ton CPO, sehingga
+    supply·p, capacity·p dan demand·q bulat untuk data ton bulat; biaya per
+    unit menjadi cost_tbs·q dan cost_cpo·p (dikali p·q). Data pecahan
+    diskalakan ke presisi 1 kg, biaya pecahan ke sisa ruang int64.
+
+    Demand (>=) ditulis sebagai supply node: PD menyerap demand-nya, T
+    menyerap sisa supply lewat arc bypass S→T, dan arc PD→T tanpa batas
+    membawa aliran di atas demand jika biayanya negatif. Return
+    (tail, head, cost, cap, supplies, unit TBS, unit CPO) dengan arc berurutan
+    seperti flow_graph, ditambah arc bypass di akhir.
+    """
+    K, P, D = len(network.kebun), len(network.pabrik), len(network.pusat)
+    tail, head, _, _, n_nodes = flow_graph(network)
+    sink = n_nodes - 1
+
+    ratio = Fraction(float(network.yield_rate)).limit_denominator(10 ** 4)
+    if abs(float(ratio) - network.yield_rate) > 1e-12:
+        ratio = Fraction(round(network.yield_rate * 10 ** 6), 10 ** 6)
+    p, q = ratio.numerator, ratio.denominator
+
+    quantities = np.concatenate([network.supply * p, network.capacity * p, network.demand * q])
+    unit = 1
+    while unit < 1000 and not np.allclose(quantities * unit, np.rint(quantities * unit), rtol=0.0, atol=1e-9):
+        unit *= 10
+    quantities = np.rint(quantities * unit).astype(np.int64)
+    supply, capacity, required = np.split(quantities, [K, K + P])
+    total = int(supply.sum())
+
+    # Arc PD→T flow_graph (blok terakhir) diganti arc excess tanpa batas demand
+    m = len(tail) - D
+    tail = np.concatenate([tail[:m], sink - D + np.arange(D), [0]]).astype(np.int64)
+    head = np.concatenate([head[:m], np.full(D + 1, sink)]).astype(np.int64)
+    cost = np.concatenate([np.zeros(K), network.tbs_cost * q, np.zeros(P), network.cpo_cost * p, np.zeros(D + 1)])
+    cost_scale = _integer_scale(cost, _INT64_HEADROOM // (4 * max(total, n_nodes + 1)))
+    cost = np.rint(cost * cost_scale).astype(np.int64)
+    unbounded = np.full(max(network.n_tbs, network.n_cpo), total, dtype=np.int64)
+    cap = np.concatenate([supply, unbounded[:network.n_tbs], capacity, unbounded[:network.n_cpo],
+                          np.full(D + 1, total, dtype=np.int64)])
+
+    supplies = np.zeros(n_nodes, dtype=np.int64)
+    supplies[0] = total
+    supplies[sink - D:sink] = -required
+    supplies[sink] = -(total - int(required.sum()))
+    return tail, head, cost, cap, supplies, p * unit, q * unit
+
+
+# SimpleMinCostFlow.Status → string gaya LpStatus
+_STATUS_NAMES = {'OPTIMAL': 'Optimal', 'INFEASIBLE': 'Infeasible', 'UNBALANCED': 'Infeasible'}
+
+
+def run_min_cost_flow(tail, head, cost, cap, supplies):
+    """Jalankan SimpleMinCostFlow di subprocess sawit/ortools_flow.py.
+    Return (nama status OR-Tools, flow per arc)."""
+    require_ortools()
+    payload = io.BytesIO()
+    np.savez(payload, tail=tail, head=head, cap=cap, cost=cost, supplies=supplies)
+    worker = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ortools_flow.py")
+    proc = subprocess.run([sys.executable, worker], input=payload.getvalue(),
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        raise RuntimeError(f"OR-Tools min-cost flow gagal (kode {proc.returncode}):\n"
+                           f"{proc.stderr.decode(errors='replace')[-2000:]}")
+    out = np.load(io.BytesIO(proc.stdout))
+    return str(out["status"]), out["flow"]
+
+
+def solve_netflow(network):
+    """Selesaikan Network sebagai min-cost flow (OR-Tools). Return SolveResult."""
+    from sawit.backends import SolveResult, route_values
+
+    start = time.perf_counter()
+    K, P = len(network.kebun), len(network.pabrik)
+    tail, head, cost, cap, supplies, tbs_unit, cpo_unit = _integer_network(network)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    status, flow = run_min_cost_flow(tail, head, cost, cap, supplies)
+    solve_time = time.perf_counter() - start
+
+    status = _STATUS_NAMES.get(status, 'Undefined')
+    if status == 'Optimal':
+        x_vals = flow[K:K + network.n_tbs] / tbs_unit
+        y_vals = flow[K + network.n_tbs + P:K + network.n_tbs + P + network.n_cpo] / cpo_unit
+    else:
+        x_vals, y_vals = np.zeros(network.n_tbs), np.zeros(network.n_cpo)
+    objective = float(network.tbs_cost @ x_vals + network.cpo_cost @ y_vals)
+
+    x, y = route_values(network, x_vals, y_vals)
+    result = SolveResult("netflow", status, objective, x, y, solve_time)
+    result.build_time = build_time
+    return result
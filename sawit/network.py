@@ -0,0 +1,180 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/network.py
+Deskripsi: Representasi jaringan distribusi dua tahap (Kebun → Pabrik → PD)
+           dalam bentuk array NumPy dan matriks insidensi sparse SciPy.
+
+Urutan baris constraint (dipakai oleh semua builder/solver):
+    [0, K)            kapasitas supply kebun      (<=)
+    [K, K+P)          kapasitas pabrik            (<=)
+    [K+P, K+2P)       material balance TBS → CPO  (==)
+    [K+2P, K+2P+D)    pemenuhan demand PD         (>=)
+
+Urutan kolom: semua rute TBS (X_TBS) lalu semua rute CPO (Y_CPO).
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+# Jenis baris constraint sesuai urutan di atas
+ROW_TYPES = ('Supply Kebun', 'Kapasitas Pabrik', 'Material Balance', 'Demand PD')
+
+
+class Network:
+    """Jaringan distribusi dengan node dan rute ber-indeks integer."""
+
+    def __init__(self, kebun, pabrik, pusat, supply, capacity, demand, yield_rate,
+                 tbs_src, tbs_dst, tbs_cost, cpo_src, cpo_dst, cpo_cost):
+        self.kebun = list(kebun)
+        self.pabrik = list(pabrik)
+        self.pusat = list(pusat)
+        self.supply = np.asarray(supply, dtype=float)
+        self.capacity = np.asarray(capacity, dtype=float)
+        self.demand = np.asarray(demand, dtype=float)
+        self.yield_rate = float(yield_rate)
+        self.tbs_src = np.asarray(tbs_src, dtype=np.int64)
+        self.tbs_dst = np.asarray(tbs_dst, dtype=np.int64)
+        self.tbs_cost = np.asarray(tbs_cost, dtype=float)
+        self.cpo_src = np.asarray(cpo_src, dtype=np.int64)
+        self.cpo_dst = np.asarray(cpo_dst, dtype=np.int64)
+        self.cpo_cost = np.asarray(cpo_cost, dtype=float)
+
+    @classmethod
+    def from_dicts(cls, supply_capacity, factory_capacity, demand, cost_tbs, cost_cpo, yield_rate):
+        """Bangun Network dari dict seperti di python_solver.py dalam satu pass."""
+        kebun_index = {k: i for i, k in enumerate(supply_capacity)}
+        pabrik_index = {p: i for i, p in enumerate(factory_capacity)}
+        pd_index = {d: i for i, d in enumerate(demand)}
+
+        n_tbs = len(cost_tbs)
+        tbs_src = np.fromiter((kebun_index[k] for k, _ in cost_tbs), dtype=np.int64, count=n_tbs)
+        tbs_dst = np.fromiter((pabrik_index[p] for _, p in cost_tbs), dtype=np.int64, count=n_tbs)
+        tbs_cost = np.fromiter(cost_tbs.values(), dtype=float, count=n_tbs)
+
+        n_cpo = len(cost_cpo)
+        cpo_src = np.fromiter((pabrik_index[p] for p, _ in cost_cpo), dtype=np.int64, count=n_cpo)
+        cpo_dst = np.fromiter((pd_index[d] for _, d in cost_cpo), dtype=np.int64, count=n_cpo)
+        cpo_cost = np.fromiter(cost_cpo.values(), dtype=float, count=n_cpo)
+
+        return cls(
+            supply_capacity.keys(), factory_capacity.keys(), demand.keys(),
+            list(supply_capacity.values()), list(factory_capacity.values()), list(demand.values()),
+            yield_rate, tbs_src, tbs_dst, tbs_cost, cpo_src, cpo_dst, cpo_cost,
+        )
+
+    def to_dicts(self):
+        """Kebalikan from_dicts: tuple (supply_capacity, factory_capacity, demand,
+        cost_tbs, cost_cpo, yield_rate). Angka bulat dikembalikan sebagai int."""
+        def number(v):
+            return int(v) if float(v).is_integer() else v
+
+        return (
+            {k: number(v) for k, v in zip(self.kebun, self.supply.tolist())},
+            {p: number(v) for p, v in zip(self.pabrik, self.capacity.tolist())},
+            {d: number(v) for d, v in zip(self.pusat, self.demand.tolist())},
+            {r: number(v) for r, v in zip(self.tbs_routes(), self.tbs_cost.tolist())},
+            {r: number(v) for r, v in zip(self.cpo_routes(), self.cpo_cost.tolist())},
+            self.yield_rate,
+        )
+
+    def copy(self):
+        """Salinan dengan array sendiri (aman untuk dimodifikasi per skenario)."""
+        return Network(
+            self.kebun, self.pabrik, self.pusat,
+            self.supply.copy(), self.capacity.copy(), self.demand.copy(), self.yield_rate,
+            self.tbs_src, self.tbs_dst, self.tbs_cost.copy(),
+            self.cpo_src, self.cpo_dst, self.cpo_cost.copy(),
+        )
+
+    # ----------------------------------------------------------------------------
+    # Ukuran
+    # ----------------------------------------------------------------------------
+
+    @property
+    def n_tbs(self):
+        return len(self.tbs_cost)
+
+    @property
+    def n_cpo(self):
+        return len(self.cpo_cost)
+
+    @property
+    def n_vars(self):
+        return self.n_tbs + self.n_cpo
+
+    @property
+    def n_rows(self):
+        return len(self.kebun) + 2 * len(self.pabrik) + len(self.pusat)
+
+    # ----------------------------------------------------------------------------
+    # Rute dan nama
+    # ----------------------------------------------------------------------------
+
+    def tbs_routes(self):
+        """Daftar tuple (kebun, pabrik) sesuai urutan kolom X_TBS."""
+        return [(self.kebun[i], self.pabrik[j]) for i, j in zip(self.tbs_src.tolist(), self.tbs_dst.tolist())]
+
+    def cpo_routes(self):
+        """Daftar tuple (pabrik, pd) sesuai urutan kolom Y_CPO."""
+        return [(self.pabrik[i], self.pusat[j]) for i, j in zip(self.cpo_src.tolist(), self.cpo_dst.tolist())]
+
+    def row_names(self):
+        return (
+            [f"Kapasitas_Supply_{k}" for k in self.kebun]
+            + [f"Kapasitas_Pabrik_{p}" for p in self.pabrik]
+            + [f"Material_Balance_{p}" for p in self.pabrik]
+            + [f"Demand_{d}" for d in self.pusat]
+        )
+
+    # ----------------------------------------------------------------------------
+    # Matriks insidensi
+    # ----------------------------------------------------------------------------
+
+    def objective(self):
+        """Vektor biaya c untuk kolom [X_TBS, Y_CPO]."""
+        return np.concatenate([self.tbs_cost, self.cpo_cost])
+
+    def constraint_matrix(self):
+        """Matriks constraint A (CSR) untuk semua baris sekaligus.
+
+        Dibangun langsung dari array indeks rute, tanpa scan nama node,
+        sehingga biayanya O(jumlah rute).
+        """
+        K, P, D = len(self.kebun), len(self.pabrik), len(self.pusat)
+        n_tbs, n_cpo = self.n_tbs, self.n_cpo
+        x_cols = np.arange(n_tbs)
+        y_cols = n_tbs + np.arange(n_cpo)
+
+        rows = np.concatenate([
+            self.tbs_src,                  # supply:   Σ_p x[k,p]
+            K + self.tbs_dst,              # kapasitas: Σ_k x[k,p]
+            K + P + self.tbs_dst,          # balance:  -yield · Σ_k x[k,p]
+            K + P + self.cpo_src,          # balance:  + Σ_d y[p,d]
+            K + 2 * P + self.cpo_dst,      # demand:   Σ_p y[p,d]
+        ])
+        cols = np.concatenate([x_cols, x_cols, x_cols, y_cols, y_cols])
+        data = np.concatenate([
+            np.ones(n_tbs),
+            np.ones(n_tbs),
+            np.full(n_tbs, -self.yield_rate),
+            np.ones(n_cpo),
+            np.ones(n_cpo),
+        ])
+        return sp.csr_matrix((data, (rows, cols)), shape=(K + 2 * P + D, n_tbs + n_cpo))
+
+    def row_bounds(self):
+        """Batas bawah dan atas setiap baris constraint (lo <= A·v <= hi)."""
+        P, D = len(self.pabrik), len(self.pusat)
+        lo = np.concatenate([
+            np.full(len(self.kebun) + P, -np.inf),
+            np.zeros(P),
+            self.demand,
+        ])
+        hi = np.concatenate([
+            self.supply,
+            self.capacity,
+            np.zeros(P),
+            np.full(D, np.inf),
+        ])
+        return lo, hi
@@ -0,0 +1,40 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/ortools_flow.py
+Deskripsi: Proses solver backend netflow: SimpleMinCostFlow OR-Tools.
+
+Dijalankan sebagai script oleh sawit/netflow.py (bukan di-import), sama
+seperti binary CBC: array int64 (tail, head, cap, cost, supplies) dibaca
+dari stdin sebagai npz, lalu status dan flow per arc ditulis ke stdout
+sebagai npz. Proses terpisah diperlukan karena wheel ortools membawa
+libhighs.so.1 sendiri (HiGHS versi lain dari highspy); di satu proses kedua
+library bentrok (import gagal atau segfault).
+
+Hanya membutuhkan numpy dan ortools.
+"""
+
+import io
+import sys
+
+import numpy as np
+
+
+def main():
+    from ortools.graph.python import min_cost_flow
+
+    data = np.load(io.BytesIO(sys.stdin.buffer.read()))
+    solver = min_cost_flow.SimpleMinCostFlow()
+    arcs = solver.add_arcs_with_capacity_and_unit_cost(data['tail'], data['head'], data['cap'], data['cost'])
+    solver.set_nodes_supplies(np.arange(len(data['supplies'])), data['supplies'])
+    status = solver.solve()
+    # flows() hanya valid (dan tidak crash) untuk solusi optimal
+    flow = solver.flows(arcs) if status == solver.OPTIMAL else np.zeros(len(arcs), dtype=np.int64)
+
+    out = io.BytesIO()
+    np.savez(out, status=np.array(status.name), flow=flow)
+    sys.stdout.buffer.write(out.getvalue())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/outputs.py
+Deskripsi: Tahap output setelah solve. Sink (HTML report, Excel, Parquet,
+           CSV, JSON ringkasan, console) didaftarkan pada satu SolverRun lalu
+           dijalankan bersamaan: sink Python murni di proses anak (fork),
+           sisanya di thread pool.
+
+    stage = OutputStage(run)
+    stage.add('HTML report', write_html, 'hasil.html', cpu_bound=True, mode='json')
+    stage.add('Excel', write_excel, 'hasil.xlsx', cpu_bound=True)
+    stage.add('Console', print_console)
+    stage.run()
+
+Semua sink membaca satu Solution yang sama (sawit/solution.py); array x/y
+dibuat read-only sebelum sink dijalankan, sehingga tidak ada sink yang bisa
+mengubah data sink lain. Exception dari satu sink dicatat di SinkResult dan
+dicetak sebagai ⚠️, sink lain tetap selesai.
+
+Sink cpu_bound (openpyxl, format baris HTML) memegang GIL hampir sepanjang
+waktunya, sehingga di thread pool mereka hanya bergantian dan waktu total
+≈ jumlah waktu per sink. Sink itu dijalankan di ProcessPoolExecutor dengan
+start method fork: proses anak mewarisi SolverRun (copy-on-write, tanpa
+pickle) dan hanya SinkResult yang dikirim balik. Proses di-fork sebelum
+thread pool dimulai. Sink I/O dan native (Parquet, CSV, JSON, console) tetap
+di thread. Tanpa fork (Windows) semua sink berjalan di thread.
+
+Waktu total hanya mendekati sink paling lambat (biasanya Excel) jika setiap
+proses mendapat core sendiri; dengan satu CPU semua sink tetap antre di core
+yang sama. Karena itu SAWIT_OUTPUT_WORKERS (jumlah proses dan thread)
+default-nya os.cpu_count(): di mesin satu CPU sink ditulis berurutan di
+proses utama. SAWIT_OUTPUT_WORKERS=1 selalu berurutan.
+"""
+
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def default_workers():
+    """SAWIT_OUTPUT_WORKERS, atau jumlah CPU (1 = berurutan)."""
+    value = os.environ.get('SAWIT_OUTPUT_WORKERS', '')
+    return int(value) if value else os.cpu_count() or 1
+
+
+def can_fork():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+class SinkResult:
+    """Hasil satu sink: berhasil atau exception, dan waktu tulisnya."""
+
+    def __init__(self, name, path, elapsed, error=None):
+        self.name = name
+        self.path = path
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"SinkResult({self.name!r}, {'ok' if self.ok else repr(self.error)}, {self.elapsed:.3f}s)"
+
+
+# OutputStage yang sedang berjalan; dibaca proses anak hasil fork
+_STAGE = None
+
+
+def _call_forked(index):
+    result = _STAGE._call(_STAGE.sinks[index])
+    try:
+        pickle.dumps(result.error)
+    except Exception:
+        result.error = RuntimeError(f"{type(result.error).__name__}: {result.error}")
+    return result
+
+
+class OutputStage:
+    """Sink output untuk satu SolverRun. Setiap sink dipanggil sebagai
+    write(run, path, **options), atau write(run, **options) jika path None."""
+
+    def __init__(self, run):
+        self.solver_run = run
+        self.sinks = []
+        self.results = []
+        self.wall_time = None
+        self.processes = 0
+        self.threads = 0
+
+    def add(self, name, write, path=None, cpu_bound=False, **options):
+        """Daftarkan sink; cpu_bound=True menjalankannya di proses anak."""
+        self.sinks.append((name, write, path, cpu_bound, options))
+        return self
+
+    def _call(self, sink):
+        name, write, path, _, options = sink
+        start = time.perf_counter()
+        try:
+            if path is None:
+                write(self.solver_run, **options)
+            else:
+                write(self.solver_run, path, **options)
+        except Exception as e:
+            return SinkResult(name, path, time.perf_counter() - start, e)
+        return SinkResult(name, path, time.perf_counter() - start)
+
+    def run(self, workers=None):
+        """Jalankan semua sink; return list SinkResult (urutan pendaftaran)."""
+        self.solver_run.solution.freeze()
+        workers = max(1, min(workers or default_workers(), len(self.sinks)))
+        start = time.perf_counter()
+        if workers == 1:
+            self.processes, self.threads = 0, 1
+            self.results = [self._call(sink) for sink in self.sinks]
+        else:
+            self.results = self._run_parallel(workers)
+        self.wall_time = time.perf_counter() - start
+
+        for result in self.results:
+            where = f": {result.path}" if result.path else ""
+            if result.ok:
+                print(f"✓ {result.name}{where} ({result.elapsed:.2f} detik)")
+            else:
+                print(f"⚠️  {result.name} gagal{where}: {result.error}")
+        total = sum(result.elapsed for result in self.results)
+        n_ok = sum(result.ok for result in self.results)
+        failed = f", {len(self.results) - n_ok} gagal" if n_ok < len(self.results) else ""
+        print(f"✓ {n_ok} output dalam {self.wall_time:.2f} detik{failed} ({self.processes} proses, "
+              f"{self.threads} thread; jumlah waktu per output {total:.2f} detik)")
+        return self.results
+
+    def _run_parallel(self, workers):
+        global _STAGE
+
+        forked = [i for i, sink in enumerate(self.sinks) if sink[3]] if can_fork() else []
+        threaded = [i for i in range(len(self.sinks)) if i not in forked]
+        self.processes = min(workers, len(forked))
+        self.threads = min(workers, len(threaded))
+        results = [None] * len(self.sinks)
+
+        _STAGE = self
+        executor = None
+        if forked:
+            executor = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('fork'))
+        try:
+            # Proses anak di-fork pada submit pertama, sebelum thread pool dimulai
+            futures = {i: executor.submit(_call_forked, i) for i in forked}
+            if threaded:
+                with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='sawit-output') as pool:
+                    for i, result in zip(threaded, pool.map(self._call, [self.sinks[i] for i in threaded])):
+                        results[i] = result
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:       # proses anak mati (BrokenProcessPool)
+                    name, _, path, _, _ = self.sinks[i]
+                    results[i] = SinkResult(name, path, 0.0, e)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            _STAGE = None
+        return results
+
+    @property
+    def failed(self):
+        return [result for result in self.results if not result.ok]
+
+    def ok(self, name):
+        return any(result.name == name and result.ok for result in self.results)
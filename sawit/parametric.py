@@ -0,0 +1,357 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/parametric.py
+Deskripsi: Analisis parametrik RHS: total biaya optimal sebagai fungsi
+           kapasitas pabrik / supply kebun, dengan breakpoint dari
+           pergantian basis simplex (bukan grid solve).
+
+Satu atau lebih parameter digerakkan bersama secara linear:
+
+    b(t) = awal + t · (akhir − awal),   t ∈ [0, 1]
+
+Total biaya optimal z(t) linear sepotong-sepotong (dan konveks). Pada satu
+basis optimal, laju perubahan variabel basis adalah B⁻¹·d (Highs.getBasisSolve),
+sehingga ratio test memberikan t di mana basis itu berhenti feasible — itulah
+breakpoint berikutnya. Di breakpoint, bound digeser sedikit melewati t dan
+HiGHS melakukan pivot dual simplex dari basis lama (warm start,
+sawit/incremental.py). Jumlah solve = jumlah pergantian basis, bukan jumlah
+titik grid.
+
+Jika instance infeasible di t = 0, t terkecil yang feasible dicari tepat
+dengan LP tambahan (minimasi t) lalu kurva dimulai dari sana. Jika instance
+menjadi infeasible di tengah rentang (mis. kapasitas diturunkan), kurva
+berhenti di breakpoint terakhir.
+
+Contoh:
+    sawit parametric -p factory_capacity Pabrik_1 5000 8000
+    sawit parametric -p factory_capacity Pabrik_1 5000 8000 \\
+        -p supply_capacity Kebun_C 3500 5000 -o kurva_parametrik.csv --json kurva.json
+"""
+
+import csv
+import json
+
+import numpy as np
+
+from sawit.incremental import IncrementalModel
+from sawit.highs import primal_values, require_highspy, status_name
+
+# Parameter yang bisa digerakkan (baris <= di sawit/network.py)
+PARAMETERS = ('factory_capacity', 'supply_capacity')
+
+PARAMETRIC_OUTPUT = 'kurva_parametrik.csv'
+
+# Langkah t melewati breakpoint untuk memaksa pivot (relatif terhadap rentang)
+STEP_PAST = 1e-6
+MAX_BREAKPOINTS = 10000
+
+
+class Breakpoint:
+    """Satu titik kurva: awal segmen dengan basis tetap sampai titik berikutnya."""
+
+    __slots__ = ('t', 'values', 'total_biaya', 'slope', 'marginal', 'entering', 'leaving')
+
+    def __init__(self, t, values, total_biaya, slope, marginal, entering=(), leaving=()):
+        self.t = t
+        self.values = values                # nilai parameter di t
+        self.total_biaya = total_biaya
+        self.slope = slope                  # dz/dt pada segmen setelah titik ini
+        self.marginal = marginal            # shadow price per parameter (Rp/ton) pada segmen
+        self.entering = list(entering)      # variabel yang masuk basis di titik ini
+        self.leaving = list(leaving)
+
+    def as_dict(self, keys):
+        return {
+            't': self.t,
+            'values': dict(zip(keys, self.values)),
+            'total_biaya': self.total_biaya,
+            'slope': self.slope,
+            'marginal': dict(zip(keys, self.marginal)) if self.marginal is not None else None,
+            'entering': self.entering,
+            'leaving': self.leaving,
+        }
+
+
+class ParametricCurve:
+    """Hasil sweep: parameter, titik kurva, dan rentang t yang infeasible
+    (t < infeasible_until dan t > infeasible_from)."""
+
+    def __init__(self, params, points, infeasible_until=None, infeasible_from=None, n_solves=0):
+        self.params = params                # list (parameter, key, awal, akhir)
+        self.points = points                # list Breakpoint, t naik
+        self.infeasible_until = infeasible_until
+        self.infeasible_from = infeasible_from
+        self.n_solves = n_solves
+
+    @property
+    def keys(self):
+        return [f"{parameter}:{key}" for parameter, key, _, _ in self.params]
+
+    def values_at(self, t):
+        start = np.array([p[2] for p in self.params], dtype=float)
+        end = np.array([p[3] for p in self.params], dtype=float)
+        return (start + t * (end - start)).tolist()
+
+    def cost_at(self, t):
+        """z(t) dari kurva (interpolasi linear antar breakpoint), None jika infeasible."""
+        if not self.points or t < self.points[0].t - 1e-12 or t > self.points[-1].t + 1e-12:
+            return None
+        ts = [p.t for p in self.points]
+        i = max(0, np.searchsorted(ts, t, side='right') - 1)
+        point = self.points[i]
+        return point.total_biaya + point.slope * (t - point.t)
+
+    def as_dict(self):
+        keys = self.keys
+        return {
+            'parameters': [{'parameter': p, 'key': k, 'start': s, 'end': e} for p, k, s, e in self.params],
+            'infeasible_until': self.infeasible_until,
+            'infeasible_from': self.infeasible_from,
+            'n_solves': self.n_solves,
+            'points': [p.as_dict(keys) for p in self.points],
+        }
+
+
+# ================================================================================
+# SWEEP
+# ================================================================================
+
+def _variable_names(network):
+    names = ([f"X_TBS {k}→{p}" for k, p in network.tbs_routes()]
+             + [f"Y_CPO {p}→{d}" for p, d in network.cpo_routes()])
+    rows = [f"slack {name}" for name in network.row_names()]
+    return names, rows
+
+
+def _param_rows(network, params):
+    """Indeks baris constraint untuk setiap parameter."""
+    kebun = {k: i for i, k in enumerate(network.kebun)}
+    pabrik = {p: i for i, p in enumerate(network.pabrik)}
+    rows = []
+    for parameter, key, _, _ in params:
+        if parameter == 'supply_capacity' and key in kebun:
+            rows.append(kebun[key])
+        elif parameter == 'factory_capacity' and key in pabrik:
+            rows.append(len(network.kebun) + pabrik[key])
+        else:
+            raise ValueError(f"Parameter tidak dikenal: {parameter} {key!r} "
+                             f"(pilihan: {', '.join(PARAMETERS)} dengan nama kebun/pabrik)")
+    if len(set(rows)) != len(rows):
+        raise ValueError("Setiap parameter hanya boleh disebut sekali")
+    return np.array(rows, dtype=np.int64)
+
+
+def _first_feasible_t(model, rows, start, direction):
+    """t terkecil di [0, 1] yang feasible: LP min t dengan kolom t tambahan
+    (A·x − d·t ≤ awal). None jika tidak ada."""
+    highspy = require_highspy()
+    from sawit.highs import build_highs
+
+    h = build_highs(model.network)
+    h.changeRowsBounds(len(rows), rows.astype(np.int32), np.full(len(rows), -highspy.kHighsInf), start)
+    n = model.network.n_vars
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), np.zeros(n))
+    h.addCol(1.0, 0.0, 1.0, len(rows), rows.astype(np.int32), -direction)
+    h.run()
+    if status_name(h) != 'Optimal':
+        return None
+    return float(primal_values(h)[n])
+
+
+def _basic_state(h, n_cols):
+    """(indeks variabel basis, nilai, aktivitas baris, dual baris)."""
+    solution = h.getSolution()
+    cols = np.asarray(solution.col_value, dtype=float)
+    activity = np.asarray(solution.row_value, dtype=float)
+    _, basic = h.getBasicVariables()
+    basic = np.asarray(basic, dtype=np.int64)
+    return basic, cols, activity, np.asarray(solution.row_dual, dtype=float)
+
+
+def _max_step(h, network, basic, cols, activity, rows, direction, basic_rows_mask):
+    """Ratio test: langkah t maksimum sebelum basis berhenti feasible."""
+    # Perubahan RHS efektif hanya lewat baris parameter yang nonbasis (aktif)
+    rhs = np.zeros(network.n_rows)
+    active = ~basic_rows_mask[rows]
+    rhs[rows[active]] = direction[active]
+    if not rhs.any():
+        rate = np.zeros(len(basic))
+    else:
+        rate = np.asarray(h.getBasisSolve(rhs)[1], dtype=float)
+
+    steps = [np.inf]
+    is_col = basic >= 0
+    # Kolom basis: x_j + s·v_j >= 0
+    col_rate = rate[is_col]
+    col_value = cols[basic[is_col]]
+    shrinking = col_rate < -1e-12
+    if shrinking.any():
+        steps.append(np.min(np.maximum(col_value[shrinking], 0.0) / -col_rate[shrinking]))
+
+    # Baris basis: variabel logical HiGHS = −aktivitas, batas baris parameter ikut bergerak
+    row_index = -1 - basic[~is_col]
+    row_rate = -rate[~is_col]
+    lo, hi = network.row_bounds()
+    bound_rate = np.zeros(network.n_rows)
+    bound_rate[rows] = direction
+    gap_hi = hi[row_index] - activity[row_index]
+    rel_hi = row_rate - bound_rate[row_index]
+    up = np.isfinite(gap_hi) & (rel_hi > 1e-12)
+    if up.any():
+        steps.append(np.min(np.maximum(gap_hi[up], 0.0) / rel_hi[up]))
+    gap_lo = activity[row_index] - lo[row_index]
+    down = np.isfinite(gap_lo) & (row_rate < -1e-12)
+    if down.any():
+        steps.append(np.min(np.maximum(gap_lo[down], 0.0) / -row_rate[down]))
+    return float(min(steps))
+
+
+def sweep(network, params):
+    """Telusuri z(t) untuk params = [(parameter, key, awal, akhir), ...].
+
+    Return ParametricCurve dengan satu Breakpoint per pergantian basis.
+    """
+    highspy = require_highspy()
+
+    params = [(parameter, key, float(start), float(end)) for parameter, key, start, end in params]
+    rows = _param_rows(network, params)
+    start = np.array([p[2] for p in params])
+    direction = np.array([p[3] for p in params]) - start
+
+    model = IncrementalModel(network)
+    h = model.h
+    col_names, row_names = _variable_names(network)
+    n_cols = network.n_vars
+
+    def set_t(t):
+        values = start + t * direction
+        capacity = {network.pabrik[r - len(network.kebun)]: v for r, v in zip(rows, values)
+                    if r >= len(network.kebun)}
+        supply = {network.kebun[r]: v for r, v in zip(rows, values) if r < len(network.kebun)}
+        if capacity:
+            model.set_capacity(capacity)
+        if supply:
+            model.set_supply(supply)
+
+    def name(var):
+        return col_names[var] if var >= 0 else row_names[-1 - var]
+
+    set_t(0.0)
+    stats = model.solve()
+    n_solves = 1
+    t, infeasible_until = 0.0, None
+    if stats.status != 'Optimal':
+        t_feas = _first_feasible_t(model, rows, start, direction)
+        n_solves += 1
+        if t_feas is None:
+            return ParametricCurve(params, [], infeasible_until=1.0, n_solves=n_solves)
+        t = infeasible_until = t_feas
+        set_t(t)
+        stats = model.solve()
+        n_solves += 1
+        if stats.status != 'Optimal':
+            return ParametricCurve(params, [], infeasible_until=1.0, n_solves=n_solves)
+
+    # t = breakpoint awal segmen; t_solved = t di mana solve terakhir dilakukan
+    # (sedikit melewati breakpoint, lihat STEP_PAST)
+    points, previous_basis, t_solved = [], None, t
+    t_end, infeasible_from = 1.0, None
+    while len(points) < MAX_BREAKPOINTS:
+        basic, cols, activity, dual = _basic_state(h, n_cols)
+        basic_rows_mask = np.zeros(network.n_rows, dtype=bool)
+        basic_rows_mask[-1 - basic[basic < 0]] = True
+        marginal = np.where(basic_rows_mask[rows], 0.0, dual[rows])
+        slope = float(marginal @ direction)
+        z = stats.objective - slope * (t_solved - t)
+
+        basis = set(basic.tolist())
+        if previous_basis is None or basis != previous_basis:
+            entering = sorted(name(v) for v in basis - (previous_basis or basis))
+            leaving = sorted(name(v) for v in (previous_basis or basis) - basis)
+            points.append(Breakpoint(t, (start + t * direction).tolist(), z, slope, marginal.tolist(),
+                                     entering, leaving))
+        previous_basis = basis
+
+        step = _max_step(h, model.network, basic, cols, activity, rows, direction, basic_rows_mask)
+        t_next = min(1.0, t_solved + step)
+        if t_next >= 1.0:
+            break
+
+        # Geser sedikit melewati breakpoint → HiGHS pivot (dual simplex) ke basis berikutnya
+        t, t_solved = t_next, min(1.0, t_next + STEP_PAST)
+        set_t(t_solved)
+        stats = model.solve()
+        n_solves += 1
+        if stats.status != 'Optimal':
+            t_end = infeasible_from = t
+            break
+
+    # Titik akhir kurva (t = 1, atau batas feasible)
+    end = points[-1]
+    if t_end > end.t:
+        points.append(Breakpoint(t_end, (start + t_end * direction).tolist(),
+                                 end.total_biaya + end.slope * (t_end - end.t), end.slope, end.marginal))
+    return ParametricCurve(params, points, infeasible_until, infeasible_from, n_solves)
+
+
+# ================================================================================
+# OUTPUT
+# ================================================================================
+
+def write_csv(curve, path):
+    keys = curve.keys
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['t', *keys, 'total_biaya', 'slope_per_t', *(f"marginal_{k}" for k in keys),
+                         'basis_masuk', 'basis_keluar'])
+        for p in curve.points:
+            writer.writerow([f"{p.t:.9f}", *p.values, p.total_biaya, p.slope, *p.marginal,
+                             '; '.join(p.entering), '; '.join(p.leaving)])
+
+
+def print_curve(curve):
+    keys = curve.keys
+    if curve.infeasible_until is not None:
+        if not curve.points:
+            print("⚠️  Infeasible di seluruh rentang parameter")
+            return
+        values = ', '.join(f"{k}={v:,.2f}" for k, v in zip(keys, curve.values_at(curve.infeasible_until)))
+        print(f"⚠️  Infeasible untuk t < {curve.infeasible_until:.6f} (feasible mulai {values})")
+    if curve.infeasible_from is not None:
+        values = ', '.join(f"{k}={v:,.2f}" for k, v in zip(keys, curve.values_at(curve.infeasible_from)))
+        print(f"⚠️  Infeasible untuk t > {curve.infeasible_from:.6f} (feasible sampai {values})")
+    print(f"{'t':>10} " + ' '.join(f"{k:>28}" for k in keys) + f" {'Total Biaya':>20} {'Marginal (Rp/ton)':>20}  Basis")
+    print("-" * (60 + 29 * len(keys)))
+    for p in curve.points:
+        change = ''
+        if p.entering or p.leaving:
+            change = f"+{len(p.entering)} −{len(p.leaving)}: " + ', '.join(p.entering[:2])
+        marginal = ', '.join(f"{m:,.0f}" for m in p.marginal)
+        print(f"{p.t:>10.6f} " + ' '.join(f"{v:>28,.2f}" for v in p.values)
+              + f" {p.total_biaya:>20,.0f} {marginal:>20}  {change}")
+
+
+def run_parametric(params, output=PARAMETRIC_OUTPUT, json_file=None):
+    """Sweep params [(parameter, key, awal, akhir)] pada data default, cetak
+    dan tulis kurvanya (sawit parametric). Return ParametricCurve."""
+    from sawit.loader import load_default_instance
+    from sawit.network import Network
+
+    print("="*80)
+    print("ANALISIS PARAMETRIK KAPASITAS")
+    print("="*80)
+
+    instance, _ = load_default_instance()
+    network = Network.from_dicts(*instance)
+
+    curve = sweep(network, params)
+    print_curve(curve)
+    write_csv(curve, output)
+    if json_file:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(curve.as_dict(), f, indent=2, ensure_ascii=False)
+
+    print(f"\n✓ {len(curve.points)} titik kurva, {curve.n_solves} solve (warm start)")
+    print(f"✓ Hasil: {output}" + (f", {json_file}" if json_file else ''))
+    return curve
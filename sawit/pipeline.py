@@ -0,0 +1,472 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/pipeline.py
+Deskripsi: Alur python_solver.py sebagai fungsi: load data → solve → output
+           (HTML report, Excel, Parquet/CSV, JSON, console, browser).
+           Dipakai oleh CLI (sawit/cli.py).
+
+Setelah solve, semua output didaftarkan sebagai sink pada sawit/outputs.py
+dan ditulis bersamaan: HTML dan Excel di proses anak, sisanya di thread pool
+(SAWIT_OUTPUT_WORKERS, default jumlah CPU; 1 = berurutan).
+
+Sebelum apa pun di-solve, pre-check max-flow (sawit/feasibility.py) memeriksa
+apakah demand bisa dipenuhi; jika tidak, solver tidak dipanggil dan report
+menampilkan status Infeasible beserta himpunan constraint yang bertentangan.
+SAWIT_PRECHECK=0 atau --no-precheck melewati pre-check.
+
+Sebelum model dibangun, jaringan direduksi oleh sawit/presolve.py (rute
+terdominasi, node identik digabung, batas diperketat); hasil solve
+di-postsolve sehingga HTML/Excel tetap menampilkan semua rute asli.
+SAWIT_PRESOLVE=0 atau --no-presolve melewati tahap ini.
+
+Tidak ada efek samping saat di-import. Dependensi berat di-import saat
+dibutuhkan: PuLP/SciPy saat solve (sawit/backends.py), highspy saat analisis
+sensitivitas, openpyxl hanya saat Excel diminta, pyarrow hanya saat Parquet
+diminta, dan webbrowser hanya saat report dibuka.
+"""
+
+import os
+
+# Potongan kode yang ditampilkan di STEP 6 report
+SOLVER_CALL = {
+    'cbc': 'model.solve(PULP_CBC_CMD())',
+    'highs': 'linprog(c, A_ub, b_ub, A_eq, b_eq, method="{method}")',
+    'netflow': 'SimpleMinCostFlow().solve()',
+    'glpk': 'model.solve(GLPK_CMD())',
+    'decomp': 'benders(master, subproblem_region, pool)',
+    'precheck': 'max_flow(S → Kebun → Pabrik → PD → T)',
+}
+
+# Backend cbc tanpa PuLP (SAWIT_CBC_MODEL selain 'pulp', lihat sawit/mps.py)
+CBC_MPS_CALL = 'write_mps(c, A, lo, hi) → cbc model.mps -solve'
+
+DATA_SOURCES = {
+    'workbook': 'parse workbook Excel',
+    'cache': 'cache workbook',
+    'default': 'sawit/data.py',
+}
+
+HTML_OUTPUT = 'hasil_python_solver.html'
+EXCEL_OUTPUT = 'hasil_python_solver.xlsx'
+
+
+def default_backend():
+    """Backend dari SAWIT_SOLVER: 'cbc' (PuLP + CBC, default), 'highs'
+    (HiGHS in-process), 'netflow' (min-cost flow OR-Tools, jika terpasang),
+    'glpk' (PuLP + GLPK, jika terpasang), 'portfolio' (balapan semua konfigurasi,
+    lihat sawit/portfolio.py) atau 'decomp' (Benders per region, lihat
+    sawit/decomposition.py)."""
+    return os.environ.get('SAWIT_SOLVER', 'cbc')
+
+
+class SolverRun:
+    """Data, network dan hasil solve yang dipakai bersama oleh semua output."""
+
+    def __init__(self, instance, data_source, network, result):
+        self.instance = instance
+        self.data_source = data_source
+        self.network = network
+        self.result = result
+        self.sensitivity = None         # sawit/sensitivity.py, lihat analyze_sensitivity
+        self.outputs = []               # SinkResult per output sawit/outputs.py, lihat run_report
+
+        # Nilai x/y dibaca sekali ke array (sawit/solution.py); biaya, tabel,
+        # export dan verifikasi residual (sawit/verification.py) memakai array ini
+        from sawit.solution import Solution
+        from sawit.verification import verify
+
+        self.solution = Solution.from_result(network, result)
+        self.verification = verify(self.solution)
+        self.biaya_tbs = self.solution.biaya_tbs
+        self.biaya_cpo = self.solution.biaya_cpo
+
+    @property
+    def total_biaya(self):
+        return self.result.objective
+
+    @property
+    def pct_tbs(self):
+        return self.biaya_tbs / self.total_biaya * 100 if self.total_biaya else 0.0
+
+    @property
+    def pct_cpo(self):
+        return self.biaya_cpo / self.total_biaya * 100 if self.total_biaya else 0.0
+
+
+# ================================================================================
+# STEP 1-4: DATA, MODEL, SOLVE, KALKULASI
+# ================================================================================
+
+def solve_default(backend=None, use_cache=True, presolve=None, precheck=None):
+    """Load data (workbook/cache/default), bangun network dan solve.
+
+    Dengan use_cache, hasil diambil dari cache hasil (sawit/resultcache.py)
+    jika instance dan pengaturan solver yang sama pernah di-solve. Dengan
+    presolve (default: SAWIT_PRESOLVE), yang di-solve adalah jaringan
+    tereduksi (sawit/presolve.py) dan hasilnya di-postsolve ke jaringan asli.
+    Dengan precheck (default: SAWIT_PRECHECK), jaringan yang infeasible
+    menurut max-flow tidak dikirim ke solver sama sekali.
+    """
+    from sawit import feasibility as check
+    from sawit import presolve as reduction
+    from sawit.backends import solve
+    from sawit.loader import load_default_instance
+    from sawit.network import Network
+    from sawit.resultcache import cached_solve, enabled
+
+    backend = backend or default_backend()
+
+    print("\n[1] Definisi data...")
+
+    # Data dibaca dari workbook Excel (cache .npz per hash file, lihat sawit/loader.py);
+    # jika workbook tidak ada, dipakai data default di sawit/data.py
+    instance, data_source = load_default_instance()
+
+    print(f"✓ Data loaded ({DATA_SOURCES[data_source]})")
+
+    print("[2] Membangun model...")
+
+    network = Network.from_dicts(*instance)
+
+    print("✓ Matriks constraint sparse dibuat")
+
+    feasibility = None
+    if check.enabled() if precheck is None else precheck:
+        feasibility = check.check_feasibility(network)
+        if not feasibility.feasible:
+            print(f"⚠️  Pre-check max-flow: INFEASIBLE ({feasibility.check_time * 1000:.1f} ms), solver tidak dijalankan")
+            for line in feasibility.explain():
+                print(f"   {line}")
+            run = SolverRun(instance, data_source, network, check.infeasible_result(network, feasibility))
+            print(f"⚠️  Status: {run.result.status} ({run.result.label})")
+            print(f"⚠️  Verifikasi: {run.verification.summary()}")
+            return run
+        print(f"✓ Pre-check max-flow: feasible ({feasibility.check_time * 1000:.1f} ms)")
+
+    presolved = None
+    if reduction.enabled() if presolve is None else presolve:
+        presolved = reduction.presolve(network)
+        if presolved.changed:
+            print(f"✓ Presolve: {presolved.summary()}")
+        else:
+            print("✓ Presolve: tidak ada reduksi")
+            presolved = None
+    model_network = presolved.reduced if presolved else network
+
+    # Backend cbc: model PuLP dibangun dari matriks sparse (lihat sawit/model.py).
+    # Backend highs: matriks langsung dikirim ke HiGHS in-process (sawit/backends.py).
+    print(f"[3] Menyelesaikan model (backend: {backend})...")
+    if use_cache and enabled():
+        result, hit = cached_solve(model_network, backend)
+    else:
+        result, hit = solve(model_network, backend=backend), False
+    if presolved:
+        result = presolved.postsolve(result)
+    result.feasibility = feasibility
+
+    if hit:
+        print(f"✓ Status: {result.status} (dari cache {result.cache_key[:12]}, {result.label})")
+    else:
+        print(f"✓ Status: {result.status} ({result.solve_time:.3f} detik, {result.label})")
+    if result.portfolio:
+        print(f"✓ Portfolio: {result.portfolio['winner']} menang dari {len(result.portfolio['runs'])} konfigurasi")
+    if result.decomposition:
+        from sawit.decomposition import print_convergence
+
+        info = result.decomposition
+        print(f"✓ Dekomposisi: {len(info['regions'])} region, {info['workers']} worker, "
+              f"{len(info['iterations'])} iterasi Benders")
+        print_convergence(result)
+
+    print("[4] Mengkalkulasi hasil...")
+
+    run = SolverRun(instance, data_source, network, result)
+
+    print(f"✓ Total biaya: Rp {run.total_biaya:,.0f}")
+    print(f"{'✓' if run.verification.ok else '⚠️ '} Verifikasi: {run.verification.summary()}")
+    return run
+
+
+def analyze_sensitivity(run):
+    """Shadow price, reduced cost dan ranging dari basis solusi solver
+    (sawit/sensitivity.py), diambil dari entri cache hasil jika ada.
+    Dilewati jika solusi tidak optimal atau highspy tidak terpasang."""
+    result = run.result
+    if result.status != 'Optimal':
+        print(f"⚠️  Analisis sensitivitas dilewati (status {result.status})")
+        return None
+
+    sensitivity = result.sensitivity if result.from_cache and not result.presolve else None
+    source = 'dari cache'
+    if sensitivity is None:
+        try:
+            from sawit.sensitivity import analyze
+
+            sensitivity = analyze(run.network, run.solution.values)
+        except ImportError as e:
+            print(f"⚠️  Analisis sensitivitas dilewati: {e}")
+            return None
+        source = 'dari basis solusi solver'
+        if sensitivity.available:
+            from sawit.resultcache import store_sensitivity
+
+            store_sensitivity(run.network, result, sensitivity)
+    run.sensitivity = sensitivity
+
+    if sensitivity.available:
+        print(f"✓ Sensitivitas ({source}): {run.network.n_rows} shadow price, "
+              f"{run.network.n_vars} reduced cost + ranging")
+    else:
+        print(f"⚠️  Sensitivitas tidak tersedia (status {run.sensitivity.status})")
+    return run.sensitivity
+
+
+def sensitivity_tables(run):
+    """Argumen sensitivity untuk sawit/report.py, atau None."""
+    sens = run.sensitivity
+    if sens is None:
+        return None
+    if not sens.available:
+        note = (f"Tidak tersedia: status model {sens.status}. Shadow price dan ranging hanya "
+                f"terdefinisi untuk solusi optimal.")
+    else:
+        note = (f"Dihitung sekaligus dari basis optimal solusi solver di atas (HiGHS dimulai dari "
+                f"solusi itu, total biaya Rp {sens.objective:,.0f}). "
+                f"Shadow price = perubahan total biaya per tambahan 1 ton RHS selama RHS di dalam rentang "
+                f"Min–Maks; negatif berarti tambahan kapasitas menghemat biaya. Reduced cost = kenaikan "
+                f"total biaya per ton jika rute yang tidak dipakai dipaksa mengalir. Biaya Min–Maks = "
+                f"rentang biaya/ton di mana rencana distribusi tetap optimal.")
+    return {'note': note, 'constraints': sens.constraint_rows(),
+            'tbs': sens.route_rows('tbs'), 'cpo': sens.route_rows('cpo')}
+
+
+# ================================================================================
+# STEP 5: OUTPUT
+# ================================================================================
+
+def solver_call(result):
+    """Potongan kode pemanggilan solver untuk STEP 6 report."""
+    if result.backend == 'cbc':
+        from sawit.backends import cbc_model
+
+        if cbc_model() != 'pulp':
+            return CBC_MPS_CALL
+    if result.backend == 'highs':
+        from sawit.backends import HIGHS_METHOD
+
+        return SOLVER_CALL['highs'].format(method=result.method or HIGHS_METHOD)
+    return SOLVER_CALL[result.backend]
+
+
+def result_source(result):
+    """Keterangan asal hasil solve untuk report."""
+    source = _solve_source(result)
+    if result.presolve:
+        source += f". Presolve: {result.presolve['summary']}"
+    return source
+
+
+def _solve_source(result):
+    if result.backend == 'precheck':
+        info = result.feasibility
+        return (f"Solver tidak dijalankan: pre-check max-flow menemukan model infeasible dalam "
+                f"{info.check_time * 1000:.1f} ms (kurang {info.shortfall:,.1f} ton CPO)")
+    if result.portfolio:
+        runs = result.portfolio['runs']
+        return (f"Portfolio: {result.portfolio['winner']} menang dari {len(runs)} konfigurasi "
+                f"({', '.join(runs)}); waktu balapan {result.solve_time:.3f} detik")
+    if result.decomposition:
+        info = result.decomposition
+        last = info['iterations'][-1] if info['iterations'] else None
+        gap = f"gap akhir {last['gap']:.2e}" if last and last['gap'] is not None else "tanpa batas atas"
+        return (f"Dekomposisi Benders: {len(info['regions'])} region di {info['workers']} worker, "
+                f"{len(info['iterations'])} iterasi, {gap}; waktu {result.solve_time:.3f} detik")
+    if result.from_cache:
+        return (f"✓ Hasil diambil dari cache (kunci {result.cache_key[:12]}); model dan solver "
+                f"tidak dijalankan. Waktu solve asli: {result.solve_time:.3f} detik")
+    if result.cache_key:
+        return f"Solve baru: {result.solve_time:.3f} detik (disimpan ke cache {result.cache_key[:12]})"
+    return f"Solve baru: {result.solve_time:.3f} detik (cache hasil tidak dipakai)"
+
+
+def diagnosis(run):
+    """Argumen diagnosis untuk sawit/report.py (himpunan konflik), atau None."""
+    info = run.result.feasibility
+    if info is None or info.feasible:
+        return None
+    return {'lines': info.explain(), 'conflict': info.conflict}
+
+
+def report_summary(run):
+    """Nilai ringkasan untuk bagian statis report (lihat placeholder di sawit/report.py)."""
+    supply_capacity, factory_capacity, demand, _, _, yield_rate = run.instance
+    network, result = run.network, run.result
+    return {
+        'supply_total': sum(supply_capacity.values()),
+        'capacity_total': sum(factory_capacity.values()),
+        'demand_total': sum(demand.values()),
+        'yield_pct': yield_rate * 100,
+        'n_vars': network.n_vars,
+        'n_tbs': network.n_tbs,
+        'n_cpo': network.n_cpo,
+        'n_rows': network.n_rows,
+        'n_kebun': len(supply_capacity),
+        'n_pabrik': len(factory_capacity),
+        'n_pd': len(demand),
+        'solver_call': solver_call(result),
+        'solver_label': result.label,
+        'result_source': result_source(result),
+        'status': result.status,
+        'total_biaya': run.total_biaya,
+        'biaya_tbs': run.biaya_tbs,
+        'biaya_cpo': run.biaya_cpo,
+        'pct_tbs': run.pct_tbs,
+        'pct_cpo': run.pct_cpo,
+        'checks': list(run.verification.families()),
+    }
+
+
+def write_html(run, path=HTML_OUTPUT, mode=None):
+    from sawit.report import report_mode, write_solver_report
+
+    solution = run.solution
+
+    # Baris tabel dari array solusi (sawit/solution.py), ditulis satu per satu;
+    # status demand dari residual verifikasi
+    tbs_rows = solution.route_rows('tbs')
+    production_rows = solution.production_rows()
+    cpo_rows = solution.route_rows('cpo')
+    demand_rows = solution.demand_rows(run.verification.demand_met)
+
+    # Network besar: tabel dikirim sebagai JSON kolumnar dan dirender virtual di browser
+    # (SAWIT_REPORT=rows|json|json-gzip|auto, lihat sawit/report.py)
+    write_solver_report(path, report_summary(run), tbs_rows, production_rows, cpo_rows, demand_rows,
+                        mode=report_mode(run.network.n_vars, mode), sensitivity=sensitivity_tables(run),
+                        diagnosis=diagnosis(run))
+
+
+def write_excel(run, path=EXCEL_OUTPUT):
+    from sawit.export import write_xlsx
+
+    # Ditulis streaming dari array solusi (sawit/export.py), tanpa DataFrame
+    summary = [('Total Biaya', run.total_biaya), ('Biaya TBS', run.biaya_tbs), ('Biaya CPO', run.biaya_cpo)]
+    write_xlsx(path, summary, run.solution, run.sensitivity)
+
+
+def write_parquet(run, path):
+    from sawit.export import write_parquet as write
+
+    write(path, run.solution)
+
+
+def write_csv(run, path):
+    from sawit.export import write_csv as write
+
+    write(path, run.solution)
+
+
+def write_summary_json(run, path):
+    """Ringkasan report (report_summary) + produksi dan demand per node ke JSON."""
+    import json
+
+    solution = run.solution
+    summary = dict(report_summary(run))
+    summary['checks'] = [dict(zip(('jenis', 'baris', 'dilanggar', 'residual_maks'), check))
+                         for check in summary['checks']]
+    summary['produksi'] = [dict(zip(('pabrik', 'tbs_masuk', 'cpo_keluar', 'kapasitas', 'utilisasi_pct'), row))
+                           for row in solution.production_rows()]
+    summary['demand'] = [dict(zip(('pd', 'demand', 'diterima', 'pemenuhan_pct', 'terpenuhi'), row))
+                         for row in solution.demand_rows(run.verification.demand_met)]
+    summary['rute_terpakai'] = {'tbs': len(solution.used('tbs')), 'cpo': len(solution.used('cpo'))}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=1, default=float)
+
+
+# Baris maksimum per tabel console (network besar: lihat HTML/Excel)
+CONSOLE_ROWS = 10
+
+
+def print_console(run):
+    """Ringkasan produksi, demand dan rute terbesar ke console (satu kali print)."""
+    solution = run.solution
+    lines = ["", "-" * 80, "RINGKASAN ALOKASI", "-" * 80,
+             f"{'Pabrik':<20} {'TBS masuk':>14} {'CPO keluar':>14} {'Kapasitas':>14} {'Utilisasi':>10}"]
+    for pabrik, tbs_in, cpo_out, capacity, util in list(solution.production_rows())[:CONSOLE_ROWS]:
+        lines.append(f"{pabrik:<20} {tbs_in:>14,.1f} {cpo_out:>14,.1f} {capacity:>14,} {util:>9.1f}%")
+    lines.append(f"{'PD':<20} {'Demand':>14} {'Diterima':>14} {'Pemenuhan':>14}")
+    for pusat, demand, supplied, pct, met in list(solution.demand_rows(run.verification.demand_met))[:CONSOLE_ROWS]:
+        lines.append(f"{pusat:<20} {demand:>14,} {supplied:>14,.1f} {pct:>13.1f}% {'✓' if met else '⚠️'}")
+    for kind in ('tbs', 'cpo'):
+        qty, cost, src, dst, src_names, dst_names = solution.route_arrays(kind)
+        used = solution.used(kind)
+        top = used[qty[used].argsort()[::-1][:CONSOLE_ROWS]]
+        lines.append(f"Rute {kind.upper()} terpakai: {len(used):,}" + (", terbesar:" if len(used) else ""))
+        for i in top.tolist():
+            lines.append(f"  {src_names[src[i]]} → {dst_names[dst[i]]}: {qty[i]:,.1f} ton × Rp {cost[i]:,.0f}")
+    lines.append("-" * 80)
+    print("\n".join(lines))
+
+
+def open_in_browser(path):
+    import webbrowser
+
+    try:
+        webbrowser.open('file://' + os.path.abspath(path))
+        print("✓ Browser opened!")
+    except Exception as e:
+        print(f"⚠️  Error: {e}")
+        print(f"   Please open manually: {path}")
+
+
+# ================================================================================
+# ALUR LENGKAP (python_solver.py / sawit report)
+# ================================================================================
+
+def run_report(backend=None, output=HTML_OUTPUT, excel=EXCEL_OUTPUT, mode=None, headless=False,
+               use_cache=True, sensitivity=True, presolve=None, precheck=None, parquet=None, csv=None,
+               summary_json=None, console=True):
+    """Solve lalu tulis HTML (dan Excel jika excel bukan None, Parquet/CSV
+    alokasi jika parquet/csv diberikan, ringkasan JSON jika summary_json
+    diberikan); buka browser kecuali headless. Semua output dijalankan
+    bersamaan oleh sawit/outputs.py.
+    sensitivity: tambahkan tabel shadow price/ranging.
+    presolve: reduksi jaringan sebelum solve (default: SAWIT_PRESOLVE).
+    precheck: pre-check max-flow sebelum solve (default: SAWIT_PRECHECK)."""
+    from sawit.outputs import OutputStage
+
+    print("="*80)
+    print("POINT 3a (PART 2): SOLUSI DENGAN PYTHON PuLP")
+    print("="*80)
+
+    run = solve_default(backend, use_cache, presolve, precheck)
+    if sensitivity:
+        analyze_sensitivity(run)
+
+    # Browser dibuka begitu HTML selesai, tanpa menunggu output lain
+    def html(run, path):
+        write_html(run, path, mode)
+        if not headless:
+            open_in_browser(path)
+
+    print("[5] Menulis output (HTML, export, ringkasan)...")
+    # HTML dan Excel diformat di Python murni (GIL): dijalankan di proses anak
+    stage = OutputStage(run).add('HTML report', html, output, cpu_bound=True)
+    outputs = [('Excel', write_excel, excel, True), ('Parquet', write_parquet, parquet, False),
+               ('CSV', write_csv, csv, False), ('Ringkasan JSON', write_summary_json, summary_json, False)]
+    for name, write, path, cpu_bound in outputs:
+        if path:
+            stage.add(name, write, path, cpu_bound=cpu_bound)
+    if console:
+        stage.add('Console', print_console)
+    run.outputs = stage.run()
+
+    print("\n" + "="*80)
+    print("✅ POINT 3a (PYTHON) SELESAI!")
+    print("="*80)
+    print(f"\nOutput files:")
+    for result in stage.results:
+        if result.ok and result.path:
+            print(f"  • {result.name}: {result.path}")
+    print("\nSelanjutnya: Jalankan comparison_solver.py untuk Point 3c")
+    return run
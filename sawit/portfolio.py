@@ -0,0 +1,252 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/portfolio.py
+Deskripsi: Portfolio solve: beberapa konfigurasi solver dijalankan paralel,
+           solusi optimal pertama dipakai, sisanya dibatalkan.
+
+Latensi tiap solver sangat bergantung pada struktur instance (CBC dual
+simplex cepat di satu jaringan, HiGHS IPM di jaringan lain).
+Untuk perencanaan malam yang penting adalah kasus terburuk, jadi semua
+konfigurasi di PORTFOLIO yang tersedia di mesin ini dibalap:
+
+    result = solve(network, 'portfolio')      # atau --backend portfolio
+    result.portfolio['winner']                # mis. 'highs-ipm'
+
+Setiap konfigurasi berjalan di proses sendiri (dan process group sendiri di
+POSIX, sehingga subprocess CBC/glpsol ikut dihentikan saat dibatalkan).
+Jika tidak ada yang optimal (mis. instance infeasible), hasil pertama yang
+selesai tanpa error yang dipakai.
+
+Setiap balapan dicatat ke <cache_dir>/portfolio.jsonl (pemenang dan waktu
+semua konfigurasi); `sawit portfolio` menampilkan ringkasannya untuk
+menyetel backend default. SAWIT_PORTFOLIO=cbc-dual,highs-ipm membatasi
+konfigurasi yang dibalap.
+"""
+
+import json
+import os
+import queue
+import signal
+import statistics
+import time
+
+from sawit.loader import cache_dir
+
+# (nama, backend, opsi solve)
+PORTFOLIO = (
+    ('cbc', 'cbc', {}),
+    ('cbc-primal', 'cbc', {'algorithm': 'primal'}),
+    ('cbc-dual', 'cbc', {'algorithm': 'dual'}),
+    ('cbc-barrier', 'cbc', {'algorithm': 'barrier'}),
+    ('highs-dual', 'highs', {'method': 'highs-ds'}),
+    ('highs-ipm', 'highs', {'method': 'highs-ipm'}),
+    ('netflow', 'netflow', {}),
+    ('glpk-primal', 'glpk', {'algorithm': 'primal'}),
+    ('glpk-dual', 'glpk', {'algorithm': 'dual'}),
+    ('glpk-barrier', 'glpk', {'algorithm': 'barrier'}),
+)
+
+# Interval cek proses yang mati tanpa mengirim hasil
+POLL_INTERVAL = 0.1
+
+
+def log_path():
+    return os.path.join(cache_dir(), 'portfolio.jsonl')
+
+
+def configurations(names=None):
+    """Konfigurasi yang akan dibalap: names, SAWIT_PORTFOLIO, atau semua yang
+    backend-nya tersedia."""
+    from sawit.backends import available_backends
+
+    if names is None and os.environ.get('SAWIT_PORTFOLIO'):
+        names = [n.strip() for n in os.environ['SAWIT_PORTFOLIO'].split(',') if n.strip()]
+    known = {name for name, _, _ in PORTFOLIO}
+    unknown = [n for n in names or () if n not in known]
+    if unknown:
+        raise ValueError(f"Konfigurasi portfolio tidak dikenal: {', '.join(unknown)} "
+                         f"(pilihan: {', '.join(n for n, _, _ in PORTFOLIO)})")
+
+    available = available_backends()
+    return [(name, backend, options) for name, backend, options in PORTFOLIO
+            if backend in available and (names is None or name in names)]
+
+
+# ================================================================================
+# WORKER
+# ================================================================================
+
+def _worker(name, backend, options, network, results):
+    from sawit.backends import solve
+    from sawit.solution import solution_arrays
+
+    # Process group sendiri agar subprocess solver ikut dihentikan saat dibatalkan
+    if hasattr(os, 'setsid'):
+        os.setsid()
+    try:
+        result = solve(network, backend, **options)
+    except Exception as e:
+        results.put({'name': name, 'status': 'Error', 'error': repr(e)})
+        return
+    x, y = solution_arrays(network, result)
+    results.put({
+        'name': name,
+        'status': result.status,
+        'objective': result.objective,
+        'solve_time': result.solve_time,
+        'build_time': result.build_time,
+        'iterations': result.iterations,
+        'x': x,
+        'y': y,
+    })
+
+
+def _cancel(process):
+    if process.is_alive():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.terminate()
+    process.join()
+
+
+# ================================================================================
+# BALAPAN
+# ================================================================================
+
+def solve_portfolio(network, configs=None, timeout=None, record=True):
+    """Balap konfigurasi solver; return SolveResult optimal pertama.
+
+    result.solve_time adalah waktu balapan (termasuk start proses);
+    result.portfolio berisi pemenang dan status/waktu setiap konfigurasi.
+    """
+    import multiprocessing
+
+    from sawit.backends import SolveResult, route_values
+
+    configs = configurations(configs)
+    if not configs:
+        raise ValueError("Tidak ada konfigurasi portfolio yang tersedia")
+    backend_of = {name: backend for name, backend, _ in configs}
+    options_of = {name: options for name, _, options in configs}
+
+    ctx = multiprocessing.get_context()
+    results = ctx.Queue()
+    start = time.perf_counter()
+    processes = {name: ctx.Process(target=_worker, args=(name, backend, options, network, results), daemon=True)
+                 for name, backend, options in configs}
+    for process in processes.values():
+        process.start()
+
+    runs, finished, winner = {}, [], None
+    try:
+        while len(runs) < len(processes):
+            if timeout is not None and time.perf_counter() - start > timeout:
+                break
+            try:
+                message = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                # Proses yang mati tanpa mengirim hasil (crash, kehabisan memori)
+                for name, process in processes.items():
+                    if name not in runs and not process.is_alive() and process.exitcode not in (0, None):
+                        runs[name] = {'status': 'Crashed', 'elapsed': time.perf_counter() - start}
+                continue
+            name = message['name']
+            message['elapsed'] = time.perf_counter() - start
+            runs[name] = message
+            if message['status'] != 'Error':
+                finished.append(name)
+            if message['status'] == 'Optimal':
+                winner = name
+                break
+    finally:
+        for name, process in processes.items():
+            if name not in runs:
+                runs[name] = {'status': 'Cancelled', 'elapsed': time.perf_counter() - start}
+            _cancel(process)
+    wall_time = time.perf_counter() - start
+
+    if winner is None:
+        if not finished:
+            errors = '; '.join(f"{n}: {r.get('error', r['status'])}" for n, r in runs.items())
+            raise RuntimeError(f"Semua konfigurasi portfolio gagal ({errors})")
+        winner = finished[0]
+
+    best = runs[winner]
+    x, y = route_values(network, best['x'], best['y'])
+    result = SolveResult(backend_of[winner], best['status'], best['objective'], x, y, wall_time)
+    result.method = options_of[winner].get('method')
+    result.build_time = best['build_time']
+    result.iterations = best['iterations']
+    result.portfolio = {
+        'winner': winner,
+        'wall_time': wall_time,
+        'runs': {name: {key: value for key, value in run.items() if key not in ('name', 'x', 'y')}
+                 for name, run in runs.items()},
+    }
+    if record:
+        _record(network, result)
+    return result
+
+
+# ================================================================================
+# RIWAYAT PEMENANG
+# ================================================================================
+
+def _record(network, result):
+    from sawit.resultcache import instance_key
+
+    entry = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'instance': instance_key(network, 'portfolio')[:16],
+        'n_vars': network.n_vars,
+        'status': result.status,
+        **result.portfolio,
+    }
+    os.makedirs(cache_dir(), exist_ok=True)
+    with open(log_path(), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def history(path=None):
+    """Semua balapan yang tercatat (list dict, urutan waktu)."""
+    try:
+        with open(path or log_path(), encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def summarize(entries):
+    """Per konfigurasi: jumlah menang, jumlah selesai, median waktu selesai.
+
+    Return list dict, diurutkan dari yang paling sering menang.
+    """
+    stats = {}
+    for entry in entries:
+        for name, run in entry['runs'].items():
+            s = stats.setdefault(name, {'name': name, 'wins': 0, 'races': 0, 'finished': []})
+            s['races'] += 1
+            if run['status'] not in ('Cancelled', 'Crashed', 'Error'):
+                s['finished'].append(run['elapsed'])
+            if name == entry['winner']:
+                s['wins'] += 1
+    rows = []
+    for s in stats.values():
+        rows.append({'name': s['name'], 'wins': s['wins'], 'races': s['races'],
+                     'finished': len(s['finished']),
+                     'median_elapsed': statistics.median(s['finished']) if s['finished'] else None})
+    return sorted(rows, key=lambda r: (-r['wins'], r['median_elapsed'] or float('inf')))
+
+
+def print_summary(entries):
+    if not entries:
+        print(f"Belum ada balapan portfolio tercatat ({log_path()})")
+        return
+    print(f"{len(entries)} balapan portfolio ({log_path()})\n")
+    print(f"{'Konfigurasi':<14} {'Menang':>7} {'Selesai':>8} {'Dibalap':>8} {'Median selesai (s)':>19}")
+    print("-" * 60)
+    for row in summarize(entries):
+        median = '–' if row['median_elapsed'] is None else f"{row['median_elapsed']:.3f}"
+        print(f"{row['name']:<14} {row['wins']:>7} {row['finished']:>8} {row['races']:>8} {median:>19}")
@@ -0,0 +1,268 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/presolve.py
+Deskripsi: Tahap reduksi (presolve) sebelum model dibangun, dengan peta
+           postsolve kembali ke jaringan asli.
+
+Reduksi yang dipakai (semuanya aman: solusi optimal jaringan tereduksi,
+setelah postsolve, adalah solusi optimal jaringan asli):
+
+    paralel     rute ganda (asal, tujuan) yang sama: hanya yang termurah
+                dipertahankan.
+    batas       kapasitas pabrik diperketat ke min(kapasitas, Σ supply kebun
+                yang terhubung, Σ demand PD yang terjangkau / yield) dan
+                supply kebun ke Σ kapasitas pabrik tujuannya. Batas demand
+                hanya dipakai jika semua biaya >= 0 (ada solusi optimal tanpa
+                kelebihan kiriman ke PD). Kebun yang supply-nya tidak pernah
+                mengikat disebut "bebas".
+    mati        rute dari kebun supply 0, ke/dari pabrik berkapasitas 0 atau
+                tanpa rute masuk/keluar, dan ke PD dengan demand 0.
+    dominasi    rute TBS ke pabrik p yang lebih mahal dari rute termurah
+                kebun bebas ke p: alirannya bisa dipindah ke kebun bebas itu
+                tanpa menambah biaya dan tanpa melanggar kapasitas.
+    agregasi    kebun dengan profil rute (pabrik, biaya) identik digabung
+                (supply dijumlah), begitu juga PD dengan profil (pabrik,
+                biaya) identik (demand dijumlah).
+
+Postsolve: setiap kolom asli menunjuk ke kolom tereduksi (atau -1 jika
+dihapus, nilainya 0) dengan bobot pembagian. Aliran rute gabungan dibagi
+proporsional terhadap supply kebun / demand PD anggota, sehingga supply
+dan demand setiap node asli tetap terpenuhi dan biayanya sama.
+
+    presolved = presolve(network)
+    result = presolved.postsolve(solve(presolved.reduced))
+"""
+
+import os
+
+import numpy as np
+
+from sawit.network import Network
+
+
+def enabled():
+    return os.environ.get('SAWIT_PRESOLVE', '1') not in ('0', '')
+
+
+def model_size(network):
+    """(kolom, baris, non-zero) model LP untuk Network."""
+    return network.n_vars, network.n_rows, 3 * network.n_tbs + 2 * network.n_cpo
+
+
+# ================================================================================
+# REDUKSI
+# ================================================================================
+
+def _cheapest_parallel(src, dst, cost, n_dst):
+    """Mask rute yang dipertahankan: satu rute termurah per (asal, tujuan)."""
+    key = src * n_dst + dst
+    order = np.lexsort((cost, key))
+    _, first = np.unique(key[order], return_index=True)
+    keep = np.zeros(len(key), dtype=bool)
+    keep[order[first]] = True
+    return keep
+
+
+def _remove_dead(n, supply, capacity, demand, tbs_keep, cpo_keep, drop_zero_demand):
+    """Matikan rute yang tidak mungkin mengalir, berulang sampai stabil."""
+    P = len(n.pabrik)
+    while True:
+        has_in = np.bincount(n.tbs_dst[tbs_keep], minlength=P) > 0
+        has_out = np.bincount(n.cpo_src[cpo_keep], minlength=P) > 0
+        open_pabrik = (capacity > 0) & has_in & has_out
+        tbs_new = tbs_keep & (supply[n.tbs_src] > 0) & open_pabrik[n.tbs_dst]
+        cpo_new = cpo_keep & open_pabrik[n.cpo_src]
+        if drop_zero_demand:
+            cpo_new &= demand[n.cpo_dst] > 0
+        if (tbs_new == tbs_keep).all() and (cpo_new == cpo_keep).all():
+            return tbs_keep, cpo_keep
+        tbs_keep, cpo_keep = tbs_new, cpo_new
+
+
+def _tighten(n, supply, capacity, demand, tbs_keep, cpo_keep, use_demand):
+    """Batas kapasitas pabrik dan supply kebun dari argumen aliran sederhana.
+    Return (supply, capacity, mask kebun bebas)."""
+    K, P = len(n.kebun), len(n.pabrik)
+    inflow = np.bincount(n.tbs_dst[tbs_keep], weights=supply[n.tbs_src[tbs_keep]], minlength=P)
+    capacity = np.minimum(capacity, inflow)
+    if use_demand and n.yield_rate > 0:
+        reach = np.bincount(n.cpo_src[cpo_keep], weights=demand[n.cpo_dst[cpo_keep]], minlength=P)
+        capacity = np.minimum(capacity, reach / n.yield_rate)
+    outflow = np.bincount(n.tbs_src[tbs_keep], weights=capacity[n.tbs_dst[tbs_keep]], minlength=K)
+    free = outflow <= supply
+    return np.minimum(supply, outflow), capacity, free
+
+
+def _dominated(n, tbs_keep, free):
+    """Mask rute TBS yang lebih mahal dari rute termurah kebun bebas ke pabrik yang sama."""
+    best = np.full(len(n.pabrik), np.inf)
+    from_free = tbs_keep & free[n.tbs_src]
+    np.minimum.at(best, n.tbs_dst[from_free], n.tbs_cost[from_free])
+    return tbs_keep & (n.tbs_cost > best[n.tbs_dst])
+
+
+def _groups(node, other, cost, keep, n_nodes, amount):
+    """Kelompokkan node dengan profil rute (other, cost) identik.
+
+    Return (leader, weight): leader[i] = node wakil kelompok i (-1 jika node
+    dibuang karena tidak punya rute), weight[i] = bagian node i dari aliran
+    kelompok (proporsional terhadap amount).
+    """
+    leader = np.full(n_nodes, -1, dtype=np.int64)
+    order = np.lexsort((cost, other, node))
+    order = order[keep[order]]
+    bounds = np.searchsorted(node[order], np.arange(n_nodes + 1))
+    seen = {}
+    for i in range(n_nodes):
+        segment = order[bounds[i]:bounds[i + 1]]
+        if not len(segment):
+            continue
+        key = (other[segment].tobytes(), cost[segment].tobytes())
+        leader[i] = seen.setdefault(key, i)
+
+    weight = np.zeros(n_nodes)
+    alive = leader >= 0
+    total = np.bincount(leader[alive], weights=amount[alive], minlength=n_nodes)
+    size = np.bincount(leader[alive], minlength=n_nodes)
+    weight[alive] = np.where(total[leader[alive]] > 0, amount[alive] / np.maximum(total[leader[alive]], 1e-300),
+                             1.0 / size[leader[alive]])
+    return leader, weight
+
+
+def _column_map(src_leader, dst_leader, src, dst, keep, red_src, red_dst, n_dst):
+    """Indeks kolom tereduksi untuk setiap kolom asli (-1 jika dihapus)."""
+    red_key = red_src * n_dst + red_dst
+    order = np.argsort(red_key, kind='stable')
+    mapped = np.full(len(src), -1, dtype=np.int64)
+    key = src_leader[src[keep]] * n_dst + dst_leader[dst[keep]]
+    mapped[keep] = order[np.searchsorted(red_key[order], key)]
+    return mapped
+
+
+def presolve(network):
+    """Reduksi Network. Return Presolved (jaringan tereduksi + peta postsolve)."""
+    n = network
+    K, P, D = len(n.kebun), len(n.pabrik), len(n.pusat)
+    supply, capacity, demand = n.supply.copy(), n.capacity.copy(), n.demand.copy()
+    nonnegative = (n.tbs_cost >= 0).all() and (n.cpo_cost >= 0).all()
+    removed = {}
+
+    tbs_keep = _cheapest_parallel(n.tbs_src, n.tbs_dst, n.tbs_cost, P)
+    cpo_keep = _cheapest_parallel(n.cpo_src, n.cpo_dst, n.cpo_cost, D)
+    removed['paralel'] = int(n.n_vars - tbs_keep.sum() - cpo_keep.sum())
+
+    def remove_dead(tbs_keep, cpo_keep):
+        before = tbs_keep.sum() + cpo_keep.sum()
+        tbs_keep, cpo_keep = _remove_dead(n, supply, capacity, demand, tbs_keep, cpo_keep, nonnegative)
+        removed['mati'] = removed.get('mati', 0) + int(before - tbs_keep.sum() - cpo_keep.sum())
+        return tbs_keep, cpo_keep
+
+    tbs_keep, cpo_keep = remove_dead(tbs_keep, cpo_keep)
+    supply, capacity, free = _tighten(n, supply, capacity, demand, tbs_keep, cpo_keep, nonnegative)
+    tightened = int((supply < n.supply).sum() + (capacity < n.capacity).sum())
+
+    dominated = _dominated(n, tbs_keep, free)
+    removed['dominasi'] = int(dominated.sum())
+    tbs_keep, cpo_keep = remove_dead(tbs_keep & ~dominated, cpo_keep)
+
+    # Agregasi: PD dengan demand > 0 tanpa rute tetap dipertahankan (model infeasible)
+    kebun_leader, kebun_weight = _groups(n.tbs_src, n.tbs_dst, n.tbs_cost, tbs_keep, K, supply)
+    pusat_leader, pusat_weight = _groups(n.cpo_dst, n.cpo_src, n.cpo_cost, cpo_keep, D, demand)
+    stranded = (pusat_leader < 0) & (demand > 0)
+    pusat_leader[stranded] = np.flatnonzero(stranded)
+    pusat_weight[stranded] = 1.0
+
+    kebun_idx = np.flatnonzero(kebun_leader == np.arange(K))
+    pusat_idx = np.flatnonzero(pusat_leader == np.arange(D))
+    has_arc = (np.bincount(n.tbs_dst[tbs_keep], minlength=P) + np.bincount(n.cpo_src[cpo_keep], minlength=P)) > 0
+    pabrik_idx = np.flatnonzero(has_arc)
+
+    def renumber(index, size):
+        new = np.full(size, -1, dtype=np.int64)
+        new[index] = np.arange(len(index))
+        return new
+
+    new_kebun, new_pabrik, new_pusat = renumber(kebun_idx, K), renumber(pabrik_idx, P), renumber(pusat_idx, D)
+    kebun_supply = np.bincount(kebun_leader[kebun_leader >= 0], weights=supply[kebun_leader >= 0], minlength=K)
+    pusat_demand = np.bincount(pusat_leader[pusat_leader >= 0], weights=demand[pusat_leader >= 0], minlength=D)
+
+    # Kolom tereduksi: rute milik wakil kelompok saja (anggota lain punya profil yang sama)
+    tbs_cols = np.flatnonzero(tbs_keep & (kebun_leader[n.tbs_src] == n.tbs_src))
+    cpo_cols = np.flatnonzero(cpo_keep & (pusat_leader[n.cpo_dst] == n.cpo_dst))
+    reduced = Network(
+        [n.kebun[i] for i in kebun_idx.tolist()], [n.pabrik[j] for j in pabrik_idx.tolist()],
+        [n.pusat[d] for d in pusat_idx.tolist()],
+        kebun_supply[kebun_idx], capacity[pabrik_idx], pusat_demand[pusat_idx], n.yield_rate,
+        new_kebun[n.tbs_src[tbs_cols]], new_pabrik[n.tbs_dst[tbs_cols]], n.tbs_cost[tbs_cols],
+        new_pabrik[n.cpo_src[cpo_cols]], new_pusat[n.cpo_dst[cpo_cols]], n.cpo_cost[cpo_cols],
+    )
+
+    tbs_map = _column_map(new_kebun[np.maximum(kebun_leader, 0)], new_pabrik, n.tbs_src, n.tbs_dst, tbs_keep,
+                          reduced.tbs_src, reduced.tbs_dst, len(pabrik_idx))
+    cpo_map = _column_map(new_pabrik, new_pusat[np.maximum(pusat_leader, 0)], n.cpo_src, n.cpo_dst, cpo_keep,
+                          reduced.cpo_src, reduced.cpo_dst, len(pusat_idx))
+
+    stats = {
+        'before': model_size(n),
+        'after': model_size(reduced),
+        'removed': removed,
+        'merged': {'kebun': int((kebun_leader >= 0).sum() - len(kebun_idx)),
+                   'pd': int((pusat_leader >= 0).sum() - len(pusat_idx))},
+        'dropped': {'kebun': int((kebun_leader < 0).sum()), 'pabrik': int(P - len(pabrik_idx)),
+                    'pd': int((pusat_leader < 0).sum())},
+        'tightened': tightened,
+        'free_kebun': int(free.sum()),
+    }
+    return Presolved(n, reduced, tbs_map, kebun_weight[n.tbs_src], cpo_map, pusat_weight[n.cpo_dst], stats)
+
+
+# ================================================================================
+# POSTSOLVE
+# ================================================================================
+
+class Presolved:
+    """Jaringan tereduksi dan peta postsolve ke jaringan asli."""
+
+    def __init__(self, original, reduced, tbs_map, tbs_weight, cpo_map, cpo_weight, stats):
+        self.original = original
+        self.reduced = reduced
+        self.tbs_map = tbs_map          # kolom X_TBS tereduksi per kolom asli, -1 = dihapus
+        self.tbs_weight = tbs_weight    # bagian kolom asli dari aliran kolom tereduksi
+        self.cpo_map = cpo_map
+        self.cpo_weight = cpo_weight
+        self.stats = stats
+
+    @property
+    def changed(self):
+        return self.stats['before'] != self.stats['after'] or self.stats['tightened'] > 0
+
+    def summary(self):
+        s = self.stats
+        (v0, r0, nz0), (v1, r1, nz1) = s['before'], s['after']
+
+        def pct(a, b):
+            return f"{(1 - b / a) * 100:.1f}%" if a else "0%"
+
+        removed = ', '.join(f"{count:,} {reason}" for reason, count in s['removed'].items() if count)
+        merged = s['merged']['kebun'] + s['merged']['pd']
+        return (f"{v0:,} → {v1:,} variabel (-{pct(v0, v1)}), {r0:,} → {r1:,} constraint (-{pct(r0, r1)}), "
+                f"{nz0:,} → {nz1:,} non-zero; rute dihapus: {removed or 'tidak ada'}; "
+                f"{merged:,} node digabung; {s['tightened']:,} batas diperketat, {s['free_kebun']:,} kebun bebas")
+
+    def postsolve_values(self, x_reduced, y_reduced):
+        """Array nilai x/y jaringan tereduksi → array nilai jaringan asli."""
+        x_reduced = np.append(np.asarray(x_reduced, dtype=float), 0.0)      # indeks -1 → 0
+        y_reduced = np.append(np.asarray(y_reduced, dtype=float), 0.0)
+        return x_reduced[self.tbs_map] * self.tbs_weight, y_reduced[self.cpo_map] * self.cpo_weight
+
+    def postsolve(self, result):
+        """SolveResult jaringan tereduksi → SolveResult dengan x/y untuk semua
+        rute asli. Statistik reduksi disimpan di result.presolve."""
+        from sawit.backends import route_values
+        from sawit.solution import solution_arrays
+
+        x_vals, y_vals = self.postsolve_values(*solution_arrays(self.reduced, result))
+        result.x, result.y = route_values(self.original, x_vals, y_vals)
+        result.presolve = dict(self.stats, summary=self.summary())
+        return result
@@ -0,0 +1,741 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/report.py
+Deskripsi: Penulis HTML report hasil solver secara streaming.
+
+Report disusun dari potongan template statis dan template baris. Setiap
+bagian dan setiap baris tabel langsung ditulis ke file (lewat buffer I/O),
+bukan digabung ke satu string besar dengan `html +=`. Baris tabel diterima
+sebagai iterable (boleh generator), sehingga memori puncak tidak bergantung
+pada jumlah rute.
+
+Untuk network besar, mode json/json-gzip mengganti tabel <tr> dengan tabel
+virtual (sawit/vtable.py): data dikirim sebagai JSON kolumnar dan browser
+hanya merender baris yang terlihat.
+"""
+
+import os
+
+from sawit.vtable import ASSETS, virtual_table
+
+BUFFER_SIZE = 1 << 16
+
+REPORT_MODES = ('rows', 'json', 'json-gzip')
+
+# Di atas jumlah baris ini mode auto memakai tabel virtual
+ROWS_LIMIT = 2000
+
+# Kolom tabel virtual (lihat sawit/vtable.py), sama dengan kolom tabel <tr>
+TBS_COLUMNS = [
+    {'key': 'src', 'label': 'Dari Kebun', 'fmt': 'key'},
+    {'key': 'dst', 'label': 'Ke Pabrik', 'fmt': 'key'},
+    {'key': 'qty', 'label': 'Jumlah (ton)', 'fmt': 'num0'},
+    {'key': 'cost', 'label': 'Biaya/ton', 'fmt': 'rp'},
+    {'key': 'total', 'label': 'Total Biaya', 'fmt': 'rp', 'product': ['qty', 'cost']},
+]
+PRODUKSI_COLUMNS = [
+    {'key': 'pabrik', 'label': 'Pabrik', 'fmt': 'key'},
+    {'key': 'tbs_in', 'label': 'Input TBS (ton)', 'fmt': 'num0'},
+    {'key': 'cpo_out', 'label': 'Output CPO (ton)', 'fmt': 'num0'},
+    {'key': 'capacity', 'label': 'Kapasitas', 'fmt': 'num', 'suffix': ' ton'},
+    {'key': 'util', 'label': 'Utilisasi', 'fmt': 'pct', 'cls': 'success'},
+]
+CPO_COLUMNS = [
+    {'key': 'src', 'label': 'Dari Pabrik', 'fmt': 'key'},
+    {'key': 'dst', 'label': 'Ke PD', 'fmt': 'key'},
+    {'key': 'qty', 'label': 'Jumlah (ton)', 'fmt': 'num1'},
+    {'key': 'cost', 'label': 'Biaya/ton', 'fmt': 'rp'},
+    {'key': 'total', 'label': 'Total Biaya', 'fmt': 'rp', 'product': ['qty', 'cost']},
+]
+DEMAND_COLUMNS = [
+    {'key': 'pusat', 'label': 'Pusat Distribusi', 'fmt': 'key'},
+    {'key': 'demand', 'label': 'Demand', 'fmt': 'num', 'suffix': ' ton'},
+    {'key': 'supplied', 'label': 'Supplied', 'fmt': 'num1', 'suffix': ' ton'},
+    {'key': 'pct', 'label': 'Pemenuhan', 'fmt': 'pct'},
+    {'key': 'status', 'label': 'Status', 'fmt': 'flag', 'labels': ['✗ Kurang', '✓ Terpenuhi'],
+     'classes': ['danger', 'success']},
+]
+SENSITIVITY_ROW_COLUMNS = [
+    {'key': 'kind', 'label': 'Constraint', 'fmt': 'text'},
+    {'key': 'node', 'label': 'Node', 'fmt': 'key'},
+    {'key': 'rhs', 'label': 'RHS (ton)', 'fmt': 'num'},
+    {'key': 'activity', 'label': 'Aktivitas (ton)', 'fmt': 'num1'},
+    {'key': 'slack', 'label': 'Slack (ton)', 'fmt': 'num1'},
+    {'key': 'dual', 'label': 'Shadow Price/ton', 'fmt': 'rp'},
+    {'key': 'rhs_lo', 'label': 'RHS Min', 'fmt': 'num1', 'empty': '−∞'},
+    {'key': 'rhs_hi', 'label': 'RHS Maks', 'fmt': 'num1', 'empty': '∞'},
+]
+
+
+def sensitivity_route_columns(src_label, dst_label):
+    return [
+        {'key': 'src', 'label': src_label, 'fmt': 'key'},
+        {'key': 'dst', 'label': dst_label, 'fmt': 'key'},
+        {'key': 'qty', 'label': 'Jumlah (ton)', 'fmt': 'num1'},
+        {'key': 'cost', 'label': 'Biaya/ton', 'fmt': 'rp'},
+        {'key': 'reduced', 'label': 'Reduced Cost', 'fmt': 'rp'},
+        {'key': 'cost_lo', 'label': 'Biaya Min', 'fmt': 'rp', 'empty': '−∞'},
+        {'key': 'cost_hi', 'label': 'Biaya Maks', 'fmt': 'rp', 'empty': '∞'},
+    ]
+
+# ================================================================================
+# TEMPLATE
+# ================================================================================
+
+# Bagian <head> (CSS) tidak diformat, sehingga kurung kurawal tidak perlu di-escape
+_HEAD = """<!DOCTYPE html>
+<html lang="id">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Python PuLP Solution</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            color: #333;
+        }
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }
+        .main-content { padding: 40px; }
+        .section {
+            margin-bottom: 40px;
+            background: #f8f9fa;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .section h2 {
+            color: #1e3c72;
+            margin-bottom: 20px;
+            font-size: 1.8em;
+            border-bottom: 3px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .metric-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin: 30px 0;
+        }
+        .metric-card {
+            background: white;
+            padding: 25px;
+            border-radius: 12px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            border-left: 5px solid #667eea;
+            transition: transform 0.3s ease;
+        }
+        .metric-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 8px 20px rgba(0,0,0,0.15);
+        }
+        .metric-card h3 {
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 10px;
+            text-transform: uppercase;
+        }
+        .metric-card .value {
+            color: #1e3c72;
+            font-size: 2em;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+        .metric-card .subtitle { color: #999; font-size: 0.9em; }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            background: white;
+            border-radius: 10px;
+            overflow: hidden;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        th {
+            background: #1e3c72;
+            color: white;
+            padding: 15px;
+            text-align: left;
+            font-weight: 600;
+        }
+        td { padding: 12px 15px; border-bottom: 1px solid #eee; }
+        tr:hover { background: #f5f5f5; }
+        .step-box {
+            background: white;
+            padding: 20px;
+            margin: 15px 0;
+            border-radius: 10px;
+            border-left: 4px solid #667eea;
+        }
+        .step-box h3 { color: #1e3c72; margin-bottom: 10px; }
+        .section h3 { color: #1e3c72; margin: 25px 0 10px; }
+        .step-box p { line-height: 1.6; color: #555; }
+        .code-box {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 8px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.9em;
+            margin: 10px 0;
+            border: 1px solid #ddd;
+        }
+        .success { color: #28a745; font-weight: bold; }
+        .danger { color: #dc3545; font-weight: bold; }
+        .footer {
+            background: #1e3c72;
+            color: white;
+            text-align: center;
+            padding: 30px;
+        }
+    </style>
+</head>
+"""
+
+_INTRO = """<body>
+    <div class="container">
+        <div class="header">
+            <h1>🐍 SOLUSI PYTHON PuLP</h1>
+            <p>Optimasi Sistem Distribusi</p>
+            <p style="font-size: 0.9em; margin-top: 10px;">PT Sawit Makmur Sejahtera</p>
+        </div>
+        
+        <div class="main-content">
+            <div class="section">
+                <h2>📋 METODOLOGI STEP-BY-STEP</h2>
+                
+                <div class="step-box">
+                    <h3>STEP 1: Definisi Data</h3>
+                    <p>Mengumpulkan semua parameter yang diperlukan:</p>
+                    <ul style="margin-left: 20px; margin-top: 10px; line-height: 1.8;">
+                        <li>Kapasitas supply kebun: {supply_total:,} ton TBS</li>
+                        <li>Kapasitas pabrik: {capacity_total:,} ton TBS</li>
+                        <li>Total demand: {demand_total:,} ton CPO</li>
+                        <li>Yield rate: {yield_pct:.0f}%</li>
+                        <li>Matriks biaya transportasi TBS dan CPO</li>
+                    </ul>
+                </div>
+                
+                <div class="step-box">
+                    <h3>STEP 2: Inisialisasi Model</h3>
+                    <div class="code-box">
+                        model = LpProblem("Optimasi_Distribusi_Sawit", LpMinimize)
+                    </div>
+                    <p>Membuat model Linear Programming dengan objective: <strong>Minimasi Biaya</strong></p>
+                </div>
+                
+                <div class="step-box">
+                    <h3>STEP 3: Definisi Variabel Keputusan</h3>
+                    <div class="code-box">
+                        x = LpVariable.dicts("X_TBS", routes_tbs, lowBound=0)<br>
+                        y = LpVariable.dicts("Y_CPO", routes_cpo, lowBound=0)
+                    </div>
+                    <p>Total: <strong>{n_vars} variabel</strong> ({n_tbs} TBS + {n_cpo} CPO)</p>
+                </div>
+                
+                <div class="step-box">
+                    <h3>STEP 4: Definisi Objective Function</h3>
+                    <div class="code-box">
+                        Minimize Z = Σ(Biaya_TBS × X) + Σ(Biaya_CPO × Y)
+                    </div>
+                    <p>Meminimalkan total biaya transportasi TBS dan CPO</p>
+                </div>
+                
+                <div class="step-box">
+                    <h3>STEP 5: Definisi Constraints</h3>
+                    <p>Total: <strong>{n_rows} constraints</strong></p>
+                    <ul style="margin-left: 20px; margin-top: 10px; line-height: 1.8;">
+                        <li>{n_kebun} constraint kapasitas supply kebun</li>
+                        <li>{n_pabrik} constraint kapasitas pabrik</li>
+                        <li>{n_pabrik} constraint material balance (TBS → CPO)</li>
+                        <li>{n_pd} constraint pemenuhan demand</li>
+                        <li>+ non-negativity constraints</li>
+                    </ul>
+                </div>
+                
+                <div class="step-box">
+                    <h3>STEP 6: Solve Model</h3>
+                    <div class="code-box">
+                        {solver_call}<br>
+                        Status: <strong style="color: {status_color};">{status}</strong>
+                    </div>
+                    <p>Menggunakan {solver_label} solver</p>
+                    <p>{result_source}</p>
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>🎯 HASIL OPTIMASI</h2>
+                <div class="metric-grid">
+                    <div class="metric-card">
+                        <h3>💰 Total Biaya Optimal</h3>
+                        <div class="value">Rp {total_biaya:,.0f}</div>
+                        <div class="subtitle">Per bulan</div>
+                    </div>
+                    <div class="metric-card">
+                        <h3>🚛 Biaya TBS</h3>
+                        <div class="value">Rp {biaya_tbs:,.0f}</div>
+                        <div class="subtitle">{pct_tbs:.1f}% dari total</div>
+                    </div>
+                    <div class="metric-card">
+                        <h3>📦 Biaya CPO</h3>
+                        <div class="value">Rp {biaya_cpo:,.0f}</div>
+                        <div class="subtitle">{pct_cpo:.1f}% dari total</div>
+                    </div>
+                    <div class="metric-card">
+                        <h3>✅ Status</h3>
+                        <div class="value" style="color: {status_color}; font-size: 1.5em;">{status_label}</div>
+                        <div class="subtitle">{solver_label}</div>
+                    </div>
+                </div>
+            </div>
+"""
+
+_TBS_SECTION = """            
+            <div class="section">
+                <h2>🚛 ALOKASI TBS (Kebun → Pabrik)</h2>
+"""
+
+_TBS_TABLE = """                <table>
+                    <thead>
+                        <tr>
+                            <th>Dari Kebun</th>
+                            <th>Ke Pabrik</th>
+                            <th>Jumlah (ton)</th>
+                            <th>Biaya/ton</th>
+                            <th>Total Biaya</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_TBS_ROW = """
+                        <tr>
+                            <td><strong>{src}</strong></td>
+                            <td><strong>{dst}</strong></td>
+                            <td>{qty:,.0f}</td>
+                            <td>Rp {cost:,}</td>
+                            <td>Rp {total:,.0f}</td>
+                        </tr>
+"""
+
+_PRODUKSI_SECTION = """            </div>
+            
+            <div class="section">
+                <h2>🏭 PRODUKSI CPO PER PABRIK</h2>
+"""
+
+_PRODUKSI_TABLE = """                <table>
+                    <thead>
+                        <tr>
+                            <th>Pabrik</th>
+                            <th>Input TBS (ton)</th>
+                            <th>Output CPO (ton)</th>
+                            <th>Kapasitas</th>
+                            <th>Utilisasi</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_PRODUKSI_ROW = """
+                        <tr>
+                            <td><strong>{pabrik}</strong></td>
+                            <td>{tbs_in:,.0f}</td>
+                            <td>{cpo_out:,.0f}</td>
+                            <td>{capacity:,} ton</td>
+                            <td class="success">{util:.1f}%</td>
+                        </tr>
+"""
+
+_CPO_SECTION = """            </div>
+            
+            <div class="section">
+                <h2>📦 DISTRIBUSI CPO (Pabrik → PD)</h2>
+"""
+
+_CPO_TABLE = """                <table>
+                    <thead>
+                        <tr>
+                            <th>Dari Pabrik</th>
+                            <th>Ke PD</th>
+                            <th>Jumlah (ton)</th>
+                            <th>Biaya/ton</th>
+                            <th>Total Biaya</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_CPO_ROW = """
+                        <tr>
+                            <td><strong>{src}</strong></td>
+                            <td><strong>{dst}</strong></td>
+                            <td>{qty:,.1f}</td>
+                            <td>Rp {cost:,}</td>
+                            <td>Rp {total:,.0f}</td>
+                        </tr>
+"""
+
+_DEMAND_SECTION = """            </div>
+            
+            <div class="section">
+                <h2>✅ VERIFIKASI PEMENUHAN DEMAND</h2>
+"""
+
+_DEMAND_TABLE = """                <table>
+                    <thead>
+                        <tr>
+                            <th>Pusat Distribusi</th>
+                            <th>Demand</th>
+                            <th>Supplied</th>
+                            <th>Pemenuhan</th>
+                            <th>Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_DEMAND_ROW = """
+                        <tr>
+                            <td><strong>{pusat}</strong></td>
+                            <td>{demand:,} ton</td>
+                            <td>{supplied:,.1f} ton</td>
+                            <td>{pct:.1f}%</td>
+                            <td class="{status_cls}">{status}</td>
+                        </tr>
+"""
+
+_DIAGNOSIS_SECTION = """            
+            <div class="section">
+                <h2>⚠️ DIAGNOSIS INFEASIBILITY</h2>
+                <ul style="margin-left: 30px; line-height: 1.8;">
+"""
+
+_DIAGNOSIS_LINE = """                    <li>{line}</li>
+"""
+
+_DIAGNOSIS_TABLE = """                </ul>
+                <h3>Himpunan Constraint yang Bertentangan</h3>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Constraint</th>
+                            <th>Node</th>
+                            <th>RHS (ton)</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_DIAGNOSIS_ROW = """
+                        <tr>
+                            <td>{kind}</td>
+                            <td><strong>{node}</strong></td>
+                            <td class="danger">{rhs:,.1f}</td>
+                        </tr>
+"""
+
+_SENSITIVITY_SECTION = """            </div>
+            
+            <div class="section">
+                <h2>📐 ANALISIS SENSITIVITAS</h2>
+                <p style="line-height: 1.6;">{note}</p>
+"""
+
+_SENSITIVITY_ROW_TABLE = """                <h3>Shadow Price & RHS Ranging per Constraint</h3>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Constraint</th>
+                            <th>Node</th>
+                            <th>RHS (ton)</th>
+                            <th>Aktivitas (ton)</th>
+                            <th>Slack (ton)</th>
+                            <th>Shadow Price/ton</th>
+                            <th>RHS Min</th>
+                            <th>RHS Maks</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_SENSITIVITY_ROW_ROW = """
+                        <tr>
+                            <td>{kind}</td>
+                            <td><strong>{node}</strong></td>
+                            <td>{rhs:,.0f}</td>
+                            <td>{activity:,.1f}</td>
+                            <td>{slack:,.1f}</td>
+                            <td>Rp {dual:,.0f}</td>
+                            <td>{rhs_lo}</td>
+                            <td>{rhs_hi}</td>
+                        </tr>
+"""
+
+_SENSITIVITY_ROUTE_TABLE = """                <h3>{title}</h3>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>{src_label}</th>
+                            <th>{dst_label}</th>
+                            <th>Jumlah (ton)</th>
+                            <th>Biaya/ton</th>
+                            <th>Reduced Cost</th>
+                            <th>Biaya Min</th>
+                            <th>Biaya Maks</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_SENSITIVITY_ROUTE_ROW = """
+                        <tr>
+                            <td><strong>{src}</strong></td>
+                            <td><strong>{dst}</strong></td>
+                            <td>{qty:,.1f}</td>
+                            <td>Rp {cost:,.0f}</td>
+                            <td>Rp {reduced:,.0f}</td>
+                            <td>{cost_lo}</td>
+                            <td>{cost_hi}</td>
+                        </tr>
+"""
+
+# (judul, label asal, label tujuan) tabel ranging rute
+_SENSITIVITY_ROUTES = (
+    ('tbs', 'Reduced Cost & Cost Ranging Rute TBS', 'Dari Kebun', 'Ke Pabrik'),
+    ('cpo', 'Reduced Cost & Cost Ranging Rute CPO', 'Dari Pabrik', 'Ke PD'),
+)
+
+_OUTRO = """            </div>
+            
+            <div class="section">
+                <h2>📝 KESIMPULAN</h2>
+                <div style="background: white; padding: 25px; border-radius: 12px; line-height: 1.8;">
+                    <p><strong>1. Model Linear Programming</strong> berhasil dibangun dengan {n_vars} variabel dan {n_rows} constraints.</p>
+                    <br>
+                    <p><strong>2. {status_title}</strong> {status_text}</p>
+                    <br>
+                    <p><strong>3. Total Biaya Optimal:</strong> <strong style="color: #1e3c72;">Rp {total_biaya:,.0f}/bulan</strong></p>
+                    <ul style="margin-left: 30px; margin-top: 10px;">
+                        <li>Biaya TBS: Rp {biaya_tbs:,.0f} ({pct_tbs:.1f}%)</li>
+                        <li>Biaya CPO: Rp {biaya_cpo:,.0f} ({pct_cpo:.1f}%)</li>
+                    </ul>
+                    <br>
+                    <p><strong>4. {checks_title}</strong> (verifikasi residual semua baris):</p>
+                    <ul style="margin-left: 30px; margin-top: 10px;">
+{checks_items}                    </ul>
+                    <br>
+                    <p><strong>5. Utilisasi Kapasitas</strong> tinggi menunjukkan efisiensi optimal.</p>
+                </div>
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p><strong>Python PuLP Solution</strong></p>
+            <p>Teknik Riset Operasional</p>
+            <p>Program Studi Teknik Informatika</p>
+        </div>
+    </div>
+"""
+
+_TABLE_END = """
+                    </tbody>
+                </table>
+"""
+
+_END = """</body>
+</html>
+"""
+
+# ================================================================================
+# WRITER
+# ================================================================================
+
+def _route_rows(template, chunks):
+    for rows in chunks:
+        for src, dst, qty, cost in rows:
+            yield template.format(src=src, dst=dst, qty=qty, cost=cost, total=cost * qty)
+
+
+def _bound(value, template):
+    """Batas ranging; ±inf berarti tidak terbatas."""
+    if value == float('inf'):
+        return '∞'
+    if value == float('-inf'):
+        return '−∞'
+    return template.format(value)
+
+
+# Kesimpulan verifikasi per jenis baris (sawit/verification.py): teks jika lolos / dilanggar
+_CHECK_LABELS = {
+    'Supply Kebun': ('Kapasitas kebun tidak terlampaui', 'Kapasitas kebun terlampaui'),
+    'Kapasitas Pabrik': ('Kapasitas pabrik tidak terlampaui', 'Kapasitas pabrik terlampaui'),
+    'Material Balance': ('Material balance TBS→CPO seimbang', 'Material balance TBS→CPO tidak seimbang'),
+    'Demand PD': ('Semua demand terpenuhi 100%', 'Demand tidak terpenuhi'),
+}
+
+
+def _check_fields(checks):
+    """Placeholder kesimpulan constraint dari (jenis, baris, dilanggar, residual maks)."""
+    items = []
+    for kind, n_rows, n_bad, worst in checks:
+        good, bad = _CHECK_LABELS[kind]
+        if n_bad:
+            items.append(f'<li class="danger">✗ {bad} di {n_bad:,} dari {n_rows:,} baris '
+                         f'(residual maks {worst:,.1f} ton)</li>')
+        else:
+            items.append(f'<li>✓ {good}</li>')
+    ok = not any(n_bad for _, _, n_bad, _ in checks)
+    return {'checks_title': 'Semua Constraints terpenuhi' if ok else 'Ada Constraint yang dilanggar',
+            'checks_items': ''.join(f'                        {item}\n' for item in items)}
+
+
+def _status_fields(summary):
+    """Placeholder status (warna, label kartu, kalimat kesimpulan) dari status solver."""
+    status = summary['status']
+    if status == 'Optimal':
+        return {'status_color': '#28a745', 'status_label': 'OPTIMAL', 'status_title': 'Solusi Optimal',
+                'status_text': f"ditemukan menggunakan Python PuLP dengan {summary['solver_label']} solver."}
+    return {'status_color': '#dc3545', 'status_label': status.upper(), 'status_title': 'Tidak Ada Solusi Optimal',
+            'status_text': f"(status {status}, {summary['solver_label']})."}
+
+
+def _write_diagnosis(f, diagnosis):
+    # Himpunan konflik selalu kecil (minimal), jadi selalu ditulis sebagai <tr>
+    f.write(_DIAGNOSIS_SECTION)
+    f.writelines(_DIAGNOSIS_LINE.format(line=line) for line in diagnosis['lines'])
+    f.write(_DIAGNOSIS_TABLE)
+    f.writelines(_DIAGNOSIS_ROW.format(kind=kind, node=node, rhs=rhs) for kind, node, rhs in diagnosis['conflict'])
+    f.write(_TABLE_END)
+    f.write('            </div>\n')
+
+
+def _write_sensitivity(f, sensitivity, mode):
+    f.write(_SENSITIVITY_SECTION.format(note=sensitivity['note']))
+    if mode != 'rows':
+        compress = mode == 'json-gzip'
+        f.write('                <h3>Shadow Price & RHS Ranging per Constraint</h3>\n')
+        f.write(virtual_table('tabel-sensitivitas-constraint', SENSITIVITY_ROW_COLUMNS,
+                              sensitivity['constraints'], compress))
+        for kind, title, src_label, dst_label in _SENSITIVITY_ROUTES:
+            f.write(f'                <h3>{title}</h3>\n')
+            f.write(virtual_table(f'tabel-sensitivitas-{kind}', sensitivity_route_columns(src_label, dst_label),
+                                  sensitivity[kind], compress))
+        return
+
+    f.write(_SENSITIVITY_ROW_TABLE)
+    f.writelines(
+        _SENSITIVITY_ROW_ROW.format(kind=kind, node=node, rhs=rhs, activity=activity, slack=slack, dual=dual,
+                                    rhs_lo=_bound(lo, '{:,.1f}'), rhs_hi=_bound(hi, '{:,.1f}'))
+        for kind, node, rhs, activity, slack, dual, lo, hi in sensitivity['constraints']
+    )
+    f.write(_TABLE_END)
+    for kind, title, src_label, dst_label in _SENSITIVITY_ROUTES:
+        f.write(_SENSITIVITY_ROUTE_TABLE.format(title=title, src_label=src_label, dst_label=dst_label))
+        f.writelines(
+            _SENSITIVITY_ROUTE_ROW.format(src=src, dst=dst, qty=qty, cost=cost, reduced=reduced,
+                                          cost_lo=_bound(lo, 'Rp {:,.0f}'), cost_hi=_bound(hi, 'Rp {:,.0f}'))
+            for src, dst, qty, cost, reduced, lo, hi in sensitivity[kind]
+        )
+        f.write(_TABLE_END)
+
+
+def report_mode(n_rows, mode=None):
+    """Mode report untuk n_rows baris tabel: SAWIT_REPORT (rows | json |
+    json-gzip | auto). auto memakai tabel virtual jika baris > ROWS_LIMIT."""
+    mode = mode or os.environ.get('SAWIT_REPORT', 'auto')
+    if mode == 'auto':
+        return 'json' if n_rows > ROWS_LIMIT else 'rows'
+    if mode not in REPORT_MODES:
+        raise ValueError(f"SAWIT_REPORT harus salah satu dari {('auto',) + REPORT_MODES}, bukan {mode!r}")
+    return mode
+
+
+def write_solver_report(path, summary, tbs_rows, production_rows, cpo_rows, demand_rows,
+                        mode='rows', buffer_size=BUFFER_SIZE, sensitivity=None, diagnosis=None):
+    """Tulis report python_solver.py ke path.
+
+    summary         : dict nilai ringkasan (lihat placeholder di _INTRO/_OUTRO)
+    tbs_rows        : potongan iterable (kebun, pabrik, jumlah_ton, biaya_per_ton),
+                      lihat Solution.route_rows
+    production_rows : iterable (pabrik, tbs_in, cpo_out, kapasitas, utilisasi_%)
+    cpo_rows        : potongan iterable (pabrik, pd, jumlah_ton, biaya_per_ton)
+    demand_rows     : iterable (pd, demand, supplied, pemenuhan_%, terpenuhi)
+    mode            : rows (<tr> per baris) | json | json-gzip (tabel virtual)
+    sensitivity     : None, atau dict note (teks) + iterable constraints
+                      (jenis, node, rhs, aktivitas, slack, dual, rhs_min, rhs_maks),
+                      tbs dan cpo (asal, tujuan, ton, biaya, reduced cost,
+                      biaya_min, biaya_maks); lihat sawit/sensitivity.py
+    diagnosis       : None, atau dict lines (teks) + conflict (jenis, node, rhs)
+                      untuk model infeasible; lihat sawit/feasibility.py
+    """
+    summary = dict(summary, **_status_fields(summary), **_check_fields(summary['checks']))
+    with open(path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        f.write(_HEAD)
+        f.write(_INTRO.format(**summary))
+        if diagnosis is not None:
+            _write_diagnosis(f, diagnosis)
+        f.write(_TBS_SECTION)
+        if mode == 'rows':
+            f.write(_TBS_TABLE)
+            f.writelines(_route_rows(_TBS_ROW, tbs_rows))
+            f.write(_TABLE_END)
+            f.write(_PRODUKSI_SECTION)
+            f.write(_PRODUKSI_TABLE)
+            f.writelines(
+                _PRODUKSI_ROW.format(pabrik=pabrik, tbs_in=tbs_in, cpo_out=cpo_out, capacity=capacity, util=util)
+                for pabrik, tbs_in, cpo_out, capacity, util in production_rows
+            )
+            f.write(_TABLE_END)
+            f.write(_CPO_SECTION)
+            f.write(_CPO_TABLE)
+            f.writelines(_route_rows(_CPO_ROW, cpo_rows))
+            f.write(_TABLE_END)
+            f.write(_DEMAND_SECTION)
+            f.write(_DEMAND_TABLE)
+            f.writelines(
+                _DEMAND_ROW.format(pusat=pusat, demand=demand, supplied=supplied, pct=pct,
+                                   status='✓ Terpenuhi' if met else '✗ Kurang', status_cls='success' if met else 'danger')
+                for pusat, demand, supplied, pct, met in demand_rows
+            )
+            f.write(_TABLE_END)
+            if sensitivity is not None:
+                _write_sensitivity(f, sensitivity, mode)
+            f.write(_OUTRO.format(**summary))
+            f.write(_END)
+            return
+
+        compress = mode == 'json-gzip'
+        f.write(virtual_table('tabel-tbs', TBS_COLUMNS, tbs_rows, compress, chunked=True))
+        f.write(_PRODUKSI_SECTION)
+        f.write(virtual_table('tabel-produksi', PRODUKSI_COLUMNS, production_rows, compress))
+        f.write(_CPO_SECTION)
+        f.write(virtual_table('tabel-cpo', CPO_COLUMNS, cpo_rows, compress, chunked=True))
+        f.write(_DEMAND_SECTION)
+        f.write(virtual_table('tabel-demand', DEMAND_COLUMNS, demand_rows, compress))
+        if sensitivity is not None:
+            _write_sensitivity(f, sensitivity, mode)
+        f.write(_OUTRO.format(**summary))
+        f.write(ASSETS)
+        f.write(_END)
@@ -0,0 +1,301 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/resultcache.py
+Deskripsi: Cache hasil solve di disk, dialamatkan dengan hash isi instance.
+
+Kunci cache = SHA-256 dari bentuk kanonik instance (supply, kapasitas,
+demand, yield rate, matriks biaya TBS/CPO; semuanya diurutkan per nama
+sehingga urutan dict/workbook tidak berpengaruh) ditambah backend, opsi
+solver dan pengaturan environment yang mengubah hasil (ENV_SETTINGS; region
+dari CSV diwakili isi filenya). Isi cache: status, objective, waktu solve
+asli, nilai x/y dalam urutan rute kanonik, metadata hasil (metode,
+iterasi, info balapan portfolio, riwayat dekomposisi) sebagai JSON, dan
+setelah report pertama juga dual/ranging sawit/sensitivity.py (baris dan
+kolom dalam urutan kanonik) sehingga cache hit tidak menghitungnya ulang.
+
+Cache hit tidak membangun model PuLP dan tidak menjalankan CBC sama sekali:
+
+    result, hit = cached_solve(network, 'cbc')
+
+File disimpan di <cache_dir>/results/ (lihat sawit/loader.py). Ukuran total
+dibatasi SAWIT_RESULT_CACHE_MB (default 256 MB); entri yang paling lama
+tidak dipakai dihapus lebih dulu (LRU, berdasarkan mtime yang diperbarui
+setiap hit). SAWIT_RESULT_CACHE=0 mematikan cache.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from sawit.loader import cache_dir
+from sawit.solution import solution_arrays
+
+# Naikkan jika format entri berubah agar entri lama tidak terpakai
+CACHE_VERSION = 2
+
+DEFAULT_MAX_MB = 256
+
+# Environment yang mengubah model atau hasil backend (cbc, portfolio, decomp)
+ENV_SETTINGS = ('SAWIT_CBC_MODEL', 'SAWIT_REGIONS', 'SAWIT_PORTFOLIO')
+
+# Atribut SolveResult yang ikut disimpan sebagai metadata JSON
+META_FIELDS = ('method', 'build_time', 'iterations', 'portfolio', 'decomposition')
+
+# Array Sensitivity per baris dan per kolom (disimpan dengan prefix sens_)
+SENSITIVITY_ROWS = ('activity', 'dual', 'rhs_lo', 'rhs_hi')
+SENSITIVITY_COLS = ('reduced_cost', 'cost_lo', 'cost_hi')
+
+
+def enabled():
+    return os.environ.get('SAWIT_RESULT_CACHE', '1') not in ('0', '')
+
+
+def results_dir():
+    return os.path.join(cache_dir(), 'results')
+
+
+def max_bytes():
+    return int(float(os.environ.get('SAWIT_RESULT_CACHE_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+# ================================================================================
+# KUNCI KANONIK
+# ================================================================================
+
+def _canonical_order(src_names, dst_names):
+    """Permutasi yang mengurutkan rute berdasarkan (asal, tujuan)."""
+    return np.lexsort((np.asarray(dst_names), np.asarray(src_names)))
+
+
+def _route_names(network):
+    kebun, pabrik, pusat = (np.asarray(names) for names in (network.kebun, network.pabrik, network.pusat))
+    return (kebun[network.tbs_src], pabrik[network.tbs_dst],
+            pabrik[network.cpo_src], pusat[network.cpo_dst])
+
+
+def _row_order(network):
+    """Permutasi kanonik baris: node diurutkan per nama dalam tiap blok."""
+    K, P = len(network.kebun), len(network.pabrik)
+    kebun, pabrik, pusat = (np.argsort(np.asarray(names), kind='stable')
+                            for names in (network.kebun, network.pabrik, network.pusat))
+    return np.concatenate([kebun, K + pabrik, K + P + pabrik, K + 2 * P + pusat]).astype(np.int64)
+
+
+def _col_order(network):
+    """Permutasi kanonik kolom [X_TBS, Y_CPO]."""
+    tbs_src, tbs_dst, cpo_src, cpo_dst = _route_names(network)
+    return np.concatenate([_canonical_order(tbs_src, tbs_dst),
+                           network.n_tbs + _canonical_order(cpo_src, cpo_dst)]).astype(np.int64)
+
+
+def settings():
+    """Nilai ENV_SETTINGS saat ini; path file (CSV region) diganti hash isinya."""
+    values = {}
+    for name in ENV_SETTINGS:
+        value = os.environ.get(name, '')
+        if value and os.path.isfile(value):
+            with open(value, 'rb') as f:
+                value = 'sha256:' + hashlib.sha256(f.read()).hexdigest()
+        values[name] = value
+    return values
+
+
+def instance_key(network, backend, options=None):
+    """Hash kanonik instance + backend, opsi dan settings() solver."""
+    tbs_src, tbs_dst, cpo_src, cpo_dst = _route_names(network)
+    tbs_order = _canonical_order(tbs_src, tbs_dst)
+    cpo_order = _canonical_order(cpo_src, cpo_dst)
+
+    digest = hashlib.sha256()
+
+    def update(*parts):
+        for part in parts:
+            if isinstance(part, np.ndarray):
+                digest.update(str(part.dtype).encode())
+                digest.update(np.ascontiguousarray(part).tobytes())
+            else:
+                digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+            digest.update(b'\0')
+
+    def nodes(names, values):
+        order = np.argsort(np.asarray(names), kind='stable')
+        return np.asarray(names)[order].tolist(), np.asarray(values, dtype=float)[order]
+
+    update(f"v{CACHE_VERSION}", backend, options or {}, settings())
+    update(*nodes(network.kebun, network.supply))
+    update(*nodes(network.pabrik, network.capacity))
+    update(*nodes(network.pusat, network.demand))
+    update(float(network.yield_rate))
+    update(tbs_src[tbs_order].tolist(), tbs_dst[tbs_order].tolist(),
+           np.asarray(network.tbs_cost, dtype=float)[tbs_order])
+    update(cpo_src[cpo_order].tolist(), cpo_dst[cpo_order].tolist(),
+           np.asarray(network.cpo_cost, dtype=float)[cpo_order])
+    return digest.hexdigest()
+
+
+# ================================================================================
+# STORE
+# ================================================================================
+
+def _path(key):
+    return os.path.join(results_dir(), f"{key}.npz")
+
+
+def load(network, key):
+    """SolveResult dari cache, atau None jika tidak ada."""
+    from sawit.backends import SolveResult, route_values
+
+    path = _path(key)
+    try:
+        with np.load(path) as z:
+            backend, status = str(z['backend']), str(z['status'])
+            objective, solve_time = float(z['objective']), float(z['solve_time'])
+            objective = None if np.isnan(objective) else objective
+            x_canon, y_canon = z['x'], z['y']
+            meta = json.loads(str(z['meta']))
+            sensitivity = ({name: z[f"sens_{name}"] for name in SENSITIVITY_ROWS + SENSITIVITY_COLS}
+                           if 'sens_dual' in z.files else None)
+    except (OSError, KeyError, ValueError):
+        return None
+    if len(x_canon) != network.n_tbs or len(y_canon) != network.n_cpo:
+        return None
+
+    # Tandai baru dipakai (LRU)
+    os.utime(path)
+
+    tbs_src, tbs_dst, cpo_src, cpo_dst = _route_names(network)
+    x_vals = np.empty(network.n_tbs)
+    y_vals = np.empty(network.n_cpo)
+    x_vals[_canonical_order(tbs_src, tbs_dst)] = x_canon
+    y_vals[_canonical_order(cpo_src, cpo_dst)] = y_canon
+
+    x, y = route_values(network, x_vals, y_vals)
+    result = SolveResult(backend, status, objective, x, y, solve_time)
+    for field in META_FIELDS:
+        setattr(result, field, meta.get(field))
+    result.cache_key = key
+    result.from_cache = True
+    if sensitivity is not None:
+        result.sensitivity = _load_sensitivity(network, result, x_vals, y_vals, sensitivity)
+    return result
+
+
+def _load_sensitivity(network, result, x_vals, y_vals, arrays):
+    from sawit.sensitivity import Sensitivity
+
+    rows, cols = _row_order(network), _col_order(network)
+    if any(len(arrays[name]) != network.n_rows for name in SENSITIVITY_ROWS):
+        return None
+    values = {}
+    for name, order in [(name, rows) for name in SENSITIVITY_ROWS] + [(name, cols) for name in SENSITIVITY_COLS]:
+        values[name] = np.empty(len(order))
+        values[name][order] = arrays[name]
+    return Sensitivity(network, result.status, result.objective, flow=np.concatenate([x_vals, y_vals]), **values)
+
+
+def _json_value(value):
+    # Skalar NumPy (np.int64, np.bool_) di metadata portfolio/dekomposisi
+    return value.item() if isinstance(value, np.generic) else str(value)
+
+
+def store(network, key, result):
+    tbs_src, tbs_dst, cpo_src, cpo_dst = _route_names(network)
+    x_vals, y_vals = solution_arrays(network, result)
+
+    directory = results_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = _path(key)
+    tmp = path + '.tmp.npz'
+    np.savez_compressed(
+        tmp,
+        backend=np.array(result.backend), status=np.array(result.status),
+        objective=np.array(result.objective if result.objective is not None else np.nan),
+        solve_time=np.array(result.solve_time),
+        x=x_vals[_canonical_order(tbs_src, tbs_dst)],
+        y=y_vals[_canonical_order(cpo_src, cpo_dst)],
+        meta=np.array(json.dumps({field: getattr(result, field) for field in META_FIELDS}, default=_json_value)),
+        **_sensitivity_arrays(network, result.sensitivity),
+    )
+    os.replace(tmp, path)
+    evict(keep=path)
+
+
+def _sensitivity_arrays(network, sensitivity):
+    if sensitivity is None or not sensitivity.available:
+        return {}
+    rows, cols = _row_order(network), _col_order(network)
+    arrays = {f"sens_{name}": getattr(sensitivity, name)[rows] for name in SENSITIVITY_ROWS}
+    arrays.update({f"sens_{name}": getattr(sensitivity, name)[cols] for name in SENSITIVITY_COLS})
+    return arrays
+
+
+def store_sensitivity(network, result, sensitivity):
+    """Tambahkan Sensitivity ke result.sensitivity dan ke entri cache result.
+    Hasil presolve tidak disimpan: entri cache-nya milik jaringan tereduksi."""
+    result.sensitivity = sensitivity
+    if result.cache_key and enabled() and not result.presolve:
+        store(network, result.cache_key, result)
+
+
+def evict(limit=None, keep=None):
+    """Hapus entri paling lama tidak dipakai sampai total ukuran <= limit."""
+    limit = max_bytes() if limit is None else limit
+    directory = results_dir()
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return 0
+    entries = []
+    for name in names:
+        if not name.endswith('.npz') or name.endswith('.tmp.npz'):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+# ================================================================================
+# SOLVE TER-CACHE
+# ================================================================================
+
+def cached_solve(network, backend='cbc', **options):
+    """Seperti sawit.backends.solve, tetapi memakai cache hasil.
+
+    Return (result, hit). Pada hit, result.from_cache bernilai True dan
+    result.solve_time adalah waktu solve asli.
+    """
+    from sawit.backends import solve
+
+    if not enabled():
+        return solve(network, backend=backend, **options), False
+
+    key = instance_key(network, backend, options)
+    result = load(network, key)
+    if result is not None:
+        return result, True
+
+    result = solve(network, backend=backend, **options)
+    store(network, key, result)
+    result.cache_key = key
+    return result, False
@@ -0,0 +1,256 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/scenarios.py
+Deskripsi: Batch what-if (demand, biaya, outage pabrik) yang diselesaikan
+           paralel di process pool. Hasil semua skenario ditulis ke satu
+           tabel CSV; tidak ada HTML report atau browser per skenario.
+
+Format tabel perturbasi (CSV, satu baris per perubahan):
+
+    scenario,parameter,key,op,value
+    base,,,,
+    demand_naik,demand,PD1,scale,1.2
+    solar_naik,cost_tbs,*,scale,1.15
+    pabrik1_mati,factory_capacity,Pabrik_1,set,0
+
+    parameter : supply_capacity | factory_capacity | demand | cost_tbs | cost_cpo
+    key       : nama node, rute "Kebun_A->Pabrik_1", atau "*" untuk semua
+    op        : scale | set | add
+
+Skenario yang gagal (mis. exception di solver) tetap mendapat satu baris
+dengan status Error dan pesan di kolom error; skenario lain tetap selesai.
+
+Contoh:
+    sawit scenarios perturbasi.csv -o hasil_skenario.csv
+    sawit scenarios --random 500 -o hasil_skenario.csv
+    python -m sawit.scenarios --random 500        # sama dengan sawit scenarios
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sawit.backends import BACKENDS, solve
+from sawit.solution import solution_arrays
+
+# parameter di tabel → (atribut array Network, daftar nama kunci)
+PARAMETERS = {
+    'supply_capacity': 'supply',
+    'factory_capacity': 'capacity',
+    'demand': 'demand',
+    'cost_tbs': 'tbs_cost',
+    'cost_cpo': 'cpo_cost',
+}
+OPERATIONS = ('scale', 'set', 'add')
+
+OUTPUT = 'hasil_skenario.csv'
+
+RESULT_COLUMNS = [
+    'scenario', 'status', 'total_biaya', 'biaya_tbs', 'biaya_cpo',
+    'tbs_dikirim', 'cpo_dikirim', 'n_perubahan', 'solve_time', 'error',
+]
+
+
+# ================================================================================
+# TABEL PERTURBASI
+# ================================================================================
+
+def read_perturbations(path):
+    """Baca CSV perturbasi → dict scenario → list (parameter, key, op, value)."""
+    scenarios = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            changes = scenarios.setdefault(row['scenario'].strip(), [])
+            if row.get('parameter'):
+                changes.append((row['parameter'].strip(), row['key'].strip(),
+                                row['op'].strip(), float(row['value'])))
+    return scenarios
+
+
+def write_perturbations(scenarios, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['scenario', 'parameter', 'key', 'op', 'value'])
+        for name, changes in scenarios.items():
+            if not changes:
+                writer.writerow([name, '', '', '', ''])
+            for change in changes:
+                writer.writerow([name, *change])
+
+
+def generate_perturbations(network, n_scenarios, demand_spread=0.2, cost_spread=0.15,
+                           outage_prob=0.1, seed=0):
+    """Skenario acak: demand ±spread per PD, biaya TBS/CPO karena harga solar,
+    dan outage pabrik dengan peluang outage_prob."""
+    rng = np.random.default_rng(seed)
+    scenarios = {'base': []}
+    for s in range(1, n_scenarios):
+        changes = [('demand', pd_name, 'scale', round(float(f), 4))
+                   for pd_name, f in zip(network.pusat, rng.uniform(1 - demand_spread, 1 + demand_spread,
+                                                                    len(network.pusat)))]
+        fuel = rng.uniform(1 - cost_spread, 1 + cost_spread)
+        changes.append(('cost_tbs', '*', 'scale', round(float(fuel), 4)))
+        changes.append(('cost_cpo', '*', 'scale', round(float(fuel), 4)))
+        for pabrik in network.pabrik:
+            if rng.random() < outage_prob:
+                changes.append(('factory_capacity', pabrik, 'set', 0.0))
+        scenarios[f"skenario_{s:04d}"] = changes
+    return scenarios
+
+
+def resolve_perturbations(network, scenarios):
+    """Ubah nama node/rute menjadi indeks array (divalidasi sebelum dikirim
+    ke worker, sehingga kunci yang salah langsung ketahuan)."""
+    keys = {
+        'supply': {k: i for i, k in enumerate(network.kebun)},
+        'capacity': {p: i for i, p in enumerate(network.pabrik)},
+        'demand': {d: i for i, d in enumerate(network.pusat)},
+        'tbs_cost': {f"{k}->{p}": i for i, (k, p) in enumerate(network.tbs_routes())},
+        'cpo_cost': {f"{p}->{d}": i for i, (p, d) in enumerate(network.cpo_routes())},
+    }
+    resolved = {}
+    for name, changes in scenarios.items():
+        ops = []
+        for parameter, key, op, value in changes:
+            if parameter not in PARAMETERS:
+                raise ValueError(f"[{name}] parameter tidak dikenal: {parameter!r}")
+            if op not in OPERATIONS:
+                raise ValueError(f"[{name}] operasi tidak dikenal: {op!r}")
+            attr = PARAMETERS[parameter]
+            if key == '*':
+                index = None
+            elif key in keys[attr]:
+                index = keys[attr][key]
+            else:
+                raise ValueError(f"[{name}] {parameter} tidak punya kunci {key!r}")
+            ops.append((attr, index, op, value))
+        resolved[name] = ops
+    return resolved
+
+
+def apply_perturbations(network, ops):
+    """Network baru dengan perubahan (attr, index, op, value) diterapkan."""
+    scenario = network.copy()
+    for attr, index, op, value in ops:
+        array = getattr(scenario, attr)
+        where = slice(None) if index is None else index
+        if op == 'scale':
+            array[where] *= value
+        elif op == 'set':
+            array[where] = value
+        else:
+            array[where] += value
+    return scenario
+
+
+# ================================================================================
+# PROCESS POOL
+# ================================================================================
+
+_BASE = None
+_BACKEND = None
+
+
+def _init_worker(network, backend):
+    global _BASE, _BACKEND
+    _BASE, _BACKEND = network, backend
+
+
+def _solve_scenario(task):
+    name, ops = task
+    try:
+        network = apply_perturbations(_BASE, ops)
+        result = solve(network, _BACKEND)
+        x, y = solution_arrays(network, result)
+    except Exception as e:
+        return {'scenario': name, 'status': 'Error', 'n_perubahan': len(ops), 'error': f"{type(e).__name__}: {e}"}
+    return {
+        'scenario': name,
+        'status': result.status,
+        'total_biaya': result.objective,
+        'biaya_tbs': float(network.tbs_cost @ x),
+        'biaya_cpo': float(network.cpo_cost @ y),
+        'tbs_dikirim': float(x.sum()),
+        'cpo_dikirim': float(y.sum()),
+        'n_perubahan': len(ops),
+        'solve_time': result.solve_time,
+        'error': '',
+    }
+
+
+def run_scenarios(network, scenarios, backend='highs', workers=None):
+    """Selesaikan semua skenario secara paralel. Return list dict per skenario
+    (urutan sama dengan input)."""
+    tasks = list(resolve_perturbations(network, scenarios).items())
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(network, backend)
+        return [_solve_scenario(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(network, backend)) as pool:
+        return list(pool.map(_solve_scenario, tasks, chunksize=chunksize))
+
+
+def write_results(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# ================================================================================
+# CLI
+# ================================================================================
+
+def run_batch(perturbations=None, random=None, output=OUTPUT, backend='highs', workers=None, seed=0):
+    """Skenario dari CSV perturbasi atau random skenario acak pada data
+    default; tulis tabel hasil ke output. Return list baris hasil."""
+    from sawit.loader import load_default_instance
+    from sawit.network import Network
+
+    instance, _ = load_default_instance()
+    network = Network.from_dicts(*instance)
+    if perturbations:
+        scenarios = read_perturbations(perturbations)
+    else:
+        scenarios = generate_perturbations(network, random, seed=seed)
+
+    start = time.perf_counter()
+    rows = run_scenarios(network, scenarios, backend=backend, workers=workers)
+    elapsed = time.perf_counter() - start
+    write_results(rows, output)
+
+    n_optimal = sum(row['status'] == 'Optimal' for row in rows)
+    print(f"✓ {len(rows)} skenario selesai dalam {elapsed:.2f} detik ({n_optimal} optimal)")
+    for row in rows:
+        if row['status'] == 'Error':
+            print(f"⚠️  {row['scenario']} gagal: {row['error']}")
+    print(f"✓ Hasil: {output}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch skenario what-if distribusi sawit")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('perturbations', nargs='?', help="CSV perturbasi (scenario,parameter,key,op,value)")
+    source.add_argument('--random', type=int, metavar='N', help="buat N skenario acak (demand ±20%%, biaya solar, outage)")
+    parser.add_argument('-o', '--output', default=OUTPUT)
+    parser.add_argument('--backend', choices=BACKENDS, default='highs')
+    parser.add_argument('--workers', type=int, default=None, help="jumlah proses (default: semua core)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = run_batch(args.perturbations, args.random, output=args.output, backend=args.backend,
+                     workers=args.workers, seed=args.seed)
+    return 1 if any(row['status'] == 'Error' for row in rows) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/sensitivity.py
+Deskripsi: Analisis sensitivitas massal dari basis optimal HiGHS:
+           shadow price setiap constraint, reduced cost setiap rute, serta
+           ranging RHS dan biaya.
+
+Semua angka diambil sekaligus dari basis optimal (Highs.getSolution dan
+Highs.getRanging), sehingga pertanyaan seperti "berapa penghematan jika
+kapasitas Pabrik_1 ditambah 1 ton" atau "sampai berapa biaya rute ini boleh
+naik sebelum rencana berubah" tidak perlu solve ulang.
+
+Jika solusi solver sudah ada (backend apa pun), analyze(network, values)
+memulai HiGHS dari basis solusi itu (rute > 0 dan baris dengan slack basis),
+sehingga simplex selesai tanpa iterasi (52.174 rute: analyze 0,2 s termasuk
+ranging, solve dari awal 7,3 s) dan dual serta ranging berasal dari rencana yang sama dengan hasil
+solver, juga jika optimumnya tidak unik.
+sawit/resultcache.py menyimpan hasilnya di entri cache solve.
+
+Konvensi tanda (minimasi):
+    shadow price = d(total biaya) / d(RHS) dalam Rp per ton. Negatif pada
+                   kapasitas kebun/pabrik berarti tambahan 1 ton menghemat
+                   biaya; positif pada demand berarti tambahan 1 ton demand
+                   menambah biaya.
+    RHS range    = rentang RHS di mana shadow price tetap berlaku.
+    reduced cost = kenaikan total biaya per ton jika rute yang tidak dipakai
+                   dipaksa mengalir (0 untuk rute basis).
+    cost range   = rentang biaya/ton rute di mana rencana (basis) tetap optimal.
+
+Membutuhkan highspy (dependensi opsional, lihat sawit/highs.py).
+"""
+
+import numpy as np
+
+from sawit.highs import build_highs, primal_values, require_highspy, status_name
+from sawit.network import ROW_TYPES
+
+
+class Sensitivity:
+    """Hasil analisis sensitivitas untuk satu Network.
+
+    Jika status bukan Optimal, dual dan ranging tidak terdefinisi; array
+    bernilai None dan tabel kosong.
+    """
+
+    def __init__(self, network, status, objective=None, activity=None, dual=None, rhs_lo=None, rhs_hi=None,
+                 flow=None, reduced_cost=None, cost_lo=None, cost_hi=None):
+        self.network = network
+        self.status = status
+        self.objective = objective
+        self.activity = activity            # nilai A·v per baris
+        self.dual = dual                    # shadow price per baris
+        self.rhs_lo = rhs_lo
+        self.rhs_hi = rhs_hi
+        self.flow = flow                    # nilai kolom [X_TBS, Y_CPO]
+        self.reduced_cost = reduced_cost
+        self.cost_lo = cost_lo
+        self.cost_hi = cost_hi
+
+    @property
+    def available(self):
+        return self.status == 'Optimal'
+
+    def rhs(self):
+        """RHS setiap baris: supply, kapasitas, 0 (balance), demand."""
+        n = self.network
+        return np.concatenate([n.supply, n.capacity, np.zeros(len(n.pabrik)), n.demand])
+
+    def row_labels(self):
+        n = self.network
+        kinds = np.repeat(ROW_TYPES, [len(n.kebun), len(n.pabrik), len(n.pabrik), len(n.pusat)])
+        return kinds.tolist(), list(n.kebun) + list(n.pabrik) + list(n.pabrik) + list(n.pusat)
+
+    def constraint_rows(self):
+        """(jenis, node, rhs, aktivitas, slack, shadow price, rhs_min, rhs_max) per baris."""
+        if not self.available:
+            return iter(())
+        kinds, names = self.row_labels()
+        rhs = self.rhs()
+        slack = np.abs(rhs - self.activity)
+        return zip(kinds, names, rhs.tolist(), self.activity.tolist(), slack.tolist(), self.dual.tolist(),
+                   self.rhs_lo.tolist(), self.rhs_hi.tolist())
+
+    def route_rows(self, kind):
+        """(asal, tujuan, ton, biaya/ton, reduced cost, biaya_min, biaya_max) per
+        rute; kind = 'tbs' atau 'cpo'."""
+        if not self.available:
+            return iter(())
+        n = self.network
+        if kind == 'tbs':
+            cols, routes, cost = slice(0, n.n_tbs), n.tbs_routes(), n.tbs_cost
+        else:
+            cols, routes, cost = slice(n.n_tbs, n.n_vars), n.cpo_routes(), n.cpo_cost
+        return ((src, dst, *values) for (src, dst), values in zip(routes, zip(
+            self.flow[cols].tolist(), np.asarray(cost, dtype=float).tolist(), self.reduced_cost[cols].tolist(),
+            self.cost_lo[cols].tolist(), self.cost_hi[cols].tolist())))
+
+
+def analyze(network, values=None):
+    """Ambil dual, reduced cost dan ranging semua baris/kolom sekaligus dari
+    basis optimal HiGHS. values: solusi [X_TBS, Y_CPO] dari solve yang sudah
+    ada; HiGHS dimulai dari titik itu (crossover) alih-alih solve dari awal.
+    Return Sensitivity."""
+    highspy = require_highspy()
+
+    h = build_highs(network, simplex=True)
+    if values is not None:
+        _start_from(h, highspy, network, np.asarray(values, dtype=float))
+    h.run()
+    status = status_name(h)
+    if status != 'Optimal':
+        return Sensitivity(network, status)
+
+    solution = h.getSolution()
+    activity = np.asarray(solution.row_value, dtype=float)
+    dual = np.asarray(solution.row_dual, dtype=float)
+    reduced_cost = np.asarray(solution.col_dual, dtype=float)
+    _, ranging = h.getRanging()
+
+    # RHS ranging HiGHS berlaku untuk baris nonbasis (aktif). Baris basis tidak
+    # aktif: RHS boleh bergerak sampai menyentuh aktivitasnya, shadow price tetap 0.
+    rhs_lo = np.asarray(ranging.row_bound_dn.value_, dtype=float)
+    rhs_hi = np.asarray(ranging.row_bound_up.value_, dtype=float)
+    basic = np.array([s == highspy.HighsBasisStatus.kBasic for s in h.getBasis().row_status])
+    lo, hi = network.row_bounds()
+    upper = np.isfinite(hi) & ~np.isfinite(lo)            # baris <=
+    lower = np.isfinite(lo) & ~np.isfinite(hi)            # baris >=
+    rhs_lo = np.where(basic & upper, activity, np.where(basic & lower, -np.inf, rhs_lo))
+    rhs_hi = np.where(basic & upper, np.inf, np.where(basic & lower, activity, rhs_hi))
+
+    return Sensitivity(
+        network, status, h.getInfo().objective_function_value, activity, dual, rhs_lo, rhs_hi,
+        primal_values(h), reduced_cost,
+        # Array ranging biaya HiGHS memuat kolom lalu baris; hanya kolom yang dipakai
+        np.asarray(ranging.col_cost_dn.value_, dtype=float)[:network.n_vars],
+        np.asarray(ranging.col_cost_up.value_, dtype=float)[:network.n_vars],
+    )
+
+
+def _start_from(h, highspy, network, values):
+    """Basis awal dari solusi values: kolom bernilai > 0 dan baris yang tidak
+    aktif menjadi basis. Solusi vertex memberi tepat n_rows elemen basis; jika
+    tidak (vertex degenerate atau solusi interior), HiGHS memulai crossover
+    dari solusi itu."""
+    lo, hi = network.row_bounds()
+    activity = network.constraint_matrix() @ values
+    tol = 1e-6 * max(1.0, float(np.abs(values).max(initial=0.0)))
+    col_basic = values > tol
+    row_basic = np.minimum(activity - lo, hi - activity) > tol
+
+    if col_basic.sum() + row_basic.sum() != network.n_rows:
+        solution = highspy.HighsSolution()
+        solution.col_value = values
+        solution.value_valid = True
+        h.setSolution(solution)
+        return
+
+    status = highspy.HighsBasisStatus
+    # Baris aktif nonbasis di batas yang disentuh (<= di atas, >= dan = di bawah)
+    at_upper = np.isfinite(hi) & ~np.isfinite(lo)
+    basis = highspy.HighsBasis()
+    basis.col_status = [status.kBasic if b else status.kLower for b in col_basic.tolist()]
+    basis.row_status = [status.kBasic if b else status.kUpper if u else status.kLower
+                        for b, u in zip(row_basic.tolist(), at_upper.tolist())]
+    basis.valid = True
+    h.setBasis(basis)
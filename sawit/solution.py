@@ -0,0 +1,168 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/solution.py
+Deskripsi: Solusi dalam bentuk array NumPy yang sejajar dengan indeks rute
+           Network, dipakai bersama oleh semua tahap output.
+
+Nilai primal dibaca sekali dari SolveResult (varValue milik LpVariable atau
+VarValue; array RouteValues dipakai langsung tanpa salinan) ke array x
+(kolom X_TBS) dan y (kolom Y_CPO). Setelah itu biaya, aliran per node,
+utilisasi, baris tabel HTML dan export dihitung dengan operasi vektor (dot product, bincount, mask), tanpa membaca objek PuLP lagi.
+
+    solution = Solution.from_result(network, result)
+    solution.biaya_tbs, solution.tbs_in, solution.route_chunks('tbs')
+
+Rute terpakai selalu diambil per potongan CHUNK (route_chunks, route_rows),
+sehingga nama node dan tuple baris hanya ada untuk satu potongan sekaligus.
+"""
+
+import numpy as np
+
+# Rute dengan aliran di bawah ambang ini tidak ditampilkan di tabel alokasi
+MIN_FLOW = 0.01
+
+# Jumlah rute per potongan baris tabel
+CHUNK = 50_000
+
+
+def _plain(values):
+    """List angka; jika semuanya bulat dikembalikan sebagai int (format {:,} tanpa .0)."""
+    if np.array_equal(values, np.round(values)):
+        return values.astype(np.int64).tolist()
+    return values.tolist()
+
+
+def _values(values, count):
+    array = getattr(values, 'array', None)      # RouteValues (sawit/backends.py): tanpa salinan
+    if array is not None:
+        return array
+    return np.fromiter((v.varValue or 0.0 for v in values.values()), dtype=float, count=count)
+
+
+def _integral(values, index, chunk=CHUNK):
+    """True jika values[index] semuanya bulat (diperiksa per potongan)."""
+    return all(np.array_equal(part, np.round(part))
+               for part in (values[index[start:start + chunk]] for start in range(0, len(index), chunk)))
+
+
+def solution_arrays(network, result):
+    """Array (x, y) dari SolveResult dalam urutan kolom Network (None → 0)."""
+    return _values(result.x, network.n_tbs), _values(result.y, network.n_cpo)
+
+
+class Solution:
+    """Nilai x/y satu solve beserta besaran turunan yang sering dipakai."""
+
+    def __init__(self, network, x, y, status=None, objective=None):
+        self.network = network
+        self.x = x                  # ton TBS per rute, sejajar network.tbs_src/tbs_dst
+        self.y = y                  # ton CPO per rute, sejajar network.cpo_src/cpo_dst
+        self.status = status
+        self.objective = objective
+
+    @classmethod
+    def from_result(cls, network, result):
+        x, y = solution_arrays(network, result)
+        return cls(network, x, y, result.status, result.objective)
+
+    def freeze(self):
+        """Jadikan x/y read-only (dibagi ke banyak thread oleh sawit/outputs.py)."""
+        self.x.setflags(write=False)
+        self.y.setflags(write=False)
+        return self
+
+    @property
+    def values(self):
+        """Vektor kolom [X_TBS, Y_CPO] (untuk A·v)."""
+        return np.concatenate([self.x, self.y])
+
+    # ----------------------------------------------------------------------------
+    # Biaya dan aliran per node
+    # ----------------------------------------------------------------------------
+
+    @property
+    def biaya_tbs(self):
+        return float(self.network.tbs_cost @ self.x)
+
+    @property
+    def biaya_cpo(self):
+        return float(self.network.cpo_cost @ self.y)
+
+    @property
+    def tbs_out(self):
+        """TBS dikirim per kebun."""
+        return np.bincount(self.network.tbs_src, weights=self.x, minlength=len(self.network.kebun))
+
+    @property
+    def tbs_in(self):
+        """TBS diterima per pabrik."""
+        return np.bincount(self.network.tbs_dst, weights=self.x, minlength=len(self.network.pabrik))
+
+    @property
+    def cpo_out(self):
+        """CPO diproduksi per pabrik (TBS masuk × yield)."""
+        return self.tbs_in * self.network.yield_rate
+
+    @property
+    def cpo_in(self):
+        """CPO diterima per PD."""
+        return np.bincount(self.network.cpo_dst, weights=self.y, minlength=len(self.network.pusat))
+
+    @property
+    def utilisation(self):
+        """Utilisasi kapasitas pabrik dalam persen (0 jika kapasitas 0)."""
+        capacity = self.network.capacity
+        return np.divide(self.tbs_in * 100, capacity, out=np.zeros(len(capacity)), where=capacity > 0)
+
+    @property
+    def fulfilment(self):
+        """Pemenuhan demand per PD dalam persen (100 jika demand 0)."""
+        demand = self.network.demand
+        return np.divide(self.cpo_in * 100, demand, out=np.full(len(demand), 100.0), where=demand > 0)
+
+    # ----------------------------------------------------------------------------
+    # Baris tabel
+    # ----------------------------------------------------------------------------
+
+    def route_arrays(self, kind):
+        """(ton, biaya/ton, indeks asal, indeks tujuan, nama asal, nama tujuan)
+        untuk semua rute; kind = 'tbs' atau 'cpo'."""
+        n = self.network
+        if kind == 'tbs':
+            return self.x, n.tbs_cost, n.tbs_src, n.tbs_dst, n.kebun, n.pabrik
+        return self.y, n.cpo_cost, n.cpo_src, n.cpo_dst, n.pabrik, n.pusat
+
+    def used(self, kind, min_flow=MIN_FLOW):
+        """Indeks kolom rute dengan aliran > min_flow."""
+        return np.flatnonzero(self.route_arrays(kind)[0] > min_flow)
+
+    def route_chunks(self, kind, min_flow=MIN_FLOW, chunk=CHUNK):
+        """Potongan array (indeks asal, indeks tujuan, ton, biaya/ton) untuk
+        rute dengan aliran > min_flow; kind = 'tbs' atau 'cpo'."""
+        flow, cost, src, dst = self.route_arrays(kind)[:4]
+        used = self.used(kind, min_flow)
+        for start in range(0, len(used), chunk):
+            cols = used[start:start + chunk]
+            yield src[cols], dst[cols], flow[cols], cost[cols]
+
+    def route_rows(self, kind, min_flow=MIN_FLOW, chunk=CHUNK):
+        """Potongan baris (asal, tujuan, ton, biaya/ton) untuk tabel alokasi.
+        Biaya ditulis sebagai int jika semua biaya rute terpakai bulat."""
+        cost, src_names, dst_names = (self.route_arrays(kind)[i] for i in (1, 4, 5))
+        plain = _integral(cost, self.used(kind, min_flow), chunk)
+        for src, dst, flow, rate in self.route_chunks(kind, min_flow, chunk):
+            yield zip([src_names[i] for i in src.tolist()], [dst_names[j] for j in dst.tolist()], flow.tolist(),
+                      rate.astype(np.int64).tolist() if plain else rate.tolist())
+
+    def production_rows(self):
+        """Iterable (pabrik, tbs_in, cpo_out, kapasitas, utilisasi_%)."""
+        n = self.network
+        return zip(n.pabrik, self.tbs_in.tolist(), self.cpo_out.tolist(), _plain(n.capacity),
+                   self.utilisation.tolist())
+
+    def demand_rows(self, met):
+        """Iterable (pd, demand, supplied, pemenuhan_%, terpenuhi); met = mask PD
+        yang terpenuhi (lihat sawit/verification.py)."""
+        n = self.network
+        return zip(n.pusat, _plain(n.demand), self.cpo_in.tolist(), self.fulfilment.tolist(), met.tolist())
@@ -0,0 +1,287 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: sawit/vtable.py
+Deskripsi: Tabel HTML virtual untuk report besar. Data tabel disisipkan
+           sebagai JSON kolumnar (opsional gzip+base64) dan dirender di
+           browser oleh script inline: hanya baris yang terlihat yang dibuat
+           sebagai <tr>, dengan sorting (klik header) dan filter teks.
+
+Semua aset (CSS + JS) inline, tanpa request jaringan, sehingga report tetap
+bisa dibuka offline dari file://. Mode gzip memakai DecompressionStream
+(Chrome/Edge 80+, Firefox 113+, Safari 16.4+).
+
+Format payload:
+
+    {"n": 3,
+     "columns": [{"key": "src", "label": "Dari Kebun", "fmt": "key"}, ...],
+     "data": {"src": {"dict": ["Kebun_A", "Kebun_B"], "codes": [0, 0, 1]},
+              "qty": [1776, 2315, 1737]}}
+
+Kolom string di-encode sebagai kamus + kode (nama kebun/pabrik berulang di
+banyak rute), kolom angka sebagai list angka yang dibulatkan.
+
+Spesifikasi kolom (dict):
+    key     : nama kolom di data
+    label   : teks header
+    fmt     : key (teks tebal) | text | num (maks 3 desimal) | num0 | num1 |
+              rp | pct | flag   (nilai null ditampilkan sebagai '–')
+    empty   : teks untuk nilai null (NaN/±inf), mis. '∞' pada batas ranging
+    suffix  : teks setelah nilai, mis. ' ton'
+    cls     : class CSS sel
+    product : [kolom_a, kolom_b] → nilai dihitung di browser (a * b)
+    const   : teks tetap untuk semua baris
+    labels  : flag → [teks_false, teks_true]
+    classes : flag → [class_false, class_true]
+"""
+
+import base64
+import gzip
+import json
+
+ROW_HEIGHT = 44
+VISIBLE_ROWS = 15
+
+# Dipasang sekali per halaman, sebelum </body>
+ASSETS = """<style>
+    .vt-toolbar { display: flex; gap: 15px; align-items: center; margin-bottom: 10px; }
+    .vt-filter { flex: 1; padding: 10px 15px; border: 1px solid #ccc; border-radius: 8px; font-size: 1em; }
+    .vt-count { color: #666; white-space: nowrap; }
+    .vt table { table-layout: fixed; margin: 0; }
+    .vt th { cursor: pointer; user-select: none; }
+    .vt th.asc::after { content: " ▲"; }
+    .vt th.desc::after { content: " ▼"; }
+    .vt-body { position: relative; overflow-y: auto; }
+    .vt-body table { position: absolute; top: 0; left: 0; border-radius: 0; box-shadow: none; }
+    .vt-body td { height: %(row_height)dpx; padding: 0 15px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+</style>
+<script>
+(function () {
+    var ROW_HEIGHT = %(row_height)d, VISIBLE_ROWS = %(visible_rows)d, OVERSCAN = 5;
+
+    function esc(s) {
+        return String(s).replace(/[&<>"]/g, function (c) {
+            return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c];
+        });
+    }
+    function num(v, min, max) {
+        return v.toLocaleString('en-US', {minimumFractionDigits: min, maximumFractionDigits: max});
+    }
+    function format(col, v) {
+        if (v === null) return col.empty !== undefined ? esc(col.empty) : '–';
+        switch (col.fmt) {
+            case 'key': return '<strong>' + esc(v) + '</strong>';
+            case 'num': return num(v, 0, 3);
+            case 'num0': return num(v, 0, 0);
+            case 'num1': return num(v, 1, 1);
+            case 'rp': return 'Rp ' + num(v, 0, 0);
+            case 'pct': return v.toFixed(1) + '%%';
+            case 'flag': return esc(col.labels[v ? 1 : 0]);
+            default: return esc(v);
+        }
+    }
+    function cellClass(col, v) {
+        if (col.classes) return col.classes[v ? 1 : 0];
+        return col.cls || '';
+    }
+
+    async function decode(el) {
+        var text = el.textContent;
+        if (el.dataset.encoding === 'gzip+base64') {
+            var bytes = Uint8Array.from(atob(text.trim()), function (c) { return c.charCodeAt(0); });
+            var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            text = await new Response(stream).text();
+        }
+        return JSON.parse(text);
+    }
+
+    function columnValues(payload, col) {
+        var n = payload.n, data = payload.data;
+        if (col.product) {
+            var a = columnValues(payload, {key: col.product[0]}), b = columnValues(payload, {key: col.product[1]});
+            return Float64Array.from({length: n}, function (_, i) { return a[i] * b[i]; });
+        }
+        if (col.const !== undefined) return null;
+        var c = data[col.key];
+        if (c.dict) return c.codes.map(function (i) { return c.dict[i]; });
+        return c;
+    }
+
+    function mount(container, payload) {
+        var cols = payload.columns, n = payload.n;
+        var values = cols.map(function (col) { return columnValues(payload, col); });
+        var view = Int32Array.from({length: n}, function (_, i) { return i; });
+        var sortIndex = -1, sortDir = 1;
+
+        var colgroup = '<colgroup>' + cols.map(function () { return '<col>'; }).join('') + '</colgroup>';
+        container.innerHTML =
+            '<div class="vt-toolbar"><input class="vt-filter" type="search" placeholder="Filter nama...">' +
+            '<span class="vt-count"></span></div>' +
+            '<table>' + colgroup + '<thead><tr>' +
+            cols.map(function (col, j) { return '<th data-col="' + j + '">' + esc(col.label) + '</th>'; }).join('') +
+            '</tr></thead></table>' +
+            '<div class="vt-body"><div class="vt-spacer"></div><table>' + colgroup + '<tbody></tbody></table></div>';
+
+        var body = container.querySelector('.vt-body'), spacer = container.querySelector('.vt-spacer');
+        var tbody = body.querySelector('tbody'), count = container.querySelector('.vt-count');
+        var headers = container.querySelectorAll('th');
+
+        function render() {
+            var first = Math.max(0, Math.floor(body.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            var last = Math.min(view.length, first + VISIBLE_ROWS + 2 * OVERSCAN);
+            var html = '';
+            for (var r = first; r < last; r++) {
+                var i = view[r];
+                html += '<tr>';
+                for (var j = 0; j < cols.length; j++) {
+                    var col = cols[j], v = values[j] === null ? col.const : values[j][i];
+                    var cls = cellClass(col, v);
+                    html += (cls ? '<td class="' + cls + '">' : '<td>') + format(col, v) + (col.suffix || '') + '</td>';
+                }
+                html += '</tr>';
+            }
+            tbody.parentNode.style.transform = 'translateY(' + first * ROW_HEIGHT + 'px)';
+            tbody.innerHTML = html;
+        }
+        function refresh() {
+            spacer.style.height = view.length * ROW_HEIGHT + 'px';
+            body.style.height = Math.min(Math.max(view.length, 1), VISIBLE_ROWS) * ROW_HEIGHT + 'px';
+            count.textContent = view.length.toLocaleString('en-US') + ' / ' + n.toLocaleString('en-US') + ' baris';
+            render();
+        }
+        function sort() {
+            if (sortIndex < 0) return;
+            var v = values[sortIndex];
+            if (v === null) return;
+            view.sort(function (a, b) { return v[a] < v[b] ? -sortDir : v[a] > v[b] ? sortDir : a - b; });
+        }
+
+        // Filter: substring (tanpa beda huruf besar/kecil) pada kolom teks.
+        // Kolom kamus dicek per entri kamus, bukan per baris.
+        container.querySelector('.vt-filter').addEventListener('input', function (e) {
+            var q = e.target.value.trim().toLowerCase();
+            if (!q) {
+                view = Int32Array.from({length: n}, function (_, i) { return i; });
+            } else {
+                var tests = [];
+                cols.forEach(function (col) {
+                    var c = payload.data[col.key];
+                    if (col.fmt !== 'key' && col.fmt !== 'text') return;
+                    if (c && c.dict) {
+                        var hit = c.dict.map(function (s) { return String(s).toLowerCase().indexOf(q) >= 0; });
+                        tests.push(function (i) { return hit[c.codes[i]]; });
+                    } else if (c) {
+                        tests.push(function (i) { return String(c[i]).toLowerCase().indexOf(q) >= 0; });
+                    }
+                });
+                var keep = [];
+                for (var i = 0; i < n; i++) {
+                    if (tests.some(function (t) { return t(i); })) keep.push(i);
+                }
+                view = Int32Array.from(keep);
+            }
+            sort();
+            body.scrollTop = 0;
+            refresh();
+        });
+
+        headers.forEach(function (th) {
+            th.addEventListener('click', function () {
+                var j = +th.dataset.col;
+                sortDir = sortIndex === j ? -sortDir : 1;
+                sortIndex = j;
+                headers.forEach(function (h) { h.classList.remove('asc', 'desc'); });
+                th.classList.add(sortDir > 0 ? 'asc' : 'desc');
+                sort();
+                refresh();
+            });
+        });
+
+        body.addEventListener('scroll', function () { window.requestAnimationFrame(render); });
+        refresh();
+    }
+
+    document.querySelectorAll('script[data-vt]').forEach(function (el) {
+        var container = document.getElementById(el.dataset.vt);
+        decode(el).then(function (payload) { mount(container, payload); }).catch(function (err) {
+            container.textContent = 'Tabel tidak bisa ditampilkan: ' + err;
+        });
+    });
+})();
+</script>
+""" % {'row_height': ROW_HEIGHT, 'visible_rows': VISIBLE_ROWS}
+
+
+# ================================================================================
+# PAYLOAD
+# ================================================================================
+
+def _encode_strings(values, index=None):
+    index = {} if index is None else index
+    codes = [index.setdefault(v, len(index)) for v in values]
+    return {'dict': list(index), 'codes': codes}
+
+
+def _encode_numbers(values, decimals=3):
+    import numpy as np
+
+    array = np.round(np.asarray(values, dtype=float), decimals)
+    finite = np.isfinite(array)
+    integral = array == np.floor(array)
+    if finite.all() and integral.all():
+        return array.astype(np.int64).tolist()
+    # NaN (nilai tidak ada) dan ±inf → null, karena JSON tidak punya NaN/Infinity
+    return [None if not ok else int(v) if whole else v
+            for v, whole, ok in zip(array.tolist(), integral.tolist(), finite.tolist())]
+
+
+def columnar_payload(columns, rows):
+    """Ubah iterable baris (tuple, urutan sama dengan kolom data) menjadi
+    payload kolumnar. Kolom turunan (product/const) tidak ikut disimpan."""
+    return columnar_chunks(columns, [rows])
+
+
+def columnar_chunks(columns, chunks):
+    """Seperti columnar_payload untuk baris yang datang per potongan (mis.
+    Solution.route_rows): setiap potongan di-encode ke kolom lalu dibuang."""
+    stored = [col for col in columns if 'product' not in col and 'const' not in col]
+    names = {col['key']: {} for col in stored if col.get('fmt') in ('key', 'text')}
+    data = {col['key']: [] for col in stored}
+    n = 0
+    for rows in chunks:
+        transposed = list(zip(*rows))
+        if not transposed:
+            continue
+        n += len(transposed[0])
+        for col, values in zip(stored, transposed):
+            key = col['key']
+            if key in names:
+                data[key].extend(_encode_strings(values, names[key])['codes'])
+            elif col.get('fmt') == 'flag':
+                data[key].extend(int(bool(v)) for v in values)
+            else:
+                data[key].extend(_encode_numbers(values))
+    if n:
+        for key, index in names.items():
+            data[key] = {'dict': list(index), 'codes': data[key]}
+    return {'n': n, 'columns': columns, 'data': data}
+
+
+def encode_payload(payload, compress=False):
+    """Return (teks, encoding) untuk disisipkan di <script type="application/json">."""
+    text = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    if compress:
+        packed = gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0)
+        return base64.b64encode(packed).decode('ascii'), 'gzip+base64'
+    # '</' di dalam string JSON akan menutup tag <script>
+    return text.replace('</', '<\\/'), 'json'
+
+
+def virtual_table(table_id, columns, rows, compress=False, indent='                ', chunked=False):
+    """Potongan HTML pengganti <table>: container + payload JSON. chunked:
+    rows berupa potongan baris (lihat columnar_chunks)."""
+    payload = columnar_chunks(columns, rows) if chunked else columnar_payload(columns, rows)
+    text, encoding = encode_payload(payload, compress)
+    return (f'{indent}<div class="vt" id="{table_id}"></div>\n'
+            f'{indent}<script type="application/json" data-vt="{table_id}" data-encoding="{encoding}">'
+            f'{text}</script>\n')
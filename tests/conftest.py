@@ -0,0 +1,28 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/conftest.py
+Deskripsi: Fixture bersama untuk test suite (pytest dari root repo).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Cache workbook/hasil di direktori sementara, bukan .sawit_cache repo."""
+    monkeypatch.setenv('SAWIT_CACHE_DIR', str(tmp_path / 'cache'))
+
+
+@pytest.fixture
+def instance():
+    """Instance sintetis kecil yang feasible."""
+    from sawit.instances import generate_instance
+    from sawit.network import Network
+
+    return Network.from_dicts(*generate_instance(20))
@@ -0,0 +1,41 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_backends.py
+Deskripsi: Semua backend memberi objective optimal yang sama.
+"""
+
+import pytest
+
+from sawit.backends import HIGHS_METHOD, SOLVE_BACKENDS, available_backends, solve
+from sawit.pipeline import solver_call
+
+REL_TOL = 1e-6
+
+
+@pytest.mark.parametrize('backend', [b for b in available_backends() if b != 'highs'] + ['decomp'])
+def test_objective_sama_dengan_highs(instance, backend):
+    if backend == 'decomp':
+        pytest.importorskip('highspy')
+    reference = solve(instance, 'highs')
+    result = solve(instance, backend)
+    assert reference.status == result.status == 'Optimal'
+    assert result.objective == pytest.approx(reference.objective, rel=REL_TOL)
+
+
+@pytest.mark.parametrize('method', ['highs-ds', 'highs-ipm'])
+def test_metode_highs(instance, method):
+    result = solve(instance, 'highs', method=method)
+    assert result.status == 'Optimal'
+    assert f'method="{method}"' in solver_call(result)
+
+
+def test_solver_call_highs_default(instance):
+    assert f'method="{HIGHS_METHOD}"' in solver_call(solve(instance, 'highs'))
+
+
+def test_backend_tidak_dikenal(instance):
+    with pytest.raises(ValueError) as error:
+        solve(instance, 'simplex')
+    assert all(name in str(error.value) for name in SOLVE_BACKENDS)
+    assert 'portfolio' in SOLVE_BACKENDS and 'decomp' in SOLVE_BACKENDS
@@ -0,0 +1,40 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_decomposition.py
+Deskripsi: Benders per region (backend decomp) sama dengan HiGHS untuk 1 dan
+           2 worker, dan melaporkan Infeasible jika master infeasible.
+"""
+
+import pytest
+
+from sawit.backends import solve
+from sawit.instances import generate_instance
+from sawit.network import Network
+
+pytest.importorskip('highspy')
+
+
+@pytest.fixture
+def regional():
+    """Instance dengan 4 pabrik, sehingga region default berjumlah 4."""
+    return Network.from_dicts(*generate_instance(200))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_sama_dengan_highs(regional, workers):
+    reference = solve(regional, 'highs')
+    result = solve(regional, 'decomp', workers=workers)
+    assert result.status == reference.status == 'Optimal'
+    assert result.objective == pytest.approx(reference.objective, rel=1e-6)
+    info = result.decomposition
+    assert info['workers'] == workers and len(info['regions']) == 4
+    assert info['converged'] and info['iterations'][-1]['gap'] <= 1e-6
+
+
+def test_master_infeasible(regional):
+    regional.demand = regional.demand * 10
+    result = solve(regional, 'decomp', workers=1)
+    assert result.status == solve(regional, 'highs').status == 'Infeasible'
+    assert not result.decomposition['converged']
+    assert result.decomposition['iterations'] == []
@@ -0,0 +1,41 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_feasibility.py
+Deskripsi: Pre-check max-flow sepakat dengan HiGHS tentang (in)feasibility.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.backends import solve
+from sawit.feasibility import check_feasibility
+from sawit.instances import generate_instance
+from sawit.network import Network
+
+
+def perturbed(seed):
+    """Instance dengan demand dinaikkan dan sebagian pabrik mati (outage)."""
+    rng = np.random.default_rng(seed)
+    network = Network.from_dicts(*generate_instance(60, seed=seed))
+    network.demand = network.demand * rng.uniform(0.8, 2.2, len(network.pusat))
+    network.capacity[rng.random(len(network.pabrik)) < 0.3] = 0
+    return network
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_precheck_sama_dengan_highs(seed):
+    network = perturbed(seed)
+    feasibility = check_feasibility(network)
+    result = solve(network, 'highs')
+    assert result.status in ('Optimal', 'Infeasible')
+    assert feasibility.feasible == (result.status == 'Optimal')
+    if not feasibility.feasible:
+        assert feasibility.conflict
+        assert feasibility.shortfall > 0
+
+
+def test_kedua_hasil_muncul():
+    # Sebaran skenario di atas harus mencakup kasus feasible dan infeasible
+    outcomes = {check_feasibility(perturbed(seed)).feasible for seed in range(12)}
+    assert outcomes == {True, False}
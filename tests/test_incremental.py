@@ -0,0 +1,58 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_incremental.py
+Deskripsi: Re-solve warm IncrementalModel sama dengan solve cold dari awal.
+"""
+
+import pytest
+
+from sawit.backends import solve
+
+pytest.importorskip('highspy')
+
+from sawit.incremental import IncrementalModel  # noqa: E402
+
+
+def test_warm_sama_dengan_cold_setelah_beberapa_edit(instance):
+    model = IncrementalModel(instance)
+    first = model.solve()
+    assert first.warm is False
+    reference = instance.copy()
+
+    # (method, array di Network, nama node, indeks yang diubah, faktor)
+    edits = [
+        ('set_capacity', 'capacity', instance.pabrik, slice(None), 0.9),
+        ('set_supply', 'supply', instance.kebun, slice(0, 5), 0.5),
+        ('set_capacity', 'capacity', instance.pabrik, slice(-1, None), 1.5),
+        ('set_supply', 'supply', instance.kebun, slice(3, 8), 1.2),
+    ]
+    objectives = [first.objective]
+    for method, field, names, index, factor in edits:
+        values = getattr(reference, field)
+        values[index] *= factor
+        getattr(model, method)(dict(zip(list(names)[index], values[index].tolist())))
+
+        stats = model.solve()
+        cold = solve(reference, 'highs')
+        assert stats.warm is True
+        assert stats.status == cold.status == 'Optimal'
+        assert stats.objective == pytest.approx(cold.objective, rel=1e-9)
+        objectives.append(stats.objective)
+    assert len(set(objectives)) > 1
+
+
+def test_edit_biaya_dan_demand(instance):
+    model = IncrementalModel(instance)
+    model.solve()
+    reference = instance.copy()
+
+    route = instance.tbs_routes()[0]
+    reference.tbs_cost[0] *= 3
+    reference.demand[0] *= 1.1
+    model.set_cost_tbs({route: float(reference.tbs_cost[0])})
+    model.set_demand({instance.pusat[0]: float(reference.demand[0])})
+
+    stats = model.solve()
+    assert stats.objective == pytest.approx(solve(reference, 'highs').objective, rel=1e-9)
+    assert model.solve(cold=True).objective == pytest.approx(stats.objective, rel=1e-9)
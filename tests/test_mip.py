@@ -0,0 +1,58 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_mip.py
+Deskripsi: parse_cbc_log sawit/mip.py pada log CBC 2.10.3 asli (tests/data):
+           MIP yang selesai optimal dan MIP yang berhenti karena batas waktu.
+"""
+
+import os
+
+import pytest
+
+from sawit.mip import parse_cbc_log
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def _profile(name):
+    with open(os.path.join(DATA, name), encoding='utf-8') as f:
+        return parse_cbc_log(f.read())
+
+
+def test_log_optimal():
+    profile = _profile('cbc_mip_optimal.log')
+    assert profile['continuous'] == 3.5531e9
+    assert profile['root_bound'] == 3.5688e9
+    assert profile['incumbents'] == [
+        (0.0, 3.573105e9, 0, 'Reduced search'),
+        (0.01, 3.56941e9, 0, 'DiveCoefficient'),
+        (0.05, 3.56888e9, 0, 'DiveCoefficient'),
+    ]
+    assert profile['progress'] == [(0.06, 0, 3.56888e9, 3.5687974e9)]
+    assert profile['result'] == 'Optimal solution found'
+    assert profile['objective'] == 3568880000.0
+    # Tanpa baris "Lower bound": solusi optimal terbukti, bound = objective
+    assert profile['bound'] == profile['objective']
+    assert profile['gap'] == 0.0
+    assert (profile['nodes'], profile['iterations'], profile['wall_time']) == (24, 328, 0.11)
+
+
+def test_log_batas_waktu():
+    profile = _profile('cbc_mip_time_limit.log')
+    assert profile['continuous'] == 2.74146e10
+    assert profile['root_bound'] == 2.74429e10
+    assert profile['incumbents'] == [(0.1, 2.746614e10, 0, 'Reduced search')]
+    assert profile['progress'] == []
+    assert profile['result'] == 'Stopped on time limit'
+    assert profile['objective'] == 27466140000.0
+    assert profile['bound'] == 27442931065.039
+    # Baris "Gap: 0.00" dibulatkan; gap dihitung ulang dari objective dan bound
+    assert profile['gap'] == pytest.approx((27466140000.0 - 27442931065.039) / 27466140000.0, rel=1e-12)
+    assert profile['gap'] > 0
+    assert (profile['nodes'], profile['iterations'], profile['wall_time']) == (0, 906, 2.08)
+
+
+def test_log_kosong():
+    profile = parse_cbc_log('')
+    assert profile['incumbents'] == [] and profile['objective'] is None and profile['gap'] is None
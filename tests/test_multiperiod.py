@@ -0,0 +1,72 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_multiperiod.py
+Deskripsi: Rolling horizon dan LP penuh sawit/multiperiod.py: horizon konstan,
+           kesamaan rolling vs penuh, dan neraca stok per periode.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.backends import solve
+
+pytest.importorskip('highspy')
+
+from sawit.multiperiod import Horizon, seasonal_horizon, solve_full, solve_rolling  # noqa: E402
+
+TOL = 1e-6
+
+
+@pytest.fixture
+def seasonal(instance):
+    return seasonal_horizon(instance, 12)
+
+
+@pytest.mark.parametrize('method', ['rolling', 'full'])
+def test_horizon_konstan_sama_dengan_statis(instance, method):
+    T = 4
+    horizon = Horizon.constant(instance, T)
+    plan = solve_rolling(horizon, window=2) if method == 'rolling' else solve_full(horizon)
+    assert plan.status == 'Optimal' and plan.n_planned == T
+    assert plan.total_biaya == pytest.approx(T * solve(instance, 'highs').objective, rel=1e-9)
+
+
+@pytest.mark.parametrize('window,warm_start', [(12, True), (6, True), (6, False), (3, True)])
+def test_rolling_sama_dengan_penuh(seasonal, window, warm_start):
+    full = solve_full(seasonal)
+    rolling = solve_rolling(seasonal, window=window, warm_start=warm_start)
+    assert full.status == rolling.status == 'Optimal'
+    assert rolling.total_biaya == pytest.approx(full.total_biaya, rel=1e-9)
+
+
+def test_rolling_tanpa_lookahead_tidak_lebih_murah(seasonal):
+    full = solve_full(seasonal)
+    myopic = solve_rolling(seasonal, window=1)
+    assert myopic.status == 'Optimal'
+    assert myopic.total_biaya >= full.total_biaya * (1 - 1e-9)
+
+
+@pytest.mark.parametrize('method', ['rolling', 'full'])
+def test_neraca_stok_per_periode(seasonal, method):
+    plan = solve_rolling(seasonal, window=6) if method == 'rolling' else solve_full(seasonal)
+    assert plan.status == 'Optimal'
+    n, h = seasonal.network, seasonal
+    P, D = len(n.pabrik), len(n.pusat)
+    stok_tbs, stok_cpo, stok_pd = h.stok_awal_tbs, h.stok_awal_cpo_pabrik, h.stok_awal_cpo_pd
+    for t in range(h.n_periods):
+        tbs_in = np.bincount(n.tbs_dst, plan.x[t], minlength=P)
+        cpo_out = np.bincount(n.cpo_src, plan.y[t], minlength=P)
+        cpo_in = np.bincount(n.cpo_dst, plan.y[t], minlength=D)
+
+        assert np.allclose(stok_tbs + tbs_in - plan.olah[t] - plan.stok_tbs[t], 0, atol=TOL)
+        assert np.allclose(stok_cpo + n.yield_rate * plan.olah[t] - cpo_out - plan.stok_cpo[t], 0, atol=TOL)
+        assert np.all(stok_pd + cpo_in - plan.stok_pd[t] >= h.demand[t] - TOL)
+
+        assert np.all(np.bincount(n.tbs_src, plan.x[t], minlength=len(n.kebun)) <= h.supply[t] + TOL)
+        assert np.all(plan.olah[t] <= h.capacity[t] + TOL)
+        assert np.all(plan.stok_tbs[t] <= h.gudang_tbs + TOL)
+        assert np.all(plan.stok_cpo[t] <= h.gudang_cpo_pabrik + TOL)
+        assert np.all(plan.stok_pd[t] <= h.gudang_cpo_pd + TOL)
+        stok_tbs, stok_cpo, stok_pd = plan.stok_tbs[t], plan.stok_cpo[t], plan.stok_pd[t]
+    assert plan.stok_tbs.any() or plan.stok_cpo.any() or plan.stok_pd.any()
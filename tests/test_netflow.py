@@ -0,0 +1,61 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_netflow.py
+Deskripsi: Backend netflow (OR-Tools) sama dengan HiGHS, termasuk biaya negatif
+           dan data pecahan; engine Python min_cost_flow untuk max_flow.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.backends import solve
+from sawit.netflow import min_cost_flow
+from sawit.portfolio import PORTFOLIO
+
+
+@pytest.mark.parametrize('scale', [0.5, 1.5, 2.5])
+def test_biaya_negatif_sama_dengan_highs(instance, scale):
+    pytest.importorskip('ortools')
+    rng = np.random.default_rng(1)
+    instance.tbs_cost = instance.tbs_cost - scale * rng.uniform(0, 1, instance.n_tbs) * instance.tbs_cost.mean()
+    instance.cpo_cost = instance.cpo_cost - scale * rng.uniform(0, 1, instance.n_cpo) * instance.cpo_cost.mean()
+    reference = solve(instance, 'highs')
+    result = solve(instance, 'netflow')
+    assert result.status == reference.status == 'Optimal'
+    assert result.objective == pytest.approx(reference.objective, rel=1e-9)
+
+
+def test_arc_negatif():
+    # 0 → 1 → 3 murah lewat arc negatif, 0 → 2 → 3 mahal
+    flow, sent, _ = min_cost_flow([0, 1, 0, 2], [1, 3, 2, 3], [1.0, -5.0, 1.0, 2.0], [4.0, 4.0, 10.0, 10.0],
+                                  4, 0, 3, 6.0)
+    assert sent == pytest.approx(6.0)
+    assert flow.tolist() == pytest.approx([4.0, 4.0, 2.0, 2.0])
+
+
+def test_siklus_negatif():
+    with pytest.raises(ValueError):
+        min_cost_flow([0, 1, 2], [1, 2, 1], [0.0, -1.0, -1.0], [1.0, 1.0, 1.0], 3, 0, 2, 1.0)
+
+
+def test_data_pecahan_sama_dengan_highs(instance):
+    pytest.importorskip('ortools')
+    rng = np.random.default_rng(2)
+    instance.yield_rate = 0.2137
+    instance.supply = instance.supply * rng.uniform(0.9, 1.1, len(instance.supply))
+    instance.tbs_cost = instance.tbs_cost * rng.uniform(0.5, 1.5, instance.n_tbs)
+    reference = solve(instance, 'highs')
+    result = solve(instance, 'netflow')
+    assert result.status == reference.status == 'Optimal'
+    assert result.objective == pytest.approx(reference.objective, rel=1e-6)
+
+
+def test_infeasible(instance):
+    pytest.importorskip('ortools')
+    instance.demand = instance.demand * 10
+    assert solve(instance, 'netflow').status == solve(instance, 'highs').status == 'Infeasible'
+
+
+def test_ikut_portfolio():
+    assert ('netflow', 'netflow', {}) in PORTFOLIO
@@ -0,0 +1,53 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_outputs.py
+Deskripsi: Tahap output: sink gagal tidak menghentikan sink lain, tidak
+           dihitung sebagai output, dan membuat `sawit report` keluar non-zero.
+"""
+
+import os
+
+import pytest
+
+import sawit.loader as loader
+from sawit.backends import solve
+from sawit.cli import main
+from sawit.outputs import OutputStage, can_fork
+from sawit.pipeline import SolverRun, write_csv, write_excel, write_html
+
+
+@pytest.fixture
+def run(instance):
+    return SolverRun(instance.to_dicts(), 'default', instance, solve(instance, 'highs'))
+
+
+def broken(run, path):
+    raise RuntimeError("disk penuh")
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_sink_gagal_terisolasi(run, tmp_path, capsys, workers):
+    stage = (OutputStage(run)
+             .add('HTML report', write_html, str(tmp_path / 'hasil.html'), cpu_bound=True)
+             .add('Excel', write_excel, str(tmp_path / 'hasil.xlsx'), cpu_bound=True)
+             .add('Rusak', broken, str(tmp_path / 'rusak.txt'), cpu_bound=True)
+             .add('CSV', write_csv, str(tmp_path / 'hasil.csv')))
+    results = stage.run(workers)
+
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert str(results[2].error) == "disk penuh"
+    assert [result.name for result in stage.failed] == ['Rusak']
+    for name in ('hasil.html', 'hasil.xlsx', 'hasil.csv'):
+        assert os.path.getsize(tmp_path / name) > 0
+    assert "✓ 3 output dalam" in capsys.readouterr().out
+    if workers > 1 and can_fork():
+        assert (stage.processes, stage.threads) == (3, 1)
+
+
+def test_report_exit_code(instance, tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, 'load_default_instance', lambda: (instance.to_dicts(), 'default'))
+    args = ['report', '--backend', 'highs', '--headless', '--no-sensitivity', '--no-cache',
+            '-o', str(tmp_path / 'hasil.html'), '--excel', str(tmp_path / 'hasil.xlsx')]
+    assert main(args) == 0
+    assert main(args + ['--csv', str(tmp_path / 'tidak-ada' / 'hasil.csv')]) == 1
@@ -0,0 +1,77 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_parametric.py
+Deskripsi: Kurva parametrik sawit/parametric.py sama dengan solve HiGHS per
+           titik grid, termasuk rentang infeasible di awal dan di akhir.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.backends import solve
+
+pytest.importorskip('highspy')
+
+from sawit.parametric import sweep  # noqa: E402
+
+GRID = np.linspace(0.0, 1.0, 41)
+
+
+def _network_at(network, curve, t):
+    network = network.copy()
+    for (parameter, key, _, _), value in zip(curve.params, curve.values_at(t)):
+        if parameter == 'factory_capacity':
+            network.capacity[network.pabrik.index(key)] = value
+        else:
+            network.supply[network.kebun.index(key)] = value
+    return network
+
+
+def _assert_sama_dengan_grid(network, curve):
+    for t in GRID:
+        result = solve(_network_at(network, curve, t), 'highs')
+        expected = result.objective if result.status == 'Optimal' else None
+        actual = curve.cost_at(t)
+        if expected is None or actual is None:
+            assert actual is expected is None, t
+        else:
+            assert actual == pytest.approx(expected, rel=1e-7), t
+
+
+@pytest.fixture
+def tight(instance):
+    """Pabrik_2 dibatasi sehingga kapasitas Pabrik_1 menentukan feasibility."""
+    instance.capacity[1] = 30000.0
+    return instance
+
+
+def test_kurva_sama_dengan_grid(tight):
+    curve = sweep(tight, [('factory_capacity', 'Pabrik_1', 20000, 60000)])
+    assert curve.infeasible_until is None and curve.infeasible_from is None
+    assert len(curve.points) > 2
+    _assert_sama_dengan_grid(tight, curve)
+
+
+def test_infeasible_di_awal(tight):
+    curve = sweep(tight, [('factory_capacity', 'Pabrik_1', 0, 40000)])
+    assert curve.infeasible_until is not None and 0 < curve.infeasible_until < 1
+    # Pabrik_1 harus mengolah sisa TBS yang tidak muat di Pabrik_2
+    required = tight.demand.sum() / tight.yield_rate - tight.capacity[1]
+    assert curve.values_at(curve.infeasible_until)[0] == pytest.approx(required, rel=1e-6)
+    _assert_sama_dengan_grid(tight, curve)
+
+
+def test_infeasible_di_akhir(tight):
+    curve = sweep(tight, [('factory_capacity', 'Pabrik_1', 40000, 0)])
+    assert curve.infeasible_from is not None and 0 < curve.infeasible_from < 1
+    assert curve.cost_at(1.0) is None
+    _assert_sama_dengan_grid(tight, curve)
+
+
+def test_dua_parameter_bersama(tight):
+    params = [('factory_capacity', 'Pabrik_1', 35000, 15000),
+              ('supply_capacity', tight.kebun[0], 0, 2 * tight.supply[0])]
+    curve = sweep(tight, params)
+    assert curve.keys == ['factory_capacity:Pabrik_1', f"supply_capacity:{tight.kebun[0]}"]
+    _assert_sama_dengan_grid(tight, curve)
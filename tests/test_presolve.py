@@ -0,0 +1,60 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_presolve.py
+Deskripsi: Presolve → solve → postsolve: feasible di network asli dengan biaya
+           sama, termasuk network tereduksi yang kosong (demand nol).
+"""
+
+import pytest
+
+from sawit.backends import available_backends, solve
+from sawit.instances import generate_instance
+from sawit.network import Network
+from sawit.presolve import presolve
+from sawit.solution import Solution
+from sawit.verification import verify
+
+BACKENDS = list(available_backends())
+
+
+@pytest.fixture
+def reducible():
+    """Instance dengan node yang bisa digabung dan satu PD tanpa demand."""
+    network = Network.from_dicts(*generate_instance(100))
+    network.demand[0] = 0
+    return network
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_postsolve_feasible_dan_biaya_sama(reducible, backend):
+    presolved = presolve(reducible)
+    assert presolved.reduced.n_vars < reducible.n_vars
+
+    reference = solve(reducible, backend)
+    result = presolved.postsolve(solve(presolved.reduced, backend))
+    solution = Solution.from_result(reducible, result)
+    assert result.status == reference.status == 'Optimal'
+    assert verify(solution).ok
+    assert solution.biaya_tbs + solution.biaya_cpo == pytest.approx(reference.objective, rel=1e-6)
+    assert result.objective == pytest.approx(reference.objective, rel=1e-6)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_demand_nol_network_tereduksi_kosong(instance, backend):
+    instance.demand[:] = 0
+    presolved = presolve(instance)
+    assert presolved.reduced.n_vars == 0
+
+    result = presolved.postsolve(solve(presolved.reduced, backend))
+    assert result.status == 'Optimal'
+    assert result.objective == 0
+    assert verify(Solution.from_result(instance, result)).ok
+
+
+@pytest.mark.parametrize('demand, status', [(0, 'Optimal'), (5, 'Infeasible')])
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_network_tanpa_rute(backend, demand, status):
+    network = Network.from_dicts({'Kebun_1': 100}, {'Pabrik_1': 100}, {'PD1': demand}, {}, {}, 0.22)
+    assert network.n_vars == 0
+    assert solve(network, backend).status == status
@@ -0,0 +1,93 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_resultcache.py
+Deskripsi: Kunci cache hasil (hit/miss) dan metadata yang ikut tersimpan.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.resultcache import cached_solve, instance_key
+from sawit.solution import solution_arrays
+
+
+def test_hit_setelah_miss(instance):
+    first, hit = cached_solve(instance, 'highs')
+    assert not hit and not first.from_cache
+    second, hit = cached_solve(instance, 'highs')
+    assert hit and second.from_cache
+    assert second.cache_key == first.cache_key
+    assert second.objective == first.objective
+    assert second.method == first.method == 'highs-ipm'
+    for a, b in zip(solution_arrays(instance, first), solution_arrays(instance, second)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_kunci_tidak_bergantung_urutan(instance):
+    reordered = instance.copy()
+    order = np.arange(instance.n_tbs)[::-1]
+    reordered.tbs_src, reordered.tbs_dst = instance.tbs_src[order], instance.tbs_dst[order]
+    reordered.tbs_cost = instance.tbs_cost[order]
+    assert instance_key(reordered, 'cbc') == instance_key(instance, 'cbc')
+
+
+def test_kunci_berubah(instance, monkeypatch, tmp_path):
+    base = instance_key(instance, 'cbc')
+    assert instance_key(instance, 'highs') != base
+    assert instance_key(instance, 'cbc', {'algorithm': 'dual'}) != base
+
+    changed = instance.copy()
+    changed.demand = changed.demand * 1.01
+    assert instance_key(changed, 'cbc') != base
+
+    monkeypatch.setenv('SAWIT_CBC_MODEL', 'pulp')
+    assert instance_key(instance, 'cbc') != base
+    monkeypatch.delenv('SAWIT_CBC_MODEL')
+
+    regions = tmp_path / 'region.csv'
+    regions.write_text('node,region\n', encoding='utf-8')
+    monkeypatch.setenv('SAWIT_REGIONS', str(regions))
+    key = instance_key(instance, 'decomp')
+    regions.write_text('node,region\nKebun_1,A\n', encoding='utf-8')
+    assert instance_key(instance, 'decomp') != key
+    monkeypatch.setenv('SAWIT_REGIONS', '2')
+    assert instance_key(instance, 'decomp') != key
+
+
+def test_metadata_dekomposisi_tersimpan(instance, monkeypatch):
+    pytest.importorskip('highspy')
+    monkeypatch.setenv('SAWIT_REGIONS', '2')
+    first, _ = cached_solve(instance, 'decomp')
+    second, hit = cached_solve(instance, 'decomp')
+    assert hit
+    assert second.decomposition == first.decomposition
+    assert second.iterations == first.iterations
+
+
+def test_metadata_portfolio_tersimpan(instance):
+    first, _ = cached_solve(instance, 'portfolio', configs=['highs-dual', 'highs-ipm'], record=False)
+    second, hit = cached_solve(instance, 'portfolio', configs=['highs-dual', 'highs-ipm'], record=False)
+    assert hit
+    assert second.portfolio == first.portfolio
+    assert second.portfolio['winner'] in ('highs-dual', 'highs-ipm')
+    assert second.method == first.method
+
+
+def test_sensitivitas_tersimpan_di_entri(instance):
+    pytest.importorskip('highspy')
+    from sawit.pipeline import SolverRun, analyze_sensitivity
+
+    first, _ = cached_solve(instance, 'highs')
+    computed = analyze_sensitivity(SolverRun(None, 'default', instance, first))
+
+    # Urutan node berbeda, kunci kanonik sama: array dikembalikan ke urutan jaringan ini
+    reordered = instance.copy()
+    order = np.arange(instance.n_tbs)[::-1]
+    reordered.tbs_src, reordered.tbs_dst = instance.tbs_src[order], instance.tbs_dst[order]
+    reordered.tbs_cost = instance.tbs_cost[order]
+    second, hit = cached_solve(reordered, 'highs')
+    assert hit and second.sensitivity is not None
+    np.testing.assert_array_equal(second.sensitivity.dual, computed.dual)
+    np.testing.assert_array_equal(second.sensitivity.reduced_cost[:instance.n_tbs], computed.reduced_cost[order])
+    assert analyze_sensitivity(SolverRun(None, 'default', reordered, second)) is second.sensitivity
@@ -0,0 +1,35 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_scenarios.py
+Deskripsi: Batch skenario: satu skenario gagal tidak menggagalkan batch.
+"""
+
+import csv
+
+import sawit.scenarios as scenarios
+from sawit.backends import solve
+from sawit.cli import main
+
+
+def test_skenario_error_jadi_baris(instance, monkeypatch):
+    def solve_or_fail(network, backend):
+        if network.demand.sum() > instance.demand.sum():
+            raise RuntimeError("solver crash")
+        return solve(network, backend)
+
+    monkeypatch.setattr(scenarios, 'solve', solve_or_fail)
+    batch = {'base': [], 'demand_naik': [('demand', '*', 'scale', 1.1)]}
+    rows = scenarios.run_scenarios(instance, batch, workers=1)
+
+    assert [row['status'] for row in rows] == ['Optimal', 'Error']
+    assert rows[1]['error'] == "RuntimeError: solver crash"
+
+
+def test_cli_scenarios(tmp_path):
+    output = tmp_path / 'hasil.csv'
+    assert main(['scenarios', '--random', '3', '--workers', '1', '-o', str(output)]) == 0
+    with open(output, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['scenario'] for row in rows] == ['base', 'skenario_0001', 'skenario_0002']
+    assert all(row['error'] == '' for row in rows)
@@ -0,0 +1,68 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_sensitivity.py
+Deskripsi: Shadow price, ranging dan reduced cost sawit/sensitivity.py
+           dibandingkan dengan solve ulang HiGHS.
+"""
+
+import numpy as np
+import pytest
+
+from sawit.backends import solve
+from sawit.solution import Solution
+
+pytest.importorskip('highspy')
+
+from sawit.sensitivity import analyze  # noqa: E402
+
+
+@pytest.fixture
+def binding(instance):
+    """Instance dengan kapasitas Pabrik pertama sebagai baris aktif."""
+    instance.capacity[0] = 20000.0
+    return instance
+
+
+def test_shadow_price_pabrik_sama_dengan_beda_hingga(binding):
+    sens = analyze(binding)
+    row = len(binding.kebun)
+    assert sens.activity[row] == pytest.approx(binding.capacity[0])
+    assert sens.dual[row] < 0
+    assert sens.rhs_hi[row] >= binding.capacity[0] + 1
+
+    base = solve(binding, 'highs').objective
+    plus = binding.copy()
+    plus.capacity[0] += 1.0
+    assert solve(plus, 'highs').objective - base == pytest.approx(sens.dual[row], rel=1e-6)
+
+
+def test_range_baris_basis(binding):
+    sens = analyze(binding)
+    lo, hi = binding.row_bounds()
+    slack = np.minimum(sens.activity - lo, hi - sens.activity)
+    basic = slack > 1e-6
+    assert basic.any()
+    upper = basic & np.isfinite(hi)
+    lower = basic & np.isfinite(lo) & ~np.isfinite(hi)
+    assert np.all(sens.dual[basic] == 0)
+    assert np.allclose(sens.rhs_lo[upper], sens.activity[upper]) and np.all(np.isposinf(sens.rhs_hi[upper]))
+    assert np.all(np.isneginf(sens.rhs_lo[lower])) and np.allclose(sens.rhs_hi[lower], sens.activity[lower])
+
+
+def test_reduced_cost_rute_basis_nol(binding):
+    sens = analyze(binding)
+    used = sens.flow > 1e-6
+    assert used.any()
+    assert np.allclose(sens.reduced_cost[used], 0.0, atol=1e-6)
+    assert np.all(sens.reduced_cost[~used] >= -1e-6)
+
+
+@pytest.mark.parametrize('backend', ['cbc', 'highs'])
+def test_mulai_dari_solusi_solver(binding, backend):
+    result = solve(binding, backend)
+    sens = analyze(binding, Solution.from_result(binding, result).values)
+    cold = analyze(binding)
+    assert sens.available
+    assert sens.objective == pytest.approx(cold.objective, rel=1e-9)
+    assert np.allclose(sens.flow, Solution.from_result(binding, result).values, atol=1e-6)
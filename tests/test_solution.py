@@ -0,0 +1,44 @@
+"""
+PT SAWIT MAKMUR SEJAHTERA - OPTIMASI SISTEM DISTRIBUSI
+
+File: tests/test_solution.py
+Deskripsi: Baris rute per potongan sama dengan baris tanpa potongan.
+"""
+
+import itertools
+
+import pytest
+
+from sawit.backends import solve
+from sawit.solution import Solution
+from sawit.vtable import columnar_chunks, columnar_payload
+
+COLUMNS = [{'key': 'src', 'fmt': 'key'}, {'key': 'dst', 'fmt': 'key'}, {'key': 'qty', 'fmt': 'num'},
+           {'key': 'cost', 'fmt': 'rp'}]
+
+
+@pytest.fixture
+def solution(instance):
+    return Solution.from_result(instance, solve(instance, 'highs'))
+
+
+@pytest.mark.parametrize('kind', ['tbs', 'cpo'])
+def test_route_rows_per_potongan(solution, kind):
+    whole = list(solution.route_rows(kind, chunk=10 ** 9))
+    chunks = list(solution.route_rows(kind, chunk=3))
+    assert len(whole) == 1
+    rows = list(whole[0])
+    assert len(rows) == len(solution.used(kind)) > 3
+    assert list(itertools.chain.from_iterable(chunks)) == rows
+    assert all(isinstance(row[3], int) for row in rows)
+
+
+@pytest.mark.parametrize('kind', ['tbs', 'cpo'])
+def test_payload_per_potongan(solution, kind):
+    rows = list(next(solution.route_rows(kind, chunk=10 ** 9)))
+    assert columnar_chunks(COLUMNS, solution.route_rows(kind, chunk=4)) == columnar_payload(COLUMNS, rows)
+
+
+def test_tanpa_rute_terpakai(solution):
+    assert list(solution.route_rows('tbs', min_flow=float('inf'))) == []
+    assert columnar_chunks(COLUMNS, []) == columnar_payload(COLUMNS, [])